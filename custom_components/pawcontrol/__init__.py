@@ -38,6 +38,7 @@ from .setup import (
     async_setup_platforms,
     async_validate_entry_config,
 )
+from .telemetry import set_bool_coercion_repr_capture
 from .types import (
     DOG_ID_FIELD,
     DOG_NAME_FIELD,
@@ -183,13 +184,17 @@ def get_platforms_for_profile_and_modules(
 
 
 def _enable_debug_logging(entry: PawControlConfigEntry) -> bool:
-    """Enable package-level debug logging when requested by the entry."""
+    """Enable package-level debug logging when requested by the entry.
+
+    Bool coercion repr capture follows the resulting package logger level.
+    """
     global _DEFAULT_LOGGER_LEVEL
     requested = bool(entry.options.get("debug_logging"))
     entry_id = entry.entry_id
     package_logger = logging.getLogger(__package__)
     if not requested:
         _DEBUG_LOGGER_ENTRIES.discard(entry_id)
+        set_bool_coercion_repr_capture(package_logger.isEnabledFor(logging.DEBUG))
         return False
 
     if entry_id not in _DEBUG_LOGGER_ENTRIES:
@@ -203,6 +208,7 @@ def _enable_debug_logging(entry: PawControlConfigEntry) -> bool:
     if package_logger.level != logging.DEBUG:
         package_logger.setLevel(logging.DEBUG)
 
+    set_bool_coercion_repr_capture(True)
     return True
 
 
@@ -222,6 +228,7 @@ def _disable_debug_logging(entry: PawControlConfigEntry) -> None:
     package_logger.setLevel(
         target_level if target_level is not None else logging.NOTSET,
     )
+    set_bool_coercion_repr_capture(package_logger.isEnabledFor(logging.DEBUG))
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
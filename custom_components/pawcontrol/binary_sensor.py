@@ -569,6 +569,8 @@ class PawControlBinarySensorBase(
 class PawControlGardenBinarySensorBase(PawControlBinarySensorBase):
     """Base class for garden binary sensors."""
 
+    _listener_module = GARDEN_MODULE
+
     def _apply_garden_common_attributes(self, attrs: AttributeDict) -> None:
         """Populate common garden telemetry attributes for garden sensors."""
         data = self._get_garden_data()
@@ -860,6 +862,8 @@ class PawControlVisitorModeBinarySensor(PawControlBinarySensorBase):
 class PawControlIsHungryBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if the dog is hungry."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -963,6 +967,8 @@ class PawControlFeedingDueBinarySensor(PawControlBinarySensorBase):
 class PawControlFeedingScheduleOnTrackBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if feeding schedule is being followed."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -993,6 +999,8 @@ class PawControlFeedingScheduleOnTrackBinarySensor(PawControlBinarySensorBase):
 class PawControlDailyFeedingGoalMetBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if daily feeding goals are met."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1177,6 +1185,8 @@ class PawControlNeedsWalkBinarySensor(PawControlBinarySensorBase):
 class PawControlWalkGoalMetBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if daily walk goals are met."""
 
+    _listener_module = WALK_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1241,6 +1251,8 @@ class PawControlLongWalkOverdueBinarySensor(PawControlBinarySensorBase):
 class PawControlIsHomeBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if the dog is at home."""
 
+    _listener_module = GPS_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1417,6 +1429,8 @@ class PawControlGPSAccuratelyTrackedBinarySensor(PawControlBinarySensorBase):
 class PawControlMovingBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if the dog is currently moving."""
 
+    _listener_module = GPS_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1452,6 +1466,8 @@ class PawControlMovingBinarySensor(PawControlBinarySensorBase):
 class PawControlGeofenceAlertBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if there's a geofence alert."""
 
+    _listener_module = GPS_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1483,6 +1499,8 @@ class PawControlGeofenceAlertBinarySensor(PawControlBinarySensorBase):
 class PawControlGPSBatteryLowBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if GPS device battery is low."""
 
+    _listener_module = GPS_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1520,6 +1538,8 @@ class PawControlGPSBatteryLowBinarySensor(PawControlBinarySensorBase):
 class PawControlHealthAlertBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if there's a health alert."""
 
+    _listener_module = HEALTH_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1570,6 +1590,8 @@ class PawControlHealthAlertBinarySensor(PawControlBinarySensorBase):
 class PawControlWeightAlertBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if there's a weight-related alert."""
 
+    _listener_module = HEALTH_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1601,6 +1623,8 @@ class PawControlWeightAlertBinarySensor(PawControlBinarySensorBase):
 class PawControlMedicationDueBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if medication is due."""
 
+    _listener_module = HEALTH_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1664,6 +1688,8 @@ class PawControlVetCheckupDueBinarySensor(PawControlBinarySensorBase):
 class PawControlGroomingDueBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if grooming is due."""
 
+    _listener_module = HEALTH_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1691,6 +1717,8 @@ class PawControlGroomingDueBinarySensor(PawControlBinarySensorBase):
 class PawControlActivityLevelConcernBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if there's concern about activity level."""
 
+    _listener_module = HEALTH_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1759,6 +1787,8 @@ class PawControlActivityLevelConcernBinarySensor(PawControlBinarySensorBase):
 class PawControlHealthAwareFeedingBinarySensor(PawControlBinarySensorBase):
     """Binary sensor showing if health-aware feeding mode is active."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1813,6 +1843,8 @@ class PawControlHealthAwareFeedingBinarySensor(PawControlBinarySensorBase):
 class PawControlMedicationWithMealsBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating if medication should be given with meals."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1856,6 +1888,8 @@ class PawControlMedicationWithMealsBinarySensor(PawControlBinarySensorBase):
 class PawControlHealthEmergencyBinarySensor(PawControlBinarySensorBase):
     """Binary sensor indicating an active health emergency."""
 
+    _listener_module = FEEDING_MODULE
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1241,6 +1241,7 @@ class PawControlMarkFedButton(PawControlButtonBase):
         range(11, 16): "lunch",
         range(16, 22): "dinner",
     }
+    _listener_module = MODULE_FEEDING
 
     def __init__(
         self,
@@ -1291,6 +1292,8 @@ class PawControlMarkFedButton(PawControlButtonBase):
 class PawControlFeedNowButton(PawControlButtonBase):
     """Immediate feeding button for quick manual feedings."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1334,6 +1337,7 @@ class PawControlFeedMealButton(PawControlButtonBase):
     """Button for specific meal type."""
 
     _meal_type: str
+    _listener_module = MODULE_FEEDING
 
     def __init__(
         self,
@@ -1378,6 +1382,8 @@ class PawControlFeedMealButton(PawControlButtonBase):
 class PawControlLogCustomFeedingButton(PawControlButtonBase):
     """Button for custom feeding."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1414,6 +1420,8 @@ class PawControlLogCustomFeedingButton(PawControlButtonBase):
 class PawControlStartWalkButton(PawControlButtonBase):
     """Button to start walk with enhanced error handling."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1487,6 +1495,8 @@ class PawControlStartWalkButton(PawControlButtonBase):
 class PawControlEndWalkButton(PawControlButtonBase):
     """Button to end walk with enhanced validation."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1554,6 +1564,8 @@ class PawControlEndWalkButton(PawControlButtonBase):
 class PawControlQuickWalkButton(PawControlButtonBase):
     """Button for quick walk with atomic operation."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1602,6 +1614,8 @@ class PawControlQuickWalkButton(PawControlButtonBase):
 class PawControlLogWalkManuallyButton(PawControlButtonBase):
     """Button for manual walk logging."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1649,6 +1663,8 @@ class PawControlLogWalkManuallyButton(PawControlButtonBase):
 class PawControlRefreshLocationButton(PawControlButtonBase):
     """Button to refresh GPS location."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1701,6 +1717,8 @@ class PawControlUpdateLocationButton(PawControlRefreshLocationButton):
 class PawControlExportRouteButton(PawControlButtonBase):
     """Button to export route data."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1736,6 +1754,8 @@ class PawControlExportRouteButton(PawControlButtonBase):
 class PawControlCenterMapButton(PawControlButtonBase):
     """Button to center map on dog location."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1765,6 +1785,8 @@ class PawControlCenterMapButton(PawControlButtonBase):
 class PawControlCallDogButton(PawControlButtonBase):
     """Button to call GPS tracker."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1802,6 +1824,8 @@ class PawControlCallDogButton(PawControlButtonBase):
 class PawControlLogWeightButton(PawControlButtonBase):
     """Button to log weight measurement."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1858,6 +1882,8 @@ class PawControlLogWeightButton(PawControlButtonBase):
 class PawControlLogMedicationButton(PawControlButtonBase):
     """Button to log medication administration."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1917,6 +1943,8 @@ class PawControlLogMedicationButton(PawControlButtonBase):
 class PawControlStartGroomingButton(PawControlButtonBase):
     """Button to start grooming session."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1987,6 +2015,8 @@ class PawControlStartGroomingButton(PawControlButtonBase):
 class PawControlScheduleVetButton(PawControlButtonBase):
     """Button to schedule veterinary appointment."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2025,6 +2055,8 @@ class PawControlScheduleVetButton(PawControlButtonBase):
 class PawControlHealthCheckButton(PawControlButtonBase):
     """Button for comprehensive health check."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2067,6 +2099,8 @@ class PawControlHealthCheckButton(PawControlButtonBase):
 class PawControlStartGardenSessionButton(PawControlButtonBase):
     """Button to start a garden session."""
 
+    _listener_module = MODULE_GARDEN
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2117,6 +2151,8 @@ class PawControlStartGardenSessionButton(PawControlButtonBase):
 class PawControlEndGardenSessionButton(PawControlButtonBase):
     """Button to end a garden session."""
 
+    _listener_module = MODULE_GARDEN
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2167,6 +2203,8 @@ class PawControlEndGardenSessionButton(PawControlButtonBase):
 class PawControlLogGardenActivityButton(PawControlButtonBase):
     """Button to log a general garden activity."""
 
+    _listener_module = MODULE_GARDEN
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2225,6 +2263,8 @@ class PawControlLogGardenActivityButton(PawControlButtonBase):
 class PawControlConfirmGardenPoopButton(PawControlButtonBase):
     """Button to confirm a garden poop event."""
 
+    _listener_module = MODULE_GARDEN
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
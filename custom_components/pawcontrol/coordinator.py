@@ -7,7 +7,7 @@ from time import perf_counter
 from typing import TYPE_CHECKING, Any, Final, Literal, cast
 
 from aiohttp import ClientSession
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import (
@@ -26,6 +26,7 @@ from .const import (
     UPDATE_INTERVALS,
 )
 from .coordinator_accessors import CoordinatorDataAccessMixin
+from .coordinator_diffing import ListenerScope, ScopedListenerRegistry, SmartDiffTracker
 from .device_api import PawControlDeviceClient
 from .exceptions import ConfigEntryAuthFailed, UpdateFailed, ValidationError
 from .http_client import ensure_shared_client_session
@@ -155,6 +156,13 @@ class PawControlCoordinator(
         self._setup_complete = False
         self._maintenance_unsub: Callable[[], None] | None = None
 
+        # Dog/module scoped listeners are woken from a single coordinator
+        # listener based on the diff between successive payloads.
+        self._diff_tracker = SmartDiffTracker()
+        self._scoped_listeners = ScopedListenerRegistry()
+        self._scoped_dispatch_unsub: CALLBACK_TYPE | None = None
+        self._scoped_last_success = True
+
         self.data_manager: PawControlDataManager | None = None
         self.feeding_manager: FeedingManager | None = None
         self.walk_manager: WalkManager | None = None
@@ -168,6 +176,8 @@ class PawControlCoordinator(
 
         # resilience_manager and _retry_config are initialised earlier
 
+        # Scheduled polls only fetch modules whose own cadence is due.
+        self._module_scheduler = coordinator_runtime.ModuleRefreshScheduler()
         self._runtime = coordinator_runtime.CoordinatorRuntime(
             registry=self.registry,
             modules=self._modules,
@@ -176,6 +186,7 @@ class PawControlCoordinator(
             metrics=self._metrics,
             adaptive_polling=self._adaptive_polling,
             logger=_LOGGER,
+            scheduler=self._module_scheduler,
         )
         self._last_cycle: RuntimeCycleInfo | None = None
 
@@ -229,6 +240,52 @@ class PawControlCoordinator(
         """Return the device API client when configured."""
         return self._api_client
 
+    @callback  # type: ignore[untyped-decorator,misc]
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+    ) -> CALLBACK_TYPE:
+        """Register a listener, honouring ``ListenerScope`` contexts.
+
+        Listeners registered with a :class:`ListenerScope` context only run
+        when the diff of the coordinator payload touches their dog (and module,
+        when given). All other listeners keep Home Assistant's broadcast
+        semantics.
+        """
+        if not isinstance(context, ListenerScope):
+            return super().async_add_listener(update_callback, context)
+
+        remove_scoped = self._scoped_listeners.add(context, update_callback)
+        if self._scoped_dispatch_unsub is None:
+            self._diff_tracker.reset()
+            self._diff_tracker.update(self.data or {})
+            self._scoped_last_success = self.last_update_success
+            self._scoped_dispatch_unsub = super().async_add_listener(
+                self._async_dispatch_scoped_listeners,
+            )
+
+        @callback  # type: ignore[untyped-decorator,misc]
+        def _remove_listener() -> None:
+            remove_scoped()
+            if len(self._scoped_listeners) or self._scoped_dispatch_unsub is None:
+                return
+            self._scoped_dispatch_unsub()
+            self._scoped_dispatch_unsub = None
+
+        return _remove_listener
+
+    @callback  # type: ignore[untyped-decorator,misc]
+    def _async_dispatch_scoped_listeners(self) -> None:
+        """Wake scoped listeners whose dog or module changed."""
+        diff = self._diff_tracker.update(self.data or {})
+        # Availability is not part of the payload, so a success flip must
+        # reach every entity even when the data itself is unchanged.
+        success = self.last_update_success
+        force = success != self._scoped_last_success
+        self._scoped_last_success = success
+        self._scoped_listeners.dispatch(diff, force=force)
+
     def report_entity_budget(self, snapshot: EntityBudgetSnapshot) -> None:
         """Receive entity budget metrics from the entity factory."""
         self._entity_budget.record(snapshot)
@@ -378,6 +435,7 @@ class PawControlCoordinator(
     async def _refresh_subset(self, dog_ids: Sequence[str]) -> None:
         if not dog_ids:
             return
+        self._invalidate_module_schedule(dog_ids)
         data, _cycle = await self._execute_cycle(dog_ids)
         await self._synchronize_module_states(data)
         for dog_id in dog_ids:
@@ -400,37 +458,71 @@ class PawControlCoordinator(
         coordinator refresh cycle. It updates the `gps` and derived `geofencing`
         module payloads in-place and notifies subscribed entities.
         """
-        if dog_id not in self.registry.ids():
-            _LOGGER.debug("Ignoring GPS patch for unknown dog_id: %s", dog_id)
+        await self.async_patch_gps_updates((dog_id,))
+
+    async def async_patch_gps_updates(self, dog_ids: Iterable[str]) -> None:
+        """Patch GPS payloads for several dogs and publish them once.
+
+        Batched push ingestion applies many points across one or more dogs; the
+        GPS and geofencing adapters run once per affected dog and listeners are
+        notified with a single ``async_set_updated_data`` call.
+        """
+        known = set(self.registry.ids())
+        targets: list[str] = []
+        for dog_id in dict.fromkeys(dog_ids):
+            if dog_id in known:
+                targets.append(dog_id)
+            else:
+                _LOGGER.debug("Ignoring GPS patch for unknown dog_id: %s", dog_id)
+        if not targets:
             return
         if not self._setup_complete or not self._data or not self.last_update_success:
             _LOGGER.debug(
                 "Deferring GPS patch for %s because coordinator data is not ready",
-                dog_id,
+                ", ".join(targets),
             )
             await self.async_request_refresh()
             return
-        current = self._data.get(dog_id)
-        if not isinstance(current, Mapping):
-            _LOGGER.warning(
-                "Cannot patch GPS data for %s because no payload is available",
-                dog_id,
+
+        patched_any = False
+        for dog_id in targets:
+            current = self._data.get(dog_id)
+            if not isinstance(current, Mapping):
+                _LOGGER.warning(
+                    "Cannot patch GPS data for %s because no payload is available",
+                    dog_id,
+                )
+                continue
+            gps_payload = await self._modules.gps.async_get_data(dog_id)
+            geofencing_payload = await self._modules.geofencing.async_get_data(dog_id)
+
+            patched: paw_types.CoordinatorDogData = cast(
+                paw_types.CoordinatorDogData, dict(current)
             )
-            return
-        gps_payload = await self._modules.gps.async_get_data(dog_id)
-        geofencing_payload = await self._modules.geofencing.async_get_data(dog_id)
+            patched["gps"] = cast(paw_types.CoordinatorModuleState, gps_payload)
+            # `geofencing` is a derived payload that is executed whenever GPS is enabled.
+            patched["geofencing"] = cast(
+                paw_types.CoordinatorModuleState, geofencing_payload
+            )
+            self._data[dog_id] = patched
+            patched_any = True
 
-        patched: paw_types.CoordinatorDogData = cast(
-            paw_types.CoordinatorDogData, dict(current)
-        )
-        patched["gps"] = cast(paw_types.CoordinatorModuleState, gps_payload)
-        # `geofencing` is a derived payload that is executed whenever GPS is enabled.
-        patched["geofencing"] = cast(
-            paw_types.CoordinatorModuleState, geofencing_payload
-        )
+        if patched_any:
+            self.async_set_updated_data(dict(self._data))
 
-        self._data[dog_id] = patched
-        self.async_set_updated_data(dict(self._data))
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that fetches every module regardless of cadence."""
+        self._invalidate_module_schedule()
+        await super().async_request_refresh()
+
+    def _invalidate_module_schedule(
+        self,
+        dog_ids: Sequence[str] | None = None,
+    ) -> None:
+        """Make every module due on the next cycle for ``dog_ids`` (or all)."""
+        scheduler = getattr(self, "_module_scheduler", None)
+        if scheduler is not None:
+            scheduler.invalidate(dog_ids)
 
     async def async_request_selective_refresh(
         self,
@@ -627,6 +719,12 @@ class PawControlCoordinator(
 
         if self._last_cycle is not None:
             snapshot["last_cycle"] = self._last_cycle.to_dict()
+        scoped_listeners = getattr(self, "_scoped_listeners", None)
+        if scoped_listeners is not None:
+            snapshot["listener_fanout"] = scoped_listeners.get_stats()
+        module_scheduler = getattr(self, "_module_scheduler", None)
+        if module_scheduler is not None:
+            snapshot["module_cadence"] = module_scheduler.as_diagnostics()
         return snapshot
 
     def get_security_scorecard(self) -> paw_types.CoordinatorSecurityScorecard:
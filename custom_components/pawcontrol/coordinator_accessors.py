@@ -1,7 +1,8 @@
 """Shared data accessor helpers for the PawControl coordinator."""
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Literal, TypeGuard, cast, overload
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypeGuard, cast, overload
 
 from .types import (
     CoordinatorDataPayload,
@@ -22,11 +23,68 @@ if TYPE_CHECKING:  # pragma: no cover - import for typing only
     from .coordinator_support import DogConfigRegistry
 
 
+class DogSnapshot(NamedTuple):
+    """Read-only view of a dog payload tagged with its publication version."""
+
+    version: int
+    data: CoordinatorDogData
+
+
+class DogSnapshotIndex:
+    """Assign versions to published dog payloads without copying module data.
+
+    Coordinator updates replace a dog's payload object whenever any of its
+    modules change, so payload identity is enough to detect a new publication.
+    Each new payload receives a fresh, globally increasing version and a
+    read-only view that readers may hold on to across calls. The top level and
+    every nested mapping (``dog_info`` and the module payloads) are exposed
+    through read-only proxies; containers nested deeper inside a module are
+    shared with the coordinator and must not be mutated.
+    """
+
+    __slots__ = ("_entries", "_version")
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self._entries: dict[str, tuple[object, DogSnapshot]] = {}
+        self._version = 0
+
+    def resolve(self, dog_id: str, payload: CoordinatorDogData) -> DogSnapshot:
+        """Return the snapshot for ``payload``, versioning it when new."""
+        entry = self._entries.get(dog_id)
+        if entry is not None and entry[0] is payload:
+            return entry[1]
+        self._version += 1
+        frozen = {
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in payload.items()
+        }
+        snapshot = DogSnapshot(
+            self._version,
+            cast(CoordinatorDogData, MappingProxyType(frozen)),
+        )
+        self._entries[dog_id] = (payload, snapshot)
+        return snapshot
+
+
+def resolve_dog_snapshot(coordinator: object, dog_id: str) -> DogSnapshot | None:
+    """Return ``coordinator``'s versioned dog snapshot when it publishes one."""
+    getter = getattr(coordinator, "get_dog_snapshot", None)
+    if not callable(getter):
+        return None
+    try:
+        snapshot = getter(dog_id)
+    except (AttributeError, TypeError):
+        return None
+    return snapshot if isinstance(snapshot, DogSnapshot) else None
+
+
 class CoordinatorDataAccessMixin:
     """Provide read helpers for coordinator managed state."""
 
     registry: DogConfigRegistry
     _data: CoordinatorDataPayload
+    _snapshot_index: DogSnapshotIndex
     runtime_managers: CoordinatorRuntimeManagers
 
     def get_dog_config(self, dog_id: str) -> DogConfigData | None:
@@ -45,6 +103,21 @@ class CoordinatorDataAccessMixin:
         """Return the cached runtime payload for a dog."""
         return self._data.get(dog_id)
 
+    def get_dog_snapshot(self, dog_id: str) -> DogSnapshot | None:
+        """Return a versioned, read-only view of the dog's payload.
+
+        The top level and the nested module mappings are read-only proxies
+        over the coordinator payload; callers must copy before modifying.
+        """
+        payload = self._data.get(dog_id)
+        if not isinstance(payload, Mapping):
+            return None
+        index: DogSnapshotIndex | None = getattr(self, "_snapshot_index", None)
+        if index is None:
+            index = DogSnapshotIndex()
+            self._snapshot_index = index
+        return index.resolve(dog_id, payload)
+
     @overload
     def get_module_data(
         self,
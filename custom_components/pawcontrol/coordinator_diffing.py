@@ -8,12 +8,13 @@ Home Assistant: 2025.9.0+
 Python: 3.13+
 """
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from itertools import count
 import logging
-from typing import Any, TypeVar
+from typing import Any, NamedTuple, TypeVar
 
-from .types import CoordinatorDataPayload, CoordinatorDogData
+from .types import CoordinatorDataPayload, CoordinatorDogData, ScopedListenerStats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -328,7 +329,9 @@ def compute_coordinator_diff(
         old_dog = old_data.get(dog_id)
         new_dog = new_data.get(dog_id)
         # Fast-path unchanged dog payloads to avoid per-module recursive diffing.
-        if old_dog == new_dog:
+        # Partial updates reuse untouched dog payloads, so identity is the
+        # common case and avoids walking their contents entirely.
+        if old_dog is new_dog or old_dog == new_dog:
             continue
         dog_diffs[dog_id] = compute_dog_diff(dog_id, old_dog, new_dog)
 
@@ -509,6 +512,124 @@ class SmartDiffTracker:
         return frozenset(entity_keys)
 
 
+class ListenerScope(NamedTuple):
+    """Coordinator listener context limiting updates to one dog or module.
+
+    Passing a ``ListenerScope`` as the ``context`` of
+    ``PawControlCoordinator.async_add_listener`` subscribes the callback to
+    changes of ``dog_id`` only; ``module`` narrows it further to one module
+    payload.  ``module=None`` matches any change for the dog.
+    """
+
+    dog_id: str
+    module: str | None = None
+
+
+class ScopedListenerRegistry:
+    """Fan out coordinator diffs to listeners keyed by ``(dog_id, module)``.
+
+    Examples:
+        >>> registry = ScopedListenerRegistry()
+        >>> remove = registry.add(ListenerScope("buddy", "gps"), on_gps_update)
+        >>> registry.dispatch(tracker.update(new_data))
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._listeners: dict[
+            str,
+            dict[str | None, dict[int, Callable[[], None]]],
+        ] = {}
+        self._tokens = count()
+        self._size = 0
+        self._dispatches = 0
+        self._notified = 0
+        self._skipped = 0
+
+    def __len__(self) -> int:
+        """Return the number of registered listeners."""
+        return self._size
+
+    def add(
+        self,
+        scope: ListenerScope,
+        update_callback: Callable[[], None],
+    ) -> Callable[[], None]:
+        """Register ``update_callback`` for ``scope`` and return a remover."""
+        token = next(self._tokens)
+        self._listeners.setdefault(scope.dog_id, {}).setdefault(scope.module, {})[
+            token
+        ] = update_callback
+        self._size += 1
+
+        def _remove() -> None:
+            modules = self._listeners.get(scope.dog_id)
+            if modules is None:
+                return
+            callbacks = modules.get(scope.module)
+            if callbacks is None or callbacks.pop(token, None) is None:
+                return
+            self._size -= 1
+            if not callbacks:
+                del modules[scope.module]
+                if not modules:
+                    del self._listeners[scope.dog_id]
+
+        return _remove
+
+    def dispatch(self, diff: CoordinatorDataDiff, *, force: bool = False) -> int:
+        """Invoke listeners affected by ``diff`` and return how many ran.
+
+        Args:
+            diff: Coordinator diff describing the update
+            force: Notify every listener regardless of the diff, e.g. when
+                coordinator availability changed
+
+        Returns:
+            Number of listeners invoked
+        """
+        targets: list[Callable[[], None]] = []
+        if force:
+            for modules in self._listeners.values():
+                for callbacks in modules.values():
+                    targets.extend(callbacks.values())
+        elif diff.has_changes:
+            for dog_id in diff.changed_dogs:
+                modules = self._listeners.get(dog_id)
+                if not modules:
+                    continue
+                dog_diff = diff.dog_diffs.get(dog_id)
+                whole_dog = (
+                    dog_diff is None
+                    or dog_id in diff.added_dogs
+                    or dog_id in diff.removed_dogs
+                )
+                changed_modules = (
+                    frozenset() if dog_diff is None else dog_diff.changed_modules
+                )
+                for module, callbacks in modules.items():
+                    if whole_dog or module is None or module in changed_modules:
+                        targets.extend(callbacks.values())
+
+        self._dispatches += 1
+        self._notified += len(targets)
+        self._skipped += self._size - len(targets)
+        for update_callback in targets:
+            update_callback()
+        return len(targets)
+
+    def get_stats(self) -> ScopedListenerStats:
+        """Return fan-out counters for diagnostics."""
+        return {
+            "listeners": self._size,
+            "dogs": len(self._listeners),
+            "dispatches": self._dispatches,
+            "notified": self._notified,
+            "skipped": self._skipped,
+        }
+
+
 def get_changed_fields(
     diff: DataDiff,
     *,
@@ -8,7 +8,8 @@ from datetime import UTC, datetime
 import logging
 from statistics import fmean
 import time
-from typing import cast
+from types import MappingProxyType
+from typing import Final, cast
 
 from .exceptions import ConfigEntryAuthFailed, UpdateFailed
 
@@ -44,6 +45,8 @@ from .types import (
     CoordinatorTypedModuleName,
     EntityBudgetSummary,
     ModuleAdapterPayload,
+    ModuleCadenceDiagnostics,
+    ModuleCadenceStats,
     ensure_dog_modules_mapping,
 )
 
@@ -241,6 +244,141 @@ class AdaptivePollingController:
         return diagnostics
 
 
+@dataclass(frozen=True, slots=True)
+class ModuleCadence:
+    """Refresh interval bounds for one coordinator module, in seconds."""
+
+    min_interval: float
+    max_interval: float
+
+
+DEFAULT_MODULE_CADENCES: Final[Mapping[CoordinatorTypedModuleName, ModuleCadence]] = (
+    MappingProxyType({
+        "gps": ModuleCadence(0.0, 0.0),
+        "geofencing": ModuleCadence(0.0, 0.0),
+        "walk": ModuleCadence(0.0, 60.0),
+        "feeding": ModuleCadence(0.0, 300.0),
+        "health": ModuleCadence(300.0, 1800.0),
+        "garden": ModuleCadence(300.0, 1800.0),
+        "weather": ModuleCadence(600.0, 1800.0),
+    })
+)
+# First back-off step for modules whose minimum cadence is every cycle.
+_CADENCE_BACKOFF_SEED: Final[float] = 30.0
+# Modules due within this share of their interval count as due, so jitter in
+# the coordinator timer does not postpone them by a whole cycle.
+_CADENCE_DUE_SLACK: Final[float] = 0.1
+
+
+@dataclass(slots=True)
+class _ModuleSchedule:
+    interval: float
+    next_due: float
+
+
+class ModuleRefreshScheduler:
+    """Track when each (dog, module) pair is next due for a refresh.
+
+    Modules refresh at their minimum cadence while their payload keeps
+    changing.  Every unchanged or failed fetch doubles the interval up to the
+    module's maximum, and a changed payload snaps it back to the minimum.
+    Pairs without a schedule - new dogs, or after :meth:`invalidate` - are
+    always due.
+    """
+
+    __slots__ = ("_cadences", "_fetches", "_schedules", "_skipped")
+
+    def __init__(
+        self,
+        cadences: Mapping[CoordinatorTypedModuleName, ModuleCadence] | None = None,
+    ) -> None:
+        """Initialise the scheduler with per-module cadence bounds."""
+        self._cadences = dict(DEFAULT_MODULE_CADENCES if cadences is None else cadences)
+        self._schedules: dict[tuple[str, str], _ModuleSchedule] = {}
+        self._fetches: dict[str, int] = {}
+        self._skipped: dict[str, int] = {}
+
+    def is_due(
+        self,
+        dog_id: str,
+        module: CoordinatorTypedModuleName,
+        now: float,
+    ) -> bool:
+        """Return True when ``module`` should be fetched for ``dog_id``."""
+        schedule = self._schedules.get((dog_id, module))
+        if schedule is None or now >= schedule.next_due - (
+            schedule.interval * _CADENCE_DUE_SLACK
+        ):
+            return True
+        self._skipped[module] = self._skipped.get(module, 0) + 1
+        return False
+
+    def record(
+        self,
+        dog_id: str,
+        module: CoordinatorTypedModuleName,
+        *,
+        changed: bool,
+        now: float,
+    ) -> None:
+        """Record a fetch and schedule the next one.
+
+        ``changed`` is False for unchanged payloads and failed fetches, which
+        both back the module off.
+        """
+        self._fetches[module] = self._fetches.get(module, 0) + 1
+        cadence = self._cadences.get(module)
+        if cadence is None:
+            return
+        key = (dog_id, module)
+        schedule = self._schedules.get(key)
+        if changed or schedule is None:
+            interval = cadence.min_interval
+        else:
+            interval = min(
+                cadence.max_interval,
+                max(schedule.interval * 2, _CADENCE_BACKOFF_SEED),
+            )
+        if schedule is None:
+            self._schedules[key] = _ModuleSchedule(interval, now + interval)
+        else:
+            schedule.interval = interval
+            schedule.next_due = now + interval
+
+    def invalidate(self, dog_ids: Iterable[str] | None = None) -> None:
+        """Make every module due again, optionally only for ``dog_ids``."""
+        if dog_ids is None:
+            self._schedules.clear()
+            return
+        targets = set(dog_ids)
+        for key in [key for key in self._schedules if key[0] in targets]:
+            del self._schedules[key]
+
+    def as_diagnostics(self) -> ModuleCadenceDiagnostics:
+        """Return effective cadences and skipped fetch counts per module."""
+        intervals: dict[str, list[float]] = {}
+        for (_dog_id, module), schedule in self._schedules.items():
+            intervals.setdefault(module, []).append(schedule.interval)
+        modules: dict[str, ModuleCadenceStats] = {}
+        for module, cadence in self._cadences.items():
+            tracked = intervals.get(module, [])
+            modules[module] = {
+                "min_interval_s": cadence.min_interval,
+                "max_interval_s": cadence.max_interval,
+                "effective_interval_s": round(fmean(tracked), 3)
+                if tracked
+                else cadence.min_interval,
+                "tracked_dogs": len(tracked),
+                "fetches": self._fetches.get(module, 0),
+                "skipped": self._skipped.get(module, 0),
+            }
+        return {
+            "modules": modules,
+            "fetches": sum(self._fetches.values()),
+            "skipped": sum(self._skipped.values()),
+        }
+
+
 @dataclass(slots=True)
 class RuntimeCycleInfo:
     """Summary of a coordinator update cycle."""
@@ -318,8 +456,12 @@ class CoordinatorRuntime:
         metrics: CoordinatorMetrics,
         adaptive_polling: AdaptivePollingController,
         logger: logging.Logger,
+        scheduler: ModuleRefreshScheduler | None = None,
     ) -> None:
-        """Initialise the runtime executor with all required collaborators."""
+        """Initialise the runtime executor with all required collaborators.
+
+        Without a ``scheduler`` every enabled module is fetched every cycle.
+        """
         self._registry = registry
         self._modules = modules
         self._resilience = resilience_manager
@@ -327,6 +469,7 @@ class CoordinatorRuntime:
         self._metrics = metrics
         self._adaptive_polling = adaptive_polling
         self._logger = logger
+        self._scheduler = scheduler
 
     async def execute_cycle(
         self,
@@ -349,6 +492,7 @@ class CoordinatorRuntime:
                 result = await self._resilience.execute_with_resilience(
                     self._fetch_dog_data,
                     dog_id,
+                    previous=current_data.get(dog_id),
                     circuit_breaker_name=f"dog_data_{dog_id}",
                     retry_config=self._retry,
                 )
@@ -447,7 +591,15 @@ class CoordinatorRuntime:
             success=success,
         )
 
-    async def _fetch_dog_data(self, dog_id: str) -> CoordinatorDogData:
+    async def _fetch_dog_data(
+        self,
+        dog_id: str,
+        previous: CoordinatorDogData | None = None,
+    ) -> CoordinatorDogData:
+        """Fetch the due module payloads for ``dog_id``.
+
+        Modules the scheduler skips keep their payload from ``previous``.
+        """
         async with asyncio.timeout(API_TIMEOUT):
             dog_config = self._registry.get(dog_id)
             if not dog_config:
@@ -464,11 +616,35 @@ class CoordinatorRuntime:
             }
 
             modules = ensure_dog_modules_mapping(dog_config)
-            module_tasks: list[CoordinatorModuleTask] = self._modules.build_tasks(
-                dog_id,
-                modules,
-            )
+            scheduler = self._scheduler
+            now = time.monotonic()
+            carried: list[CoordinatorTypedModuleName] = []
+            if scheduler is None or previous is None:
+                module_tasks: list[CoordinatorModuleTask] = self._modules.build_tasks(
+                    dog_id,
+                    modules,
+                )
+            else:
+                cached = previous
+
+                def is_due(module: CoordinatorTypedModuleName) -> bool:
+                    if module in cached and not scheduler.is_due(dog_id, module, now):
+                        payload[module] = cached[module]
+                        carried.append(module)
+                        return False
+                    return True
+
+                module_tasks = self._modules.build_tasks(
+                    dog_id,
+                    modules,
+                    include=is_due,
+                )
             if not module_tasks:
+                if carried:
+                    payload["status_snapshot"] = build_dog_status_snapshot(
+                        dog_id,
+                        payload,
+                    )
                 return payload
 
             results = await asyncio.gather(
@@ -478,6 +654,14 @@ class CoordinatorRuntime:
 
             for task, result in zip(module_tasks, results, strict=True):
                 module_name: CoordinatorTypedModuleName = task.module
+                if scheduler is not None:
+                    scheduler.record(
+                        dog_id,
+                        module_name,
+                        changed=not isinstance(result, Exception)
+                        and (previous is None or previous.get(module_name) != result),
+                        now=now,
+                    )
                 if isinstance(result, GPSUnavailableError):
                     self._logger.debug(
                         "GPS unavailable for %s: %s",
@@ -32,7 +32,12 @@ from .coordinator_tasks import (
     merge_rejection_metric_values,
 )
 from .dashboard_renderer import DashboardRenderer
-from .dashboard_shared import coerce_dog_config, coerce_dog_configs, unwrap_async_result
+from .dashboard_shared import (
+    coerce_dog_config,
+    coerce_dog_configs,
+    dashboard_fingerprint,
+    unwrap_async_result,
+)
 from .dashboard_templates import DashboardTemplates
 from .runtime_data import get_runtime_data
 from .service_guard import normalise_guard_history
@@ -186,6 +191,27 @@ class DashboardPerformanceReport(TypedDict, total=False):
 _TrackedResultT = TypeVar("_TrackedResultT")
 
 
+def _serialise_dashboard_file(
+    config: JSONMutableMapping,
+    previous_digest: str | None,
+    path: Path | None = None,
+    updated: str | None = None,
+) -> tuple[str, str | None]:
+    """Return the digest of ``config`` and the file JSON, unless unchanged.
+
+    Runs in the executor.  The ``updated`` timestamp is excluded from the
+    digest so re-rendering identical content does not count as a change; the
+    JSON is ``None`` when the digest matches ``previous_digest`` and ``path``
+    still exists.
+    """
+    digest = dashboard_fingerprint(config)
+    if digest == previous_digest and path is not None and path.exists():
+        return digest, None
+    file_config = {**config, "updated": updated} if updated is not None else config
+    payload = {"data": {"config": file_config}}
+    return digest, json.dumps(payload, indent=2, ensure_ascii=False)
+
+
 class PawControlDashboardGenerator:
     """Performance-optimized dashboard generator.
 
@@ -210,6 +236,9 @@ class PawControlDashboardGenerator:
             minor_version=1,  # Allow minor version updates
         )
 
+        # Digest of the dashboard content last written to each file path
+        self._file_digests: dict[str, str] = {}
+
         # OPTIMIZED: Renderer with resource pooling
         self._renderer = DashboardRenderer(hass)
 
@@ -890,29 +919,26 @@ class PawControlDashboardGenerator:
         dashboard_file = storage_dir / f"lovelace.{url_path}"
 
         # OPTIMIZED: Build complete dashboard data structure
-        dashboard_data = {
-            "data": {
-                "config": {
-                    "title": title,
-                    "icon": icon,
-                    "path": url_path,
-                    "require_admin": False,
-                    "show_in_sidebar": show_in_sidebar,
-                    "views": list(config.get("views", [])),
-                },
-            },
+        dashboard_config: JSONMutableMapping = {
+            "title": title,
+            "icon": icon,
+            "path": url_path,
+            "require_admin": False,
+            "show_in_sidebar": show_in_sidebar,
+            "views": cast(JSONValue, list(config.get("views", []))),
         }
 
-        # OPTIMIZED: Async file writing with proper encoding
+        # OPTIMIZED: Serialise in the executor, then write asynchronously
         try:
+            digest, json_str = await self.hass.async_add_executor_job(
+                _serialise_dashboard_file,
+                dashboard_config,
+                None,
+            )
             async with aiofiles.open(dashboard_file, "w", encoding="utf-8") as f:
-                json_str = json.dumps(
-                    dashboard_data,
-                    indent=2,
-                    ensure_ascii=False,
-                )
-                await f.write(json_str)
+                await f.write(cast(str, json_str))
 
+            self._file_digests[str(dashboard_file)] = digest
             self._performance_metrics["file_operations"] += 1
             return dashboard_file
         except Exception as err:
@@ -1245,32 +1271,33 @@ class PawControlDashboardGenerator:
                         dashboard_url,
                     )
                     return False
-                # OPTIMIZED: Async file update
+                # OPTIMIZED: Async file update, skipped when content is unchanged
                 dashboard_path = Path(dashboard_info["path"])
-                await self._update_dashboard_file_async(
+                written = await self._update_dashboard_file_async(
                     dashboard_path,
                     dashboard_config_payload,
                     cast(JSONMutableMapping, dict(dashboard_info)),
                 )
 
-                # Update metadata
-                view_summaries = self._summarise_dashboard_views(
-                    dashboard_config_payload,
-                )
-
-                async with self._lock:
-                    dashboard_info["updated"] = dt_util.utcnow().isoformat()
-                    dashboard_info["views"] = view_summaries
-                    dashboard_info["has_notifications_view"] = (
-                        self._has_notifications_view(view_summaries)
+                # Update metadata; unchanged content leaves it as stored
+                if written or options is not None:
+                    view_summaries = self._summarise_dashboard_views(
+                        dashboard_config_payload,
                     )
 
-                    if options is not None:
-                        dashboard_info["options"] = self._copy_dashboard_options(
-                            options_merged,
+                    async with self._lock:
+                        dashboard_info["updated"] = dt_util.utcnow().isoformat()
+                        dashboard_info["views"] = view_summaries
+                        dashboard_info["has_notifications_view"] = (
+                            self._has_notifications_view(view_summaries)
                         )
 
-                    await self._save_dashboard_metadata_async()
+                        if options is not None:
+                            dashboard_info["options"] = self._copy_dashboard_options(
+                                options_merged
+                            )
+
+                        await self._save_dashboard_metadata_async()
                 update_time = self._monotonic_time() - start_time
                 await self._update_performance_metrics("update", update_time)
 
@@ -1296,37 +1323,45 @@ class PawControlDashboardGenerator:
         dashboard_path: Path,
         dashboard_config: DashboardRenderResult,
         dashboard_info: JSONMutableMapping,
-    ) -> None:
-        """Update dashboard file with async operations."""
-        dashboard_data = {
-            "data": {
-                "config": {
-                    "title": cast(str, dashboard_info["title"]),
-                    "icon": cast(
-                        str,
-                        dashboard_info.get("icon", DEFAULT_DASHBOARD_ICON),
-                    ),
-                    "path": cast(str, dashboard_info["url"]),
-                    "require_admin": False,
-                    "show_in_sidebar": bool(
-                        dashboard_info.get("show_in_sidebar", True),
-                    ),
-                    "views": list(dashboard_config.get("views", [])),
-                    "updated": dt_util.utcnow().isoformat(),
-                },
-            },
+    ) -> bool:
+        """Update dashboard file with async operations.
+
+        Returns ``False`` without touching the file when the rendered content
+        hashes to the digest last written to ``dashboard_path``.
+        """
+        config_payload: JSONMutableMapping = {
+            "title": cast(str, dashboard_info["title"]),
+            "icon": cast(
+                str,
+                dashboard_info.get("icon", DEFAULT_DASHBOARD_ICON),
+            ),
+            "path": cast(str, dashboard_info["url"]),
+            "require_admin": False,
+            "show_in_sidebar": bool(
+                dashboard_info.get("show_in_sidebar", True),
+            ),
+            "views": cast(JSONValue, list(dashboard_config.get("views", []))),
         }
+        digest_key = str(dashboard_path)
 
         try:
+            digest, json_str = await self.hass.async_add_executor_job(
+                _serialise_dashboard_file,
+                config_payload,
+                self._file_digests.get(digest_key),
+                dashboard_path,
+                dt_util.utcnow().isoformat(),
+            )
+            if json_str is None:
+                self._performance_metrics["cache_hits"] += 1
+                return False
             async with aiofiles.open(dashboard_path, "w", encoding="utf-8") as f:
-                json_str = json.dumps(
-                    dashboard_data,
-                    indent=2,
-                    ensure_ascii=False,
-                )
                 await f.write(json_str)
 
+            self._file_digests[digest_key] = digest
+            self._performance_metrics["cache_misses"] += 1
             self._performance_metrics["file_operations"] += 1
+            return True
         except Exception as err:
             raise HomeAssistantError(
                 f"Dashboard file update failed: {err}",
@@ -1352,6 +1387,7 @@ class PawControlDashboardGenerator:
 
                 # Remove from registry
                 del self._dashboards[dashboard_url]
+                self._file_digests.pop(str(dashboard_path), None)
                 await self._save_dashboard_metadata_async()
 
                 _LOGGER.info("Deleted dashboard %s", dashboard_url)
@@ -11,6 +11,7 @@ Python: 3.13+
 
 import asyncio
 from collections.abc import Awaitable, Callable, Sequence
+import copy
 from functools import partial
 import json
 import logging
@@ -39,7 +40,12 @@ from .dashboard_cards import (
     OverviewCardGenerator,
     StatisticsCardGenerator,
 )
-from .dashboard_shared import coerce_dog_config, coerce_dog_configs, unwrap_async_result
+from .dashboard_shared import (
+    coerce_dog_config,
+    coerce_dog_configs,
+    dashboard_fingerprint,
+    unwrap_async_result,
+)
 from .dashboard_templates import DashboardTemplates
 from .types import (
     DOG_ID_FIELD,
@@ -52,6 +58,7 @@ from .types import (
     DashboardRendererStatistics,
     DashboardRenderJobConfig,
     DashboardRenderResult,
+    DashboardViewCacheStats,
     DogConfigData,
     HelperManagerGuardMetrics,
     JSONMapping,
@@ -69,6 +76,12 @@ MAX_CONCURRENT_RENDERS = 3
 RENDER_TIMEOUT_SECONDS = 30
 MAX_CARDS_PER_BATCH = 50
 
+# Rendered dog views are reused while their inputs hash identically.  Cards
+# also depend on which entities are available, so cached views expire on the
+# same schedule as the card generators' entity validation cache.
+VIEW_CACHE_TTL_SECONDS = 300
+MAX_CACHED_VIEWS = 128
+
 
 RenderJobType = Literal["main_dashboard", "dog_dashboard"]
 
@@ -144,6 +157,14 @@ class DashboardRenderer:
         self._active_jobs: dict[str, DashboardRenderJobState] = {}
         self._job_counter = 0
 
+        # Content-addressed caches: fingerprint -> (rendered at, dog view) and
+        # file path -> digest of the dashboard last written there.
+        self._view_cache: dict[str, tuple[float, LovelaceViewConfig]] = {}
+        self._view_cache_hits = 0
+        self._view_cache_misses = 0
+        self._file_digests: dict[str, str] = {}
+        self._skipped_writes = 0
+
     @staticmethod
     def _ensure_dog_config(dog_config: RawDogConfig) -> DogConfigData | None:
         """Return a typed dog configuration for downstream rendering."""
@@ -598,6 +619,15 @@ class DashboardRenderer:
         # Get theme colors (cycling through available themes)
         theme_colors = self._get_dog_theme(index)
 
+        fingerprint = dashboard_fingerprint([dog_config, theme_colors, options])
+        now = time.monotonic()
+        cached = self._view_cache.get(fingerprint)
+        if cached is not None and now - cached[0] < VIEW_CACHE_TTL_SECONDS:
+            self._view_cache_hits += 1
+            # Callers may edit cards in place; never hand out the cached ones.
+            return copy.deepcopy(cached[1])
+        self._view_cache_misses += 1
+
         # Generate dog cards
         cards = await self.dog_generator.generate_dog_overview_cards(
             dog_config,
@@ -612,8 +642,24 @@ class DashboardRenderer:
             "theme": options.get("theme", "default"),
             "cards": cards,
         }
+        if cards:
+            # Failed card generation yields no cards; retry it next time.
+            self._store_cached_view(fingerprint, now, copy.deepcopy(view_config))
         return view_config
 
+    def _store_cached_view(
+        self,
+        fingerprint: str,
+        rendered_at: float,
+        view_config: LovelaceViewConfig,
+    ) -> None:
+        """Cache ``view_config`` under ``fingerprint``, evicting the oldest."""
+        cache = self._view_cache
+        cache.pop(fingerprint, None)
+        cache[fingerprint] = (rendered_at, view_config)
+        while len(cache) > MAX_CACHED_VIEWS:
+            del cache[next(iter(cache))]
+
     def _get_dog_theme(self, index: int) -> dict[str, str]:
         """Get theme colors for dog based on index.
 
@@ -918,18 +964,35 @@ class DashboardRenderer:
         dashboard_config: DashboardRenderResult,
         file_path: Path,
         metadata: JSONMutableMapping | None = None,
-    ) -> None:
+    ) -> bool:
         """Write dashboard configuration to file asynchronously.
 
+        Serialisation runs in the executor.  When the payload hashes to the
+        digest last written to ``file_path`` and the file still exists, the
+        write is skipped.
+
         Args:
             dashboard_config: Dashboard configuration
             file_path: Path to write file
             metadata: Optional metadata to include
 
+        Returns:
+            True if the file was written, False if it was already up to date
+
         Raises:
             HomeAssistantError: If file write fails
         """
 
+        def _serialise_if_changed(
+            payload: JSONMutableMapping,
+            previous_digest: str | None,
+        ) -> tuple[str, str | None]:
+            """Return the payload digest and its JSON unless it is unchanged."""
+            digest = dashboard_fingerprint(payload)
+            if digest == previous_digest and file_path.exists():
+                return digest, None
+            return digest, json.dumps(payload, indent=2, ensure_ascii=False)
+
         def _replace_with_retry(source: Path, destination: Path) -> None:
             """Atomically replace destination with retry and copy fallback."""
             for _ in range(3):
@@ -990,6 +1053,17 @@ class DashboardRenderer:
                 },
             )
 
+            digest_key = str(file_path)
+            digest, content = await self.hass.async_add_executor_job(
+                _serialise_if_changed,
+                dashboard_data,
+                self._file_digests.get(digest_key),
+            )
+            if content is None:
+                self._skipped_writes += 1
+                _LOGGER.debug("Dashboard file unchanged, write skipped: %s", file_path)
+                return False
+
             # Ensure parent directory exists without blocking the event loop
             await self.hass.async_add_executor_job(
                 partial(file_path.parent.mkdir, parents=True, exist_ok=True),
@@ -999,11 +1073,6 @@ class DashboardRenderer:
                 return file_path.parent / (f".{file_path.stem}.{uuid4().hex}.tmp")
 
             temp_path = await self.hass.async_add_executor_job(_create_temp_path)
-            content = json.dumps(
-                dashboard_data,
-                indent=2,
-                ensure_ascii=False,
-            )
 
             def _write_temp_file(path: Path, payload: str) -> None:
                 path.write_text(payload, encoding="utf-8")
@@ -1020,7 +1089,9 @@ class DashboardRenderer:
                 file_path,
             )
             temp_path = None
+            self._file_digests[digest_key] = digest
             _LOGGER.debug("Dashboard file written: %s", file_path)
+            return True
         except Exception as err:
             if temp_path is not None:
                 await self.hass.async_add_executor_job(
@@ -1052,6 +1123,8 @@ class DashboardRenderer:
         for job in self._active_jobs.values():
             job.status = "cancelled"
         self._active_jobs.clear()
+        self._view_cache.clear()
+        self._file_digests.clear()
 
         # Clean up templates
         await self.templates.cleanup()
@@ -1065,10 +1138,17 @@ class DashboardRenderer:
         active_jobs = len(self._active_jobs)
         template_stats = self.templates.get_cache_stats()
 
+        view_cache_stats: DashboardViewCacheStats = {
+            "cached_views": len(self._view_cache),
+            "hits": self._view_cache_hits,
+            "misses": self._view_cache_misses,
+            "skipped_writes": self._skipped_writes,
+        }
         render_stats: DashboardRendererStatistics = {
             "active_jobs": active_jobs,
             "total_jobs_processed": self._job_counter,
             "template_cache": template_stats,
+            "view_cache": view_cache_stats,
         }
         return render_stats
 
@@ -2,6 +2,8 @@
 
 import asyncio
 from collections.abc import Mapping, Sequence
+import hashlib
+import json
 import logging
 from typing import TypeVar, cast
 
@@ -21,6 +23,7 @@ __all__ = [
     "CardConfig",
     "coerce_dog_config",
     "coerce_dog_configs",
+    "dashboard_fingerprint",
     "unwrap_async_result",
 ]
 
@@ -49,6 +52,22 @@ def coerce_dog_configs(dogs_config: Sequence[RawDogConfig]) -> list[DogConfigDat
     return typed
 
 
+def dashboard_fingerprint(payload: object) -> str:
+    """Return a stable content hash for a JSON-compatible dashboard payload.
+
+    Keys are sorted so equal payloads hash identically regardless of the order
+    in which their mappings were built.
+    """
+    encoded = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
 T = TypeVar("T")
 
 
@@ -18,7 +18,7 @@ import logging
 from math import isfinite
 from pathlib import Path
 import sys
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any, Final, NotRequired, TypedDict, TypeVar, cast
 
 from homeassistant.core import HomeAssistant
@@ -41,6 +41,8 @@ from .coordinator_support import (
     CoordinatorMetrics,
     CoordinatorModuleAdapter,
 )
+from .dog_storage import DogShardStore
+from .history_index import ModuleHistoryIndex
 from .module_adapters import (
     ModuleAdapterCacheError,
     ModuleAdapterCacheSnapshot,
@@ -73,6 +75,7 @@ from .types import (
     PawControlRuntimeData,
     RawDogConfig,
     StorageNamespaceDogSummary,
+    StorageNamespaceFlushStats,
     StorageNamespacePayload,
     StorageNamespaceSnapshot,
     StorageNamespaceStats,
@@ -92,6 +95,13 @@ from .utils import (  # type: ignore[attr-defined]
 _LOGGER = logging.getLogger(__name__)
 
 _STORAGE_FILENAME = "data.json"
+_SHARD_DIRECTORY_SUFFIX = "dogs"
+
+# Namespace writes are coalesced: a flush runs once updates stop arriving for
+# ``_NAMESPACE_FLUSH_DELAY`` seconds, but never later than
+# ``_NAMESPACE_FLUSH_MAX_LATENCY`` seconds after the first unflushed update.
+_NAMESPACE_FLUSH_DELAY: Final[float] = 2.0
+_NAMESPACE_FLUSH_MAX_LATENCY: Final[float] = 10.0
 
 _MODULE_HISTORY_ATTRS: Final[dict[str, tuple[str, str]]] = {
     MODULE_FEEDING: ("feeding_history", "timestamp"),
@@ -652,6 +662,12 @@ class _StorageNamespaceCacheMonitor:
             "dogs": len(per_dog),
             "entries": total_entries,
         }
+        flush_snapshot = getattr(self._manager, "_namespace_flush_snapshot", None)
+        flush_stats = flush_snapshot(self._namespace) if flush_snapshot else None
+        if flush_stats is not None:
+            stats["flushes"] = flush_stats["flushes"]
+            stats["bytes_written"] = flush_stats["bytes_written"]
+            stats["pending_flush"] = flush_stats["pending"]
 
         snapshot: StorageNamespaceSnapshot = {
             "namespace": self._label,
@@ -667,6 +683,8 @@ class _StorageNamespaceCacheMonitor:
 
         if timestamp_anomalies:
             diagnostics["timestamp_anomalies"] = timestamp_anomalies
+        if flush_stats is not None:
+            diagnostics["write_behind"] = cast(JSONMutableMapping, dict(flush_stats))
         return stats, snapshot, diagnostics
 
     def coordinator_snapshot(self) -> CacheDiagnosticsSnapshot:
@@ -706,6 +724,14 @@ def _deserialize_datetime(value: Any) -> datetime | None:
     return dt_util.as_utc(parsed)
 
 
+def _normalise_history_entry(entry: Mapping[str, Any]) -> JSONMutableMapping:
+    """Return the normalised JSON payload exposed for a history entry."""
+    payload = _coerce_json_mutable(
+        cast(JSONMappingLike | JSONMutableMapping, entry),
+    )
+    return cast(JSONMutableMapping, normalize_value(payload))
+
+
 def _utcnow() -> datetime:
     """Return the current UTC time honoring patched Home Assistant helpers."""
     module = sys.modules.get("homeassistant.util.dt")
@@ -954,6 +980,28 @@ class DogProfile:
             data["current_walk"] = _serialize_walk(self.current_walk)
         return data
 
+    def shard_state(self) -> dict[str, Any]:
+        """Return the live state handed to :class:`DogShardStore`.
+
+        History lists are passed by reference so the shard store can detect
+        appended entries without copying the full history.
+        """
+        return {
+            "config": self.config,
+            "daily_stats": self.daily_stats.as_dict(),
+            "current_walk": (
+                _serialize_walk(self.current_walk)
+                if self.current_walk is not None
+                else None
+            ),
+            "feeding_history": self.feeding_history,
+            "walk_history": self.walk_history,
+            "health_history": self.health_history,
+            "medication_history": self.medication_history,
+            "poop_history": self.poop_history,
+            "grooming_sessions": self.grooming_sessions,
+        }
+
 
 def _serialize_walk(walk: WalkData) -> JSONMutableMapping:
     """Serialise a :class:`WalkData` instance into JSON friendly data."""
@@ -990,8 +1038,14 @@ class PawControlDataManager:
         *,
         coordinator: Any | None = None,
         dogs_config: Sequence[RawDogConfig] | None = None,
+        namespace_flush_delay: float = _NAMESPACE_FLUSH_DELAY,
+        namespace_flush_max_latency: float = _NAMESPACE_FLUSH_MAX_LATENCY,
     ) -> None:
-        """Create a new data manager tied to ``entry_id`` and configuration."""
+        """Create a new data manager tied to ``entry_id`` and configuration.
+
+        ``namespace_flush_delay`` debounces namespace writes; ``0`` disables the
+        write-behind layer and persists every update immediately.
+        """
         self.hass = hass
         self._coordinator = coordinator
         typed_configs: dict[str, DogConfigData] = {}
@@ -1023,13 +1077,26 @@ class PawControlDataManager:
         self._backup_path = self._storage_path.with_suffix(
             self._storage_path.suffix + ".backup",
         )
+        self._shard_store = DogShardStore(
+            self._storage_dir / f"{self.entry_id}_{_SHARD_DIRECTORY_SUFFIX}",
+        )
 
         self._dog_profiles: dict[str, DogProfile] = {}
+        self._history_indexes: dict[tuple[str, str], ModuleHistoryIndex] = {}
         self._data_lock = asyncio.Lock()
-        self._save_lock = asyncio.Lock()
+        self._dog_save_locks: dict[str, asyncio.Lock] = {}
         self._initialised = False
         self._namespace_locks: dict[str, asyncio.Lock] = {}
         self._namespace_state: dict[str, StorageNamespacePayload] = {}
+        self._namespace_flush_delay = max(0.0, namespace_flush_delay)
+        self._namespace_flush_max_latency = max(
+            self._namespace_flush_delay,
+            namespace_flush_max_latency,
+        )
+        self._namespace_dirty_since: dict[str, float] = {}
+        self._namespace_flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._namespace_flush_tasks: set[asyncio.Task[None]] = set()
+        self._namespace_flush_stats: dict[str, StorageNamespaceFlushStats] = {}
         self._session_id_factory: Callable[
             [],
             str,
@@ -1090,6 +1157,10 @@ class PawControlDataManager:
                 data.pop(dog_id, None)
             else:
                 data[dog_id] = updated
+            if getattr(self, "_namespace_flush_delay", 0.0) > 0:
+                namespace_state[namespace] = cast(StorageNamespacePayload, data)
+                self._schedule_namespace_flush(namespace)
+                return updated
             try:
                 await self._save_namespace(namespace, data)
             except Exception:
@@ -1099,6 +1170,124 @@ class PawControlDataManager:
                 raise
             return updated
 
+    def _schedule_namespace_flush(
+        self,
+        namespace: str,
+        *,
+        retry: bool = False,
+    ) -> None:
+        """Debounce a write of ``namespace`` within the max-latency bound."""
+        now = monotonic()
+        dirty_since = self._namespace_dirty_since.setdefault(namespace, now)
+        stats = self._namespace_flush_stats_for(namespace)
+        handle = self._namespace_flush_handles.pop(namespace, None)
+        if handle is not None:
+            handle.cancel()
+            stats["coalesced_writes"] += 1
+
+        delay = self._namespace_flush_delay
+        if not retry:
+            deadline = dirty_since + self._namespace_flush_max_latency
+            delay = min(delay, max(0.0, deadline - now))
+        self._namespace_flush_handles[namespace] = (
+            asyncio.get_running_loop().call_later(
+                delay,
+                self._start_namespace_flush,
+                namespace,
+            )
+        )
+
+    def _start_namespace_flush(self, namespace: str) -> None:
+        """Timer callback spawning the background flush for ``namespace``."""
+        self._namespace_flush_handles.pop(namespace, None)
+        task = asyncio.create_task(self._async_background_flush(namespace))
+        self._namespace_flush_tasks.add(task)
+        task.add_done_callback(self._namespace_flush_tasks.discard)
+
+    async def _async_background_flush(self, namespace: str) -> None:
+        """Flush ``namespace`` and reschedule when persisting fails."""
+        try:
+            await self._async_flush_namespace(namespace)
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Deferred write of PawControl %s data failed, retrying: %s",
+                namespace,
+                err,
+            )
+            self._schedule_namespace_flush(namespace, retry=True)
+
+    async def _async_flush_namespace(self, namespace: str) -> None:
+        """Write ``namespace`` to disk if it has unflushed updates."""
+        handle = self._namespace_flush_handles.pop(namespace, None)
+        if handle is not None:
+            handle.cancel()
+        async with self._get_namespace_lock(namespace):
+            dirty_since = self._namespace_dirty_since.pop(namespace, None)
+            if dirty_since is None:
+                return
+            try:
+                await self._save_namespace(
+                    namespace,
+                    self._namespace_state.get(namespace, {}),
+                )
+            except HomeAssistantError:
+                self._namespace_dirty_since[namespace] = dirty_since
+                self._namespace_flush_stats_for(namespace)["errors"] += 1
+                raise
+
+    async def async_flush_namespaces(self) -> None:
+        """Force all pending namespace writes to disk."""
+        dirty = getattr(self, "_namespace_dirty_since", None)
+        if not dirty:
+            return
+        errors: list[str] = []
+        for namespace in list(dirty):
+            try:
+                await self._async_flush_namespace(namespace)
+            except HomeAssistantError:
+                errors.append(namespace)
+        if errors:
+            raise HomeAssistantError(
+                f"Unable to flush PawControl namespaces: {', '.join(errors)}",
+            )
+
+    def _namespace_flush_stats_for(
+        self,
+        namespace: str,
+    ) -> StorageNamespaceFlushStats:
+        """Return the mutable write-behind counters for ``namespace``."""
+        stats_map = getattr(self, "_namespace_flush_stats", None)
+        if stats_map is None:
+            stats_map = {}
+            self._namespace_flush_stats = stats_map
+        stats = stats_map.get(namespace)
+        if stats is None:
+            stats = {
+                "flushes": 0,
+                "bytes_written": 0,
+                "coalesced_writes": 0,
+                "errors": 0,
+                "pending": False,
+            }
+            stats_map[namespace] = stats
+        return stats
+
+    def _namespace_flush_snapshot(
+        self,
+        namespace: str,
+    ) -> StorageNamespaceFlushStats:
+        """Return a copy of the write-behind counters for ``namespace``."""
+        snapshot = cast(
+            StorageNamespaceFlushStats,
+            dict(self._namespace_flush_stats_for(namespace)),
+        )
+        snapshot["pending"] = namespace in getattr(
+            self,
+            "_namespace_dirty_since",
+            {},
+        )
+        return snapshot
+
     def _ensure_profile(self, dog_id: str) -> DogProfile:
         """Return the profile for ``dog_id`` or raise ``HomeAssistantError``."""
         profile = self._dog_profiles.get(dog_id)
@@ -1146,7 +1335,15 @@ class PawControlDataManager:
         self._metrics[key] = base + increment
 
     async def async_initialize(self) -> None:
-        """Create storage folders and load persisted data."""
+        """Create storage folders and load persisted data.
+
+        Each dog's shard is loaded and its journal replayed here, concurrently
+        and in the executor, rather than on first access.  The history getters
+        such as :meth:`get_feeding_history` are synchronous and called from
+        entity updates, so a deferred load would either block the event loop or
+        serve empty history until the dog was first written.  Compaction keeps
+        every journal short, which bounds the per-dog replay cost.
+        """
         try:
             self._storage_dir.mkdir(parents=True, exist_ok=True)
         except OSError as err:
@@ -1154,9 +1351,19 @@ class PawControlDataManager:
                 f"Unable to prepare PawControl storage at {self._storage_dir}: {err}",
             ) from err
 
-        stored = await self._async_load_storage()
-        for dog_id, config in self._dogs_config.items():
-            stored_payload = stored.get(dog_id)
+        dog_ids = list(self._dogs_config)
+        shards = await asyncio.gather(
+            *(self._async_load_dog_shard(dog_id) for dog_id in dog_ids),
+        )
+        # The legacy single-file store is only consulted before any shard has
+        # been written.  Once shards exist it is stale, and a dog without a
+        # shard is a new dog rather than one awaiting migration.
+        legacy: JSONMutableMapping = {}
+        if all(shard is None for shard in shards):
+            legacy = await self._async_load_storage()
+        for dog_id, shard in zip(dog_ids, shards, strict=True):
+            config = self._dogs_config[dog_id]
+            stored_payload: Any = shard[0] if shard is not None else legacy.get(dog_id)
             stored_mapping: JSONMappingLike | JSONMutableMapping | None
             if isinstance(stored_payload, Mapping):
                 stored_mapping = cast(
@@ -1165,10 +1372,24 @@ class PawControlDataManager:
                 )
             else:
                 stored_mapping = None
-            self._dog_profiles[dog_id] = DogProfile.from_storage(
+            profile = DogProfile.from_storage(
                 cast(JSONMappingLike | JSONMutableMapping, dict(config)),
                 stored_mapping,
             )
+            self._dog_profiles[dog_id] = profile
+            if shard is not None:
+                self._shard_store.track(
+                    dog_id,
+                    profile.shard_state(),
+                    sequence=shard[1],
+                    journal_records=shard[2],
+                )
+
+        if legacy:
+            # Write every migrated dog in one pass so the next start loads
+            # shards only and never re-reads the legacy file.
+            for dog_id in dog_ids:
+                await self._async_save_dog_data(dog_id)
 
         for namespace in (
             "visitor_mode",
@@ -1189,6 +1410,27 @@ class PawControlDataManager:
 
     async def async_shutdown(self) -> None:
         """Persist pending data on shutdown."""
+        handles: dict[str, asyncio.TimerHandle] = getattr(
+            self,
+            "_namespace_flush_handles",
+            {},
+        )
+        for handle in handles.values():
+            handle.cancel()
+        handles.clear()
+        # Let write-behind flushes that already started finish before the
+        # forced flush, so the two never race on a namespace file.
+        if in_flight := list(getattr(self, "_namespace_flush_tasks", ())):
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        # A failed in-flight flush reschedules itself; the forced flush below
+        # retries it instead.
+        for handle in handles.values():
+            handle.cancel()
+        handles.clear()
+        try:
+            await self.async_flush_namespaces()
+        except HomeAssistantError:
+            _LOGGER.exception("Failed to flush PawControl namespaces on shutdown")
         if not self._initialised:
             return
         for dog_id in list(self._dog_profiles):
@@ -1902,75 +2144,31 @@ class PawControlDataManager:
         entries = getattr(profile, attribute, None)
         if not isinstance(entries, list):
             return []
-        since_bound = (
-            _deserialize_datetime(
-                since,
-            )
-            if since is not None
-            else None
-        )
-        until_bound = (
-            _deserialize_datetime(
-                until,
-            )
-            if until is not None
-            else None
+        index = self._history_index(dog_id, module_key, entries)
+        return index.query(
+            since=_deserialize_datetime(since) if since is not None else None,
+            until=_deserialize_datetime(until) if until is not None else None,
+            limit=limit,
         )
 
-        prepared: list[tuple[datetime | None, JSONMutableMapping]] = []
-        for entry in entries:
-            if not isinstance(entry, Mapping):
-                continue
-
-            payload = _coerce_json_mutable(
-                cast(JSONMappingLike | JSONMutableMapping, entry),
-            )
-            timestamp = _deserialize_datetime(payload.get(timestamp_key))
-            normalised_payload = cast(
-                JSONMutableMapping,
-                normalize_value(payload),
+    def _history_index(
+        self,
+        dog_id: str,
+        module_key: str,
+        entries: list[Any],
+    ) -> ModuleHistoryIndex:
+        """Return the time index for ``entries``, synchronised with the list."""
+        key = (dog_id, module_key)
+        index = self._history_indexes.get(key)
+        if index is None:
+            index = ModuleHistoryIndex(
+                _MODULE_HISTORY_ATTRS[module_key][1],
+                parse=_deserialize_datetime,
+                normalise=_normalise_history_entry,
             )
-
-            if since_bound is not None and (
-                timestamp is None or timestamp < since_bound
-            ):
-                continue
-            if until_bound is not None and (
-                timestamp is None or timestamp > until_bound
-            ):
-                continue
-
-            prepared.append((timestamp, normalised_payload))
-
-        def _sort_key(
-            item: tuple[datetime | None, JSONMutableMapping],
-        ) -> tuple[int, str]:
-            timestamp, payload = item
-            if timestamp is not None:
-                return (1, timestamp.isoformat())
-
-            raw_value = payload.get(timestamp_key)
-            if isinstance(raw_value, datetime):
-                return (1, raw_value.isoformat())
-            if isinstance(raw_value, int | float):
-                try:
-                    iso = datetime.fromtimestamp(float(raw_value)).isoformat()
-                except OverflowError:
-                    iso = ""
-                except ValueError:
-                    iso = ""
-                return (0, iso)
-            if isinstance(raw_value, str):
-                return (0, raw_value)
-            return (0, "")
-
-        prepared.sort(key=_sort_key, reverse=True)
-
-        ordered = [payload for _timestamp, payload in prepared]
-
-        if limit is not None:
-            return ordered[:limit]
-        return ordered
+            self._history_indexes[key] = index
+        index.sync(entries)
+        return index
 
     async def async_set_dog_power_state(self, dog_id: str, enabled: bool) -> None:
         """Persist the main power state for ``dog_id``."""
@@ -2233,19 +2431,23 @@ class PawControlDataManager:
         feeding_section: JSONMutableMapping | None = None
         walks_section: JSONMutableMapping | None = None
 
-        def _within_window(timestamp: Any) -> bool:
-            ts = _deserialize_datetime(timestamp)
-            if ts is None:
-                return False
-            return report_window_start <= ts <= report_window_end
+        def _window_entries(
+            module_key: str,
+            entries: list[Any],
+        ) -> list[JSONMutableMapping]:
+            index = self._history_index(dog_id, module_key, entries)
+            return list(
+                index.iter_entries(
+                    since=report_window_start,
+                    until=report_window_end,
+                    newest_first=False,
+                ),
+            )
 
         if "feeding" in sections:
-            feedings: list[JSONMutableMapping] = []
+            feedings = _window_entries(MODULE_FEEDING, profile.feeding_history)
             total_portion = 0.0
-            for entry in profile.feeding_history:
-                if not _within_window(entry.get("timestamp")):
-                    continue
-                feedings.append(entry)
+            for entry in feedings:
                 portion = entry.get("portion_size")
                 if isinstance(portion, int | float):
                     total_portion += float(portion)
@@ -2255,12 +2457,9 @@ class PawControlDataManager:
             }
             report["feeding"] = feeding_section
         if "walks" in sections:
-            walks: list[JSONMutableMapping] = []
+            walks = _window_entries(MODULE_WALK, profile.walk_history)
             total_distance = 0.0
-            for entry in profile.walk_history:
-                if not _within_window(entry.get("end_time")):
-                    continue
-                walks.append(entry)
+            for entry in walks:
                 distance = entry.get("distance")
                 if isinstance(distance, int | float):
                     total_distance += float(distance)
@@ -2270,14 +2469,10 @@ class PawControlDataManager:
             }
             report["walks"] = walks_section
         if "health" in sections:
-            health_entries = [
-                entry
-                for entry in profile.health_history
-                if _within_window(entry.get("timestamp"))
-            ]
+            health_entries = _window_entries(MODULE_HEALTH, profile.health_history)
             report["health"] = {
                 "entries": len(health_entries),
-                "latest": health_entries[-1] if health_entries else None,
+                "latest": dict(health_entries[-1]) if health_entries else None,
             }
 
         if include_recommendations:
@@ -2992,12 +3187,10 @@ class PawControlDataManager:
             return None
         cutoff = _utcnow() - timedelta(days=days)
         tolerance = timedelta(seconds=1)
-        relevant = [
-            entry
-            for entry in profile.health_history
-            if (timestamp := _deserialize_datetime(entry.get("timestamp")))
-            and timestamp >= cutoff - tolerance
-        ]
+        index = self._history_index(dog_id, MODULE_HEALTH, profile.health_history)
+        relevant = list(
+            index.iter_entries(since=cutoff - tolerance, newest_first=False),
+        )
 
         if not relevant:
             return cast(
@@ -3071,6 +3264,7 @@ class PawControlDataManager:
         metrics: DataManagerMetricsSnapshot = {
             "dogs": len(self._dog_profiles),
             "storage_path": str(self._storage_path),
+            "storage_shards": self._shard_store.get_stats(),
             "cache_diagnostics": self.cache_snapshots(),
         }
         return metrics
@@ -3079,6 +3273,19 @@ class PawControlDataManager:
         """Return the list of configured dog identifiers."""
         return list(self._dog_profiles)
 
+    async def async_remove_dog(self, dog_id: str) -> None:
+        """Forget the in-memory state of a dog removed from the entry.
+
+        Stored shards are left untouched; only caches keyed by the dog, such
+        as its profile and history indexes, are released.
+        """
+        async with self._data_lock:
+            self._dog_profiles.pop(dog_id, None)
+            self._dogs_config.pop(dog_id, None)
+            self._dog_save_locks.pop(dog_id, None)
+            for key in [key for key in self._history_indexes if key[0] == dog_id]:
+                del self._history_indexes[key]
+
     def _namespace_path(self, namespace: str) -> Path:
         """Return the file path used to persist a namespace payload."""
         safe_namespace = namespace.replace("/", "_")
@@ -3086,6 +3293,9 @@ class PawControlDataManager:
 
     async def _get_namespace_data(self, namespace: str) -> StorageNamespacePayload:
         """Read a JSON payload for ``namespace`` from disk."""
+        if namespace in getattr(self, "_namespace_dirty_since", {}):
+            # Unflushed updates are newer than the file on disk.
+            return self._namespace_state.get(namespace, {})
         path = self._namespace_path(namespace)
         try:
             if not Path.exists(path):
@@ -3127,7 +3337,7 @@ class PawControlDataManager:
     ) -> None:
         """Persist a JSON payload for ``namespace`` to disk."""
         path = self._namespace_path(namespace)
-        payload = json.dumps(data, ensure_ascii=False, indent=2)
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
         try:
             await self._async_add_executor_job(path.write_text, payload, "utf-8")
         except OSError as err:
@@ -3137,6 +3347,9 @@ class PawControlDataManager:
 
         self._ensure_metrics_containers()
         self._increment_metric("saves")
+        flush_stats = self._namespace_flush_stats_for(namespace)
+        flush_stats["flushes"] += 1
+        flush_stats["bytes_written"] += len(payload.encode("utf-8"))
         self._namespace_state[namespace] = cast(
             StorageNamespacePayload,
             dict(data),
@@ -3204,22 +3417,55 @@ class PawControlDataManager:
 
         return {}
 
+    async def _async_load_dog_shard(
+        self,
+        dog_id: str,
+    ) -> tuple[JSONMutableMapping, int, int] | None:
+        """Load and replay the shard for ``dog_id`` if one exists.
+
+        An unreadable shard is surfaced rather than treated as missing, since
+        falling back to the legacy store would overwrite newer shard data.
+        """
+        try:
+            return await self._async_add_executor_job(
+                self._shard_store.load,
+                dog_id,
+            )
+        except (OSError, json.JSONDecodeError) as err:
+            raise HomeAssistantError(
+                f"Unable to read PawControl shard for {dog_id}: {err}",
+            ) from err
+
+    def _get_dog_save_lock(self, dog_id: str) -> asyncio.Lock:
+        """Return the lock serialising shard writes for ``dog_id``."""
+        lock = self._dog_save_locks.get(dog_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._dog_save_locks[dog_id] = lock
+        return lock
+
     async def _async_save_dog_data(self, dog_id: str) -> None:
-        """Persist all dog data to disk."""
-        async with self._save_lock:
-            payload: JSONMutableMapping = {
-                k: cast(JSONValue, profile.as_dict())
-                for k, profile in self._dog_profiles.items()
-            }
+        """Persist the changes made to ``dog_id`` since its last save."""
+        async with self._get_dog_save_lock(dog_id):
+            profile = self._dog_profiles.get(dog_id)
+            if profile is None:
+                return
+            pending = self._shard_store.prepare(dog_id, profile.shard_state())
+            if pending is None:
+                return
             try:
-                await self._async_add_executor_job(
-                    self._write_storage,
-                    payload,
+                written = await self._async_add_executor_job(
+                    self._shard_store.write,
+                    pending,
                 )
             except OSError as err:
                 raise HomeAssistantError(
                     f"Failed to persist PawControl data: {err}",
                 ) from err
+            self._shard_store.commit(
+                pending,
+                written if isinstance(written, int) else 0,
+            )
 
     @staticmethod
     def _read_storage_payload(path: Path) -> Mapping[str, Any] | None:
@@ -3229,21 +3475,6 @@ class PawControlDataManager:
         with path.open(encoding="utf-8") as handle:
             return json.load(handle)
 
-    def _write_storage(self, payload: JSONMutableMapping) -> None:
-        """Write data to the JSON storage file."""
-        if self._storage_path.exists():
-            self._create_backup()
-        with open(self._storage_path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
-
-    def _create_backup(self) -> None:
-        """Create a best-effort backup copy of the current data file."""
-        try:
-            data = self._storage_path.read_bytes()
-        except FileNotFoundError:
-            return
-        self._backup_path.write_bytes(data)
-
     @staticmethod
     def _maybe_roll_daily_stats(profile: DogProfile, timestamp: datetime) -> None:
         """Reset daily statistics when the day changes."""
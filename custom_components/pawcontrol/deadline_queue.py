@@ -0,0 +1,127 @@
+"""Keyed deadline queue for timer-driven background work.
+
+Background loops such as notification batching, expiry and retries used to
+wake on a fixed interval and scan every pending item to find the few that were
+due.  :class:`DeadlineQueue` keeps one deadline per key in a binary heap, so a
+loop only peeks at the earliest deadline, sleeps until then and pops exactly
+the keys that are due.  Rescheduling or cancelling a key is O(1); superseded
+heap entries are skipped lazily and compacted when they pile up.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+import asyncio
+from collections.abc import Hashable
+import contextlib
+import heapq
+from itertools import count
+from typing import Final
+
+# Rebuild the heap once stale entries outnumber live ones by this factor.
+_COMPACT_RATIO: Final[int] = 2
+_COMPACT_MIN: Final[int] = 64
+
+
+class DeadlineQueue[K: Hashable]:
+    """Min-heap of ``(deadline, key)`` pairs with one live deadline per key.
+
+    Deadlines are POSIX timestamps so callers can derive them from the Home
+    Assistant clock and compare them against the same clock when popping.
+    """
+
+    __slots__ = ("_deadlines", "_heap", "_scheduled", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialise an empty queue."""
+        self._heap: list[tuple[float, int, K]] = []
+        self._deadlines: dict[K, tuple[float, int]] = {}
+        self._sequence = count()
+        self._scheduled = asyncio.Event()
+
+    def __len__(self) -> int:
+        """Return the number of keys with a pending deadline."""
+        return len(self._deadlines)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True when ``key`` has a pending deadline."""
+        return key in self._deadlines
+
+    def schedule(self, key: K, deadline: float, *, keep_earlier: bool = False) -> None:
+        """Set the deadline of ``key``, replacing any previous one.
+
+        With ``keep_earlier`` an existing earlier deadline is left untouched.
+        """
+        current = self._deadlines.get(key)
+        if keep_earlier and current is not None and current[0] <= deadline:
+            return
+        earliest = self.next_deadline()
+        sequence = next(self._sequence)
+        self._deadlines[key] = (deadline, sequence)
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        if len(self._heap) > max(_COMPACT_MIN, _COMPACT_RATIO * len(self._deadlines)):
+            self._compact()
+        # Only a new earliest deadline shortens the sleep of a waiting loop.
+        if earliest is None or deadline < earliest:
+            self._scheduled.set()
+
+    def cancel(self, key: K) -> None:
+        """Forget the deadline of ``key`` if it has one."""
+        self._deadlines.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every deadline."""
+        self._heap.clear()
+        self._deadlines.clear()
+
+    def _compact(self) -> None:
+        self._heap = [
+            (deadline, sequence, key)
+            for key, (deadline, sequence) in self._deadlines.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _is_live(self, entry: tuple[float, int, K]) -> bool:
+        deadline, sequence, key = entry
+        return self._deadlines.get(key) == (deadline, sequence)
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest pending deadline, or None when empty."""
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: float) -> list[K]:
+        """Remove and return every key whose deadline is at or before ``now``.
+
+        Keys are returned in deadline order.
+        """
+        heap = self._heap
+        due: list[K] = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self._is_live(entry):
+                del self._deadlines[entry[2]]
+                due.append(entry[2])
+        return due
+
+    async def async_wait(self, now: float, max_delay: float | None = None) -> None:
+        """Sleep until the next deadline or until an earlier one is scheduled.
+
+        An empty queue waits until something is scheduled instead of polling.
+        ``max_delay`` optionally caps the sleep when a deadline is pending.
+        """
+        self._scheduled.clear()
+        deadline = self.next_deadline()
+        if deadline is None:
+            await self._scheduled.wait()
+            return
+        timeout = max(deadline - now, 0.0)
+        if max_delay is not None:
+            timeout = min(timeout, max_delay)
+        if timeout <= 0.0:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._scheduled.wait(), timeout)
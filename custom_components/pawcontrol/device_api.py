@@ -1,8 +1,10 @@
 """HTTP client helpers for communicating with Paw Control hardware."""
 
-from collections.abc import Mapping
+import asyncio
+from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass
-from typing import cast
+from typing import Final, TypedDict, Unpack, cast
+from urllib.parse import urlencode
 
 from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout
 from aiohttp.client_exceptions import ContentTypeError
@@ -11,9 +13,23 @@ from yarl import URL
 from .exceptions import ConfigEntryAuthFailed, NetworkError, RateLimitError
 from .http_client import ensure_shared_client_session
 from .resilience import ResilienceManager, RetryConfig
-from .types import JSONMutableMapping
+from .types import (
+    DeviceClientDiagnostics,
+    DeviceConnectionPoolStats,
+    JSONMutableMapping,
+)
 
 _DEFAULT_TIMEOUT = ClientTimeout(total=15.0)
+BULK_FEEDING_PATH: Final[str] = "/api/dogs/feeding"
+# Statuses telling us the device firmware has no bulk endpoint.
+_BULK_UNSUPPORTED_STATUSES: Final[frozenset[int]] = frozenset({404, 405, 501})
+
+
+class _RequestOptions(TypedDict, total=False):
+    """Optional keyword arguments forwarded to :meth:`_async_request`."""
+
+    extra_headers: Mapping[str, str] | None
+    accept_statuses: Collection[int]
 
 
 def _coerce_json_mutable(
@@ -37,6 +53,24 @@ class DeviceEndpoint:
     api_key: str | None = None
 
 
+@dataclass(slots=True)
+class _ConditionalEntry:
+    """Validators and decoded payload of the last 200 response for a path."""
+
+    payload: JSONMutableMapping
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        """Return the conditional request headers for this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
 def validate_device_endpoint(endpoint: str) -> URL:
     """Validate and normalize the configured device endpoint."""
     if not endpoint:
@@ -96,13 +130,122 @@ class PawControlDeviceClient:
             jitter=True,
         )
 
+        # Conditional request validators keyed by request path
+        self._conditional: dict[str, _ConditionalEntry] = {}
+        self._bulk_supported: bool | None = None
+        self._requests = 0
+        self._json_decoded = 0
+        self._not_modified = 0
+        self._bulk_requests = 0
+        self._bulk_fallbacks = 0
+
     @property
     def base_url(self) -> URL:
         """Return the configured base URL for the companion endpoint."""
         return self._endpoint.base_url
 
     async def async_get_json(self, path: str) -> JSONMutableMapping:
-        """Perform a JSON GET request against the companion device with resilience."""
+        """Perform a JSON GET request against the companion device with resilience.
+
+        Responses carrying an ``ETag`` or ``Last-Modified`` header are
+        remembered so the next request for ``path`` is conditional; a ``304 Not
+        Modified`` answer returns the remembered payload without decoding JSON.
+        """
+        payload = await self._async_fetch_json(path)
+        return cast(JSONMutableMapping, payload)
+
+    async def async_get_feeding_payload(self, dog_id: str) -> JSONMutableMapping:
+        """Fetch the latest feeding payload for a dog from the companion device."""
+        return await self.async_get_json(f"/api/dogs/{dog_id}/feeding")
+
+    async def async_get_feeding_payloads(
+        self,
+        dog_ids: Sequence[str],
+    ) -> dict[str, JSONMutableMapping]:
+        """Fetch feeding payloads for several dogs in as few requests as possible.
+
+        Devices exposing the bulk endpoint answer with ``{"dogs": {dog_id:
+        payload}}`` in one round trip.  When the device reports the endpoint as
+        missing the client remembers that and falls back to one request per
+        dog; dogs absent from a bulk answer are fetched individually.
+        """
+        unique_ids = list(dict.fromkeys(dog_ids))
+        payloads: dict[str, JSONMutableMapping] = {}
+        if len(unique_ids) > 1 and self._bulk_supported is not False:
+            query = urlencode({"dog_ids": ",".join(unique_ids)})
+            bulk_path = f"{BULK_FEEDING_PATH}?{query}"
+            self._bulk_requests += 1
+            bulk = await self._async_fetch_json(
+                bulk_path,
+                accept_statuses=_BULK_UNSUPPORTED_STATUSES,
+            )
+            if bulk is None:
+                self._bulk_supported = False
+                self._bulk_fallbacks += 1
+            else:
+                self._bulk_supported = True
+                dogs = bulk.get("dogs")
+                if not isinstance(dogs, Mapping):
+                    raise NetworkError(
+                        "Device API returned an unexpected bulk feeding payload.",
+                    )
+                for dog_id in unique_ids:
+                    entry = dogs.get(dog_id)
+                    if isinstance(entry, Mapping):
+                        payloads[dog_id] = _coerce_json_mutable(entry)
+
+        missing = [dog_id for dog_id in unique_ids if dog_id not in payloads]
+        if missing:
+            results = await asyncio.gather(
+                *(self.async_get_feeding_payload(dog_id) for dog_id in missing),
+            )
+            payloads.update(zip(missing, results, strict=True))
+        return payloads
+
+    def get_diagnostics(self) -> DeviceClientDiagnostics:
+        """Return request counters and connection pool limits."""
+        return {
+            "requests": self._requests,
+            "json_decoded": self._json_decoded,
+            "not_modified": self._not_modified,
+            "bulk_requests": self._bulk_requests,
+            "bulk_fallbacks": self._bulk_fallbacks,
+            "bulk_supported": self._bulk_supported,
+            "conditional_entries": len(self._conditional),
+            "connection_pool": self._connection_pool_stats(),
+        }
+
+    def _connection_pool_stats(self) -> DeviceConnectionPoolStats | None:
+        """Describe the shared session connector's public pool limits."""
+        connector = getattr(self._session, "connector", None)
+        if connector is None:
+            return None
+        limit = getattr(connector, "limit", None)
+        limit_per_host = getattr(connector, "limit_per_host", None)
+        return {
+            "limit": limit if isinstance(limit, int) else None,
+            "limit_per_host": (
+                limit_per_host if isinstance(limit_per_host, int) else None
+            ),
+        }
+
+    async def _async_fetch_json(
+        self,
+        path: str,
+        *,
+        accept_statuses: Collection[int] = (),
+    ) -> JSONMutableMapping | None:
+        """GET ``path`` conditionally and decode the JSON object it returns.
+
+        Returns ``None`` when the response status is in ``accept_statuses``.
+        """
+        cached = self._conditional.get(path)
+        options: _RequestOptions = {}
+        if cached is not None:
+            options["extra_headers"] = cached.request_headers()
+        if accept_statuses:
+            options["accept_statuses"] = accept_statuses
+
         # RESILIENCE: Wrap in circuit breaker and retry if available
         if self._resilience_manager:
             response = await self._resilience_manager.execute_with_resilience(
@@ -111,9 +254,20 @@ class PawControlDeviceClient:
                 path,
                 circuit_breaker_name="device_api_request",
                 retry_config=self._retry_config,
+                **options,
             )
         else:
-            response = await self._async_request("GET", path)
+            response = await self._async_request("GET", path, **options)
+        self._requests += 1
+
+        if response.status in accept_statuses:
+            _release(response)
+            return None
+        if response.status == 304 and cached is not None:
+            self._not_modified += 1
+            _release(response)
+            return _coerce_json_mutable(cached.payload)
+
         try:
             payload = await response.json()
         except (ContentTypeError, ValueError) as err:  # pragma: no cover - defensive
@@ -125,13 +279,27 @@ class PawControlDeviceClient:
                 "Device API returned an unexpected response payload."
                 " Expected a JSON object.",
             )
-        return _coerce_json_mutable(payload)
-
-    async def async_get_feeding_payload(self, dog_id: str) -> JSONMutableMapping:
-        """Fetch the latest feeding payload for a dog from the companion device."""
-        return await self.async_get_json(f"/api/dogs/{dog_id}/feeding")
+        self._json_decoded += 1
+        result = _coerce_json_mutable(payload)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._conditional[path] = _ConditionalEntry(
+                payload=_coerce_json_mutable(result),
+                etag=etag,
+                last_modified=last_modified,
+            )
+        else:
+            self._conditional.pop(path, None)
+        return result
 
-    async def _async_request_protected(self, method: str, path: str) -> ClientResponse:
+    async def _async_request_protected(
+        self,
+        method: str,
+        path: str,
+        **options: Unpack[_RequestOptions],
+    ) -> ClientResponse:
         """Protected request wrapper - called through resilience patterns.
 
         This method is wrapped by circuit breaker and retry logic.
@@ -139,6 +307,7 @@ class PawControlDeviceClient:
         Args:
             method: HTTP method
             path: API path
+            **options: Extra headers and accepted statuses for the request
 
         Returns:
             ClientResponse
@@ -148,14 +317,27 @@ class PawControlDeviceClient:
             RateLimitError: If rate limited
             NetworkError: For other errors
         """
-        return await self._async_request(method, path)
+        return await self._async_request(method, path, **options)
+
+    async def _async_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        extra_headers: Mapping[str, str] | None = None,
+        accept_statuses: Collection[int] = (),
+    ) -> ClientResponse:
+        """Execute an HTTP request and normalize errors.
 
-    async def _async_request(self, method: str, path: str) -> ClientResponse:
-        """Execute an HTTP request and normalize errors."""
+        Responses whose status is in ``accept_statuses`` are returned to the
+        caller instead of being mapped to an exception.
+        """
         url = self._endpoint.base_url.join(URL(path))
         headers: dict[str, str] | None = None
         if self._endpoint.api_key:
             headers = {"Authorization": f"Bearer {self._endpoint.api_key}"}
+        if extra_headers:
+            headers = {**(headers or {}), **extra_headers}
         try:
             response = await self._session.request(
                 method,
@@ -176,6 +358,8 @@ class PawControlDeviceClient:
                 f"Network error talking to device API: {err}",
             ) from err
 
+        if response.status in accept_statuses:
+            return response
         if response.status == 401:
             raise ConfigEntryAuthFailed(
                 "Authentication with Paw Control device failed",
@@ -195,4 +379,11 @@ class PawControlDeviceClient:
         return response
 
 
+def _release(response: ClientResponse) -> None:
+    """Return a body-less response's connection to the pool."""
+    release = getattr(response, "release", None)
+    if callable(release):
+        release()
+
+
 __all__ = ["PawControlDeviceClient", "validate_device_endpoint"]
@@ -28,6 +28,7 @@ from homeassistant.util import dt as dt_util
 from .const import DEFAULT_MODEL, DEFAULT_SW_VERSION, MODULE_GPS
 from .coordinator import PawControlCoordinator
 from .entity import PawControlDogEntityBase
+from .route_simplify import DEFAULT_TOLERANCE_M, simplify_route_points
 from .runtime_data import get_runtime_data
 from .types import (
     DOG_ID_FIELD,
@@ -78,6 +79,7 @@ DEFAULT_GPS_ACCURACY = 50  # meters
 MIN_LOCATION_UPDATE_INTERVAL = 30  # seconds
 ROUTE_POINT_MAX_AGE = timedelta(hours=24)
 MAX_ROUTE_POINTS = 1000  # Maximum stored route points per dog
+ROUTE_SNAPSHOT_POINTS = 100  # Simplified points published for map cards
 
 # Location source priorities (higher = more trusted)
 LOCATION_SOURCE_PRIORITY = {
@@ -198,6 +200,7 @@ class PawControlGPSTracker(PawControlDogEntityBase, TrackerEntity):
 
     _attr_should_poll = False
     _attr_has_entity_name = True
+    _listener_module = MODULE_GPS
 
     def __init__(
         self,
@@ -639,9 +642,14 @@ class PawControlGPSTracker(PawControlDogEntityBase, TrackerEntity):
                 end_time_iso = self._serialize_timestamp(
                     current_route.get("end_time"),
                 )
+                # Publish the whole route, simplified, rather than its tail.
                 route_points: list[GPSRoutePoint] = [
                     self._serialize_route_point(point)
-                    for point in self._route_points.snapshot(limit=100)
+                    for point in simplify_route_points(
+                        self._route_points.view(),
+                        DEFAULT_TOLERANCE_M,
+                        max_points=ROUTE_SNAPSHOT_POINTS,
+                    )
                 ]
                 route_snapshot: GPSRouteSnapshot = {
                     "active": True,
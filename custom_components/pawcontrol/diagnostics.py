@@ -69,6 +69,7 @@ from .types import (
     CoordinatorUpdateCounts,
     DataStatisticsPayload,
     DebugInformationPayload,
+    DeviceClientDiagnostics,
     DogConfigData,
     EntityFactoryGuardMetricsSnapshot,
     JSONLikeMapping,
@@ -710,6 +711,7 @@ async def async_get_config_entry_diagnostics(
         "door_sensor": await _get_door_sensor_diagnostics(runtime_data),
         "service_execution": await _get_service_execution_diagnostics(runtime_data),
         "bool_coercion": _get_bool_coercion_diagnostics(runtime_data),
+        "device_api": _get_device_api_diagnostics(runtime_data),
         "push_telemetry": get_entry_push_telemetry_snapshot(hass, entry.entry_id),
         "setup_flags": _summarise_setup_flags(entry),
         "setup_flags_panel": await _async_build_setup_flags_panel(hass, entry),
@@ -1932,6 +1934,17 @@ def _get_bool_coercion_diagnostics(
     return payload
 
 
+def _get_device_api_diagnostics(
+    runtime_data: PawControlRuntimeData | None,
+) -> DeviceClientDiagnostics | dict[str, bool]:
+    """Expose companion device request and connection pool statistics."""
+    client = getattr(runtime_data, "device_api_client", None)
+    get_diagnostics = getattr(client, "get_diagnostics", None)
+    if not callable(get_diagnostics):
+        return {"available": False}
+    return cast(DeviceClientDiagnostics, get_diagnostics())
+
+
 def _normalise_service_guard_metrics(
     payload: Any,
 ) -> ServiceGuardMetricsSnapshot | None:
@@ -13,6 +13,8 @@ from homeassistant.util import dt as dt_util
 from . import types as paw_types
 from .const import ATTR_DOG_ID, ATTR_DOG_NAME
 from .coordinator import PawControlCoordinator
+from .coordinator_accessors import resolve_dog_snapshot
+from .coordinator_diffing import ListenerScope
 from .dog_status import build_dog_status_snapshot
 from .runtime_data import get_runtime_data
 from .service_guard import ServiceGuardResult
@@ -56,6 +58,8 @@ class PawControlEntity(
 
     _attr_should_poll = False
     _attr_has_entity_name = True
+    # Coordinator module this entity renders; ``None`` listens to the whole dog.
+    _listener_module: str | None = None
 
     def __init__(
         self,
@@ -65,6 +69,8 @@ class PawControlEntity(
     ) -> None:
         """Initialise the entity and attach device metadata."""
         super().__init__(coordinator)
+        # Scope coordinator updates so other dogs' changes do not wake us.
+        self.coordinator_context = ListenerScope(dog_id, self._listener_module)
         self._dog_id = dog_id
         self._dog_name = dog_name
         self._attr_extra_state_attributes = {
@@ -269,28 +275,46 @@ class PawControlDogEntityBase(PawControlEntity):
         super().__init__(coordinator, dog_id, dog_name)
         self._dog_data_cache: dict[str, CoordinatorDogData | None] = {}
         self._cache_timestamp: dict[str, float] = {}
+        self._cache_version: dict[str, tuple[int, bool]] = {}
 
     def _set_cache_ttl(self, ttl: float) -> None:
         """Update the cache TTL for dog data lookups."""
         self._cache_ttl = float(ttl)
 
     def _get_dog_data_cached(self) -> CoordinatorDogData | None:
-        """Return cached dog data when available."""
+        """Return cached dog data when available.
+
+        Coordinators that publish versioned snapshots invalidate the cache by
+        version and availability, so an outage (which does not advance the
+        version) still drops the cached payload; the TTL only applies to
+        coordinators without snapshots.
+        """
         cache_key = f"dog_data_{self._dog_id}"
         # Use time.monotonic() for cache TTL — it is faster than dt_util.utcnow()
         # (which creates a TZ-aware datetime object before discarding it) and is
         # immune to system clock adjustments.
         now = time.monotonic()
-
-        if (
-            cache_key in self._dog_data_cache
-            and cache_key in self._cache_timestamp
-            and now - self._cache_timestamp[cache_key] < self._cache_ttl
-        ):
-            return self._dog_data_cache[cache_key]
-        if not self.coordinator.available:
+        snapshot = resolve_dog_snapshot(self.coordinator, self._dog_id)
+        available = bool(self.coordinator.available)
+
+        if cache_key in self._dog_data_cache and cache_key in self._cache_timestamp:
+            if snapshot is not None:
+                fresh = self._cache_version.get(cache_key) == (
+                    snapshot.version,
+                    available,
+                )
+            else:
+                fresh = now - self._cache_timestamp[cache_key] < self._cache_ttl
+            if fresh:
+                return self._dog_data_cache[cache_key]
+        if not available:
             return None
-        data = self.coordinator.get_dog_data(self._dog_id)
+        if snapshot is not None:
+            data: CoordinatorDogData | None = snapshot.data
+            self._cache_version[cache_key] = (snapshot.version, available)
+        else:
+            data = self.coordinator.get_dog_data(self._dog_id)
+            self._cache_version.pop(cache_key, None)
         self._dog_data_cache[cache_key] = data
         self._cache_timestamp[cache_key] = now
         return data
@@ -24,7 +24,10 @@ from homeassistant.const import Platform
 from homeassistant.helpers.entity import Entity
 
 from .coordinator_runtime import EntityBudgetSnapshot
-from .telemetry import update_runtime_entity_factory_guard_metrics
+from .telemetry import (
+    get_runtime_entity_factory_guard_collector,
+    record_runtime_entity_factory_guard_sample,
+)
 from .types import (
     DOG_MODULES_FIELD,
     DogModulesProjection,
@@ -695,56 +698,14 @@ class EntityFactory:
                     "runtime_data",
                     None,
                 )
-                if runtime_data is not None:
-                    performance_stats = getattr(runtime_data, "performance_stats", None)
-                    if isinstance(performance_stats, dict):
-                        metrics = performance_stats.get("entity_factory_guard_metrics")
-                        if isinstance(metrics, dict):
-                            runtime_floor = max(
-                                original_runtime_floor, _MIN_OPERATION_DURATION
-                            )
-                            baseline_floor = max(
-                                float(
-                                    metrics.get(
-                                        "baseline_floor", _MIN_OPERATION_DURATION
-                                    )
-                                ),
-                                _MIN_OPERATION_DURATION,
-                            )
-                            metrics["baseline_floor"] = baseline_floor
-                            metrics["runtime_floor"] = runtime_floor
-                            metrics["runtime_floor_delta"] = max(
-                                runtime_floor - baseline_floor,
-                                0.0,
-                            )
-                            metrics["last_floor_change"] = 0.0
-                            metrics["last_floor_change_ratio"] = 0.0
-                            lowest_runtime_floor = metrics.get("lowest_runtime_floor")
-                            if (
-                                isinstance(lowest_runtime_floor, int | float)
-                                and lowest_runtime_floor > 0
-                            ):
-                                metrics["lowest_runtime_floor"] = max(
-                                    baseline_floor,
-                                    min(float(lowest_runtime_floor), runtime_floor),
-                                )
-                            else:
-                                metrics["lowest_runtime_floor"] = max(
-                                    baseline_floor, runtime_floor
-                                )
-                            samples = int(metrics.get("samples", 0) or 0)
-                            if samples > 0:
-                                metrics["expansions"] = 0
-                                metrics["contractions"] = 0
-                                metrics["stable_samples"] = samples
-                                metrics["stable_ratio"] = 1.0
-                                metrics["expansion_ratio"] = 0.0
-                                metrics["contraction_ratio"] = 0.0
-                                metrics["volatility_ratio"] = 0.0
-                                recent_samples = min(5, samples)
-                                metrics["recent_events"] = ["stable"] * recent_samples
-                                metrics["recent_stable_samples"] = recent_samples
-                                metrics["recent_stable_ratio"] = 1.0
+                collector = get_runtime_entity_factory_guard_collector(
+                    cast("PawControlRuntimeData | None", runtime_data)
+                )
+                if collector is not None:
+                    collector.rebase(
+                        runtime_floor=original_runtime_floor,
+                        minimum_floor=_MIN_OPERATION_DURATION,
+                    )
 
         # Ensure the default combination remains the active baseline after warming
         self._update_last_estimate_state(default_estimate)
@@ -1196,7 +1157,7 @@ class EntityFactory:
                 getattr(config_entry, "runtime_data", None),
             )
 
-        update_runtime_entity_factory_guard_metrics(
+        record_runtime_entity_factory_guard_sample(
             runtime_data,
             runtime_floor=self._runtime_guard_floor,
             actual_duration=actual_duration,
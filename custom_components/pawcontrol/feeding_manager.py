@@ -1,15 +1,26 @@
 """Feeding management with health-aware portions for PawControl."""
 
 import asyncio
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Iterable, Mapping, Sequence
 import contextlib
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 from functools import partial
+from itertools import islice
 import logging
 from time import perf_counter
-from typing import Any, Final, Literal, NotRequired, Required, TypedDict, TypeVar, cast
+from typing import (
+    Any,
+    Final,
+    Literal,
+    NotRequired,
+    Required,
+    Self,
+    TypedDict,
+    TypeVar,
+    cast,
+)
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
@@ -590,6 +601,99 @@ class FeedingComplianceNoData(TypedDict):
 FeedingComplianceResult = FeedingComplianceCompleted | FeedingComplianceNoData
 
 
+@dataclass(slots=True)
+class _FeedingAggregates:
+    """Running per-day totals for one dog's feeding history.
+
+    The totals are updated in O(1) whenever an event is recorded or trimmed
+    from the history, so snapshots and statistics read precomputed counters
+    instead of walking every event.  Buckets are keyed by local calendar day,
+    which makes the rollover at midnight implicit: a new day simply starts
+    with an empty bucket.  ``history`` and ``length`` identify the list the
+    totals were derived from so replaced or externally edited histories are
+    detected and re-aggregated.
+    """
+
+    history: list[FeedingEvent]
+    length: int = 0
+    day_counts: dict[date, int] = field(default_factory=dict)
+    day_amounts: dict[date, float] = field(default_factory=dict)
+    day_meals: dict[date, dict[MealType | None, int]] = field(default_factory=dict)
+    last_feeding: FeedingEvent | None = None
+    serialized: list[FeedingEventTelemetry | None] = field(default_factory=list)
+
+    @classmethod
+    def from_history(cls, history: list[FeedingEvent]) -> Self:
+        """Aggregate an existing history in a single pass."""
+        aggregates = cls(history)
+        for event in history:
+            aggregates.add(event)
+        aggregates.length = len(history)
+        return aggregates
+
+    def matches(self, history: list[FeedingEvent]) -> bool:
+        """Return True when the totals still describe ``history``."""
+        return self.history is history and self.length == len(history)
+
+    def add(self, event: FeedingEvent) -> None:
+        """Account for a newly appended event."""
+        serialized: FeedingEventTelemetry | None = None
+        try:
+            serialized = cast(FeedingEventTelemetry, event.to_dict())
+        except ValueError:
+            _LOGGER.debug("Failed to serialize feeding event amount: %s", event.amount)
+        except TypeError:
+            _LOGGER.debug("Failed to serialize feeding event amount: %s", event.amount)
+        # Keep one slot per event so trimming stays aligned with the history.
+        self.serialized.append(serialized)
+        if event.skipped:
+            return
+        day = event.time.date()
+        self.day_counts[day] = self.day_counts.get(day, 0) + 1
+        self.day_amounts[day] = self.day_amounts.get(day, 0.0) + _event_amount(event)
+        meals = self.day_meals.setdefault(day, {})
+        meals[event.meal_type] = meals.get(event.meal_type, 0) + 1
+        self.last_feeding = event
+
+    def trim(self, removed: Sequence[FeedingEvent]) -> None:
+        """Forget events dropped from the front of the history."""
+        del self.serialized[: len(removed)]
+        for event in removed:
+            if event.skipped:
+                continue
+            day = event.time.date()
+            count = self.day_counts.get(day, 0) - 1
+            if count <= 0:
+                self.day_counts.pop(day, None)
+                self.day_amounts.pop(day, None)
+                self.day_meals.pop(day, None)
+                continue
+            self.day_counts[day] = count
+            self.day_amounts[day] -= _event_amount(event)
+            meals = self.day_meals[day]
+            meals[event.meal_type] -= 1
+            if not meals[event.meal_type]:
+                del meals[event.meal_type]
+        if self.last_feeding is not None and any(
+            event is self.last_feeding for event in removed
+        ):
+            self.last_feeding = next(
+                (event for event in reversed(self.history) if not event.skipped),
+                None,
+            )
+
+
+def _event_amount(event: FeedingEvent) -> float:
+    """Return the event amount in grams, ignoring malformed values."""
+    try:
+        return float(event.amount)
+    except ValueError:
+        _LOGGER.debug("Invalid feeding amount %s", event.amount)
+    except TypeError:
+        _LOGGER.debug("Invalid feeding amount %s", event.amount)
+    return 0.0
+
+
 @dataclass
 class FeedingConfig:
     """Enhanced feeding configuration with health integration."""
@@ -1160,7 +1264,10 @@ class FeedingManager:
         # attribute, so we continue to populate it even though the refactored
         # manager primarily works with FeedingConfig instances.
         self._dogs: dict[str, FeedingDogMetadata] = {}
+        # ``_lock`` guards manager-wide operations (initialisation); per-dog
+        # work is serialised by ``_dog_locks`` so dogs never block each other.
         self._lock = asyncio.Lock()
+        self._dog_locks: dict[str, asyncio.Lock] = {}
         self._max_history = max_history
 
         # OPTIMIZATION: Event-based reminder system
@@ -1194,6 +1301,9 @@ class FeedingManager:
         self._stats_cache_time: dict[str, datetime] = {}
         self._stats_cache_ttl = timedelta(minutes=5)
 
+        # Running per-day totals maintained on every recorded feeding
+        self._feeding_aggregates: dict[str, _FeedingAggregates] = {}
+
     async def _offload_blocking(
         self,
         description: str,
@@ -1215,6 +1325,26 @@ class FeedingManager:
             )
         return result
 
+    def _dog_lock(self, dog_id: str) -> asyncio.Lock:
+        """Return the lock serialising feedings, config and caches of a dog."""
+        lock = self._dog_locks.get(dog_id)
+        if lock is None:
+            lock = self._dog_locks[dog_id] = asyncio.Lock()
+        return lock
+
+    @contextlib.asynccontextmanager
+    async def _exclusive(self) -> AsyncGenerator[None]:
+        """Hold the manager lock and every per-dog lock.
+
+        Used for operations that replace state of all dogs at once.  Per-dog
+        operations only ever hold a single lock, so acquiring them in a fixed
+        order cannot deadlock.
+        """
+        async with self._lock, contextlib.AsyncExitStack() as stack:
+            for dog_id in sorted(self._dog_locks):
+                await stack.enter_async_context(self._dog_locks[dog_id])
+            yield
+
     def _apply_emergency_restoration(
         self,
         config: FeedingConfig,
@@ -1239,7 +1369,7 @@ class FeedingManager:
             dogs: Sequence of dog configuration payloads
                 compatible with ``FeedingManagerDogSetupPayload``
         """
-        async with self._lock:
+        async with self._exclusive():
             # Reset caches so repeated initialisation (common in tests) does not
             # leak previous dog metadata or reminder tasks.
             for task in self._reminder_tasks.values():
@@ -1248,6 +1378,7 @@ class FeedingManager:
             self._reminder_events.clear()
             self._next_reminders.clear()
             self._feedings.clear()
+            self._feeding_aggregates.clear()
             self._configs.clear()
             self._dogs.clear()
             self._data_cache.clear()
@@ -1955,83 +2086,141 @@ class FeedingManager:
         Returns:
             Created FeedingEvent
         """
+        amount_value = self._coerce_feeding_amount(amount)
+        if timestamp is not None:
+            time = timestamp
+        async with self._dog_lock(dog_id):
+            event = self._record_feeding(
+                dog_id,
+                amount_value,
+                meal_type,
+                time,
+                notes=notes,
+                feeder=feeder,
+                scheduled=scheduled,
+                with_medication=with_medication,
+                medication_name=medication_name,
+                medication_dose=medication_dose,
+                medication_time=medication_time,
+            )
+            self._invalidate_cache(dog_id)
+            return event
+
+    def _feeding_aggregates_for(
+        self,
+        dog_id: str,
+        history: list[FeedingEvent],
+    ) -> _FeedingAggregates:
+        """Return running totals for ``history``, re-aggregating if it changed."""
+        aggregates = self._feeding_aggregates.get(dog_id)
+        if aggregates is None or not aggregates.matches(history):
+            aggregates = _FeedingAggregates.from_history(history)
+            self._feeding_aggregates[dog_id] = aggregates
+        return aggregates
+
+    def _coerce_feeding_amount(self, amount: object) -> float:
+        """Return ``amount`` as grams or raise ``ValueError`` when invalid."""
         if not is_number(amount):
             raise ValueError("Feeding amount must be a numeric value in grams")
-        amount_value = float(amount)
+        amount_value = float(cast(float, amount))
         if not (0 < amount_value <= self._MAX_SINGLE_FEEDING_GRAMS):
             raise ValueError(
                 f"Feeding amount must be between 0 and {self._MAX_SINGLE_FEEDING_GRAMS} grams",
             )
+        return amount_value
 
+    def _record_feeding(
+        self,
+        dog_id: str,
+        amount_value: float,
+        meal_type: str | None = None,
+        time: datetime | None = None,
+        *,
+        timestamp: datetime | None = None,
+        notes: str | None = None,
+        feeder: str | None = None,
+        scheduled: bool = False,
+        with_medication: bool = False,
+        medication_name: str | None = None,
+        medication_dose: str | None = None,
+        medication_time: str | None = None,
+    ) -> FeedingEvent:
+        """Append a feeding event.
+
+        The caller holds the dog's lock and invalidates its caches.
+        """
+        if dog_id not in self._configs:
+            raise KeyError(dog_id)
         if timestamp is not None:
             time = timestamp
-        async with self._lock:
-            if dog_id not in self._configs:
-                raise KeyError(dog_id)
-
-            event_time = time or dt_util.now()
-            if event_time.tzinfo is None:
-                event_time = dt_util.as_local(dt_util.as_utc(event_time))
-            else:
-                event_time = dt_util.as_local(event_time)
-
-            meal_type_enum = None
-            is_medication_meal = False
-            if meal_type:
-                normalized_meal = meal_type.lower()
-                try:
-                    meal_type_enum = MealType(normalized_meal)
-                except ValueError:
-                    if normalized_meal == "medication":
-                        is_medication_meal = True
-                    else:
-                        _LOGGER.warning("Invalid meal type: %s", meal_type)
 
-            if is_medication_meal and not with_medication:
-                with_medication = True
+        event_time = time or dt_util.now()
+        if event_time.tzinfo is None:
+            event_time = dt_util.as_local(dt_util.as_utc(event_time))
+        else:
+            event_time = dt_util.as_local(event_time)
 
-            config = self._configs.get(dog_id)
-            portion_size = None
-            if config and meal_type_enum:
-                # Use health-aware portion calculation if enabled
-                if config.portion_calculation_enabled:
-                    portion_size = config.calculate_portion_size(
-                        meal_type_enum,
-                        health_data=None,  # Could pass real-time health data here
-                    )
+        meal_type_enum = None
+        is_medication_meal = False
+        if meal_type:
+            normalized_meal = meal_type.lower()
+            try:
+                meal_type_enum = MealType(normalized_meal)
+            except ValueError:
+                if normalized_meal == "medication":
+                    is_medication_meal = True
                 else:
-                    # Fall back to schedule-based portion size
-                    for schedule in config.meal_schedules:
-                        if schedule.meal_type == meal_type_enum:
-                            portion_size = schedule.portion_size
-                            break
-            event = FeedingEvent(
-                time=event_time,
-                amount=amount_value,
-                meal_type=meal_type_enum,
-                portion_size=portion_size,
-                food_type=config.food_type if config else None,
-                notes=notes,
-                feeder=feeder,
-                scheduled=scheduled,
-                with_medication=with_medication,
-                medication_name=medication_name,
-                medication_dose=medication_dose,
-                medication_time=medication_time,
-            )
+                    _LOGGER.warning("Invalid meal type: %s", meal_type)
 
-            self._feedings.setdefault(dog_id, []).append(event)
-            # OPTIMIZATION: Maintain history limit
-            if len(self._feedings[dog_id]) > self._max_history:
-                self._feedings[dog_id] = self._feedings[dog_id][-self._max_history :]
+        if is_medication_meal and not with_medication:
+            with_medication = True
 
-            # Invalidate caches
-            self._invalidate_cache(dog_id)
-            # Signal reminder update if scheduled feeding
-            if scheduled and dog_id in self._reminder_events:
-                self._reminder_events[dog_id].set()
+        config = self._configs.get(dog_id)
+        portion_size = None
+        if config and meal_type_enum:
+            # Use health-aware portion calculation if enabled
+            if config.portion_calculation_enabled:
+                portion_size = config.calculate_portion_size(
+                    meal_type_enum,
+                    health_data=None,  # Could pass real-time health data here
+                )
+            else:
+                # Fall back to schedule-based portion size
+                for schedule in config.meal_schedules:
+                    if schedule.meal_type == meal_type_enum:
+                        portion_size = schedule.portion_size
+                        break
+        event = FeedingEvent(
+            time=event_time,
+            amount=amount_value,
+            meal_type=meal_type_enum,
+            portion_size=portion_size,
+            food_type=config.food_type if config else None,
+            notes=notes,
+            feeder=feeder,
+            scheduled=scheduled,
+            with_medication=with_medication,
+            medication_name=medication_name,
+            medication_dose=medication_dose,
+            medication_time=medication_time,
+        )
 
-            return event
+        history = self._feedings.setdefault(dog_id, [])
+        aggregates = self._feeding_aggregates_for(dog_id, history)
+        history.append(event)
+        aggregates.add(event)
+        # OPTIMIZATION: Maintain history limit
+        if len(history) > self._max_history:
+            removed = history[: len(history) - self._max_history]
+            del history[: len(removed)]
+            aggregates.trim(removed)
+        aggregates.length = len(history)
+
+        # Signal reminder update if scheduled feeding
+        if scheduled and dog_id in self._reminder_events:
+            self._reminder_events[dog_id].set()
+
+        return event
 
     async def async_add_feeding_with_medication(
         self,
@@ -2128,29 +2317,40 @@ class FeedingManager:
     ) -> list[FeedingEvent]:
         """OPTIMIZATION: Add multiple feeding events at once.
 
+        Entries are validated up front and grouped by dog.  Each dog's lock is
+        taken once for all of its entries and its feeding snapshot is rebuilt
+        once afterwards.  Events are returned in input order.
+
         Args:
             feedings: List of feeding data dictionaries
 
         Returns:
             List of created FeedingEvents
         """
-        events = []
-
-        # BUG FIX: Do NOT acquire self._lock here.  async_add_feeding() already
-        # acquires it internally, and asyncio.Lock is not reentrant.  Holding the
-        # outer lock while awaiting async_add_feeding() would deadlock permanently
-        # because the inner await would block forever waiting for a lock that is
-        # already held by the same coroutine.
-        # Sequential individual locking is safe: each call is atomic, and between
-        # awaits only other tasks at the event-loop level can interleave.
-        for raw_data in feedings:
+        grouped: dict[str, list[tuple[int, float, FeedingAddParams]]] = {}
+        for position, raw_data in enumerate(feedings):
             batch_payload = dict(raw_data)
             dog_id = cast(str, batch_payload.pop("dog_id"))
+            amount = self._coerce_feeding_amount(batch_payload.pop("amount", None))
             params = cast(FeedingAddParams, batch_payload)
-            event = await self.async_add_feeding(dog_id, **params)
-            events.append(event)
+            grouped.setdefault(dog_id, []).append((position, amount, params))
 
-        return events
+        events: list[FeedingEvent | None] = [None] * len(feedings)
+        for dog_id, entries in grouped.items():
+            async with self._dog_lock(dog_id):
+                try:
+                    for position, amount, params in entries:
+                        events[position] = self._record_feeding(
+                            dog_id, amount, **params
+                        )
+                finally:
+                    # Invalidate once for the whole group, including when an
+                    # entry failed after earlier ones were already recorded.
+                    self._invalidate_cache(dog_id)
+                self._data_cache[dog_id] = self._build_feeding_snapshot(dog_id)
+                self._cache_time[dog_id] = dt_util.now()
+
+        return cast(list[FeedingEvent], events)
 
     async def async_get_feedings(
         self,
@@ -2166,7 +2366,7 @@ class FeedingManager:
         Returns:
             List of feeding events
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             feedings = self._feedings.get(dog_id, [])
             if since:
                 # OPTIMIZATION: Binary search for efficiency with large lists
@@ -2192,7 +2392,7 @@ class FeedingManager:
         Returns:
             Dictionary with feeding statistics
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             if dog_id not in self._configs and dog_id not in self._feedings:
                 empty_snapshot = self._empty_feeding_data(None)
                 self._data_cache[dog_id] = empty_snapshot
@@ -2293,31 +2493,14 @@ class FeedingManager:
         now = dt_util.now()
         today = now.date()
 
-        feedings_today: dict[str, int] = {}
-        daily_amount = 0.0
-        last_feeding: FeedingEvent | None = None
-
-        for event in reversed(feedings):
-            if event.time.date() == today and not event.skipped:
-                meal = event.meal_type.value if event.meal_type else "unknown"
-                feedings_today[meal] = feedings_today.get(meal, 0) + 1
-                try:
-                    daily_amount += float(event.amount)
-                except ValueError:
-                    _LOGGER.debug(
-                        "Invalid feeding amount for %s event %s",
-                        dog_id,
-                        event.amount,
-                    )
-                except TypeError:
-                    _LOGGER.debug(
-                        "Invalid feeding amount for %s event %s",
-                        dog_id,
-                        event.amount,
-                    )
-
-            if last_feeding is None and not event.skipped:
-                last_feeding = event
+        # Today's counters are maintained incrementally on every feeding.
+        aggregates = self._feeding_aggregates_for(dog_id, feedings)
+        feedings_today = {
+            meal.value if meal else "unknown": count
+            for meal, count in aggregates.day_meals.get(today, {}).items()
+        }
+        daily_amount = aggregates.day_amounts.get(today, 0.0)
+        last_feeding = aggregates.last_feeding
 
         last_hours: float | None = None
         if last_feeding:
@@ -2554,24 +2737,9 @@ class FeedingManager:
                     health_status = "on_track"
         elif portion_adjustment is not None:
             health_status = "monitoring"
-        serialized_feedings: list[FeedingEventTelemetry] = []
-        for event in feedings:
-            try:
-                serialized_feedings.append(
-                    cast(FeedingEventTelemetry, event.to_dict()),
-                )
-            except ValueError:
-                _LOGGER.debug(
-                    "Failed to serialize feeding event amount for %s: %s",
-                    dog_id,
-                    event.amount,
-                )
-            except TypeError:
-                _LOGGER.debug(
-                    "Failed to serialize feeding event amount for %s: %s",
-                    dog_id,
-                    event.amount,
-                )
+        serialized_feedings = [
+            record for record in aggregates.serialized if record is not None
+        ]
 
         snapshot: FeedingSnapshot = FeedingSnapshot(
             status="ready",
@@ -2733,7 +2901,7 @@ class FeedingManager:
             dog_id: Dog identifier
             config_data: New configuration data
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = await self._create_feeding_config(dog_id, config_data)
             self._configs[dog_id] = config
             dog_record = self._dogs.get(dog_id)
@@ -2762,7 +2930,7 @@ class FeedingManager:
 
     async def async_refresh_reminder(self, dog_id: str) -> None:
         """Refresh reminder scheduling for ``dog_id``."""
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if config is None:
                 return
@@ -2804,7 +2972,7 @@ class FeedingManager:
         """
         cache_key = f"{dog_id}_{days}"
 
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             # Check cache
             if cache_key in self._stats_cache:
                 cache_time = self._stats_cache_time.get(cache_key)
@@ -2847,9 +3015,7 @@ class FeedingManager:
             else:
                 right = mid
 
-        recent_feedings = feedings[left:]
-
-        if not recent_feedings:
+        if left == len(feedings):
             return FeedingStatisticsSnapshot(
                 period_days=days,
                 total_feedings=0,
@@ -2864,22 +3030,36 @@ class FeedingManager:
                 ),
             )
 
-        # OPTIMIZATION: Single pass aggregation
+        # OPTIMIZATION: Whole days come from the running per-day totals; only
+        # the partially covered first day of the window is scanned.
+        aggregates = self._feeding_aggregates_for(dog_id, feedings)
+        first_day = since.date()
         daily_counts: dict[date, int] = {}
         daily_amounts: dict[date, float] = {}
         meal_counts: dict[str, int] = {}
 
-        for feeding in recent_feedings:
+        for feeding in islice(feedings, left, None):
+            day = feeding.time.date()
+            if day > first_day:
+                break
             if feeding.skipped:
                 continue
-
-            date = feeding.time.date()
-            daily_counts[date] = daily_counts.get(date, 0) + 1
-            daily_amounts[date] = daily_amounts.get(date, 0.0) + feeding.amount
+            daily_counts[day] = daily_counts.get(day, 0) + 1
+            daily_amounts[day] = daily_amounts.get(day, 0.0) + _event_amount(feeding)
             if feeding.meal_type:
                 meal = feeding.meal_type.value
                 meal_counts[meal] = meal_counts.get(meal, 0) + 1
 
+        for day, count in aggregates.day_counts.items():
+            if day <= first_day:
+                continue
+            daily_counts[day] = count
+            daily_amounts[day] = aggregates.day_amounts[day]
+            for meal_type, meal_count in aggregates.day_meals[day].items():
+                if meal_type:
+                    meal = meal_type.value
+                    meal_counts[meal] = meal_counts.get(meal, 0) + meal_count
+
         # Calculate metrics
         avg_daily_feedings = (
             sum(daily_counts.values()) / len(daily_counts) if daily_counts else 0
@@ -2906,7 +3086,7 @@ class FeedingManager:
 
         return FeedingStatisticsSnapshot(
             period_days=days,
-            total_feedings=len([f for f in recent_feedings if not f.skipped]),
+            total_feedings=sum(daily_counts.values()),
             average_daily_feedings=round(avg_daily_feedings, 1),
             average_daily_amount=round(avg_daily_amount, 1),
             most_common_meal=most_common_meal,
@@ -2921,11 +3101,14 @@ class FeedingManager:
     async def async_get_reminders(self) -> dict[str, datetime]:
         """Get all next reminder times.
 
+        No lock is taken: writers replace or drop a single dog's entry without
+        awaiting, so copying the mapping in one synchronous step always sees a
+        consistent set of per-dog reminders.
+
         Returns:
             Dictionary mapping dog_id to next reminder time
         """
-        async with self._lock:
-            return dict(self._next_reminders)
+        return dict(self._next_reminders)
 
     async def async_calculate_health_aware_portion(
         self,
@@ -2943,7 +3126,7 @@ class FeedingManager:
         Returns:
             Calculated portion size in grams or None if not possible
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config or not config.health_aware_portions:
                 return None
@@ -2984,73 +3167,81 @@ class FeedingManager:
         Returns:
             Health analysis of feeding patterns
         """
-        async with self._lock:
-            config = self._configs.get(dog_id)
-            feedings = self._feedings.get(dog_id, [])
-            if not config or not feedings:
-                return FeedingHistoryAnalysis(
-                    status="insufficient_data",
-                    message="Need feeding configuration and history",
-                )
+        async with self._dog_lock(dog_id):
+            return self._analyze_feeding_health(dog_id, days)
 
-            # Get recent feeding events
-            since = dt_util.now() - timedelta(days=days)
-            recent_events: list[FeedingHistoryEvent] = []
-            for event in feedings:
-                if event.time <= since or event.skipped:
-                    continue
-                recent_events.append(
-                    FeedingHistoryEvent(
-                        time=event.time,
-                        amount=float(event.amount),
-                        meal_type=event.meal_type.value if event.meal_type else None,
-                    ),
-                )
+    def _analyze_feeding_health(
+        self,
+        dog_id: str,
+        days: int,
+    ) -> FeedingHistoryAnalysis:
+        """Analyze feeding patterns; the caller holds the dog's lock."""
+        config = self._configs.get(dog_id)
+        feedings = self._feedings.get(dog_id, [])
+        if not config or not feedings:
+            return FeedingHistoryAnalysis(
+                status="insufficient_data",
+                message="Need feeding configuration and history",
+            )
 
-            if not recent_events:
-                return FeedingHistoryAnalysis(
-                    status="no_recent_data",
-                    message=f"No feeding data in last {days} days",
-                )
+        # Get recent feeding events
+        since = dt_util.now() - timedelta(days=days)
+        recent_events: list[FeedingHistoryEvent] = []
+        for event in feedings:
+            if event.time <= since or event.skipped:
+                continue
+            recent_events.append(
+                FeedingHistoryEvent(
+                    time=event.time,
+                    amount=float(event.amount),
+                    meal_type=event.meal_type.value if event.meal_type else None,
+                ),
+            )
 
-            # Get health summary for target calories
-            health_summary = config.get_health_summary()
-            target_calories = health_summary.get("daily_calorie_requirement")
-            if not target_calories:
-                return FeedingHistoryAnalysis(
-                    status="no_health_data",
-                    message="Insufficient health data for analysis",
-                )
+        if not recent_events:
+            return FeedingHistoryAnalysis(
+                status="no_recent_data",
+                message=f"No feeding data in last {days} days",
+            )
 
-            # Use health calculator to analyze patterns
-            calories_per_gram = health_summary.get("calories_per_gram", 3.5)
-            analysis = HealthCalculator.analyze_feeding_history(
-                recent_events,
-                target_calories,
-                calories_per_gram,
+        # Get health summary for target calories
+        health_summary = config.get_health_summary()
+        target_calories = health_summary.get("daily_calorie_requirement")
+        if not target_calories:
+            return FeedingHistoryAnalysis(
+                status="no_health_data",
+                message="Insufficient health data for analysis",
             )
 
-            # Add health-specific recommendations
-            health_context: FeedingHealthContext = {}
-            if config.weight_goal is not None:
-                health_context["weight_goal"] = config.weight_goal
-            if (bcs := health_summary.get("body_condition_score")) is not None:
-                health_context["body_condition_score"] = bcs
-            if (life_stage := health_summary.get("life_stage")) is not None:
-                health_context["life_stage"] = life_stage
-            if (activity := health_summary.get("activity_level")) is not None:
-                health_context["activity_level"] = activity
-            if (conditions := health_summary.get("health_conditions")) is not None:
-                health_context["health_conditions"] = cast(  # type: ignore[redundant-cast]
-                    list[str],
-                    conditions,
-                )
-            if (diet := health_summary.get("special_diet")) is not None:
-                health_context["special_diet"] = diet
-            if health_context:
-                analysis["health_context"] = health_context
+        # Use health calculator to analyze patterns
+        calories_per_gram = health_summary.get("calories_per_gram", 3.5)
+        analysis = HealthCalculator.analyze_feeding_history(
+            recent_events,
+            target_calories,
+            calories_per_gram,
+        )
+
+        # Add health-specific recommendations
+        health_context: FeedingHealthContext = {}
+        if config.weight_goal is not None:
+            health_context["weight_goal"] = config.weight_goal
+        if (bcs := health_summary.get("body_condition_score")) is not None:
+            health_context["body_condition_score"] = bcs
+        if (life_stage := health_summary.get("life_stage")) is not None:
+            health_context["life_stage"] = life_stage
+        if (activity := health_summary.get("activity_level")) is not None:
+            health_context["activity_level"] = activity
+        if (conditions := health_summary.get("health_conditions")) is not None:
+            health_context["health_conditions"] = cast(  # type: ignore[redundant-cast]
+                list[str],
+                conditions,
+            )
+        if (diet := health_summary.get("special_diet")) is not None:
+            health_context["special_diet"] = diet
+        if health_context:
+            analysis["health_context"] = health_context
 
-            return analysis
+        return analysis
 
     async def async_generate_health_report(self, dog_id: str) -> HealthReport | None:
         """Generate comprehensive health report for a dog.
@@ -3061,7 +3252,7 @@ class FeedingManager:
         Returns:
             Health report or None if insufficient data
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config or not config.health_aware_portions:
                 return None
@@ -3110,7 +3301,7 @@ class FeedingManager:
                 report["feeding_insights"] = feeding_insights
 
                 # Add recent feeding analysis
-                feeding_analysis = await self.async_analyze_feeding_health(dog_id, 14)
+                feeding_analysis = self._analyze_feeding_health(dog_id, 14)
                 if feeding_analysis.get("status") == "good":
                     report["recent_feeding_performance"] = feeding_analysis
                 return report
@@ -3201,7 +3392,7 @@ class FeedingManager:
         Returns:
             True if update successful
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 return False
@@ -3258,7 +3449,7 @@ class FeedingManager:
         Returns:
             True if update successful
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 _LOGGER.warning("No config found for dog %s", dog_id)
@@ -3299,7 +3490,7 @@ class FeedingManager:
         Returns:
             Diet validation status or None if not available
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config or not config.diet_validation:
                 return None
@@ -3327,7 +3518,7 @@ class FeedingManager:
         Returns:
             Dictionary with portion calculation and validation results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 return FeedingPortionValidationError(
@@ -3430,7 +3621,7 @@ class FeedingManager:
         Returns:
             Dictionary with recalculation results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -3544,7 +3735,7 @@ class FeedingManager:
         Returns:
             Dictionary with adjustment results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -3703,7 +3894,7 @@ class FeedingManager:
         Returns:
             Dictionary with activation results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -3848,7 +4039,7 @@ class FeedingManager:
         Returns:
             Dictionary with activation results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -4005,7 +4196,7 @@ class FeedingManager:
         Returns:
             Dictionary with transition plan and results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -4139,7 +4330,7 @@ class FeedingManager:
         Returns:
             Dictionary with compliance analysis
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -4396,7 +4587,7 @@ class FeedingManager:
         Returns:
             Dictionary with adjustment results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             config = self._configs.get(dog_id)
             if not config:
                 raise ValueError(
@@ -4521,7 +4712,7 @@ class FeedingManager:
         Returns:
             Dictionary with snack addition results
         """
-        async with self._lock:
+        async with self._dog_lock(dog_id):
             if dog_id not in self._configs:
                 raise ValueError(
                     f"No feeding configuration found for dog {dog_id}",
@@ -4609,6 +4800,7 @@ class FeedingManager:
         self._reminder_events.clear()
         self._next_reminders.clear()
         self._feedings.clear()
+        self._feeding_aggregates.clear()
         self._configs.clear()
         self._data_cache.clear()
         self._cache_time.clear()
@@ -22,6 +22,7 @@ from .translation_helpers import (
     async_get_component_translation_lookup,
     resolve_component_translation,
 )
+from .translation_index import get_bundled_translation_index
 
 FEEDING_COMPLIANCE_TRANSLATION_KEYS: Final[dict[str, str]] = {
     "no_data_title": "feeding_compliance_no_data_title",
@@ -37,6 +38,10 @@ FEEDING_COMPLIANCE_TRANSLATION_KEYS: Final[dict[str, str]] = {
     "no_recommendations": "feeding_compliance_no_recommendations",
 }
 
+_FEEDING_COMPLIANCE_TEMPLATE_KEYS: Final[tuple[str, ...]] = tuple(
+    FEEDING_COMPLIANCE_TRANSLATION_KEYS.values(),
+)
+
 
 def _resolve_feeding_compliance_translations(
     translations: Mapping[str, str],
@@ -595,10 +600,24 @@ def _load_static_common_translations(language: str | None) -> Mapping[str, str]:
 
 def get_feeding_compliance_translations(language: str | None) -> dict[str, str]:
     """Return static feeding compliance translations for non-HA unit tests."""
-    common = _load_static_common_translations(language)
+    if (index := get_bundled_translation_index()) is not None:
+        templates = index.templates(
+            (language or "en").lower(),
+            _FEEDING_COMPLIANCE_TEMPLATE_KEYS,
+        )
+    else:
+        common = _load_static_common_translations(language)
+        templates = tuple(
+            common.get(translation_key)
+            for translation_key in _FEEDING_COMPLIANCE_TEMPLATE_KEYS
+        )
     return {
-        key: str(common.get(translation_key, key))
-        for key, translation_key in FEEDING_COMPLIANCE_TRANSLATION_KEYS.items()
+        key: str(template) if template is not None else key
+        for key, template in zip(
+            FEEDING_COMPLIANCE_TRANSLATION_KEYS,
+            templates,
+            strict=True,
+        )
     }
 
 
@@ -0,0 +1,135 @@
+"""Spatial index for circular geofence zones.
+
+Zone checks used to test every configured zone against every location update.
+:class:`ZoneIndex` buckets the bounding box of each zone's circle into a fixed
+latitude/longitude grid so a lookup only returns the handful of zones whose
+circle can contain the queried point.  Lookups cost one dictionary access and
+are independent of the number of zones; exact containment is still decided by
+the caller with a single haversine per candidate.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from collections.abc import Iterable, Iterator
+import math
+from typing import Final, Self
+
+from .route_track import EARTH_RADIUS_M
+
+DEFAULT_CELL_DEGREES: Final[float] = 0.05  # ~5.5 km of latitude
+_METERS_PER_DEGREE: Final[float] = EARTH_RADIUS_M * math.pi / 180.0
+_MIN_COS_LATITUDE: Final[float] = 1e-6
+# Small safety margin so boxes never under-cover the spherical circle.
+_BOX_MARGIN: Final[float] = 1.01
+
+
+class ZoneIndex[K]:
+    """Grid bucket index over zone bounding circles.
+
+    Every zone is registered in each grid cell its bounding box touches.
+    Zones whose box spans half the globe in longitude (very close to the
+    poles) are kept in a small overflow set that is returned for every query.
+    """
+
+    __slots__ = (
+        "_cell_degrees",
+        "_cells",
+        "_columns",
+        "_entries",
+        "_wide",
+    )
+
+    def __init__(self, cell_degrees: float = DEFAULT_CELL_DEGREES) -> None:
+        """Initialise an empty index with square cells of ``cell_degrees``."""
+        self._cell_degrees = cell_degrees
+        self._columns = math.ceil(360.0 / cell_degrees)
+        self._cells: dict[tuple[int, int], set[K]] = {}
+        self._entries: dict[K, list[tuple[int, int]]] = {}
+        self._wide: set[K] = set()
+
+    @classmethod
+    def from_circles(
+        cls,
+        circles: Iterable[tuple[K, float, float, float]],
+        cell_degrees: float = DEFAULT_CELL_DEGREES,
+    ) -> Self:
+        """Build an index from ``(key, latitude, longitude, radius_m)`` rows."""
+        index = cls(cell_degrees)
+        for key, latitude, longitude, radius in circles:
+            index.insert(key, latitude, longitude, radius)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed zones."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True when ``key`` is indexed."""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over indexed keys."""
+        return iter(self._entries)
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        row = math.floor((latitude + 90.0) / self._cell_degrees)
+        column = math.floor((longitude + 180.0) / self._cell_degrees)
+        return row, column % self._columns
+
+    def insert(self, key: K, latitude: float, longitude: float, radius: float) -> None:
+        """Register (or re-register) a circular zone under ``key``."""
+        self.remove(key)
+        lat_span = radius * _BOX_MARGIN / _METERS_PER_DEGREE
+        cos_lat = max(
+            min(
+                math.cos(math.radians(latitude - lat_span)),
+                math.cos(math.radians(latitude + lat_span)),
+            ),
+            _MIN_COS_LATITUDE,
+        )
+        lon_span = radius * _BOX_MARGIN / (_METERS_PER_DEGREE * cos_lat)
+        if lon_span >= 90.0 or abs(latitude) + lat_span >= 90.0:
+            self._wide.add(key)
+            self._entries[key] = []
+            return
+
+        min_row, min_column = self._cell(latitude - lat_span, longitude - lon_span)
+        max_row, max_column = self._cell(latitude + lat_span, longitude + lon_span)
+        if max_column < min_column:  # the box wraps across the antimeridian
+            max_column += self._columns
+        cells: list[tuple[int, int]] = []
+        for row in range(min_row, max_row + 1):
+            for column in range(min_column, max_column + 1):
+                cell = (row, column % self._columns)
+                self._cells.setdefault(cell, set()).add(key)
+                cells.append(cell)
+        self._entries[key] = cells
+
+    def remove(self, key: K) -> None:
+        """Forget ``key`` if it is indexed."""
+        cells = self._entries.pop(key, None)
+        if cells is None:
+            return
+        self._wide.discard(key)
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if not bucket:
+                del self._cells[cell]
+
+    def clear(self) -> None:
+        """Drop every indexed zone."""
+        self._cells.clear()
+        self._entries.clear()
+        self._wide.clear()
+
+    def candidates(self, latitude: float, longitude: float) -> set[K]:
+        """Return keys of zones whose bounding box covers the point."""
+        bucket = self._cells.get(self._cell(latitude, longitude))
+        if bucket is None:
+            return set(self._wide)
+        return bucket | self._wide if self._wide else set(bucket)
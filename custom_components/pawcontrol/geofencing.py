@@ -32,6 +32,7 @@ from .const import (
     STORAGE_VERSION,
 )
 from .exceptions import ValidationError
+from .geofence_index import ZoneIndex
 from .notifications import (
     NotificationPriority,
     NotificationTemplateData,
@@ -100,6 +101,9 @@ def _empty_zone_metadata() -> GeofenceZoneMetadata:
 DEFAULT_HOME_ZONE_RADIUS: Final[int] = 50  # meters
 DEFAULT_CHECK_INTERVAL: Final[int] = 30  # seconds
 GEOFENCE_HYSTERESIS: Final[float] = 0.8  # 20% hysteresis to prevent flapping
+# Entry/exit thresholds relative to the zone radius derived from the hysteresis
+_ENTRY_RADIUS_FACTOR: Final[float] = min(1.0, GEOFENCE_HYSTERESIS)
+_EXIT_RADIUS_FACTOR: Final[float] = max(1.0, 1.0 / GEOFENCE_HYSTERESIS)
 EARTH_RADIUS_KM: Final[float] = 6371.0  # Earth radius in kilometers
 
 
@@ -312,7 +316,14 @@ class PawControlGeofencing:
 
         # Runtime state
         self._zones: dict[str, GeofenceZone] = {}
+        self._zone_index: ZoneIndex[str] | None = None
+        # Insertion position of each zone, rebuilt together with the index.
+        self._zone_order: dict[str, int] = {}
         self._dog_states: dict[str, DogLocationState] = {}
+        # Dogs whose zone membership must be re-evaluated because zones (or
+        # the enabled flag) changed; location updates are checked inline.
+        self._dirty_dogs: set[str] = set()
+        self._check_requested = asyncio.Event()
         self._enabled = False
         self._check_interval = DEFAULT_CHECK_INTERVAL
         self._use_home_location = True
@@ -409,6 +420,7 @@ class PawControlGeofencing:
                 # Create home zone if enabled and not exists
                 if use_home_location and "home" not in self._zones:
                     await self._create_home_zone()
+                self._invalidate_zone_index()
                 # Start monitoring if enabled
                 if enabled:
                     await self._start_monitoring()
@@ -443,6 +455,7 @@ class PawControlGeofencing:
                 )
 
                 self._zones["home"] = home_zone
+                self._invalidate_zone_index()
                 await self._save_data()
 
                 _LOGGER.info(
@@ -484,9 +497,15 @@ class PawControlGeofencing:
         _LOGGER.debug("Stopped geofencing monitoring tasks")
 
     async def _monitoring_loop(self) -> None:
-        """Main monitoring loop for geofence checking."""
+        """Re-evaluate dogs whose zones changed, at most once per interval.
+
+        Location updates are checked as they arrive, so the loop sleeps until
+        a zone change requests a pass instead of polling unchanged positions.
+        """
         while True:
             try:
+                await self._check_requested.wait()
+                self._check_requested.clear()
                 await self._check_all_locations()
                 await asyncio.sleep(self._check_interval)
             except asyncio.CancelledError:
@@ -507,51 +526,87 @@ class PawControlGeofencing:
                 _LOGGER.error("Error in geofencing cleanup loop: %s", err)
 
     async def _check_all_locations(self) -> None:
-        """Check all dog locations against all geofence zones."""
+        """Check every dog flagged by a zone change against the zone index."""
         async with self._lock:
-            for dog_state in self._dog_states.values():
-                if dog_state.last_location:
+            dirty, self._dirty_dogs = self._dirty_dogs, set()
+            for dog_id in dirty:
+                dog_state = self._dog_states.get(dog_id)
+                if dog_state is not None and dog_state.last_location:
                     await self._check_dog_location(dog_state)
 
+    def _invalidate_zone_index(self) -> None:
+        """Drop the zone index and schedule a re-check of every located dog."""
+        self._zone_index = None
+        self._dirty_dogs.update(
+            dog_id
+            for dog_id, dog_state in self._dog_states.items()
+            if dog_state.last_location is not None
+        )
+        if self._dirty_dogs:
+            self._check_requested.set()
+
+    def _get_zone_index(self) -> ZoneIndex[str]:
+        """Return the spatial index over zone circles, rebuilding it if stale."""
+        index = self._zone_index
+        if index is None or len(index) != len(self._zones):
+            index = ZoneIndex.from_circles(
+                (
+                    zone_id,
+                    zone.latitude,
+                    zone.longitude,
+                    zone.radius * _ENTRY_RADIUS_FACTOR,
+                )
+                for zone_id, zone in self._zones.items()
+            )
+            self._zone_index = index
+            self._zone_order = {
+                zone_id: position for position, zone_id in enumerate(self._zones)
+            }
+        return index
+
     async def _check_dog_location(self, dog_state: DogLocationState) -> None:
-        """Check a specific dog's location against all zones.
+        """Check a specific dog's location against nearby zones.
+
+        Only zones whose circle can contain the location (from the spatial
+        index) and zones the dog is currently in are evaluated, each with a
+        single distance calculation.
 
         Args:
             dog_state: Current state for the dog
         """
-        if not dog_state.last_location:
+        location = dog_state.last_location
+        if not location:
             return
         current_time = dt_util.utcnow()
-        newly_entered_zones = set()
-        newly_left_zones = set()
+        newly_entered_zones: list[str] = []
+        newly_left_zones: list[str] = []
 
-        # Check each zone
-        for zone in self._zones.values():
-            if not zone.enabled:
+        zone_ids = self._get_zone_index().candidates(
+            location.latitude,
+            location.longitude,
+        )
+        zone_ids.update(dog_state.current_zones)
+        # Visited in zone insertion order so events for overlapping zones fire
+        # in the order the zones were configured.
+        order = self._zone_order
+        for zone_id in sorted(
+            zone_ids, key=lambda zone_id: order.get(zone_id, len(order))
+        ):
+            zone = self._zones.get(zone_id)
+            if zone is None or not zone.enabled:
                 continue
 
-            zone_id = zone.id
-            currently_inside = zone.contains_location(dog_state.last_location)
-            was_inside = zone_id in dog_state.current_zones
-            # Check for zone entry
-            if currently_inside and not was_inside:
-                # Use hysteresis to confirm entry
-                if zone.contains_location(dog_state.last_location, GEOFENCE_HYSTERESIS):
+            distance = zone.distance_to_location(location)
+            if zone_id not in dog_state.current_zones:
+                # Entry must clear the hysteresis band to prevent flapping
+                if distance <= zone.radius * _ENTRY_RADIUS_FACTOR:
                     dog_state.current_zones.add(zone_id)
                     dog_state.zone_entry_times[zone_id] = current_time
-                    newly_entered_zones.add(zone_id)
-            # Check for zone exit
-            elif (
-                not currently_inside
-                and was_inside
-                and not zone.contains_location(
-                    dog_state.last_location,
-                    1.0 / GEOFENCE_HYSTERESIS,
-                )
-            ):
+                    newly_entered_zones.append(zone_id)
+            elif distance > zone.radius * _EXIT_RADIUS_FACTOR:
                 dog_state.current_zones.discard(zone_id)
                 dog_state.zone_entry_times.pop(zone_id, None)
-                newly_left_zones.add(zone_id)
+                newly_left_zones.append(zone_id)
 
         # Fire events for zone changes
         for zone_id in newly_entered_zones:
@@ -652,6 +707,7 @@ class PawControlGeofencing:
             dog_state = self._dog_states[dog_id]
             dog_state.add_location(location)
             if self._enabled:
+                self._dirty_dogs.discard(dog_id)
                 await self._check_dog_location(dog_state)
 
     async def async_add_zone(self, zone: GeofenceZone) -> bool:
@@ -668,6 +724,7 @@ class PawControlGeofencing:
                 return False
 
             self._zones[zone.id] = zone
+            self._invalidate_zone_index()
             await self._save_data()
             _LOGGER.info(
                 "Added geofence zone '%s' (%s): %.6f,%.6f radius %dm",
@@ -695,6 +752,7 @@ class PawControlGeofencing:
 
             zone.updated_at = dt_util.utcnow()
             self._zones[zone.id] = zone
+            self._invalidate_zone_index()
             await self._save_data()
             _LOGGER.info("Updated geofence zone '%s'", zone.name)
             return True
@@ -717,6 +775,7 @@ class PawControlGeofencing:
             for dog_state in self._dog_states.values():
                 dog_state.current_zones.discard(zone_id)
                 dog_state.zone_entry_times.pop(zone_id, None)
+            self._zone_index = None
 
             await self._save_data()
             _LOGGER.info("Removed geofence zone '%s'", zone.name)
@@ -734,6 +793,8 @@ class PawControlGeofencing:
 
             self._enabled = enabled
             if enabled:
+                # Positions reported while disabled were never evaluated.
+                self._invalidate_zone_index()
                 await self._start_monitoring()
             else:
                 await self._stop_monitoring()
@@ -816,7 +877,9 @@ class PawControlGeofencing:
 
         async with self._lock:
             self._zones.clear()
+            self._zone_index = None
             self._dog_states.clear()
+            self._dirty_dogs.clear()
             self._notification_manager = None
 
     async def _notify_zone_event(
@@ -10,18 +10,18 @@ Python: 3.13+
 """
 
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-import inspect
 import logging
 import math
-from typing import Any, NamedTuple, cast
+from typing import Any, NamedTuple, Self, cast
 from uuid import uuid4
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -30,6 +30,7 @@ from .const import (
     EVENT_GEOFENCE_LEFT,
     EVENT_GEOFENCE_RETURN,
 )
+from .geofence_index import ZoneIndex
 from .notifications import (
     NotificationPriority,
     NotificationTemplateData,
@@ -37,6 +38,15 @@ from .notifications import (
     PawControlNotificationManager,
 )
 from .resilience import ResilienceManager, RetryConfig
+from .route_analytics import RouteAnalytics, analyze_track
+from .route_simplify import DEFAULT_TOLERANCE_M, simplify_track
+from .route_track import (
+    TrackBuffer,
+    TrackRow,
+    calculate_distance,
+    datetime_to_epoch,
+    epoch_to_datetime,
+)
 from .types import (
     GeofenceEventPayload,
     GeofenceNotificationCoordinates,
@@ -62,7 +72,11 @@ from .utils import async_fire_event, normalize_value
 _LOGGER = logging.getLogger(__name__)
 
 _TRACKING_UPDATE_TIMEOUT = 30.0
-_TASK_CANCEL_TIMEOUT = 5.0
+
+
+def _is_device_tracker(entity_id: object) -> bool:
+    """Return True when ``entity_id`` belongs to the device_tracker domain."""
+    return isinstance(entity_id, str) and entity_id.startswith("device_tracker.")
 
 
 class GeofenceEventType(Enum):
@@ -132,6 +146,64 @@ class GPSPoint:
         ]
 
 
+class GPSTrack(TrackBuffer):
+    """Columnar route storage that reads back as :class:`GPSPoint` values.
+
+    Indexing and iteration materialise points on demand; statistics and
+    exports should prefer the underlying columns.  ``battery_level`` is not
+    retained per sample.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_points(cls, points: Iterable[GPSPoint]) -> Self:
+        """Build a track from existing :class:`GPSPoint` objects."""
+        track = cls()
+        for point in points:
+            track.append(point)
+        return track
+
+    def append(self, point: GPSPoint) -> None:
+        """Append ``point`` to the columns."""
+        self.add(
+            point.latitude,
+            point.longitude,
+            datetime_to_epoch(point.timestamp),
+            altitude=point.altitude,
+            accuracy=point.accuracy,
+            speed=point.speed,
+            heading=point.heading,
+            source=point.source.value,
+        )
+
+    def __getitem__(self, index: int) -> GPSPoint:
+        """Materialise the point at ``index``."""
+        return _point_from_row(self.row(index))
+
+    def __iter__(self) -> Iterator[GPSPoint]:
+        """Iterate over materialised points."""
+        for row in self.rows():
+            yield _point_from_row(row)
+
+
+def _point_from_row(row: TrackRow) -> GPSPoint:
+    try:
+        source = LocationSource(row.source)
+    except ValueError:
+        source = LocationSource.DEVICE_TRACKER
+    return GPSPoint(
+        latitude=row.latitude,
+        longitude=row.longitude,
+        timestamp=epoch_to_datetime(row.timestamp),
+        altitude=row.altitude,
+        accuracy=row.accuracy,
+        speed=row.speed,
+        heading=row.heading,
+        source=source,
+    )
+
+
 @dataclass
 class GeofenceZone:
     """Geofence zone definition with safety parameters."""
@@ -220,7 +292,7 @@ class WalkRoute:
     dog_id: str
     start_time: datetime
     end_time: datetime | None = None
-    gps_points: list[GPSPoint] = field(default_factory=list)
+    gps_points: GPSTrack = field(default_factory=GPSTrack)
     segments: list[RouteSegment] = field(default_factory=list)
     total_distance_meters: float = 0.0
     total_duration_seconds: float = 0.0
@@ -228,6 +300,13 @@ class WalkRoute:
     max_speed_mps: float | None = None
     geofence_events: list[GeofenceEvent] = field(default_factory=list)
     route_quality: GPSAccuracy = GPSAccuracy.FAIR
+    analytics: RouteAnalytics | None = field(default=None, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store assigned point sequences in columnar form."""
+        if name == "gps_points" and not isinstance(value, GPSTrack):
+            value = GPSTrack.from_points(value)
+        object.__setattr__(self, name, value)
 
     @property
     def is_active(self) -> bool:
@@ -329,37 +408,6 @@ def _build_tracking_config(config: GPSTrackingConfigInput) -> GPSTrackingConfig:
     )
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two GPS points using Haversine formula.
-
-    Args:
-        lat1: Latitude of first point
-        lon1: Longitude of first point
-        lat2: Latitude of second point
-        lon2: Longitude of second point
-
-    Returns:
-        Distance in meters
-    """
-    # Earth's radius in meters
-    earth_radius_m = 6_371_000
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    # Haversine formula
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    )
-
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return earth_radius_m * c
-
-
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate bearing between two GPS points.
 
@@ -385,6 +433,20 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     return (bearing_degrees + 360) % 360
 
 
+def _extract_tracker_coordinates(
+    state: Any,
+) -> tuple[float, float, float | None] | None:
+    """Return ``(latitude, longitude, accuracy)`` from a tracker state if usable."""
+    if state is None or state.state in ("unavailable", "unknown"):
+        return None
+    attributes = state.attributes
+    latitude = attributes.get("latitude")
+    longitude = attributes.get("longitude")
+    if latitude is None or longitude is None:
+        return None
+    return latitude, longitude, attributes.get("gps_accuracy")
+
+
 class GPSGeofenceManager:
     """Manages GPS tracking and geofencing for PawControl dogs."""
 
@@ -402,8 +464,20 @@ class GPSGeofenceManager:
             str,
             dict[str, bool],
         ] = {}  # dog_id -> zone_name -> inside
+        # dog_id -> (indexed zone list, its length, index over list positions)
+        self._zone_indexes: dict[
+            str,
+            tuple[list[GeofenceZone], int, ZoneIndex[int]],
+        ] = {}
         self._last_locations: dict[str, GPSPoint] = {}
-        self._tracking_tasks: dict[str, asyncio.Task[Any]] = {}
+        # dog_id -> (subscribed tracker entity_ids, unsubscribe callback)
+        self._tracker_unsubs: dict[
+            str,
+            tuple[tuple[str, ...], Callable[[], None]],
+        ] = {}
+        self._tracker_index: dict[str, tuple[str, ...]] | None = None
+        self._indexed_dog_ids: frozenset[str] = frozenset()
+        self._registry_unsub: Callable[[], None] | None = None
         self._route_history: dict[str, list[WalkRoute]] = {}
         self._notification_manager: PawControlNotificationManager | None = None
 
@@ -422,6 +496,7 @@ class GPSGeofenceManager:
             "gps_points_processed": 0,
             "routes_completed": 0,
             "geofence_events": 0,
+            "tracker_index_rebuilds": 0,
             "last_update": dt_util.utcnow(),
         }
 
@@ -603,10 +678,10 @@ class GPSGeofenceManager:
             )
 
             self._active_routes[dog_id] = route
-            # Start tracking task if configured
+            # Subscribe to device tracker movement if configured
             config = self._dog_configs.get(dog_id)
             if config and config.enabled and track_route:
-                await self._start_tracking_task(dog_id)
+                await self._start_tracker_subscription(dog_id)
 
             session_id = f"{dog_id}_{uuid4().hex}"
             _LOGGER.info(
@@ -648,8 +723,8 @@ class GPSGeofenceManager:
                 _LOGGER.warning("No active GPS tracking found for %s", dog_id)
                 return None
 
-            # Stop tracking task
-            await self._stop_tracking_task(dog_id)
+            # Stop tracker subscription
+            await self._stop_tracker_subscription(dog_id)
             # Finalize route
             route.end_time = dt_util.utcnow()
             if route.gps_points:
@@ -658,6 +733,12 @@ class GPSGeofenceManager:
 
                 # Save to history if requested
                 if save_route:
+                    # Statistics above used every sample; history keeps an
+                    # error-bounded polyline that also feeds the exports.
+                    route.gps_points = simplify_track(
+                        route.gps_points,
+                        DEFAULT_TOLERANCE_M,
+                    )
                     if dog_id not in self._route_history:
                         self._route_history[dog_id] = []
                     self._route_history[dog_id].append(route)
@@ -743,11 +824,15 @@ class GPSGeofenceManager:
             route = self._active_routes.get(dog_id)
             if route:
                 # Check minimum distance filter
-                if config and route.gps_points and config.min_distance_for_point > 0:
-                    last_point = route.gps_points[-1]
+                last_position = route.gps_points.last_position()
+                if (
+                    config
+                    and last_position is not None
+                    and config.min_distance_for_point > 0
+                ):
                     distance = calculate_distance(
-                        last_point.latitude,
-                        last_point.longitude,
+                        last_position[0],
+                        last_position[1],
                         latitude,
                         longitude,
                     )
@@ -932,6 +1017,7 @@ class GPSGeofenceManager:
             "gps_points_processed": int(self._stats["gps_points_processed"]),
             "routes_completed": int(self._stats["routes_completed"]),
             "geofence_events": int(self._stats["geofence_events"]),
+            "tracker_index_rebuilds": int(self._stats["tracker_index_rebuilds"]),
             "last_update": self._stats["last_update"],
             "dogs_configured": len(self._dog_configs),
             "active_tracking_sessions": active_tracking,
@@ -950,169 +1036,163 @@ class GPSGeofenceManager:
         if len(history) > 100:
             self._route_history[dog_id] = history[-100:]
 
-    async def _start_tracking_task(self, dog_id: str) -> None:
-        """Start background tracking task for a dog."""
-        await self._stop_tracking_task(dog_id)  # Stop any existing task
+    def _rebuild_tracker_index(
+        self,
+        extra_dog_id: str | None = None,
+    ) -> dict[str, tuple[str, ...]]:
+        """Build the dog_id -> device_tracker entity index in a single pass.
 
-        config = self._dog_configs.get(dog_id)
-        if not config or not config.enabled:
+        The registry scan only happens when the index is cold; entity registry
+        update events invalidate it so the tracking hot path stays O(1).
+        """
+        entity_registry = er.async_get(self.hass)
+        dog_ids = {dog_id.lower(): dog_id for dog_id in self._dog_configs}
+        dog_ids.update({dog_id.lower(): dog_id for dog_id in self._active_routes})
+        if extra_dog_id is not None:
+            dog_ids[extra_dog_id.lower()] = extra_dog_id
+
+        index: dict[str, list[str]] = {}
+        for entity in entity_registry.entities.values():
+            if not _is_device_tracker(entity.entity_id):
+                continue
+            name = (entity.name or "").lower()
+            if not name:
+                continue
+            for lowered, dog_id in dog_ids.items():
+                if lowered in name:
+                    index.setdefault(dog_id, []).append(entity.entity_id)
+
+        self._tracker_index = {
+            dog_id: tuple(entity_ids) for dog_id, entity_ids in index.items()
+        }
+        self._indexed_dog_ids = frozenset(dog_ids.values())
+        self._stats["tracker_index_rebuilds"] += 1
+        self._ensure_registry_listener()
+        return self._tracker_index
+
+    def _resolve_tracker_entities(self, dog_id: str) -> tuple[str, ...]:
+        """Return the indexed device_tracker entities associated with a dog."""
+        index = self._tracker_index
+        if index is None or dog_id not in self._indexed_dog_ids:
+            index = self._rebuild_tracker_index(dog_id)
+        return index.get(dog_id, ())
+
+    def _ensure_registry_listener(self) -> None:
+        """Subscribe to entity registry updates to keep the tracker index fresh."""
+        if self._registry_unsub is not None:
             return
+        bus = getattr(self.hass, "bus", None)
+        async_listen = getattr(bus, "async_listen", None)
+        if not callable(async_listen):
+            return
+        self._registry_unsub = async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._handle_entity_registry_updated,
+        )
 
-        async def _tracking_loop() -> None:
-            """Background task for GPS tracking."""
-            try:
-                while dog_id in self._active_routes:
-                    # Try to get location from device tracker
-                    try:
-                        await asyncio.wait_for(
-                            self._update_location_from_device_tracker(dog_id),
-                            timeout=min(
-                                _TRACKING_UPDATE_TIMEOUT,
-                                max(5.0, float(config.update_interval)),
-                            ),
-                        )
-                    except TimeoutError:
-                        _LOGGER.warning(
-                            "GPS tracking update timed out for %s",
-                            dog_id,
-                        )
+    @callback  # type: ignore[untyped-decorator,misc]
+    def _handle_entity_registry_updated(self, event: Event) -> None:
+        """Invalidate the tracker index when device_tracker entities change."""
+        data = getattr(event, "data", None) or {}
+        entity_ids = {data.get("entity_id"), data.get("old_entity_id")}
+        if not any(_is_device_tracker(entity_id) for entity_id in entity_ids):
+            return
 
-                    # Wait for next update
-                    await asyncio.sleep(config.update_interval)
-            except asyncio.CancelledError:
-                _LOGGER.debug("GPS tracking task cancelled for %s", dog_id)
-            except Exception as err:
-                _LOGGER.error(
-                    "GPS tracking task error for %s: %s",
-                    dog_id,
-                    err,
-                )
+        self._tracker_index = None
+        for dog_id in list(self._tracker_unsubs):
+            self._subscribe_tracker_entities(dog_id)
 
-        async def _resolve_task(candidate: Any) -> asyncio.Task[Any] | None:
-            """Coerce scheduler return values into asyncio tasks."""
-            current: Any = candidate
-            while True:
-                if isinstance(current, asyncio.Task):
-                    return current
-                if isinstance(current, asyncio.Future):
-                    return cast(asyncio.Task[Any], current)
-                if inspect.isawaitable(current):
-                    try:
-                        current = await current
-                    except Exception as err:  # pragma: no cover - defensive guard
-                        _LOGGER.debug(
-                            "Awaiting scheduled task wrapper failed for %s: %s",
-                            dog_id,
-                            err,
-                        )
-                        return None
-                    continue
-                return None
-
-        def _loop_factory() -> Coroutine[Any, Any, None]:
-            return _tracking_loop()
-
-        task_name = f"pawcontrol_gps_tracking_{dog_id}"
-        task_handle: asyncio.Task[Any] | None = None
-
-        hass_create_task = getattr(self.hass, "async_create_task", None)
-        hass_coroutine: Coroutine[Any, Any, None] | None = None
-        if callable(hass_create_task):
-            hass_coroutine = _loop_factory()
-            try:
-                scheduled = hass_create_task(hass_coroutine, name=task_name)
-            except TypeError:
-                scheduled = hass_create_task(hass_coroutine)
-            except Exception as err:  # pragma: no cover - defensive guard
-                _LOGGER.debug(
-                    "Home Assistant task scheduling failed for %s: %s",
-                    dog_id,
-                    err,
-                )
-                scheduled = None
-            else:
-                task_handle = await _resolve_task(scheduled)
-
-            if task_handle is None and hass_coroutine is not None:
-                hass_coroutine.close()
-                hass_coroutine = None
-
-        if task_handle is None:
-            loop = getattr(self.hass, "loop", None)
-            if loop is not None:
-                try:
-                    task_handle = loop.create_task(
-                        _loop_factory(),
-                        name=task_name,
-                    )
-                except TypeError:
-                    task_handle = loop.create_task(_loop_factory())
-            else:
-                try:
-                    task_handle = asyncio.create_task(
-                        _loop_factory(),
-                        name=task_name,
-                    )
-                except TypeError:  # pragma: no cover - <3.8 compatibility guard
-                    task_handle = asyncio.create_task(_loop_factory())
-        if task_handle is None:
-            raise RuntimeError(
-                f"Failed to schedule GPS tracking task for {dog_id}",
+    def _subscribe_tracker_entities(self, dog_id: str) -> None:
+        """(Re)subscribe to state changes of the trackers indexed for a dog."""
+        entity_ids = self._resolve_tracker_entities(dog_id)
+        subscription = self._tracker_unsubs.get(dog_id)
+        if subscription is not None and subscription[0] == entity_ids:
+            return
+        if subscription is not None:
+            subscription[1]()
+
+        @callback  # type: ignore[untyped-decorator,misc]
+        def _on_tracker_change(
+            event: Event[EventStateChangedData],
+        ) -> None:
+            if dog_id not in self._active_routes:
+                return
+            coordinates = _extract_tracker_coordinates(event.data.get("new_state"))
+            if coordinates is None:
+                return
+            previous = _extract_tracker_coordinates(event.data.get("old_state"))
+            if previous is not None and previous[:2] == coordinates[:2]:
+                # Attribute-only updates (battery, accuracy) are not movement.
+                return
+            latitude, longitude, accuracy = coordinates
+            self.hass.async_create_task(
+                self.async_add_gps_point(
+                    dog_id=dog_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    accuracy=accuracy,
+                    source=LocationSource.DEVICE_TRACKER,
+                ),
             )
 
-        self._tracking_tasks[dog_id] = task_handle
+        unsub = async_track_state_change_event(
+            self.hass,
+            list(entity_ids),
+            _on_tracker_change,
+        )
+        self._tracker_unsubs[dog_id] = (entity_ids, unsub)
 
-        _LOGGER.debug("Started GPS tracking task for %s", dog_id)
+    async def _start_tracker_subscription(self, dog_id: str) -> None:
+        """Subscribe to device tracker movement for an active walk."""
+        await self._stop_tracker_subscription(dog_id)
 
-    async def _stop_tracking_task(self, dog_id: str) -> None:
-        """Stop background tracking task for a dog."""
-        task = self._tracking_tasks.pop(dog_id, None)
-        if task is None:
+        config = self._dog_configs.get(dog_id)
+        if not config or not config.enabled:
             return
-        if not task.done():
-            task.cancel()
-            try:
-                await asyncio.wait_for(task, timeout=_TASK_CANCEL_TIMEOUT)
-            except TimeoutError:
-                _LOGGER.warning(
-                    "Timeout while stopping GPS tracking task for %s",
-                    dog_id,
-                )
-            except asyncio.CancelledError:
-                _LOGGER.debug("GPS tracking task cancelled for %s", dog_id)
 
-        _LOGGER.debug("Stopped GPS tracking task for %s", dog_id)
+        self._subscribe_tracker_entities(dog_id)
+
+        # Seed the route with the tracker's current position; subsequent points
+        # arrive through the state-change subscription.
+        try:
+            await asyncio.wait_for(
+                self._update_location_from_device_tracker(dog_id),
+                timeout=_TRACKING_UPDATE_TIMEOUT,
+            )
+        except TimeoutError:
+            _LOGGER.warning("Initial GPS tracker read timed out for %s", dog_id)
+
+        _LOGGER.debug("Started GPS tracker subscription for %s", dog_id)
+
+    async def _stop_tracker_subscription(self, dog_id: str) -> None:
+        """Unsubscribe from device tracker movement for a dog."""
+        subscription = self._tracker_unsubs.pop(dog_id, None)
+        if subscription is None:
+            return
+        subscription[1]()
+
+        _LOGGER.debug("Stopped GPS tracker subscription for %s", dog_id)
 
     async def _update_location_from_device_tracker(self, dog_id: str) -> None:
         """Try to update location from associated device tracker with retry."""
 
         async def _fetch_device_tracker_location() -> None:
             """Internal function to fetch location - wrapped by retry logic."""
-            # Try to find device tracker entity for this dog
-            entity_registry = er.async_get(self.hass)
-            dr.async_get(self.hass)
-            # Look for device tracker entities that might belong to this dog
-            for entity in entity_registry.entities.values():
-                if (
-                    entity.platform == "device_tracker"
-                    and dog_id.lower() in (entity.name or "").lower()
-                ):
-                    state = self.hass.states.get(entity.entity_id)
-                    if state and state.state not in ["unavailable", "unknown"]:
-                        # Extract GPS coordinates
-                        lat = state.attributes.get("latitude")
-                        lon = state.attributes.get("longitude")
-                        accuracy = state.attributes.get("gps_accuracy")
-
-                        if lat is not None and lon is not None:
-                            await self.async_add_gps_point(
-                                dog_id=dog_id,
-                                latitude=lat,
-                                longitude=lon,
-                                accuracy=accuracy,
-                                source=LocationSource.DEVICE_TRACKER,
-                            )
-                            return
+            for entity_id in self._resolve_tracker_entities(dog_id):
+                coordinates = _extract_tracker_coordinates(
+                    self.hass.states.get(entity_id),
+                )
+                if coordinates is None:
+                    continue
+                latitude, longitude, accuracy = coordinates
+                await self.async_add_gps_point(
+                    dog_id=dog_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    accuracy=accuracy,
+                    source=LocationSource.DEVICE_TRACKER,
+                )
+                return
             # Could also check for companion app entities, etc.
 
         # RESILIENCE: Wrap in retry logic for transient failures
@@ -1128,21 +1208,48 @@ class GPSGeofenceManager:
                 err,
             )
 
+    def _zone_index_for(self, dog_id: str, zones: list[GeofenceZone]) -> ZoneIndex[int]:
+        """Return the spatial index for ``zones``, rebuilding it when replaced."""
+        cached = self._zone_indexes.get(dog_id)
+        if cached is not None and cached[0] is zones and cached[1] == len(zones):
+            return cached[2]
+        index = ZoneIndex.from_circles(
+            (position, zone.center_lat, zone.center_lon, zone.radius_meters)
+            for position, zone in enumerate(zones)
+        )
+        self._zone_indexes[dog_id] = (zones, len(zones), index)
+        return index
+
     async def _check_geofence_zones(self, dog_id: str, gps_point: GPSPoint) -> None:
-        """Check GPS point against all geofence zones for a dog."""
+        """Check GPS point against the geofence zones near it.
+
+        Zones are narrowed down with a spatial index; zones the dog is
+        currently inside are always re-checked so exits are detected.
+        """
         zones = self._geofence_zones.get(dog_id, [])
         if not zones:
             return
         zone_status = self._zone_status.get(dog_id, {})
 
-        for zone in zones:
+        positions = self._zone_index_for(dog_id, zones).candidates(
+            gps_point.latitude,
+            gps_point.longitude,
+        )
+        positions.update(
+            position
+            for position, zone in enumerate(zones)
+            if zone_status.get(zone.name, True)
+        )
+        for position in sorted(positions):
+            zone = zones[position]
             if not zone.enabled:
                 continue
 
-            is_inside = zone.contains_point(
+            distance_from_center = zone.distance_to_center(
                 gps_point.latitude,
                 gps_point.longitude,
             )
+            is_inside = distance_from_center <= zone.radius_meters
             was_inside = zone_status.get(zone.name, True)
             # Check for zone transitions
             if is_inside != was_inside:
@@ -1150,11 +1257,6 @@ class GPSGeofenceManager:
                     GeofenceEventType.ENTERED if is_inside else GeofenceEventType.EXITED
                 )
 
-                distance_from_center = zone.distance_to_center(
-                    gps_point.latitude,
-                    gps_point.longitude,
-                )
-
                 event = GeofenceEvent(
                     dog_id=dog_id,
                     zone=zone,
@@ -1276,58 +1378,22 @@ class GPSGeofenceManager:
 
     async def _calculate_route_statistics(self, route: WalkRoute) -> None:
         """Calculate comprehensive statistics for a completed route."""
-        if not route.gps_points:
+        track = route.gps_points
+        if not track:
             return
-        total_distance = 0.0
-        total_time = 0.0
-        speeds = []
-
-        # Calculate segments and statistics
+        # One batched pass over the columns; per-segment figures stay in
+        # ``route.analytics`` instead of being materialised as RouteSegments.
+        analytics = analyze_track(track)
+        route.analytics = analytics
         route.segments = []
+        route.total_distance_meters = analytics.valid_distance_m
+        route.total_duration_seconds = analytics.valid_duration_s
+        if analytics.valid_segment_count:
+            route.avg_speed_mps = analytics.avg_speed_mps
+            route.max_speed_mps = analytics.max_speed_mps
 
-        for i in range(1, len(route.gps_points)):
-            prev_point = route.gps_points[i - 1]
-            curr_point = route.gps_points[i]
-            # Calculate distance
-            distance = calculate_distance(
-                prev_point.latitude,
-                prev_point.longitude,
-                curr_point.latitude,
-                curr_point.longitude,
-            )
-
-            # Calculate time
-            time_diff = (curr_point.timestamp - prev_point.timestamp).total_seconds()
-            # Skip invalid segments
-            if time_diff <= 0 or distance > 1000:  # Skip if >1km between points
-                continue
-
-            # Calculate speed
-            speed_mps = distance / time_diff if time_diff > 0 else 0
-            # Create segment
-            segment = RouteSegment(
-                start_point=prev_point,
-                end_point=curr_point,
-                distance_meters=distance,
-                duration_seconds=time_diff,
-                avg_speed_mps=speed_mps,
-            )
-
-            route.segments.append(segment)
-            total_distance += distance
-            total_time += time_diff
-            speeds.append(speed_mps)
-        # Update route totals
-        route.total_distance_meters = total_distance
-        route.total_duration_seconds = total_time
-
-        if speeds:
-            route.avg_speed_mps = sum(speeds) / len(speeds)
-            route.max_speed_mps = max(speeds)
         # Assess route quality based on GPS accuracy
-        accurate_points = sum(1 for p in route.gps_points if p.is_accurate)
-        accuracy_ratio = accurate_points / len(route.gps_points)
-
+        accuracy_ratio = analytics.accuracy_ratio
         if accuracy_ratio >= 0.9:
             route.route_quality = GPSAccuracy.EXCELLENT
         elif accuracy_ratio >= 0.7:
@@ -1343,14 +1409,14 @@ class GPSGeofenceManager:
         new_point: GPSPoint,
     ) -> None:
         """Update route statistics with a new GPS point."""
-        if len(route.gps_points) < 2:
+        track = route.gps_points
+        if len(track) < 2:
             return
-        prev_point = route.gps_points[-2]
 
         # Calculate distance for this segment
         distance = calculate_distance(
-            prev_point.latitude,
-            prev_point.longitude,
+            track.latitudes[-2],
+            track.longitudes[-2],
             new_point.latitude,
             new_point.longitude,
         )
@@ -1378,13 +1444,14 @@ class GPSGeofenceManager:
                 f"    <name>Walk {route.start_time.strftime('%Y-%m-%d %H:%M')}</name>\n"
             )
             gpx_content += "    <trkseg>\n"
-            for point in route.gps_points:
+            for row in route.gps_points.rows():
                 gpx_content += (
-                    f'      <trkpt lat="{point.latitude}" lon="{point.longitude}">\n'
+                    f'      <trkpt lat="{row.latitude}" lon="{row.longitude}">\n'
                 )
-                if point.altitude is not None:
-                    gpx_content += f"        <ele>{point.altitude}</ele>\n"
-                gpx_content += f"        <time>{point.timestamp.isoformat()}Z</time>\n"
+                if row.altitude is not None:
+                    gpx_content += f"        <ele>{row.altitude}</ele>\n"
+                timestamp = epoch_to_datetime(row.timestamp).isoformat()
+                gpx_content += f"        <time>{timestamp}Z</time>\n"
                 gpx_content += "      </trkpt>\n"
 
             gpx_content += "    </trkseg>\n"
@@ -1423,14 +1490,14 @@ class GPSGeofenceManager:
                 "geofence_events": [],
             }
 
-            for point in route.gps_points:
+            for row in route.gps_points.rows():
                 point_payload: GPSRouteExportJSONPoint = {
-                    "latitude": point.latitude,
-                    "longitude": point.longitude,
-                    "timestamp": point.timestamp.isoformat(),
-                    "altitude": point.altitude,
-                    "accuracy": point.accuracy,
-                    "source": point.source.value,
+                    "latitude": row.latitude,
+                    "longitude": row.longitude,
+                    "timestamp": epoch_to_datetime(row.timestamp).isoformat(),
+                    "altitude": row.altitude,
+                    "accuracy": row.accuracy,
+                    "source": row.source or LocationSource.DEVICE_TRACKER.value,
                 }
                 route_data["gps_points"].append(point_payload)
 
@@ -1472,17 +1539,17 @@ class GPSGeofenceManager:
             csv_lines.extend(
                 ",".join(
                     [
-                        point.timestamp.isoformat(),
-                        str(point.latitude),
-                        str(point.longitude),
-                        str(point.altitude if point.altitude is not None else ""),
-                        str(point.accuracy if point.accuracy is not None else ""),
+                        epoch_to_datetime(row.timestamp).isoformat(),
+                        str(row.latitude),
+                        str(row.longitude),
+                        str(row.altitude if row.altitude is not None else ""),
+                        str(row.accuracy if row.accuracy is not None else ""),
                         route_id,
                         str(route.distance_km),
                         str(route.duration_minutes),
                     ],
                 )
-                for point in route.gps_points
+                for row in route.gps_points.rows()
             )
 
         csv_content = "\n".join(csv_lines)
@@ -1497,15 +1564,21 @@ class GPSGeofenceManager:
 
     async def async_cleanup(self) -> None:
         """Cleanup GPS manager resources."""
-        # Stop all tracking tasks
-        for dog_id in list(self._tracking_tasks.keys()):
-            await self._stop_tracking_task(dog_id)
+        # Stop all tracker subscriptions
+        for dog_id in list(self._tracker_unsubs.keys()):
+            await self._stop_tracker_subscription(dog_id)
+        if self._registry_unsub is not None:
+            self._registry_unsub()
+            self._registry_unsub = None
         # Clear all data
         self._dog_configs.clear()
         self._active_routes.clear()
         self._geofence_zones.clear()
+        self._zone_indexes.clear()
         self._zone_status.clear()
         self._last_locations.clear()
         self._route_history.clear()
+        self._tracker_index = None
+        self._indexed_dog_ids = frozenset()
 
         _LOGGER.debug("GPS and geofencing manager cleaned up")
@@ -5,10 +5,7 @@ from typing import Final
 
 from homeassistant.core import HomeAssistant
 
-from .translation_helpers import (
-    get_cached_component_translation_lookup,
-    resolve_component_translation,
-)
+from .translation_helpers import get_cached_component_template
 
 GROOMING_LABEL_TRANSLATION_KEYS: Final[Mapping[str, str]] = {
     "button_action": "grooming_label_button_action",
@@ -47,13 +44,9 @@ def translated_grooming_label(
     if hass is None:
         template = translation_key
     else:
-        translations, fallback = get_cached_component_translation_lookup(
+        template = get_cached_component_template(
             hass,
             language,
-        )
-        template = resolve_component_translation(
-            translations,
-            fallback,
             translation_key,
             default=key,
         )
@@ -77,13 +70,9 @@ def translated_grooming_template(
     if hass is None:
         template = translation_key
     else:
-        translations, fallback = get_cached_component_translation_lookup(
+        template = get_cached_component_template(
             hass,
             language,
-        )
-        template = resolve_component_translation(
-            translations,
-            fallback,
             translation_key,
             default=template_key,
         )
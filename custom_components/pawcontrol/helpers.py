@@ -41,10 +41,14 @@ from .const import (
     EVENT_WALK_STARTED,
 )
 from .data_manager import _deserialize_datetime
+from .metrics_registry import Histogram
+from .runtime_data import get_runtime_data
 from .types import (
     VALID_NOTIFICATION_PRIORITIES,
     CacheDiagnosticsMetadata,
     DogConfigData,
+    EventQueueHistogram,
+    EventQueueStats,
     HealthEvent,
     HealthHistoryEntry,
     HealthNamespaceMutable,
@@ -54,6 +58,7 @@ from .types import (
     JSONValue,
     NotificationPriority,
     NotificationQueueStats,
+    PawControlConfigEntry,
     PerformanceMonitorSnapshot,
     QueuedNotificationPayload,
     StorageCacheValue,
@@ -86,6 +91,28 @@ MAX_NOTIFICATION_QUEUE = 100  # Max queued notifications
 DATA_CLEANUP_INTERVAL = 3600  # 1 hour cleanup interval
 MAX_HISTORY_ITEMS = 1000  # Max items per dog per category
 
+# OPTIMIZATION: Event queue tuning
+EVENT_QUEUE_MAXSIZE = 1000  # Hard cap of the event deque
+EVENT_QUEUE_HIGH_WATERMARK = 800  # Producers wait above this depth
+EVENT_QUEUE_LOW_WATERMARK = 400  # Producers resume below this depth
+EVENT_BATCH_MIN = 10  # Batch size worth waiting for
+EVENT_BATCH_MAX = 200  # Upper bound of a single batch
+EVENT_FLUSH_LATENCY = 0.1  # Max seconds an event waits for a fuller batch
+
+_DEPTH_BUCKETS: Final[tuple[float, ...]] = (1, 10, 50, 100, 250, 500, 1000)
+_BATCH_SIZE_BUCKETS: Final[tuple[float, ...]] = (1, 5, 10, 25, 50, 100, 200)
+_LATENCY_MS_BUCKETS: Final[tuple[float, ...]] = (
+    1,
+    5,
+    10,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    5000,
+)
+
 DEFAULT_NOTIFICATION_PRIORITY: Final[NotificationPriority] = "normal"
 
 
@@ -101,6 +128,19 @@ class PerformanceCounters:
     last_cleanup: datetime | None = None
 
 
+def _event_queue_histogram(histogram: Histogram) -> EventQueueHistogram:
+    """Return the event queue export of a fixed-bucket histogram."""
+    return {
+        "bounds": [float(bound) for bound in histogram.bounds],
+        "counts": list(histogram.counts),
+        "samples": histogram.count,
+        "mean": (
+            round(histogram.total / histogram.count, 3) if histogram.count else 0.0
+        ),
+        "max": round(float(histogram.maximum), 3) if histogram.count else 0.0,
+    }
+
+
 DEFAULT_DATA_KEYS: Final[tuple[StorageNamespaceKey, ...]] = (
     "walks",
     "feedings",
@@ -816,11 +856,36 @@ class PawControlData:
             config_entry.data.get(CONF_DOGS, []),
         )
 
-        # OPTIMIZATION: Event queue for batch processing
-        self._event_queue: deque[QueuedEvent] = deque(maxlen=1000)
+        # OPTIMIZATION: Event queue for batch processing. Entries carry their
+        # enqueue time so the consumer can bound latency and report it.
+        self._event_queue: deque[tuple[float, QueuedEvent]] = deque(
+            maxlen=EVENT_QUEUE_MAXSIZE,
+        )
         self._event_task: asyncio.Task | None = None
+        self._event_ready = asyncio.Event()
+        self._event_space = asyncio.Event()
+        self._event_space.set()
+        self._events_processed = 0
+        self._event_batches = 0
+        self._backpressure_waits = 0
+        self._depth_histogram = Histogram("event_queue.depth", _DEPTH_BUCKETS)
+        self._batch_size_histogram = Histogram(
+            "event_queue.batch_size",
+            _BATCH_SIZE_BUCKETS,
+        )
+        self._latency_histogram = Histogram(
+            "event_queue.latency_ms",
+            _LATENCY_MS_BUCKETS,
+        )
         self._valid_dog_ids: set[str] | None = None
 
+        runtime_data = get_runtime_data(
+            hass,
+            cast(PawControlConfigEntry, config_entry),
+        )
+        if runtime_data is not None and runtime_data.data_manager is not None:
+            runtime_data.data_manager.register_cache_monitor("event_queue", self)
+
     async def async_load_data(self) -> None:
         """Load data with performance monitoring."""
         loop = asyncio.get_running_loop()
@@ -1239,29 +1304,96 @@ class PawControlData:
             "timestamp": dt_util.utcnow().isoformat(),
         }
 
-        self._event_queue.append(event)
+        await self._enqueue_event(event)
+
+    def _event_consumer_running(self) -> bool:
+        """Return True when a live consumer task drains the event queue."""
+        task = self._event_task
+        return isinstance(task, asyncio.Task) and not task.done()
+
+    async def _enqueue_event(self, event: QueuedEvent) -> None:
+        """Queue ``event`` and wake the consumer, applying backpressure.
+
+        Producers wait while the queue is above the high watermark instead of
+        letting the bounded deque silently drop the oldest events.  Without a
+        running consumer the producer drains a batch itself.
+        """
+        while len(self._event_queue) >= EVENT_QUEUE_HIGH_WATERMARK:
+            self._backpressure_waits += 1
+            if not self._event_consumer_running():
+                await self._drain_event_batch()
+                continue
+            self._event_space.clear()
+            await self._event_space.wait()
+
+        self._event_queue.append((perf_counter(), event))
+        self._event_ready.set()
 
     async def _process_events(self) -> None:
-        """Process events in batches for better performance."""
+        """Process events in batches as soon as they are queued."""
         while True:
             try:
                 if not self._event_queue:
-                    await asyncio.sleep(1.0)  # Wait for events
+                    self._event_ready.clear()
+                    await self._event_ready.wait()
                     continue
-                # Process batch of events
-                batch: list[QueuedEvent] = [
-                    self._event_queue.popleft()
-                    for _ in range(min(10, len(self._event_queue)))
-                ]
-
-                if batch:
-                    await self._process_event_batch(batch)
+                await self._await_batch_window()
+                await self._drain_event_batch()
             except asyncio.CancelledError:
                 break
             except Exception as err:
                 _LOGGER.error("Event processing error: %s", err)
                 await asyncio.sleep(5.0)  # Error recovery delay
 
+    async def _await_batch_window(self) -> None:
+        """Wait for a worthwhile batch, at most until the oldest event expires."""
+        while len(self._event_queue) < EVENT_BATCH_MIN:
+            remaining = EVENT_FLUSH_LATENCY - (perf_counter() - self._event_queue[0][0])
+            if remaining <= 0:
+                return
+            self._event_ready.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._event_ready.wait(), timeout=remaining)
+
+    async def _drain_event_batch(self) -> None:
+        """Persist one batch sized to the current backlog and record metrics."""
+        depth = len(self._event_queue)
+        if not depth:
+            return
+        # Batch size follows the backlog so bursts are absorbed in few writes.
+        size = min(depth, EVENT_BATCH_MAX)
+        entries = [self._event_queue.popleft() for _ in range(size)]
+        if len(self._event_queue) <= EVENT_QUEUE_LOW_WATERMARK:
+            self._event_space.set()
+
+        self._depth_histogram.observe(depth)
+        self._batch_size_histogram.observe(size)
+        try:
+            await self._process_event_batch([event for _, event in entries])
+        finally:
+            finished = perf_counter()
+            for enqueued, _ in entries:
+                self._latency_histogram.observe((finished - enqueued) * 1000)
+            self._events_processed += size
+            self._event_batches += 1
+
+    def get_event_queue_stats(self) -> EventQueueStats:
+        """Return queue depth, batch size and latency histograms."""
+        return {
+            "depth": len(self._event_queue),
+            "high_watermark": EVENT_QUEUE_HIGH_WATERMARK,
+            "events_processed": self._events_processed,
+            "batches_processed": self._event_batches,
+            "backpressure_waits": self._backpressure_waits,
+            "depth_histogram": _event_queue_histogram(self._depth_histogram),
+            "batch_size_histogram": _event_queue_histogram(self._batch_size_histogram),
+            "latency_ms_histogram": _event_queue_histogram(self._latency_histogram),
+        }
+
+    def coordinator_snapshot(self) -> JSONMutableMapping:
+        """Return the event queue stats in the cache monitor payload format."""
+        return {"stats": cast(JSONValue, self.get_event_queue_stats())}
+
     async def _process_event_batch(self, events: list[QueuedEvent]) -> None:
         """Process a batch of events efficiently."""
         # Group events by type and dog for efficient processing
@@ -1669,10 +1801,9 @@ class PawControlData:
                 await self._event_task
             self._event_task = None
         # Process remaining events
-        if self._event_queue:
-            remaining = list(self._event_queue)
-            if remaining:
-                await self._process_event_batch(remaining)
+        while self._event_queue:
+            await self._drain_event_batch()
+        self._event_space.set()
 
         # Shutdown storage
         await self.storage.async_shutdown()
@@ -0,0 +1,241 @@
+"""Time-ordered index over append-only module history lists.
+
+Module history queries used to parse every stored timestamp, normalise every
+entry and sort the whole list on each call.  :class:`ModuleHistoryIndex`
+keeps, for one history list, the parsed timestamps in sorted order next to
+their normalised payloads.  Window queries bisect into the sorted keys and
+``limit`` stops after the requested number of entries, so a query costs
+O(log n + k) for ``k`` returned entries.
+
+The stored history lists stay the source of truth.  Before answering a query
+the index synchronises with its list: appended entries are inserted with
+binary search, anything else (a trimmed or replaced list) triggers a
+rebuild that reuses the cached parse results of entries it has already seen.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from datetime import datetime
+from itertools import chain, islice
+import math
+from typing import Any
+
+from .types import JSONMutableMapping
+
+type TimestampParser = Callable[[Any], datetime | None]
+type PayloadNormaliser = Callable[[Mapping[str, Any]], JSONMutableMapping]
+
+# (timestamp seconds, insertion sequence); the sequence keeps equal timestamps
+# in insertion order.
+type _TimedKey = tuple[float, int]
+# Entries without a parseable timestamp sort by their raw value instead.
+type _UntimedKey = tuple[str, int]
+
+
+def _untimed_sort_value(raw_value: Any) -> str:
+    """Return the fallback ordering value for an unparseable timestamp."""
+    if isinstance(raw_value, int | float):
+        try:
+            return datetime.fromtimestamp(float(raw_value)).isoformat()
+        except (OverflowError, ValueError):
+            return ""
+    if isinstance(raw_value, str):
+        return raw_value
+    return ""
+
+
+class ModuleHistoryIndex:
+    """Sorted timestamps and cached normalised payloads for one history list."""
+
+    __slots__ = (
+        "_head",
+        "_keys",
+        "_memo",
+        "_next_sequence",
+        "_normalise",
+        "_parse",
+        "_payloads",
+        "_source",
+        "_synced",
+        "_tail",
+        "_timestamp_key",
+        "_untimed_keys",
+        "_untimed_payloads",
+        "rebuilds",
+    )
+
+    def __init__(
+        self,
+        timestamp_key: str,
+        *,
+        parse: TimestampParser,
+        normalise: PayloadNormaliser,
+    ) -> None:
+        """Initialise an empty index for entries timestamped by ``timestamp_key``."""
+        self._timestamp_key = timestamp_key
+        self._parse = parse
+        self._normalise = normalise
+        self._keys: list[_TimedKey] = []
+        self._payloads: list[JSONMutableMapping] = []
+        self._untimed_keys: list[_UntimedKey] = []
+        self._untimed_payloads: list[JSONMutableMapping] = []
+        # id(raw entry) -> (raw entry, parsed timestamp, normalised payload)
+        self._memo: dict[
+            int, tuple[Mapping[str, Any], datetime | None, JSONMutableMapping]
+        ] = {}
+        self._source: Sequence[Any] | None = None
+        self._synced = 0
+        self._head: object = None
+        self._tail: object = None
+        self._next_sequence = 0
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed entries."""
+        return len(self._keys) + len(self._untimed_keys)
+
+    def sync(self, entries: Sequence[Any]) -> None:
+        """Bring the index up to date with ``entries``."""
+        synced = self._synced
+        if (
+            entries is self._source
+            and len(entries) >= synced
+            and (synced == 0 or entries[0] is self._head)
+            and (synced == 0 or entries[synced - 1] is self._tail)
+        ):
+            for entry in entries[synced:]:
+                self._insert(entry, self._prepare(entry))
+        else:
+            self._rebuild(entries)
+        self._source = entries
+        self._synced = len(entries)
+        self._head = entries[0] if entries else None
+        self._tail = entries[-1] if entries else None
+
+    def _prepare(self, entry: Any) -> tuple[datetime | None, JSONMutableMapping] | None:
+        if not isinstance(entry, Mapping):
+            return None
+        cached = self._memo.get(id(entry))
+        if cached is not None and cached[0] is entry:
+            return cached[1], cached[2]
+        payload = self._normalise(entry)
+        timestamp = self._parse(entry.get(self._timestamp_key))
+        self._memo[id(entry)] = (entry, timestamp, payload)
+        return timestamp, payload
+
+    def _insert(
+        self,
+        entry: Any,
+        prepared: tuple[datetime | None, JSONMutableMapping] | None,
+    ) -> None:
+        if prepared is None:
+            return
+        timestamp, payload = prepared
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        if timestamp is not None:
+            key: _TimedKey = (timestamp.timestamp(), sequence)
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._payloads.insert(position, payload)
+            return
+        untimed_key = (_untimed_sort_value(entry.get(self._timestamp_key)), sequence)
+        position = bisect_right(self._untimed_keys, untimed_key)
+        self._untimed_keys.insert(position, untimed_key)
+        self._untimed_payloads.insert(position, payload)
+
+    def _rebuild(self, entries: Sequence[Any]) -> None:
+        self.rebuilds += 1
+        prepared = [(entry, self._prepare(entry)) for entry in entries]
+        self._memo = {
+            id(entry): (entry, result[0], result[1])
+            for entry, result in prepared
+            if result is not None
+        }
+        self._next_sequence = 0
+        timed: list[tuple[_TimedKey, JSONMutableMapping]] = []
+        untimed: list[tuple[_UntimedKey, JSONMutableMapping]] = []
+        for entry, result in prepared:
+            if result is None:
+                continue
+            timestamp, payload = result
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            if timestamp is not None:
+                timed.append(((timestamp.timestamp(), sequence), payload))
+            else:
+                raw_value = entry.get(self._timestamp_key)
+                untimed.append(((_untimed_sort_value(raw_value), sequence), payload))
+        # History is appended chronologically, so these sorts are near-linear.
+        timed.sort(key=lambda item: item[0])
+        untimed.sort(key=lambda item: item[0])
+        self._keys = [key for key, _payload in timed]
+        self._payloads = [payload for _key, payload in timed]
+        self._untimed_keys = [key for key, _payload in untimed]
+        self._untimed_payloads = [payload for _key, payload in untimed]
+
+    def _bounds(
+        self, since: datetime | None, until: datetime | None
+    ) -> tuple[int, int]:
+        low = (
+            bisect_left(self._keys, (since.timestamp(), -math.inf))
+            if since is not None
+            else 0
+        )
+        high = (
+            bisect_right(self._keys, (until.timestamp(), math.inf))
+            if until is not None
+            else len(self._keys)
+        )
+        return low, max(low, high)
+
+    def iter_entries(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        newest_first: bool = True,
+    ) -> Iterator[JSONMutableMapping]:
+        """Yield cached payloads within ``[since, until]``.
+
+        Without bounds, entries lacking a parseable timestamp follow the timed
+        ones (newest first) or precede them (oldest first).  The payloads are
+        shared with the index and must not be mutated.
+        """
+        low, high = self._bounds(since, until)
+        payloads = self._payloads
+        bounded = since is not None or until is not None
+        if newest_first:
+            timed = (payloads[index] for index in range(high - 1, low - 1, -1))
+            if bounded:
+                return timed
+            return chain(timed, reversed(self._untimed_payloads))
+        timed = (payloads[index] for index in range(low, high))
+        if bounded:
+            return timed
+        return chain(self._untimed_payloads, timed)
+
+    def query(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> list[JSONMutableMapping]:
+        """Return copies of up to ``limit`` payloads within ``[since, until]``."""
+        stream = self.iter_entries(since=since, until=until, newest_first=newest_first)
+        if limit is not None:
+            stream = islice(stream, max(limit, 0))
+        return [dict(payload) for payload in stream]
+
+    def count(
+        self, *, since: datetime | None = None, until: datetime | None = None
+    ) -> int:
+        """Return the number of timed entries within ``[since, until]``."""
+        low, high = self._bounds(since, until)
+        return high - low
@@ -0,0 +1,268 @@
+"""Low-overhead metric primitives for runtime telemetry.
+
+Runtime telemetry used to live in nested dictionaries that were rebuilt,
+timestamped and re-averaged on every sample, even on hot paths such as the
+entity factory's cached lookups.  The primitives in this module keep raw
+values in ``__slots__`` attributes instead:
+
+* :class:`Counter` and :class:`Gauge` record with a single attribute update.
+* :class:`Histogram` counts observations in fixed buckets and tracks the
+  count, sum, minimum and maximum, so recording is O(1) and allocation free.
+* :class:`MetricsRegistry` owns named metrics plus composite collectors and
+  renders JSON-compatible dictionaries only when diagnostics or system health
+  ask for them.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+import math
+from typing import Final, Protocol
+
+# Upper bounds in seconds, tuned for sub-millisecond to one-second operations.
+DEFAULT_DURATION_BUCKETS: Final[tuple[float, ...]] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class MetricsCollector(Protocol):
+    """Composite metric that renders its own diagnostics payload."""
+
+    def render(self) -> object:
+        """Return a JSON-compatible snapshot."""
+
+
+class Counter:
+    """Monotonic event counter."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str) -> None:
+        """Initialise the counter at zero."""
+        self.name = name
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Add ``amount`` to the counter."""
+        self.value += amount
+
+    def reset(self, value: int = 0) -> None:
+        """Reset the counter to ``value``."""
+        self.value = value
+
+    def render(self) -> int:
+        """Return the current count."""
+        return self.value
+
+
+class Gauge:
+    """Point-in-time value."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str, value: float = 0.0) -> None:
+        """Initialise the gauge with ``value``."""
+        self.name = name
+        self.value = value
+
+    def set(self, value: float) -> None:
+        """Replace the current value."""
+        self.value = value
+
+    def render(self) -> float:
+        """Return the current value."""
+        return self.value
+
+
+class Histogram:
+    """Fixed-bucket distribution with count, sum, minimum and maximum."""
+
+    __slots__ = ("bounds", "count", "counts", "maximum", "minimum", "name", "total")
+
+    def __init__(
+        self,
+        name: str,
+        bounds: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        """Initialise an empty histogram with the given bucket upper bounds."""
+        self.name = name
+        self.bounds = tuple(sorted(bounds))
+        # One bucket per bound plus an overflow bucket.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean observation, or ``None`` when empty."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, fraction: float) -> float | None:
+        """Return the bucket upper bound containing the ``fraction`` quantile.
+
+        The estimate is capped at the largest observation, so the overflow
+        bucket resolves to the recorded maximum.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(min(max(fraction, 0.0), 1.0) * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.maximum)
+                break
+        return self.maximum
+
+    def seed(self, *, count: int, total: float, minimum: float, maximum: float) -> None:
+        """Carry over aggregates from a persisted summary.
+
+        Bucket counts are unknown for seeded observations, so only samples
+        recorded afterwards contribute to :meth:`quantile`.
+        """
+        self.count += count
+        self.total += total
+        if count > 0:
+            self.minimum = min(self.minimum, minimum)
+            self.maximum = max(self.maximum, maximum)
+
+    def reset(self) -> None:
+        """Forget every observation."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def render(self) -> dict[str, object]:
+        """Return the distribution as a JSON-compatible mapping."""
+        buckets: dict[str, int] = {
+            f"le_{bound:g}": bucket_count
+            for bound, bucket_count in zip(self.bounds, self.counts, strict=False)
+        }
+        buckets["overflow"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+
+type Metric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    """Named metrics and collectors rendered lazily for diagnostics."""
+
+    __slots__ = ("_collectors", "_metrics")
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: dict[str, MetricsCollector] = {}
+
+    def __contains__(self, name: object) -> bool:
+        """Return True when a metric or collector is registered as ``name``."""
+        return name in self._metrics or name in self._collectors
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over registered metric names."""
+        return iter(self._metrics)
+
+    def __len__(self) -> int:
+        """Return the number of registered metrics."""
+        return len(self._metrics)
+
+    def _get_or_create[M: Metric](
+        self,
+        name: str,
+        kind: type[M],
+        factory: Callable[[], M],
+    ) -> M:
+        metric = self._metrics.get(name)
+        if metric is None:
+            created = factory()
+            self._metrics[name] = created
+            return created
+        if not isinstance(metric, kind):
+            raise TypeError(
+                f"Metric {name!r} is a {type(metric).__name__}, not {kind.__name__}"
+            )
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        """Return the counter registered as ``name``, creating it if needed."""
+        return self._get_or_create(name, Counter, lambda: Counter(name))
+
+    def gauge(self, name: str) -> Gauge:
+        """Return the gauge registered as ``name``, creating it if needed."""
+        return self._get_or_create(name, Gauge, lambda: Gauge(name))
+
+    def histogram(
+        self,
+        name: str,
+        bounds: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram registered as ``name``, creating it if needed."""
+        return self._get_or_create(name, Histogram, lambda: Histogram(name, bounds))
+
+    def collector[C: MetricsCollector](
+        self,
+        name: str,
+        factory: Callable[[MetricsRegistry], C],
+    ) -> C:
+        """Return the collector registered as ``name``, creating it if needed.
+
+        ``factory`` receives the registry so the collector can register its
+        underlying metrics.
+        """
+        collector = self._collectors.get(name)
+        if collector is None:
+            collector = factory(self)
+            self._collectors[name] = collector
+        return collector  # type: ignore[return-value]
+
+    def get_collector(self, name: str) -> MetricsCollector | None:
+        """Return the collector registered as ``name`` when present."""
+        return self._collectors.get(name)
+
+    def render(self) -> dict[str, object]:
+        """Return a JSON-compatible snapshot of every registered metric."""
+        return {name: metric.render() for name, metric in self._metrics.items()}
+
+    def clear(self) -> None:
+        """Drop every registered metric and collector."""
+        self._metrics.clear()
+        self._collectors.clear()
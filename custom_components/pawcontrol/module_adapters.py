@@ -1,6 +1,8 @@
 """Helpers that translate runtime managers into coordinator-facing adapters."""
 
-from collections.abc import Mapping
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
 from datetime import UTC, datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
@@ -38,6 +40,7 @@ from .exceptions import GPSUnavailableError, NetworkError, RateLimitError
 from .http_client import ensure_shared_client_session
 from .types import (
     CoordinatorModuleTask,
+    CoordinatorTypedModuleName,
     DogModulesMapping,
     FeedingDailyStats,
     FeedingModulePayload,
@@ -71,6 +74,12 @@ if TYPE_CHECKING:
     from .weather_manager import WeatherHealthManager
 _LOGGER = logging.getLogger(__name__)
 
+# How long the first external feeding fetch waits for other dogs to join its
+# bulk request.  Coordinator updates for different dogs can be separated by
+# several awaits, so a single loop iteration is not enough to collect them.
+# The window closes early once every configured dog has joined.
+_BULK_FETCH_WINDOW_SECONDS = 0.05
+
 
 class ModuleAdapterCacheStats(TypedDict):
     """Runtime statistics exposed by module adapter caches."""
@@ -322,7 +331,13 @@ class _BaseModuleAdapter[PayloadT]:
 
 
 class FeedingModuleAdapter(_BaseModuleAdapter[FeedingModulePayload]):
-    """Adapter that exposes feeding information through the coordinator."""
+    """Adapter that exposes feeding information through the coordinator.
+
+    When the device client supports bulk fetches, external API requests issued
+    for several dogs in the same coordinator cycle are coalesced into one
+    round trip.  ``dog_count`` lets the request go out as soon as every dog
+    has joined instead of waiting for the full batching window.
+    """
 
     def __init__(
         self,
@@ -331,6 +346,7 @@ class FeedingModuleAdapter(_BaseModuleAdapter[FeedingModulePayload]):
         use_external_api: bool,
         ttl: timedelta,
         api_client: PawControlDeviceClient | None,
+        dog_count: int | None = None,
     ) -> None:
         """Initialise the feeding adapter with HTTP and manager context."""
         super().__init__(ttl)
@@ -341,11 +357,75 @@ class FeedingModuleAdapter(_BaseModuleAdapter[FeedingModulePayload]):
         self._use_external_api = use_external_api
         self._manager: FeedingManager | None = None
         self._api_client = api_client
+        self._pending_payloads: dict[str, asyncio.Future[JSONMutableMapping]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._dog_count = dog_count
+        self._batch_full = asyncio.Event()
 
     def attach(self, manager: FeedingManager | None) -> None:
         """Attach the feeding manager instance."""
         self._manager = manager
 
+    async def _async_fetch_external(self, dog_id: str) -> JSONMutableMapping:
+        """Fetch a device payload, joining the bulk request of this cycle."""
+        api_client = cast(PawControlDeviceClient, self._api_client)
+        if getattr(api_client, "async_get_feeding_payloads", None) is None:
+            return await api_client.async_get_feeding_payload(dog_id)
+
+        future = self._pending_payloads.get(dog_id)
+        if future is None:
+            if not self._pending_payloads:
+                self._flush_task = asyncio.create_task(
+                    self._async_flush_pending(api_client),
+                )
+            future = asyncio.get_running_loop().create_future()
+            self._pending_payloads[dog_id] = future
+            if self._dog_count and len(self._pending_payloads) >= self._dog_count:
+                self._batch_full.set()
+        return await asyncio.shield(future)
+
+    async def _async_flush_pending(self, api_client: PawControlDeviceClient) -> None:
+        """Resolve every queued dog with a single bulk device request.
+
+        Futures left unresolved when the task ends, including when it is
+        cancelled during the window or the request, are failed so no caller
+        waits forever.
+        """
+        batch: dict[str, asyncio.Future[JSONMutableMapping]] | None = None
+        failure: Exception = NetworkError("Bulk feeding fetch was cancelled")
+        try:
+            # Let the other dogs of this coordinator cycle enqueue themselves.
+            with suppress(TimeoutError):
+                async with asyncio.timeout(_BULK_FETCH_WINDOW_SECONDS):
+                    await self._batch_full.wait()
+            batch, self._pending_payloads = self._pending_payloads, {}
+            self._batch_full.clear()
+            try:
+                payloads = await api_client.async_get_feeding_payloads(list(batch))
+            except Exception as err:
+                failure = err
+                return
+
+            for dog_id, future in batch.items():
+                if future.done():
+                    continue
+                payload = payloads.get(dog_id)
+                if payload is None:
+                    future.set_exception(
+                        NetworkError(
+                            f"Device API returned no feeding data for {dog_id}"
+                        ),
+                    )
+                else:
+                    future.set_result(payload)
+        finally:
+            if batch is None:
+                batch, self._pending_payloads = self._pending_payloads, {}
+                self._batch_full.clear()
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(failure)
+
     async def async_get_data(self, dog_id: str) -> FeedingModulePayload:
         """Return the latest feeding context for the dog."""
         if (cached := self._cached(dog_id)) is not None:
@@ -369,7 +449,7 @@ class FeedingModuleAdapter(_BaseModuleAdapter[FeedingModulePayload]):
             try:
                 payload = cast(
                     FeedingModulePayload,
-                    dict(await self._api_client.async_get_feeding_payload(dog_id)),
+                    dict(await self._async_fetch_external(dog_id)),
                 )
             except RateLimitError:
                 raise
@@ -796,17 +876,31 @@ class HealthModuleAdapter(_BaseModuleAdapter[HealthModulePayload]):
 
 
 class WeatherModuleAdapter(_BaseModuleAdapter[WeatherModulePayload]):
-    """Adapter for weather-informed health data."""
+    """Adapter for weather-informed health data.
+
+    Weather is shared by every dog: the manager refreshes the entity once per
+    cache period and the adapter derives alert payloads once per shared
+    snapshot and recommendations once per dog profile. Snapshots are keyed on
+    ``(version, expires_at)`` because the manager rebuilds them without a new
+    version once an alert lapses.
+    """
 
     def __init__(self, *, config_entry: PawControlConfigEntry, ttl: timedelta) -> None:
         """Initialise the weather adapter with config context."""
         super().__init__(ttl)
         self._config_entry = config_entry
         self._manager: WeatherHealthManager | None = None
+        self._shared_key: tuple[int, datetime | None] | None = None
+        self._shared_alerts: list[WeatherAlertPayload] = []
+        self._shared_recommendations: dict[
+            tuple[str | None, int | None, tuple[str, ...]],
+            list[str],
+        ] = {}
 
     def attach(self, manager: WeatherHealthManager | None) -> None:
         """Attach the weather health manager to source observations."""
         self._manager = manager
+        self._shared_key = None
 
     def _resolve_dog_config(self, dog_id: str) -> JSONLikeMapping | None:
         """Return the config entry mapping for ``dog_id`` if available."""
@@ -822,6 +916,31 @@ class WeatherModuleAdapter(_BaseModuleAdapter[WeatherModulePayload]):
 
         return None
 
+    @staticmethod
+    def _alert_payloads(alerts: Iterable[Any]) -> list[WeatherAlertPayload]:
+        """Serialise weather alerts for the coordinator payload."""
+        return [
+            WeatherAlertPayload(
+                type=getattr(
+                    alert.alert_type,
+                    "value",
+                    str(alert.alert_type),
+                ),
+                severity=getattr(
+                    alert.severity,
+                    "value",
+                    str(alert.severity),
+                ),
+                title=alert.title,
+                message=alert.message,
+                recommendations=list(alert.recommendations),
+                duration_hours=alert.duration_hours,
+                affected_breeds=list(alert.affected_breeds),
+                age_considerations=list(alert.age_considerations),
+            )
+            for alert in alerts
+        ]
+
     async def async_get_data(self, dog_id: str) -> WeatherModulePayload:
         """Return weather-adjusted health information for a dog."""
         if (cached := self._cached(dog_id)) is not None:
@@ -835,10 +954,14 @@ class WeatherModuleAdapter(_BaseModuleAdapter[WeatherModulePayload]):
             )
             self._remember(dog_id, payload)
             return payload
+        manager = self._manager
         weather_entity = self._config_entry.options.get(CONF_WEATHER_ENTITY)
         if isinstance(weather_entity, str) and weather_entity:
             try:
-                await self._manager.async_update_weather_data(weather_entity)
+                await manager.async_refresh_shared(
+                    weather_entity,
+                    max_age=self._ttl or timedelta(0),
+                )
             except Exception as err:  # pragma: no cover - defensive logging
                 _LOGGER.debug(
                     "Failed to refresh weather data from %s: %s",
@@ -873,34 +996,30 @@ class WeatherModuleAdapter(_BaseModuleAdapter[WeatherModulePayload]):
                 ]
 
         try:
-            alerts: list[WeatherAlertPayload] = [
-                WeatherAlertPayload(
-                    type=getattr(
-                        alert.alert_type,
-                        "value",
-                        str(alert.alert_type),
-                    ),
-                    severity=getattr(
-                        alert.severity,
-                        "value",
-                        str(alert.severity),
-                    ),
-                    title=alert.title,
-                    message=alert.message,
-                    recommendations=list(alert.recommendations),
-                    duration_hours=alert.duration_hours,
-                    affected_breeds=list(alert.affected_breeds),
-                    age_considerations=list(alert.age_considerations),
-                )
-                for alert in self._manager.get_active_alerts()
-            ]
-            recommendations = self._manager.get_recommendations_for_dog(
-                dog_breed=dog_breed,
-                dog_age_months=dog_age_months,
-                health_conditions=health_conditions,
+            snapshot = manager.get_health_snapshot()
+            shared_key = (snapshot.version, snapshot.expires_at)
+            if shared_key != self._shared_key:
+                self._shared_key = shared_key
+                self._shared_alerts = self._alert_payloads(snapshot.alerts)
+                self._shared_recommendations.clear()
+            profile = (
+                dog_breed,
+                dog_age_months,
+                tuple(health_conditions or ()),
             )
-            health_score = self._manager.get_weather_health_score()
-            conditions = self._manager.get_current_conditions()
+            recommendations = self._shared_recommendations.get(profile)
+            if recommendations is None:
+                recommendations = manager.get_recommendations_for_dog(
+                    dog_breed=dog_breed,
+                    dog_age_months=dog_age_months,
+                    health_conditions=health_conditions,
+                    alerts=snapshot.alerts,
+                )
+                self._shared_recommendations[profile] = recommendations
+            alerts = list(self._shared_alerts)
+            recommendations = list(recommendations)
+            health_score = snapshot.health_score
+            conditions = snapshot.conditions
         except Exception as err:  # pragma: no cover - defensive logging
             _LOGGER.warning("Failed to build weather health data: %s", err)
             payload = WeatherModulePayload(
@@ -1012,11 +1131,13 @@ class CoordinatorModuleAdapters:
     ) -> None:
         """Initialise the container of module adapters with shared context."""
         self._cache_ttl = cache_ttl
+        raw_dogs = config_entry.data.get(CONF_DOGS)
         self.feeding = FeedingModuleAdapter(
             session=session,
             use_external_api=use_external_api,
             ttl=cache_ttl,
             api_client=api_client,
+            dog_count=len(raw_dogs) if isinstance(raw_dogs, list) else None,
         )
         self.walk = WalkModuleAdapter(ttl=cache_ttl)
         self.gps = GPSModuleAdapter()
@@ -1069,18 +1190,27 @@ class CoordinatorModuleAdapters:
         self,
         dog_id: str,
         modules: DogModulesMapping,
+        *,
+        include: Callable[[CoordinatorTypedModuleName], bool] | None = None,
     ) -> list[CoordinatorModuleTask]:
-        """Return coroutine tasks for every enabled module flag for the dog."""
+        """Return coroutine tasks for every enabled module flag for the dog.
+
+        ``include`` lets the coordinator's cadence scheduler skip modules that
+        are not due yet; it is only consulted for enabled modules.
+        """
         tasks: list[CoordinatorModuleTask] = []
 
-        if modules.get(MODULE_FEEDING):
+        def wanted(module: CoordinatorTypedModuleName) -> bool:
+            return include is None or include(module)
+
+        if modules.get(MODULE_FEEDING) and wanted("feeding"):
             tasks.append(
                 CoordinatorModuleTask(
                     module="feeding",
                     coroutine=self.feeding.async_get_data(dog_id),
                 ),
             )
-        if modules.get(MODULE_WALK):
+        if modules.get(MODULE_WALK) and wanted("walk"):
             tasks.append(
                 CoordinatorModuleTask(
                     module="walk",
@@ -1088,33 +1218,35 @@ class CoordinatorModuleAdapters:
                 ),
             )
         if modules.get(MODULE_GPS):
-            tasks.append(
-                CoordinatorModuleTask(
-                    module="gps",
-                    coroutine=self.gps.async_get_data(dog_id),
-                ),
-            )
-            tasks.append(
-                CoordinatorModuleTask(
-                    module="geofencing",
-                    coroutine=self.geofencing.async_get_data(dog_id),
-                ),
-            )
-        if modules.get(MODULE_HEALTH):
+            if wanted("gps"):
+                tasks.append(
+                    CoordinatorModuleTask(
+                        module="gps",
+                        coroutine=self.gps.async_get_data(dog_id),
+                    ),
+                )
+            if wanted("geofencing"):
+                tasks.append(
+                    CoordinatorModuleTask(
+                        module="geofencing",
+                        coroutine=self.geofencing.async_get_data(dog_id),
+                    ),
+                )
+        if modules.get(MODULE_HEALTH) and wanted("health"):
             tasks.append(
                 CoordinatorModuleTask(
                     module="health",
                     coroutine=self.health.async_get_data(dog_id),
                 ),
             )
-        if modules.get(MODULE_WEATHER):
+        if modules.get(MODULE_WEATHER) and wanted("weather"):
             tasks.append(
                 CoordinatorModuleTask(
                     module="weather",
                     coroutine=self.weather.async_get_data(dog_id),
                 ),
             )
-        if modules.get(MODULE_GARDEN):
+        if modules.get(MODULE_GARDEN) and wanted("garden"):
             tasks.append(
                 CoordinatorModuleTask(
                     module="garden",
@@ -21,7 +21,11 @@ from .const import (
     DEFAULT_MQTT_TOPIC,
     DOMAIN,
 )
-from .push_router import async_process_gps_push
+from .push_router import (
+    async_process_gps_push,
+    async_process_gps_push_batch,
+    is_batch_payload,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,6 +102,23 @@ async def async_register_entry_mqtt(hass: HomeAssistant, entry: ConfigEntry) ->
         nonce = None
         if isinstance(payload_obj.get("nonce"), str):
             nonce = payload_obj["nonce"]
+        if is_batch_payload(payload_obj):
+            batch = await async_process_gps_push_batch(
+                hass,
+                entry,
+                cast(dict[str, Any], payload_obj),
+                source="mqtt",
+                raw_size=len(raw),
+                nonce=nonce,
+            )
+            if batch.get("rejected"):
+                _LOGGER.debug(
+                    "MQTT GPS batch on %s: %s accepted, %s rejected",
+                    topic,
+                    batch.get("accepted", 0),
+                    batch.get("rejected", 0),
+                )
+            return
         await async_process_gps_push(
             hass,
             entry,
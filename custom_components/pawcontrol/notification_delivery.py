@@ -0,0 +1,186 @@
+"""Bounded per-channel delivery lanes for notifications.
+
+Notification delivery used to run inside the manager lock, so one slow mobile
+app, TTS or webhook call stalled every other notification and the batch
+processor.  :class:`ChannelDeliveryPool` gives every channel its own lane with
+a fixed number of concurrent delivery slots, a bounded wait queue and a
+per-attempt timeout.  Callers await their own delivery, so results such as
+failed channels are still known when the send returns, while a saturated or
+hanging channel only delays deliveries queued on the same lane.
+
+Each lane records how long deliveries waited for a slot and how long the
+delivery itself took.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import MappingProxyType
+from typing import Final
+
+from .types import ChannelDeliveryStats
+
+DEFAULT_CHANNEL_WORKERS: Final[int] = 2
+DEFAULT_CHANNEL_QUEUE_LIMIT: Final[int] = 50
+DEFAULT_DELIVERY_TIMEOUT: Final[float] = 30.0
+
+# Channels that talk to slow devices get tighter timeouts so a hung speaker or
+# webhook endpoint frees its slot quickly; the retry task re-sends later.
+CHANNEL_DELIVERY_TIMEOUTS: Final[Mapping[str, float]] = MappingProxyType(
+    {
+        "persistent": 10.0,
+        "mobile": 20.0,
+        "tts": 15.0,
+        "media_player": 15.0,
+        "webhook": 10.0,
+    },
+)
+CHANNEL_WORKERS: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "persistent": 4,
+        "mobile": 4,
+    },
+)
+
+
+class DeliveryQueueFullError(RuntimeError):
+    """Raised when a channel lane cannot accept another waiting delivery."""
+
+    def __init__(self, channel: str, limit: int) -> None:
+        """Initialise the error for ``channel`` and its queue ``limit``."""
+        super().__init__(f"Delivery queue for {channel} is full ({limit} waiting)")
+        self.channel = channel
+        self.limit = limit
+
+
+@dataclass(slots=True)
+class _ChannelLane:
+    """Concurrency slots and counters for one delivery channel."""
+
+    workers: int
+    queue_limit: int
+    timeout: float
+    semaphore: asyncio.Semaphore = field(init=False)
+    waiting: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    started: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    delivery_total_ms: float = 0.0
+    delivery_max_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Create the semaphore that bounds concurrent deliveries."""
+        self.semaphore = asyncio.Semaphore(self.workers)
+
+    def as_stats(self) -> ChannelDeliveryStats:
+        """Return a JSON-serialisable snapshot of the lane."""
+        finished = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "timeout_seconds": self.timeout,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "avg_queue_wait_ms": round(self.wait_total_ms / self.started, 3)
+            if self.started
+            else 0.0,
+            "max_queue_wait_ms": round(self.wait_max_ms, 3),
+            "avg_delivery_ms": round(self.delivery_total_ms / finished, 3)
+            if finished
+            else 0.0,
+            "max_delivery_ms": round(self.delivery_max_ms, 3),
+        }
+
+
+class ChannelDeliveryPool:
+    """Run deliveries through bounded, independently timed channel lanes."""
+
+    __slots__ = ("_lanes", "_queue_limit", "_timeouts", "_workers")
+
+    def __init__(
+        self,
+        *,
+        workers: Mapping[str, int] = CHANNEL_WORKERS,
+        timeouts: Mapping[str, float] = CHANNEL_DELIVERY_TIMEOUTS,
+        queue_limit: int = DEFAULT_CHANNEL_QUEUE_LIMIT,
+    ) -> None:
+        """Initialise the pool with per-channel worker and timeout overrides."""
+        self._workers = workers
+        self._timeouts = timeouts
+        self._queue_limit = max(0, queue_limit)
+        self._lanes: dict[str, _ChannelLane] = {}
+
+    def _lane(self, channel: str) -> _ChannelLane:
+        lane = self._lanes.get(channel)
+        if lane is None:
+            lane = _ChannelLane(
+                workers=max(1, self._workers.get(channel, DEFAULT_CHANNEL_WORKERS)),
+                queue_limit=self._queue_limit,
+                timeout=self._timeouts.get(channel, DEFAULT_DELIVERY_TIMEOUT),
+            )
+            self._lanes[channel] = lane
+        return lane
+
+    async def run[T](self, channel: str, deliver: Callable[[], Awaitable[T]]) -> T:
+        """Await ``deliver`` in the lane of ``channel``.
+
+        Raises:
+            DeliveryQueueFullError: The lane already has ``queue_limit``
+                deliveries waiting for a slot
+            TimeoutError: The delivery exceeded the lane timeout
+        """
+        lane = self._lane(channel)
+        if lane.semaphore.locked() and lane.waiting >= lane.queue_limit:
+            lane.rejected += 1
+            raise DeliveryQueueFullError(channel, lane.queue_limit)
+
+        queued_at = perf_counter()
+        lane.waiting += 1
+        try:
+            await lane.semaphore.acquire()
+        finally:
+            lane.waiting -= 1
+
+        started_at = perf_counter()
+        wait_ms = (started_at - queued_at) * 1000
+        lane.started += 1
+        lane.wait_total_ms += wait_ms
+        lane.wait_max_ms = max(lane.wait_max_ms, wait_ms)
+        lane.in_flight += 1
+        try:
+            async with asyncio.timeout(lane.timeout):
+                result = await deliver()
+        except TimeoutError:
+            lane.timeouts += 1
+            lane.failed += 1
+            raise
+        except BaseException:
+            lane.failed += 1
+            raise
+        else:
+            lane.completed += 1
+            return result
+        finally:
+            lane.in_flight -= 1
+            lane.semaphore.release()
+            delivery_ms = (perf_counter() - started_at) * 1000
+            lane.delivery_total_ms += delivery_ms
+            lane.delivery_max_ms = max(lane.delivery_max_ms, delivery_ms)
+
+    def snapshot(self) -> dict[str, ChannelDeliveryStats]:
+        """Return metrics for every channel that has seen a delivery."""
+        return {channel: lane.as_stats() for channel, lane in self._lanes.items()}
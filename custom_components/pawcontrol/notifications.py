@@ -29,16 +29,20 @@ from homeassistant.util import dt as dt_util
 from .coordinator_support import CacheMonitorRegistrar
 from .coordinator_tasks import default_rejection_metrics
 from .dashboard_shared import unwrap_async_result
+from .deadline_queue import DeadlineQueue
 from .feeding_translations import async_build_feeding_compliance_notification
 from .http_client import ensure_shared_client_session
+from .notification_delivery import ChannelDeliveryPool
 from .person_entity_manager import (  # type: ignore[attr-defined]
     PersonEntityConfigInput,
     PersonEntityManager,
 )
+from .rate_limiter import RateLimiterRegistry
 from .resilience import CircuitBreakerConfig, ResilienceManager
 from .runtime_data import get_runtime_data
 from .telemetry import ensure_runtime_performance_stats
 from .types import (
+    ChannelDeliveryStats,
     CoordinatorRejectionMetrics,
     JSONMutableMapping,
     PersonEntityStats,
@@ -74,6 +78,8 @@ CACHE_CLEANUP_INTERVAL = 3600  # 1 hour
 QUIET_TIME_CACHE_TTL = 300  # 5 minutes
 CONFIG_CACHE_SIZE_LIMIT = 100
 RATE_LIMIT_RETENTION_SECONDS = 7 * 24 * 3600
+BATCH_MAX_AGE_SECONDS = 300  # Flush partial batches after 5 minutes
+ACKNOWLEDGED_RETENTION_SECONDS = 8 * 24 * 3600  # Kept until more than 7 days old
 
 
 class NotificationType(Enum):
@@ -461,6 +467,7 @@ class NotificationManagerStats(TypedDict):
     available_channels: list[str]
     handlers_registered: int
     person_entity_stats: PersonEntityStats | None
+    channel_delivery: dict[str, ChannelDeliveryStats]
 
 
 class WebhookSecurityStatus(TypedDict):
@@ -796,7 +803,10 @@ class PawControlNotificationManager:
         self._notifications: dict[str, NotificationEvent] = {}
         self._configs: dict[str, NotificationConfig] = {}
         self._handlers: dict[NotificationChannel, NotificationChannelHandler] = {}
+        # The lock guards admission and shared state only; deliveries run
+        # outside it through bounded per-channel lanes.
         self._lock = asyncio.Lock()
+        self._delivery_pool = ChannelDeliveryPool()
         self._session = ensure_shared_client_session(
             session,
             owner="PawControlNotificationManager",
@@ -819,10 +829,20 @@ class PawControlNotificationManager:
         self._batch_task: asyncio.Task[None] | None = None
 
         # Lightweight runtime state
-        self._rate_limit_last_sent: dict[str, dict[str, float]] = {}
+        self._rate_limits: RateLimiterRegistry[tuple[str, str]] = RateLimiterRegistry(
+            RATE_LIMIT_RETENTION_SECONDS
+        )
         self._batch_queue: deque[NotificationEvent] = deque()
         self._pending_batches: dict[str, list[NotificationEvent]] = {}
         self._delivery_status: dict[str, NotificationDeliveryStatus] = {}
+        # Notification ids with a channel delivery under way; retries wait
+        # for these to settle so a slow send is not duplicated.
+        self._in_flight: set[str] = set()
+
+        # OPTIMIZE: Deadline queues replace periodic full sweeps
+        self._batch_deadlines: DeadlineQueue[str] = DeadlineQueue()
+        self._expiry_deadlines: DeadlineQueue[str] = DeadlineQueue()
+        self._retry_deadlines: DeadlineQueue[str] = DeadlineQueue()
 
         # OPTIMIZE: Performance monitoring
         self._performance_metrics: NotificationPerformanceMetrics = {
@@ -1404,6 +1424,8 @@ class PawControlNotificationManager:
 
             # Store notification
             self._notifications[notification_id] = notification
+            if expires_at is not None:
+                self._expiry_deadlines.schedule(notification_id, expires_at.timestamp())
             # OPTIMIZE: Handle batching for eligible notifications
             if (
                 allow_batching
@@ -1415,20 +1437,22 @@ class PawControlNotificationManager:
                     "Added notification %s to batch queue",
                     notification_id,
                 )
-            else:
-                # Send immediately
-                await self._send_to_channels(notification)
-                _LOGGER.info(
-                    "Sent notification %s: %s (%s) [%d targets]",
-                    notification_id,
-                    formatted_title,
-                    priority.value,
-                    len(notification_services)
-                    if notification_services
-                    else len(allowed_channels),
-                )
+                return notification_id
 
-            return notification_id
+        # Send immediately, outside the lock so a slow channel does not block
+        # admission of other notifications or the batch processor.
+        await self._send_to_channels(notification)
+        _LOGGER.info(
+            "Sent notification %s: %s (%s) [%d targets]",
+            notification_id,
+            formatted_title,
+            priority.value,
+            len(notification_services)
+            if notification_services
+            else len(allowed_channels),
+        )
+
+        return notification_id
 
     async def _get_person_notification_targets(
         self,
@@ -1509,28 +1533,12 @@ class PawControlNotificationManager:
         limit_minutes: int,
     ) -> bool:
         """Return True when the notification is allowed by rate limit."""
-        now = time.monotonic()
-        channel_state = self._rate_limit_last_sent.setdefault(config_key, {})
-        last_sent = channel_state.get(channel)
-        window = float(limit_minutes) * 60.0
-        if last_sent is not None and now - last_sent < window:
-            return False
-        channel_state[channel] = now
-
-        cutoff = now - RATE_LIMIT_RETENTION_SECONDS
-        stale_channels = [
-            channel_name
-            for channel_name, timestamp in channel_state.items()
-            if timestamp < cutoff
-        ]
-        for channel_name in stale_channels:
-            del channel_state[channel_name]
-        stale_configs = [
-            key for key, state in self._rate_limit_last_sent.items() if not state
-        ]
-        for key in stale_configs:
-            del self._rate_limit_last_sent[key]
-        return True
+        return self._rate_limits.allow(
+            (config_key, channel),
+            time.monotonic(),
+            window_seconds=float(limit_minutes) * 60.0,
+            max_events=1,
+        )
 
     def _apply_template(
         self,
@@ -1631,44 +1639,55 @@ class PawControlNotificationManager:
             if batch_key not in self._pending_batches:
                 self._pending_batches[batch_key] = []
             self._pending_batches[batch_key].append(notification)
+            self._schedule_batch_deadline(batch_key, self._pending_batches[batch_key])
+
+    def _schedule_batch_deadline(
+        self,
+        batch_key: str,
+        notifications: list[NotificationEvent],
+    ) -> None:
+        """Schedule the flush of a pending batch.
+
+        Full batches are due immediately, partial ones once their oldest
+        notification reaches ``BATCH_MAX_AGE_SECONDS``.
+        """
+        if len(notifications) >= BATCH_PROCESSING_SIZE:
+            deadline = dt_util.now().timestamp()
+        else:
+            deadline = notifications[0].created_at.timestamp() + BATCH_MAX_AGE_SECONDS
+        self._batch_deadlines.schedule(batch_key, deadline, keep_earlier=True)
 
     async def _process_batch_notifications(self) -> None:
         """Background task to process batch notifications.
 
-        OPTIMIZE: Process notifications in batches for better user experience.
+        OPTIMIZE: Sleeps until the next batch deadline and flushes only the
+        batches that are due instead of scanning every pending batch.
         """
         while True:
             try:
-                await asyncio.sleep(60)  # Process batches every minute
+                await self._batch_deadlines.async_wait(dt_util.now().timestamp())
 
+                batches_to_send: list[list[NotificationEvent]] = []
                 async with self._lock:
-                    if not self._pending_batches:
-                        continue
-
-                    # Process each batch
-                    batches_to_send = {}
-                    for batch_key, notifications in list(self._pending_batches.items()):
-                        if len(notifications) >= BATCH_PROCESSING_SIZE:
-                            batches_to_send[batch_key] = notifications[
-                                :BATCH_PROCESSING_SIZE
-                            ]
-                            # Remove processed notifications
-                            del self._pending_batches[batch_key]
-                        elif notifications:
-                            # Check if oldest notification is older than 5 minutes
-                            oldest = min(
-                                notifications,
-                                key=lambda n: n.created_at,
-                            )
-                            age = (dt_util.now() - oldest.created_at).total_seconds()
-                            if age > 300:  # 5 minutes
-                                batches_to_send[batch_key] = notifications
-                                del self._pending_batches[batch_key]
-
-                    # Send batches
-                    for notifications in batches_to_send.values():
-                        await self._send_batch(notifications)
-                        self._performance_metrics["batch_operations"] += 1
+                    due_keys = self._batch_deadlines.pop_due(
+                        dt_util.now().timestamp(),
+                    )
+                    for batch_key in due_keys:
+                        notifications = self._pending_batches.pop(batch_key, None)
+                        if not notifications:
+                            continue
+                        if len(notifications) > BATCH_PROCESSING_SIZE:
+                            # Keep the overflow pending with its own deadline
+                            remaining = notifications[BATCH_PROCESSING_SIZE:]
+                            notifications = notifications[:BATCH_PROCESSING_SIZE]
+                            self._pending_batches[batch_key] = remaining
+                            self._schedule_batch_deadline(batch_key, remaining)
+                        batches_to_send.append(notifications)
+
+                # Send batches without holding the lock
+                for notifications in batches_to_send:
+                    await self._send_batch(notifications)
+                    self._performance_metrics["batch_operations"] += 1
 
             except asyncio.CancelledError:
                 break
@@ -1756,32 +1775,59 @@ class PawControlNotificationManager:
         Args:
             notification: Notification to send
         """
-        # Send to all channels in parallel
-        send_tasks: list[Awaitable[None]] = []
-        task_channels: list[NotificationChannel] = []
-        for channel in notification.channels:
-            handler = self._handlers.get(channel)
-            if handler:
-                task_channels.append(channel)
-                send_tasks.append(
-                    self._send_to_channel_safe(notification, channel, handler),
-                )
-            else:
-                _LOGGER.warning("No handler for channel %s", channel.value)
-                notification.failed_channels.append(channel)
+        self._in_flight.add(notification.id)
+        try:
+            # Send to all channels in parallel
+            send_tasks: list[Awaitable[None]] = []
+            task_channels: list[NotificationChannel] = []
+            for channel in notification.channels:
+                handler = self._handlers.get(channel)
+                if handler:
+                    task_channels.append(channel)
+                    send_tasks.append(
+                        self._send_to_channel_safe(notification, channel, handler),
+                    )
+                else:
+                    _LOGGER.warning("No handler for channel %s", channel.value)
+                    notification.failed_channels.append(channel)
+
+            if send_tasks:
+                # Execute all sends in parallel
+                results = await asyncio.gather(*send_tasks, return_exceptions=True)
+                # Process results using shared gather guard
+                for channel, result in zip(task_channels, results, strict=True):
+                    _unwrap_async_result(
+                        result,
+                        context=(
+                            f"Failed to send notification {notification.id} to channel {channel.value}"
+                        ),
+                        level=logging.ERROR,
+                    )
+        finally:
+            self._in_flight.discard(notification.id)
 
-        if send_tasks:
-            # Execute all sends in parallel
-            results = await asyncio.gather(*send_tasks, return_exceptions=True)
-            # Process results using shared gather guard
-            for channel, result in zip(task_channels, results, strict=True):
-                _unwrap_async_result(
-                    result,
-                    context=(
-                        f"Failed to send notification {notification.id} to channel {channel.value}"
-                    ),
-                    level=logging.ERROR,
-                )
+        self._schedule_retry(notification)
+
+    def _schedule_retry(self, notification: NotificationEvent) -> None:
+        """Schedule the next retry of a stored notification with failures.
+
+        Attempt ``n`` becomes due ``RETRY_DELAY_SECONDS * 2**n`` seconds after
+        the notification was created.
+        """
+        if (
+            notification.id not in self._notifications
+            or notification.retry_count >= MAX_RETRY_ATTEMPTS
+            or (
+                not notification.failed_channels
+                and not notification.failed_notification_services
+            )
+        ):
+            return
+        self._retry_deadlines.schedule(
+            notification.id,
+            notification.created_at.timestamp()
+            + RETRY_DELAY_SECONDS * (2**notification.retry_count),
+        )
 
     async def _send_to_channel_safe(
         self,
@@ -1797,12 +1843,17 @@ class PawControlNotificationManager:
             handler: Channel handler function
         """
         try:
-            # RESILIENCE: Wrap handler call with circuit breaker
+            # RESILIENCE: Wrap handler call with circuit breaker and run it in
+            # the channel's bounded delivery lane.
             circuit_name = f"notification_channel_{channel.value}"
-            await self.resilience_manager.execute_with_resilience(
-                handler,
-                notification,
-                circuit_breaker_name=circuit_name,
+            await self._delivery_pool.run(
+                channel.value,
+                partial(
+                    self.resilience_manager.execute_with_resilience,
+                    handler,
+                    notification,
+                    circuit_breaker_name=circuit_name,
+                ),
             )
             notification.sent_to.append(channel)
             # Track send attempts
@@ -2343,14 +2394,28 @@ class PawControlNotificationManager:
 
     # OPTIMIZE: Enhanced cleanup and maintenance
     async def _cleanup_expired_notifications(self) -> None:
-        """Background task to clean up expired notifications and cache."""
+        """Background task removing notifications when their deadline passes."""
         while True:
             try:
-                await asyncio.sleep(CACHE_CLEANUP_INTERVAL)
+                await self._expiry_deadlines.async_wait(
+                    dt_util.now().timestamp(),
+                    CACHE_CLEANUP_INTERVAL,
+                )
 
                 async with self._lock:
-                    # Clean expired notifications
-                    expired_count = await self.async_cleanup_expired_notifications()
+                    now = dt_util.utcnow()
+                    expired_count = 0
+                    for notification_id in self._expiry_deadlines.pop_due(
+                        now.timestamp(),
+                    ):
+                        notification = self._notifications.get(notification_id)
+                        if notification is not None and self._is_notification_expired(
+                            notification,
+                            now,
+                        ):
+                            del self._notifications[notification_id]
+                            self._retry_deadlines.cancel(notification_id)
+                            expired_count += 1
                     if expired_count > 0:
                         _LOGGER.debug(
                             "Cleanup: %d expired notifications", expired_count
@@ -2361,6 +2426,29 @@ class PawControlNotificationManager:
             except Exception as err:
                 _LOGGER.error("Cleanup task error: %s", err)
 
+    @staticmethod
+    def _is_notification_expired(
+        notification: NotificationEvent,
+        now: datetime,
+    ) -> bool:
+        """Return True when a notification expired or was acknowledged long ago."""
+        expires_at = notification.expires_at
+        if expires_at and expires_at.tzinfo is None:
+            expires_at = dt_util.as_utc(expires_at)
+
+        acknowledged_at = notification.acknowledged_at
+        if acknowledged_at is not None:
+            acknowledged_at = dt_util.as_utc(acknowledged_at)
+
+        return bool(
+            (expires_at and expires_at < now)
+            or (
+                notification.acknowledged
+                and acknowledged_at
+                and (now - acknowledged_at).days > 7
+            )
+        )
+
     async def async_cleanup_expired_notifications(self) -> int:
         """Clean up expired notifications with enhanced logic.
 
@@ -2368,28 +2456,18 @@ class PawControlNotificationManager:
             Number of notifications cleaned up
         """
         now = dt_util.utcnow()
-        expired_ids = []
-
-        for notification_id, notification in self._notifications.items():
-            # Remove if expired or very old acknowledged notifications
-            expires_at = notification.expires_at
-            if expires_at and expires_at.tzinfo is None:
-                expires_at = dt_util.as_utc(expires_at)
-
-            acknowledged_at = notification.acknowledged_at
-            if acknowledged_at is not None:
-                acknowledged_at = dt_util.as_utc(acknowledged_at)
-
-            if (expires_at and expires_at < now) or (
-                notification.acknowledged
-                and acknowledged_at
-                and (now - acknowledged_at).days > 7
-            ):
-                expired_ids.append(notification_id)
+        # Remove if expired or very old acknowledged notifications
+        expired_ids = [
+            notification_id
+            for notification_id, notification in self._notifications.items()
+            if self._is_notification_expired(notification, now)
+        ]
 
         # Batch remove expired notifications
         for notification_id in expired_ids:
             del self._notifications[notification_id]
+            self._expiry_deadlines.cancel(notification_id)
+            self._retry_deadlines.cancel(notification_id)
         if expired_ids:
             _LOGGER.debug(
                 "Cleaned up %d expired notifications",
@@ -2408,6 +2486,13 @@ class PawControlNotificationManager:
 
             notification.acknowledged = True
             notification.acknowledged_at = dt_util.now()
+            self._retry_deadlines.cancel(notification_id)
+            self._expiry_deadlines.schedule(
+                notification_id,
+                notification.acknowledged_at.timestamp()
+                + ACKNOWLEDGED_RETENTION_SECONDS,
+                keep_earlier=True,
+            )
             # Dismiss persistent notification if it exists
             if NotificationChannel.PERSISTENT in notification.sent_to:
                 try:
@@ -2437,9 +2522,7 @@ class PawControlNotificationManager:
         person-targeting entries are sourced from ``PersonEntityManager`` cache
         diagnostics when available.
         """
-        rate_limit_entries = sum(
-            len(channel_map) for channel_map in self._rate_limit_last_sent.values()
-        )
+        rate_limit_entries = len(self._rate_limits)
         person_targeting_entries = 0
         if self._person_manager is not None:
             person_targeting_entries = int(
@@ -2517,6 +2600,7 @@ class PawControlNotificationManager:
                 "handlers_registered": len(self._handlers),
                 # NEW: Person targeting stats
                 "person_entity_stats": person_stats,
+                "channel_delivery": self._delivery_pool.snapshot(),
             }
             return stats
 
@@ -2590,45 +2674,61 @@ class PawControlNotificationManager:
             await self._person_manager.async_shutdown()
         # Process any remaining batches
         async with self._lock:
-            for notifications in self._pending_batches.values():
-                for notification in notifications:
-                    await self._send_to_channels(notification)
+            remaining = [
+                notification
+                for notifications in self._pending_batches.values()
+                for notification in notifications
+            ]
+        for notification in remaining:
+            await self._send_to_channels(notification)
         # Clear all data
         self._notifications.clear()
         self._configs.clear()
         self._handlers.clear()
         self._batch_queue.clear()
         self._pending_batches.clear()
+        self._batch_deadlines.clear()
+        self._expiry_deadlines.clear()
+        self._retry_deadlines.clear()
 
     # Keep existing methods for backward compatibility
     async def _retry_failed_notifications(self) -> None:
-        """Background task to retry failed notifications."""
+        """Background task to retry failed notifications when they are due.
+
+        Retry deadlines are scheduled by :meth:`_schedule_retry` after each
+        delivery with failures.  Deliveries run outside the lock.  A due
+        notification whose previous delivery is still in flight is skipped;
+        that delivery reschedules the retry once it settles.
+        """
         while True:
             try:
-                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                await self._retry_deadlines.async_wait(dt_util.now().timestamp())
 
+                retry_notifications: list[NotificationEvent] = []
                 async with self._lock:
                     now = dt_util.now()
-                    retry_notifications = []
-                    for notification in self._notifications.values():
+                    for notification_id in self._retry_deadlines.pop_due(
+                        now.timestamp(),
+                    ):
+                        notification = self._notifications.get(notification_id)
                         if (
-                            (notification.expires_at and notification.expires_at < now)
+                            notification is None
+                            or (
+                                notification.expires_at
+                                and notification.expires_at < now
+                            )
                             or notification.acknowledged
                             or (
                                 not notification.failed_channels
                                 and not notification.failed_notification_services
                             )
                             or notification.retry_count >= MAX_RETRY_ATTEMPTS
+                            or notification.id in self._in_flight
                         ):
                             continue
-                        time_since_creation = now - notification.created_at
-                        if time_since_creation.total_seconds() > RETRY_DELAY_SECONDS:
-                            retry_notifications.append(notification)
+                        self._in_flight.add(notification.id)
+                        retry_notifications.append(notification)
                     for notification in retry_notifications:
-                        if not notification.failed_channels and (
-                            not notification.failed_notification_services
-                        ):
-                            continue
                         _LOGGER.info(
                             "Retrying notification %s (attempt %d)",
                             notification.id,
@@ -2650,10 +2750,15 @@ class PawControlNotificationManager:
                         notification.retry_count += 1
                         self._performance_metrics["retry_reschedules"] += 1
 
+                try:
+                    for notification in retry_notifications:
                         await self._send_to_channels(notification)
 
                         if not notification.failed_channels:
                             self._performance_metrics["retry_successes"] += 1
+                finally:
+                    for notification in retry_notifications:
+                        self._in_flight.discard(notification.id)
             except asyncio.CancelledError:
                 break
             except Exception as err:
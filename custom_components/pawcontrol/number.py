@@ -816,13 +816,6 @@ class PawControlDogWeightNumber(PawControlNumberBase):
         """Set the dog's weight."""
         weight_value = float(value)
 
-        dog_data = self._get_dog_data()
-        if isinstance(dog_data, Mapping):
-            dog_info = cast(
-                DogConfigData,
-                dog_data.setdefault("dog_info", cast(DogConfigData, {})),
-            )
-            dog_info[DOG_WEIGHT_FIELD] = weight_value
         updates: DogConfigUpdatePayload = {DOG_WEIGHT_FIELD: weight_value}
         await self._async_persist_config_update(updates)
         await self._async_refresh_after_update()
@@ -887,13 +880,6 @@ class PawControlDogAgeNumber(PawControlNumberBase):
         """Set the dog's age."""
         int_value = int(value)
 
-        dog_data = self._get_dog_data()
-        if isinstance(dog_data, Mapping):
-            dog_info = cast(
-                DogConfigData,
-                dog_data.setdefault("dog_info", cast(DogConfigData, {})),
-            )
-            dog_info[DOG_AGE_FIELD] = int_value
         updates: DogConfigUpdatePayload = {DOG_AGE_FIELD: int_value}
         await self._async_persist_config_update(updates)
         await self._async_refresh_after_update()
@@ -31,6 +31,7 @@ import gc
 import inspect
 import logging
 import sys
+from types import MappingProxyType
 from typing import Any, ClassVar, Final, Protocol, cast
 from unittest.mock import Mock
 import weakref
@@ -53,7 +54,8 @@ from .const import (
     MANUFACTURER,
 )
 from .coordinator import PawControlCoordinator
-from .coordinator_accessors import CoordinatorDataAccessMixin
+from .coordinator_accessors import CoordinatorDataAccessMixin, resolve_dog_snapshot
+from .coordinator_diffing import ListenerScope
 from .types import (
     CoordinatorDataPayload,
     CoordinatorDogData,
@@ -113,11 +115,17 @@ MEMORY_OPTIMIZATION: Final[OptimizedEntityMemoryConfig] = {
 
 @dataclass(slots=True)
 class _StateCacheEntry:
-    """State cache entry storing payload snapshots and coordinator status."""
+    """State cache entry storing payload snapshots and coordinator status.
+
+    Entries carrying a ``version`` hold read-only coordinator snapshot views
+    and stay valid until the coordinator publishes a new dog payload or its
+    availability changes; unversioned entries fall back to the wall-clock TTL.
+    """
 
     payload: OptimizedEntityStateCachePayload
     timestamp: float
     coordinator_available: bool | None = None
+    version: int | None = None
 
 
 @dataclass(slots=True)
@@ -209,6 +217,29 @@ def _coordinator_is_available(coordinator: Any) -> bool:
         return True
 
 
+def _state_cache_entry_is_fresh(
+    entry: _StateCacheEntry,
+    now: float,
+    version: int | None,
+    coordinator_available: bool,
+) -> bool:
+    """Return True when ``entry`` may be served for the current snapshot."""
+    if version is not None:
+        # Failed refreshes do not advance the version, so availability is part
+        # of the key; otherwise an outage keeps serving the last good payload.
+        return (
+            entry.version == version
+            and entry.coordinator_available == coordinator_available
+        )
+    cache_time, normalized = _normalize_cache_timestamp(entry.timestamp, now)
+    if normalized:
+        entry.timestamp = cache_time
+    fresh = now - cache_time < CACHE_TTL_SECONDS["state"]
+    return fresh and (
+        not coordinator_available or entry.coordinator_available is not False
+    )
+
+
 def _call_coordinator_method(
     coordinator: Any,
     method: str,
@@ -334,6 +365,8 @@ class OptimizedEntityBase(
     consistent high performance and maintain Platinum quality ambitions.
     """
 
+    # Coordinator module this entity renders; ``None`` listens to the whole dog.
+    _listener_module: ClassVar[str | None] = None
     # Class-level performance tracking
     _performance_registry: ClassVar[dict[str, PerformanceTracker]] = {}
     _last_cache_cleanup: ClassVar[float] = 0
@@ -387,6 +420,8 @@ class OptimizedEntityBase(
             icon: Material Design icon for the entity
         """
         super().__init__(coordinator)
+        # Only wake this entity when its dog (or module) payload changes.
+        self.coordinator_context = ListenerScope(dog_id, self._listener_module)
 
         # Core identification and tracking
         self._dog_id = dog_id
@@ -823,6 +858,10 @@ class OptimizedEntityBase(
     def _get_dog_data_cached(self) -> CoordinatorDogData | None:
         """Get dog data with intelligent caching.
 
+        Coordinators publishing versioned snapshots are served zero-copy: the
+        cached read-only view is reused until the dog's snapshot version
+        changes.
+
         Returns:
             Dog data dictionary or None if unavailable
         """
@@ -833,25 +872,26 @@ class OptimizedEntityBase(
         previous_available = self._update_coordinator_availability(
             coordinator_available,
         )
+        snapshot = resolve_dog_snapshot(self.coordinator, self._dog_id)
+        version = None if snapshot is None else snapshot.version
 
         # Check cache first
-        if entry := _STATE_CACHE.get(cache_key):
-            cache_time, normalized = _normalize_cache_timestamp(
-                entry.timestamp,
-                now,
-            )
-            if normalized:
-                entry.timestamp = cache_time
-            cached_available = entry.coordinator_available
-            if now - cache_time < CACHE_TTL_SECONDS["state"] and (
-                not coordinator_available or cached_available is not False
-            ):
-                self._performance_tracker.record_cache_hit()
-                return cast(CoordinatorDogData, dict(entry.payload))
+        if (entry := _STATE_CACHE.get(cache_key)) and _state_cache_entry_is_fresh(
+            entry,
+            now,
+            version,
+            coordinator_available,
+        ):
+            self._performance_tracker.record_cache_hit()
+            if version is not None:
+                return cast(CoordinatorDogData, entry.payload)
+            return cast(CoordinatorDogData, dict(entry.payload))
 
         dog_payload: CoordinatorDogData | None = None
         if coordinator_available:
-            if isinstance(self.coordinator, PawControlCoordinator):
+            if snapshot is not None:
+                dog_payload = snapshot.data
+            elif isinstance(self.coordinator, PawControlCoordinator):
                 dog_payload = self.coordinator.get_dog_data(self._dog_id)
             else:
                 result = _call_coordinator_method(
@@ -861,35 +901,50 @@ class OptimizedEntityBase(
                 )
                 if isinstance(result, Mapping):
                     dog_payload = cast(CoordinatorDogData, dict(result))
-        if dog_payload is not None:
-            dog_data = cast(CoordinatorDogData, dict(dog_payload))
+        if (
+            snapshot is not None
+            and dog_payload is not None
+            and "status" in dog_payload
+            and "last_update" in dog_payload
+        ):
+            # Complete snapshot views are shared as-is.
+            dog_data = dog_payload
         else:
-            if not coordinator_available:
-                status = "offline"
-            elif not previous_available:
-                status = "recovering"
+            if dog_payload is not None:
+                dog_data = cast(CoordinatorDogData, dict(dog_payload))
             else:
-                status = "missing"
-            dog_data = cast(
-                CoordinatorDogData,
-                {
-                    "dog_info": {
-                        "dog_id": self._dog_id,
-                        "dog_name": self._dog_name,
+                if not coordinator_available:
+                    status = "offline"
+                elif not previous_available:
+                    status = "recovering"
+                else:
+                    status = "missing"
+                dog_data = cast(
+                    CoordinatorDogData,
+                    {
+                        "dog_info": {
+                            "dog_id": self._dog_id,
+                            "dog_name": self._dog_name,
+                        },
+                        "status": status,
+                        "last_update": None,
                     },
-                    "status": status,
-                    "last_update": None,
-                },
-            )
+                )
 
-        dog_data.setdefault("status", "online")
-        dog_data.setdefault("last_update", None)
+            dog_data.setdefault("status", "online")
+            dog_data.setdefault("last_update", None)
+            if version is not None:
+                dog_data = cast(CoordinatorDogData, MappingProxyType(dog_data))
 
         # Cache result (including empty dicts) to prevent repeated lookups
         _STATE_CACHE[cache_key] = _StateCacheEntry(
-            payload=cast(OptimizedEntityStateCachePayload, dict(dog_data)),
+            payload=cast(
+                OptimizedEntityStateCachePayload,
+                dog_data if version is not None else dict(dog_data),
+            ),
             timestamp=now,
             coordinator_available=coordinator_available,
+            version=version,
         )
         self._performance_tracker.record_cache_miss()
 
@@ -908,29 +963,48 @@ class OptimizedEntityBase(
         now = _utcnow_timestamp()
         coordinator_available = _coordinator_is_available(self.coordinator)
         typed_module = CoordinatorDataAccessMixin._is_typed_module(module)
+        snapshot = resolve_dog_snapshot(self.coordinator, self._dog_id)
+        version = None if snapshot is None else snapshot.version
 
         # Check cache first
-        if entry := _STATE_CACHE.get(cache_key):
-            cache_time, normalized = _normalize_cache_timestamp(
-                entry.timestamp,
-                now,
+        if (entry := _STATE_CACHE.get(cache_key)) and _state_cache_entry_is_fresh(
+            entry,
+            now,
+            version,
+            coordinator_available,
+        ):
+            self._performance_tracker.record_cache_hit()
+            if version is not None:
+                return cast(CoordinatorModuleLookupResult, entry.payload)
+            payload = ensure_json_mapping(
+                cast(JSONMappingLike | JSONMutableMapping, entry.payload),
             )
-            if normalized:
-                entry.timestamp = cache_time
-            cached_available = entry.coordinator_available
-            if now - cache_time < CACHE_TTL_SECONDS["state"] and (
-                not coordinator_available or cached_available is not False
-            ):
-                self._performance_tracker.record_cache_hit()
-                payload = ensure_json_mapping(
-                    cast(JSONMappingLike | JSONMutableMapping, entry.payload),
-                )
-                if typed_module:
-                    return cast(CoordinatorModuleState, payload)
-                return cast(
-                    CoordinatorUntypedModuleState,
-                    _coerce_json_mutable(payload),
-                )
+            if typed_module:
+                return cast(CoordinatorModuleState, payload)
+            return cast(
+                CoordinatorUntypedModuleState,
+                _coerce_json_mutable(payload),
+            )
+
+        if snapshot is not None:
+            # Share the module mapping from the snapshot without copying it.
+            module_view: Mapping[str, Any] = (
+                MappingProxyType({"status": "unknown"})
+                if typed_module
+                else MappingProxyType({})
+            )
+            if coordinator_available:
+                result = snapshot.data.get(module)
+                if isinstance(result, Mapping):
+                    module_view = result
+            _STATE_CACHE[cache_key] = _StateCacheEntry(
+                payload=cast(OptimizedEntityStateCachePayload, module_view),
+                timestamp=now,
+                coordinator_available=coordinator_available,
+                version=version,
+            )
+            self._performance_tracker.record_cache_miss()
+            return cast(CoordinatorModuleLookupResult, module_view)
 
         # Fetch from coordinator
         module_payload: CoordinatorModuleLookupResult
@@ -1035,6 +1109,11 @@ class OptimizedEntityBase(
                 await maybe_coro
             return
         if hasattr(self.coordinator, "async_refresh"):
+            # ``async_refresh`` honours the per-module cadence; an explicit entity
+            # update must fetch every module, as ``async_request_refresh`` does.
+            invalidate = getattr(self.coordinator, "_invalidate_module_schedule", None)
+            if callable(invalidate):
+                invalidate()
             maybe_coro = self.coordinator.async_refresh()
             if inspect.isawaitable(maybe_coro):
                 await maybe_coro
@@ -961,6 +961,10 @@ class DogManagementOptionsMixin(GardenModuleSelectorMixin, DogManagementOptionsH
                     self._entry,
                     data=new_data,
                 )
+                runtime = getattr(self._entry, "runtime_data", None)
+                data_manager = getattr(runtime, "data_manager", None)
+                if data_manager is not None and isinstance(selected_dog_id, str):
+                    await data_manager.async_remove_dog(selected_dog_id)
                 self._dogs = typed_dogs
                 if self._current_dog and (
                     self._current_dog.get(DOG_ID_FIELD) == selected_dog_id
@@ -5,12 +5,16 @@ or other entity-driven sources. It validates payloads, enforces strict per-dog
 source matching, rate-limits bursty senders, and records telemetry suitable
 for diagnostics and repairs.
 
+Trackers that buffer points offline can deliver them as a batch
+(``{"dog_id": ..., "points": [...]}``). Batches are validated and applied in
+one pass and publish a single coordinator patch for all affected dogs.
+
 Telemetry is intentionally non-sensitive (no coordinates).
 """
 
-from collections import deque
 from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 import time
 from typing import Any, Final, Literal, TypedDict, cast
@@ -34,6 +38,7 @@ from .const import (
     DEFAULT_PUSH_RATE_LIMIT_WEBHOOK_PER_MINUTE,
     DOMAIN,
 )
+from .rate_limiter import SlidingWindowLimiter
 from .runtime_data import require_runtime_data
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +47,10 @@ PushSource = Literal["webhook", "mqtt", "entity"]
 
 _PUSH_STORE_KEY: Final[str] = "_push_router"
 _MAX_REASONS: Final[int] = 25
+_MAX_BATCH_POINTS: Final[int] = 500
+# Per-dog point volume accepted through batches.  Sized so a tracker can flush
+# a full offline buffer right after reconnecting and still send a second one.
+_BATCH_POINTS_PER_MINUTE: Final[int] = 2 * _MAX_BATCH_POINTS
 
 
 class PushResult(TypedDict, total=False):
@@ -51,22 +60,29 @@ class PushResult(TypedDict, total=False):
     status: int
     error: str
     dog_id: str
+    index: int
 
 
-@dataclass(slots=True)
-class _RateLimiter:
-    window_seconds: int
-    max_events: int
-    events: deque[float]
+class PushBatchResult(TypedDict, total=False):
+    """Result payload returned by :func:`async_process_gps_push_batch`."""
+
+    ok: bool
+    status: int
+    error: str
+    accepted: int
+    rejected: int
+    results: list[PushResult]
 
-    def allow(self, now: float) -> bool:
-        cutoff = now - self.window_seconds
-        while self.events and self.events[0] < cutoff:
-            self.events.popleft()
-        if len(self.events) >= self.max_events:
-            return False
-        self.events.append(now)
-        return True
+
+@dataclass(slots=True)
+class _ParsedPoint:
+    index: int
+    dog_id: str
+    latitude: float
+    longitude: float
+    altitude: float | None
+    accuracy: float | None
+    timestamp: datetime
 
 
 def _store(hass: HomeAssistant) -> dict[str, Any]:
@@ -186,6 +202,11 @@ def _payload_limit(entry: ConfigEntry) -> int:
     return max(1024, min(256 * 1024, value))
 
 
+def get_payload_limit(entry: ConfigEntry) -> int:
+    """Return the maximum accepted push payload size in bytes for ``entry``."""
+    return _payload_limit(entry)
+
+
 def _nonce_ttl(entry: ConfigEntry) -> int:
     raw = entry.options.get(CONF_PUSH_NONCE_TTL_SECONDS, DEFAULT_PUSH_NONCE_TTL_SECONDS)
     try:
@@ -235,9 +256,13 @@ def _check_nonce(
         nonces = entry_store["nonces"]
     ttl = _nonce_ttl(entry)
     cutoff = now - ttl
-    for key, ts in list(nonces.items()):
-        if not isinstance(ts, (int, float)) or ts < cutoff:
-            nonces.pop(key, None)
+    # Nonces are inserted in arrival order, so expired ones sit at the front.
+    while nonces:
+        oldest = next(iter(nonces))
+        ts = nonces[oldest]
+        if isinstance(ts, (int, float)) and ts >= cutoff:
+            break
+        del nonces[oldest]
     if nonce in nonces:
         return False
     nonces[nonce] = now
@@ -245,17 +270,25 @@ def _check_nonce(
 
 
 def _limiter(
-    entry_store: dict[str, Any], dog_id: str, source: PushSource, max_per_minute: int
-) -> _RateLimiter:
+    entry_store: dict[str, Any],
+    dog_id: str,
+    source: PushSource,
+    max_per_minute: int,
+    *,
+    scope: Literal["requests", "points"] = "requests",
+) -> SlidingWindowLimiter:
     limiters = entry_store.get("limiters")
     if not isinstance(limiters, dict):
         entry_store["limiters"] = {}
         limiters = entry_store["limiters"]
-    key = f"{dog_id}:{source}"
+    key = f"{dog_id}:{source}" if scope == "requests" else f"{dog_id}:{source}:{scope}"
     existing = limiters.get(key)
-    if isinstance(existing, _RateLimiter) and existing.max_events == max_per_minute:
+    if (
+        isinstance(existing, SlidingWindowLimiter)
+        and existing.max_events == max_per_minute
+    ):
         return existing
-    limiter = _RateLimiter(window_seconds=60, max_events=max_per_minute, events=deque())
+    limiter = SlidingWindowLimiter(60.0, max_per_minute)
     limiters[key] = limiter
     return limiter
 
@@ -296,6 +329,64 @@ def _reject(
     return PushResult(ok=False, status=status, error=reason, dog_id=dog_id)
 
 
+def _parse_coordinates(
+    payload: Mapping[str, Any],
+) -> tuple[float, float, float | None, float | None, datetime] | str:
+    """Return parsed point fields or the rejection reason."""
+    lat = payload.get("latitude")
+    lon = payload.get("longitude")
+    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        return "missing_coordinates"
+
+    latitude = float(lat)
+    longitude = float(lon)
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return "coordinates_out_of_range"
+
+    altitude = payload.get("altitude")
+    accuracy = payload.get("accuracy")
+    timestamp_raw = payload.get("timestamp")
+    timestamp = dt_util.utcnow()
+    if isinstance(timestamp_raw, str) and timestamp_raw:
+        parsed = dt_util.parse_datetime(timestamp_raw)
+        if parsed is not None:
+            # Naive timestamps are taken as UTC so every point compares with
+            # the aware ``utcnow()`` default when a batch is ordered.
+            timestamp = dt_util.as_utc(parsed)
+    return (
+        latitude,
+        longitude,
+        float(altitude) if isinstance(altitude, (int, float)) else None,
+        float(accuracy) if isinstance(accuracy, (int, float)) else None,
+        timestamp,
+    )
+
+
+def _location_source(source: PushSource) -> Any:
+    from .gps_manager import LocationSource
+
+    if source == "webhook":
+        return LocationSource.WEBHOOK
+    if source == "mqtt":
+        return LocationSource.MQTT
+    return LocationSource.ENTITY
+
+
+async def _async_patch_coordinator(coordinator: Any, dog_ids: list[str]) -> None:
+    """Publish GPS patches for ``dog_ids`` with a single coordinator update."""
+    patch_many = getattr(coordinator, "async_patch_gps_updates", None)
+    try:
+        if callable(patch_many):
+            await patch_many(dog_ids)
+        else:
+            for dog_id in dog_ids:
+                await coordinator.async_patch_gps_update(dog_id)
+    except Exception as err:  # pragma: no cover
+        _LOGGER.debug("GPS patch update failed for %s: %s", ", ".join(dog_ids), err)
+        for dog_id in dog_ids:
+            await coordinator.async_refresh_dog(dog_id)
+
+
 async def async_process_gps_push(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -334,26 +425,11 @@ async def async_process_gps_push(
     if not limiter.allow(now_mono):
         return _reject(telemetry, dog_id, source, now_iso, "rate_limited", 429)
 
-    lat = payload.get("latitude")
-    lon = payload.get("longitude")
-    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
-        return _reject(telemetry, dog_id, source, now_iso, "missing_coordinates", 400)
+    parsed = _parse_coordinates(payload)
+    if isinstance(parsed, str):
+        return _reject(telemetry, dog_id, source, now_iso, parsed, 400)
+    latitude, longitude, altitude, accuracy, timestamp = parsed
 
-    latitude = float(lat)
-    longitude = float(lon)
-    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
-        return _reject(
-            telemetry, dog_id, source, now_iso, "coordinates_out_of_range", 400
-        )
-
-    altitude = payload.get("altitude")
-    accuracy = payload.get("accuracy")
-    timestamp_raw = payload.get("timestamp")
-    timestamp = dt_util.utcnow()
-    if isinstance(timestamp_raw, str) and timestamp_raw:
-        parsed = dt_util.parse_datetime(timestamp_raw)
-        if parsed is not None:
-            timestamp = parsed
     runtime_data = require_runtime_data(hass, entry)
     coordinator = runtime_data.coordinator
     gps_manager = runtime_data.gps_geofence_manager or coordinator.gps_geofence_manager
@@ -363,22 +439,14 @@ async def async_process_gps_push(
         )
 
     try:
-        from .gps_manager import LocationSource
-
-        src_enum = (
-            LocationSource.WEBHOOK
-            if source == "webhook"
-            else (LocationSource.MQTT if source == "mqtt" else LocationSource.ENTITY)
-        )
-
         ok = await gps_manager.async_add_gps_point(
             dog_id=dog_id,
             latitude=latitude,
             longitude=longitude,
-            altitude=float(altitude) if isinstance(altitude, (int, float)) else None,
-            accuracy=float(accuracy) if isinstance(accuracy, (int, float)) else None,
+            altitude=altitude,
+            accuracy=accuracy,
             timestamp=timestamp,
-            source=src_enum,
+            source=_location_source(source),
         )
     except Exception as err:
         _LOGGER.exception("Push GPS update failed for %s (%s): %s", dog_id, source, err)
@@ -395,3 +463,190 @@ async def async_process_gps_push(
         await coordinator.async_refresh_dog(dog_id)
 
     return PushResult(ok=True, status=200, dog_id=dog_id)
+
+
+def is_batch_payload(payload: Mapping[str, Any]) -> bool:
+    """Return True when ``payload`` uses the batched ``points`` format."""
+    return isinstance(payload, Mapping) and "points" in payload
+
+
+async def async_process_gps_push_batch(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    payload: Mapping[str, Any],
+    *,
+    source: PushSource,
+    raw_size: int | None = None,
+    nonce: str | None = None,
+) -> PushBatchResult:
+    """Validate and apply a batch of GPS points in a single pass.
+
+    Each point may carry its own ``dog_id`` or inherit the batch-level one.
+    Payload size and nonce are checked once per batch, the request rate limiter
+    is charged once per dog, point volume is capped by a separate per-dog
+    budget, points are applied in timestamp order and the coordinator is
+    patched once for every dog that accepted a point.
+    """
+    entry_store = _entry_store(hass, entry.entry_id)
+    telemetry = cast(dict[str, Any], entry_store.get("telemetry", {}))
+    now_mono = time.monotonic()
+    now_iso = dt_util.utcnow().isoformat()
+
+    def _batch_reject(reason: str, status: int) -> PushBatchResult:
+        _reject(telemetry, "unknown", source, now_iso, reason, status)
+        return PushBatchResult(
+            ok=False, status=status, error=reason, accepted=0, rejected=0, results=[]
+        )
+
+    if raw_size is not None and raw_size > _payload_limit(entry):
+        return _batch_reject("payload_too_large", 413)
+    if not isinstance(payload, Mapping):
+        return _batch_reject("invalid_payload", 400)
+    points = payload.get("points")
+    if not isinstance(points, list) or not points:
+        return _batch_reject("invalid_payload", 400)
+    if len(points) > _MAX_BATCH_POINTS:
+        return _batch_reject("batch_too_large", 413)
+    if nonce and not _check_nonce(entry_store, entry, nonce, now_mono):
+        return _batch_reject("replay_nonce", 409)
+
+    default_dog = payload.get("dog_id")
+    results: dict[int, PushResult] = {}
+    parsed_points: list[_ParsedPoint] = []
+    dog_checks: dict[str, tuple[str, int] | None] = {}
+
+    for index, point in enumerate(points):
+        if not isinstance(point, Mapping):
+            results[index] = _reject(
+                telemetry, "unknown", source, now_iso, "invalid_payload", 400
+            )
+            continue
+        dog_id_raw = point.get("dog_id", default_dog)
+        if not isinstance(dog_id_raw, str) or not dog_id_raw.strip():
+            results[index] = _reject(
+                telemetry, "unknown", source, now_iso, "missing_dog_id", 400
+            )
+            continue
+        dog_id = dog_id_raw.strip()
+        if dog_id not in dog_checks:
+            expected = _dog_expected_source(entry, dog_id)
+            if expected is None:
+                dog_checks[dog_id] = ("unknown_dog_id", 404)
+            elif expected != source:
+                dog_checks[dog_id] = ("gps_source_mismatch", 409)
+            else:
+                dog_checks[dog_id] = None
+        check = dog_checks[dog_id]
+        if check is not None:
+            results[index] = _reject(telemetry, dog_id, source, now_iso, *check)
+            continue
+        parsed = _parse_coordinates(point)
+        if isinstance(parsed, str):
+            results[index] = _reject(telemetry, dog_id, source, now_iso, parsed, 400)
+            continue
+        latitude, longitude, altitude, accuracy, timestamp = parsed
+        parsed_points.append(
+            _ParsedPoint(
+                index, dog_id, latitude, longitude, altitude, accuracy, timestamp
+            )
+        )
+
+    # A batch counts as one request against each dog's request limit.  Point
+    # volume is charged against its own budget so a reconnecting tracker can
+    # flush its buffer; the overflow is rejected in batch order.
+    max_per_minute = _rate_limit(entry, source)
+    requested: dict[str, int] = {}
+    for point in parsed_points:
+        requested[point.dog_id] = requested.get(point.dog_id, 0) + 1
+    budget: dict[str, int] = {}
+    for dog_id, count in requested.items():
+        if not _limiter(entry_store, dog_id, source, max_per_minute).allow(now_mono):
+            budget[dog_id] = 0
+            continue
+        budget[dog_id] = _limiter(
+            entry_store,
+            dog_id,
+            source,
+            _BATCH_POINTS_PER_MINUTE,
+            scope="points",
+        ).admit(now_mono, count)
+
+    accepted_dogs: list[str] = []
+    pending: list[_ParsedPoint] = []
+    for point in parsed_points:
+        if budget[point.dog_id] > 0:
+            budget[point.dog_id] -= 1
+            pending.append(point)
+        else:
+            results[point.index] = _reject(
+                telemetry, point.dog_id, source, now_iso, "rate_limited", 429
+            )
+
+    if pending:
+        runtime_data = require_runtime_data(hass, entry)
+        coordinator = runtime_data.coordinator
+        gps_manager = (
+            runtime_data.gps_geofence_manager or coordinator.gps_geofence_manager
+        )
+        src_enum = _location_source(source)
+        pending.sort(key=lambda point: point.timestamp)
+        for point in pending:
+            if gps_manager is None:
+                results[point.index] = _reject(
+                    telemetry,
+                    point.dog_id,
+                    source,
+                    now_iso,
+                    "gps_manager_unavailable",
+                    503,
+                )
+                continue
+            try:
+                ok = await gps_manager.async_add_gps_point(
+                    dog_id=point.dog_id,
+                    latitude=point.latitude,
+                    longitude=point.longitude,
+                    altitude=point.altitude,
+                    accuracy=point.accuracy,
+                    timestamp=point.timestamp,
+                    source=src_enum,
+                )
+            except Exception as err:
+                _LOGGER.exception(
+                    "Push GPS update failed for %s (%s): %s", point.dog_id, source, err
+                )
+                results[point.index] = _reject(
+                    telemetry, point.dog_id, source, now_iso, "gps_update_failed", 500
+                )
+                continue
+            if not ok:
+                results[point.index] = _reject(
+                    telemetry, point.dog_id, source, now_iso, "gps_rejected", 400
+                )
+                continue
+            _accept(telemetry, point.dog_id, source, now_iso)
+            results[point.index] = PushResult(ok=True, status=200, dog_id=point.dog_id)
+            if point.dog_id not in accepted_dogs:
+                accepted_dogs.append(point.dog_id)
+
+        if accepted_dogs:
+            await _async_patch_coordinator(coordinator, accepted_dogs)
+
+    ordered: list[PushResult] = []
+    for index in range(len(points)):
+        result = results[index]
+        result["index"] = index
+        ordered.append(result)
+    accepted = sum(1 for result in ordered if result.get("ok"))
+    batch = PushBatchResult(
+        ok=accepted > 0,
+        status=200,
+        accepted=accepted,
+        rejected=len(ordered) - accepted,
+        results=ordered,
+    )
+    if not accepted:
+        statuses = {result.get("status", 400) for result in ordered}
+        batch["status"] = statuses.pop() if len(statuses) == 1 else 400
+        batch["error"] = "no_points_accepted"
+    return batch
@@ -0,0 +1,195 @@
+"""Shared sliding-window rate limiting primitives.
+
+Webhook security, the push router and the notification manager each kept their
+own timestamp deques and re-counted them on every request.  The deques were
+capped, so counts saturated at high rates, and counting cost grew with the
+window.  This module provides one implementation for all of them:
+
+* :class:`SlidingWindowCounter` counts events over a trailing window using a
+  fixed number of time buckets, so adding and counting are O(1) amortised and
+  memory is bounded regardless of the request rate.
+* :class:`SlidingWindowLimiter` admits at most ``max_events`` per window.
+* :class:`RateLimiterRegistry` keeps one limiter per key in least-recently-used
+  order and evicts keys that have been idle for longer than a retention
+  period.
+
+Counts are exact at bucket granularity and err on the safe side: a bucket is
+counted until its newest event leaves the window.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from collections import deque
+from collections.abc import Hashable, Iterator
+import math
+from typing import Final
+
+# Buckets per window; bounds memory per counter independent of the rate.
+DEFAULT_BUCKETS_PER_WINDOW: Final[int] = 60
+
+
+class SlidingWindowCounter:
+    """Count events within the trailing ``window`` seconds."""
+
+    __slots__ = ("_buckets", "_resolution", "_total", "window")
+
+    def __init__(self, window: float, *, resolution: float | None = None) -> None:
+        """Initialise an empty counter.
+
+        Args:
+            window: Length of the trailing window in seconds
+            resolution: Bucket width in seconds; defaults to
+                ``window / DEFAULT_BUCKETS_PER_WINDOW``
+        """
+        self.window = float(window)
+        self._resolution = (
+            resolution
+            if resolution is not None and resolution > 0
+            else max(self.window / DEFAULT_BUCKETS_PER_WINDOW, 1e-9)
+        )
+        # Each bucket is [bucket index, event count, newest timestamp].
+        self._buckets: deque[list[float]] = deque()
+        self._total = 0
+
+    def add(self, now: float, count: int = 1) -> None:
+        """Record ``count`` events at ``now``."""
+        index = math.floor(now / self._resolution)
+        buckets = self._buckets
+        if buckets and buckets[-1][0] >= index:
+            # Same bucket, or a clock step backwards: merge into the newest.
+            newest = buckets[-1]
+            newest[1] += count
+            newest[2] = max(newest[2], now)
+        else:
+            buckets.append([index, count, now])
+        self._total += count
+
+    def count(self, now: float) -> int:
+        """Return the number of events newer than ``now - window``."""
+        cutoff = now - self.window
+        buckets = self._buckets
+        while buckets and buckets[0][2] <= cutoff:
+            self._total -= int(buckets.popleft()[1])
+        return self._total
+
+    def last_event(self) -> float | None:
+        """Return the timestamp of the newest recorded event."""
+        return self._buckets[-1][2] if self._buckets else None
+
+    def clear(self) -> None:
+        """Forget every recorded event."""
+        self._buckets.clear()
+        self._total = 0
+
+
+class SlidingWindowLimiter:
+    """Admit at most ``max_events`` within a sliding window."""
+
+    __slots__ = ("last_seen", "max_events", "window")
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_events: int,
+        *,
+        resolution: float | None = None,
+    ) -> None:
+        """Initialise the limiter for ``max_events`` per ``window_seconds``."""
+        self.window = SlidingWindowCounter(window_seconds, resolution=resolution)
+        self.max_events = max_events
+        self.last_seen: float | None = None
+
+    @property
+    def window_seconds(self) -> float:
+        """Return the window length in seconds."""
+        return self.window.window
+
+    def allow(self, now: float) -> bool:
+        """Record and admit one event unless the window is already full."""
+        return self.admit(now) == 1
+
+    def admit(self, now: float, requested: int = 1) -> int:
+        """Record up to ``requested`` events and return how many fit the window.
+
+        Charging several events at once never grants more than admitting them
+        one by one would; the shortfall is simply not recorded.
+        """
+        self.last_seen = now
+        granted = max(0, min(requested, self.max_events - self.window.count(now)))
+        if granted:
+            self.window.add(now, granted)
+        return granted
+
+    def count(self, now: float) -> int:
+        """Return the admitted events currently inside the window."""
+        return self.window.count(now)
+
+
+class RateLimiterRegistry[K: Hashable]:
+    """Per-key :class:`SlidingWindowLimiter` instances with idle eviction."""
+
+    __slots__ = ("_idle_seconds", "_limiters", "evicted")
+
+    def __init__(self, idle_seconds: float) -> None:
+        """Initialise the registry; keys idle for ``idle_seconds`` are dropped."""
+        self._idle_seconds = idle_seconds
+        self._limiters: dict[K, SlidingWindowLimiter] = {}
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._limiters)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True when ``key`` is tracked."""
+        return key in self._limiters
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over tracked keys, least recently used first."""
+        return iter(self._limiters)
+
+    def allow(
+        self,
+        key: K,
+        now: float,
+        *,
+        window_seconds: float,
+        max_events: int,
+    ) -> bool:
+        """Admit one event for ``key`` under the given limit."""
+        self.evict_idle(now)
+        limiter = self._limiters.pop(key, None)
+        if (
+            limiter is None
+            or limiter.max_events != max_events
+            or limiter.window_seconds != window_seconds
+        ):
+            limiter = SlidingWindowLimiter(window_seconds, max_events)
+        # Re-inserting keeps the dict ordered by last use.
+        self._limiters[key] = limiter
+        return limiter.allow(now)
+
+    def evict_idle(self, now: float) -> int:
+        """Drop keys without activity for the idle period; return the count."""
+        cutoff = now - self._idle_seconds
+        limiters = self._limiters
+        removed = 0
+        while limiters:
+            key = next(iter(limiters))
+            last_seen = limiters[key].last_seen
+            if last_seen is not None and last_seen > cutoff:
+                break
+            del limiters[key]
+            removed += 1
+        self.evicted += removed
+        return removed
+
+    def discard(self, key: K) -> None:
+        """Forget ``key`` if it is tracked."""
+        self._limiters.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        self._limiters.clear()
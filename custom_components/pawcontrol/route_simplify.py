@@ -0,0 +1,304 @@
+"""Error-bounded path simplification for walk routes.
+
+Long walks used to be thinned by keeping every Nth sample once a point limit
+was exceeded, or by refusing new samples altogether, which cut corners and
+dropped the tail of the route.  This module replaces both with
+Douglas-Peucker simplification driven by a tolerance in meters:
+
+* :func:`simplify_indices` reports which samples to keep and the largest
+  deviation of any dropped sample from the simplified line.
+* :class:`StreamingTrack` is a bounded :class:`~.route_track.TrackBuffer` that
+  re-simplifies itself whenever it reaches its capacity, so memory per active
+  walk stays constant while the raw distance and an upper bound of the
+  positional error remain measurable.
+* :func:`simplify_track` and :func:`simplify_route_points` apply the same
+  stage to stored route history, exports and dashboard snapshots.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from collections.abc import Mapping, Sequence
+import math
+from typing import Any, Final, NamedTuple
+
+from .route_track import EARTH_RADIUS_M, TrackBuffer, calculate_distance
+from .types import PathSimplificationStats
+
+DEFAULT_TOLERANCE_M: Final[float] = 5.0
+DEFAULT_CAPACITY: Final[int] = 500
+# Compactions shrink the buffer below capacity so they do not run per sample.
+_COMPACTION_FILL: Final[float] = 0.75
+_MIN_ESCALATION_TOLERANCE_M: Final[float] = 0.5
+
+
+class Simplification(NamedTuple):
+    """Result of simplifying a polyline."""
+
+    indices: list[int]
+    tolerance_m: float
+    max_deviation_m: float
+
+
+def _project(
+    latitudes: Sequence[float], longitudes: Sequence[float]
+) -> tuple[list[float], list[float]]:
+    """Project coordinates onto a local equirectangular plane in meters."""
+    if not latitudes:
+        return [], []
+    ref_lat = math.radians(latitudes[0])
+    ref_lon = math.radians(longitudes[0])
+    scale_x = EARTH_RADIUS_M * math.cos(ref_lat)
+    xs = [(math.radians(lon) - ref_lon) * scale_x for lon in longitudes]
+    ys = [(math.radians(lat) - ref_lat) * EARTH_RADIUS_M for lat in latitudes]
+    return xs, ys
+
+
+def _segment_distance(
+    px: float, py: float, ax: float, ay: float, bx: float, by: float
+) -> float:
+    """Return the distance from ``p`` to the segment ``a``-``b``."""
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0.0:
+        return math.hypot(px - ax, py - ay)
+    t = ((px - ax) * dx + (py - ay) * dy) / length_sq
+    t = min(1.0, max(0.0, t))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _douglas_peucker(
+    xs: list[float], ys: list[float], tolerance: float
+) -> tuple[list[int], float]:
+    """Iterative Douglas-Peucker returning kept indices and max deviation."""
+    count = len(xs)
+    if count <= 2:
+        return list(range(count)), 0.0
+    keep = bytearray(count)
+    keep[0] = keep[-1] = 1
+    max_deviation = 0.0
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        ax, ay, bx, by = xs[start], ys[start], xs[end], ys[end]
+        worst = -1.0
+        worst_index = start
+        for index in range(start + 1, end):
+            distance = _segment_distance(xs[index], ys[index], ax, ay, bx, by)
+            if distance > worst:
+                worst = distance
+                worst_index = index
+        if worst > tolerance:
+            keep[worst_index] = 1
+            stack.append((start, worst_index))
+            stack.append((worst_index, end))
+        elif worst > max_deviation:
+            max_deviation = worst
+    return [index for index in range(count) if keep[index]], max_deviation
+
+
+def simplify_indices(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    tolerance_m: float = DEFAULT_TOLERANCE_M,
+    *,
+    max_points: int | None = None,
+) -> Simplification:
+    """Return the samples to keep so no dropped one deviates beyond tolerance.
+
+    When ``max_points`` is given and the tolerance keeps too many samples, the
+    tolerance is doubled until the result fits; the effective tolerance is
+    reported alongside the measured deviation.
+    """
+    if max_points is not None:
+        max_points = max(2, max_points)
+    xs, ys = _project(latitudes, longitudes)
+    tolerance = max(0.0, tolerance_m)
+    while True:
+        indices, deviation = _douglas_peucker(xs, ys, tolerance)
+        if max_points is None or len(indices) <= max_points:
+            return Simplification(indices, tolerance, deviation)
+        tolerance = max(tolerance * 2, _MIN_ESCALATION_TOLERANCE_M)
+
+
+def simplify_track[TTrack: TrackBuffer](
+    track: TTrack,
+    tolerance_m: float = DEFAULT_TOLERANCE_M,
+    *,
+    max_points: int | None = None,
+) -> TTrack:
+    """Return ``track`` reduced by :func:`simplify_indices`.
+
+    The original track is returned unchanged when nothing can be dropped.
+    """
+    result = simplify_indices(
+        track.latitudes, track.longitudes, tolerance_m, max_points=max_points
+    )
+    if len(result.indices) == len(track):
+        return track
+    return track.take(result.indices)
+
+
+def simplify_route_points[TPoint: Mapping[str, Any]](
+    points: Sequence[TPoint],
+    tolerance_m: float = DEFAULT_TOLERANCE_M,
+    *,
+    max_points: int | None = None,
+) -> list[TPoint]:
+    """Simplify a list of route point mappings, keeping the original objects.
+
+    Points without numeric coordinates are skipped.
+    """
+    valid = [
+        point
+        for point in points
+        if isinstance(point.get("latitude"), int | float)
+        and isinstance(point.get("longitude"), int | float)
+    ]
+    result = simplify_indices(
+        [float(point["latitude"]) for point in valid],
+        [float(point["longitude"]) for point in valid],
+        tolerance_m,
+        max_points=max_points,
+    )
+    return [valid[index] for index in result.indices]
+
+
+class StreamingTrack(TrackBuffer):
+    """Bounded track that simplifies itself online.
+
+    Samples are appended as usual.  Once ``capacity`` is exceeded the buffer
+    is simplified in place with the current tolerance, which is doubled until
+    the result fits comfortably below capacity.  The raw sample count, path
+    distance, elevation gain and top speed are accumulated on every append, so
+    statistics stay exact and the distance error of the stored polyline can be
+    reported at any time.  ``max_deviation_m`` is an upper bound for how far
+    any raw sample lies from the stored polyline: each compaction adds its own
+    maximum deviation.
+    """
+
+    __slots__ = (
+        "capacity",
+        "compactions",
+        "max_deviation_m",
+        "peak_tolerance_m",
+        "raw_distance_m",
+        "raw_elevation_gain_m",
+        "raw_max_speed",
+        "raw_points",
+        "revision",
+        "tolerance_m",
+    )
+
+    def __init__(
+        self,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        tolerance_m: float = DEFAULT_TOLERANCE_M,
+    ) -> None:
+        """Initialise an empty track with the given bounds."""
+        super().__init__()
+        self.capacity = max(4, capacity)
+        self.tolerance_m = tolerance_m
+        self.peak_tolerance_m = tolerance_m
+        self.raw_points = 0
+        self.raw_distance_m = 0.0
+        self.raw_elevation_gain_m = 0.0
+        self.raw_max_speed: float | None = None
+        self.max_deviation_m = 0.0
+        self.compactions = 0
+        self.revision = 0
+
+    def add(
+        self,
+        latitude: float,
+        longitude: float,
+        timestamp: float,
+        *,
+        altitude: object = None,
+        accuracy: object = None,
+        speed: object = None,
+        heading: object = None,
+        source: str | None = None,
+    ) -> None:
+        """Append one sample and compact the buffer when it is full."""
+        last = self.last_position()
+        if last is not None:
+            self.raw_distance_m += calculate_distance(
+                last[0], last[1], latitude, longitude
+            )
+        if (
+            isinstance(speed, int | float)
+            and not isinstance(speed, bool)
+            and (self.raw_max_speed is None or speed > self.raw_max_speed)
+        ):
+            self.raw_max_speed = float(speed)
+        super().add(
+            latitude,
+            longitude,
+            timestamp,
+            altitude=altitude,
+            accuracy=accuracy,
+            speed=speed,
+            heading=heading,
+            source=source,
+        )
+        if last is not None:
+            # NaN altitudes compare False, so gaps never count as climb.
+            climb = self.altitudes[-1] - self.altitudes[-2]
+            if climb > 0:
+                self.raw_elevation_gain_m += climb
+        self.raw_points += 1
+        self.revision += 1
+        if len(self) > self.capacity:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Simplify the buffer in place below the compaction fill level."""
+        result = simplify_indices(
+            self.latitudes,
+            self.longitudes,
+            self.tolerance_m,
+            max_points=int(self.capacity * _COMPACTION_FILL),
+        )
+        self._retain(result.indices)
+        # A dense stretch may need a raised tolerance to fit; later compactions
+        # start again from the configured one.
+        self.peak_tolerance_m = max(self.peak_tolerance_m, result.tolerance_m)
+        self.max_deviation_m += result.max_deviation_m
+        self.compactions += 1
+        self.revision += 1
+
+    def clear(self) -> None:
+        """Drop every sample and reset the raw-track accounting."""
+        super().clear()
+        self.raw_points = 0
+        self.raw_distance_m = 0.0
+        self.raw_elevation_gain_m = 0.0
+        self.raw_max_speed = None
+        self.max_deviation_m = 0.0
+        self.peak_tolerance_m = self.tolerance_m
+        self.compactions = 0
+        self.revision += 1
+
+    @property
+    def distance_error_m(self) -> float:
+        """Return how much shorter the stored polyline is than the raw path."""
+        return self.raw_distance_m - self.total_distance()
+
+    def simplification_stats(self) -> PathSimplificationStats:
+        """Return diagnostics describing the simplification applied so far."""
+        return {
+            "raw_points": self.raw_points,
+            "kept_points": len(self),
+            "compactions": self.compactions,
+            "tolerance_m": self.tolerance_m,
+            "peak_tolerance_m": self.peak_tolerance_m,
+            "max_deviation_m": round(self.max_deviation_m, 3),
+            "raw_distance_m": round(self.raw_distance_m, 3),
+            "distance_error_m": round(self.distance_error_m, 3),
+        }
@@ -0,0 +1,354 @@
+"""Columnar GPS track storage for walk routes and sessions.
+
+Long walks used to be stored as lists of per-point objects or dictionaries
+carrying ISO-8601 timestamp strings, which cost several hundred bytes per
+sample and forced timestamps to be re-parsed whenever the latest point was
+inspected.  :class:`TrackBuffer` keeps every attribute in its own
+``array('d')`` column that grows in place, with timestamps stored as epoch
+seconds and missing optional values encoded as NaN.  Distance, elevation and
+speed statistics read the columns directly; dictionaries are only
+materialised at the diagnostics/export boundary via :meth:`to_route_points`.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+import math
+from typing import Any, Final, NamedTuple, Self, cast
+
+from homeassistant.util import dt as dt_util
+
+from .types import WalkRoutePoint
+
+EARTH_RADIUS_M: Final[float] = 6_371_000.0
+
+_MISSING: Final[float] = math.nan
+_NO_SOURCE: Final[int] = 0
+_COLUMNS: Final[tuple[str, ...]] = (
+    "latitudes",
+    "longitudes",
+    "timestamps",
+    "altitudes",
+    "accuracies",
+    "speeds",
+    "headings",
+    "sources",
+)
+
+
+def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two GPS points using Haversine formula.
+
+    Args:
+        lat1: Latitude of first point
+        lon1: Longitude of first point
+        lat2: Latitude of second point
+        lon2: Longitude of second point
+
+    Returns:
+        Distance in meters
+    """
+    # Convert to radians
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+    # Haversine formula
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    )
+
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return EARTH_RADIUS_M * c
+
+
+def datetime_to_epoch(value: datetime) -> float:
+    """Convert ``value`` to epoch seconds, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def epoch_to_datetime(value: float) -> datetime:
+    """Convert epoch seconds back into an aware UTC datetime."""
+    return datetime.fromtimestamp(value, tz=UTC)
+
+
+def _coerce_epoch(value: object) -> float | None:
+    """Return epoch seconds for datetime, ISO string or numeric inputs."""
+    if isinstance(value, datetime):
+        return datetime_to_epoch(value)
+    if isinstance(value, str) and value:
+        parsed = dt_util.parse_datetime(value)
+        return datetime_to_epoch(parsed) if parsed is not None else None
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _pack(value: object) -> float:
+    """Encode an optional numeric value for a ``double`` column."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return _MISSING
+
+
+def _unpack(value: float) -> float | None:
+    """Decode a ``double`` column value, mapping NaN back to ``None``."""
+    return None if math.isnan(value) else value
+
+
+def _select(column: array, indices: list[int]) -> array:
+    """Return a new column holding ``column[i]`` for every index."""
+    return array(column.typecode, [column[i] for i in indices])
+
+
+class TrackRow(NamedTuple):
+    """A single materialised sample of a :class:`TrackBuffer`."""
+
+    latitude: float
+    longitude: float
+    timestamp: float
+    altitude: float | None
+    accuracy: float | None
+    speed: float | None
+    heading: float | None
+    source: str | None
+
+
+class TrackBuffer:
+    """Append-only, array-backed GPS track.
+
+    Columns are exposed as read-only attributes so hot paths can iterate them
+    without materialising rows.  Source labels are interned per buffer and
+    stored as small integer codes.
+    """
+
+    __slots__ = (
+        "_source_codes",
+        "_source_names",
+        "accuracies",
+        "altitudes",
+        "headings",
+        "latitudes",
+        "longitudes",
+        "sources",
+        "speeds",
+        "timestamps",
+    )
+
+    def __init__(self) -> None:
+        """Initialise empty columns."""
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.timestamps = array("d")
+        self.altitudes = array("d")
+        self.accuracies = array("d")
+        self.speeds = array("d")
+        self.headings = array("d")
+        self.sources = array("H")
+        self._source_names: list[str | None] = [None]
+        self._source_codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return len(self.timestamps)
+
+    def __bool__(self) -> bool:
+        """Return True when the track contains at least one sample."""
+        return bool(self.timestamps)
+
+    def __repr__(self) -> str:
+        """Return a compact representation for logs and test failures."""
+        return f"{type(self).__name__}(points={len(self)})"
+
+    @classmethod
+    def from_route_points(cls, points: Iterable[Mapping[str, Any]]) -> Self:
+        """Build a track from ``WalkRoutePoint``-style mappings.
+
+        Points without valid coordinates or a parseable timestamp are skipped;
+        timestamps are parsed exactly once here.
+        """
+        track = cls()
+        track.extend_route_points(points)
+        return track
+
+    def extend_route_points(self, points: Iterable[Mapping[str, Any]]) -> None:
+        """Append ``WalkRoutePoint``-style mappings, skipping invalid ones."""
+        for point in points:
+            if not isinstance(point, Mapping):
+                continue
+            latitude = point.get("latitude")
+            longitude = point.get("longitude")
+            timestamp = _coerce_epoch(point.get("timestamp"))
+            if (
+                not isinstance(latitude, int | float)
+                or not isinstance(longitude, int | float)
+                or timestamp is None
+            ):
+                continue
+            source = point.get("source")
+            self.add(
+                float(latitude),
+                float(longitude),
+                timestamp,
+                altitude=point.get("altitude"),
+                accuracy=point.get("accuracy"),
+                speed=point.get("speed"),
+                heading=point.get("heading"),
+                source=source if isinstance(source, str) else None,
+            )
+
+    def add(
+        self,
+        latitude: float,
+        longitude: float,
+        timestamp: float,
+        *,
+        altitude: object = None,
+        accuracy: object = None,
+        speed: object = None,
+        heading: object = None,
+        source: str | None = None,
+    ) -> None:
+        """Append one sample; ``timestamp`` is expressed in epoch seconds."""
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+        self.timestamps.append(timestamp)
+        self.altitudes.append(_pack(altitude))
+        self.accuracies.append(_pack(accuracy))
+        self.speeds.append(_pack(speed))
+        self.headings.append(_pack(heading))
+        self.sources.append(self._source_code(source))
+
+    def _source_code(self, source: str | None) -> int:
+        if source is None:
+            return _NO_SOURCE
+        code = self._source_codes.get(source)
+        if code is None:
+            code = len(self._source_names)
+            self._source_names.append(source)
+            self._source_codes[source] = code
+        return code
+
+    def _columns(self) -> Iterator[array]:
+        for name in _COLUMNS:
+            yield getattr(self, name)
+
+    def clear(self) -> None:
+        """Drop every stored sample."""
+        for column in self._columns():
+            del column[:]
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate memory used by the column buffers."""
+        return sum(column.itemsize * len(column) for column in self._columns())
+
+    def last_position(self) -> tuple[float, float] | None:
+        """Return the most recent ``(latitude, longitude)`` pair."""
+        if not self.timestamps:
+            return None
+        return self.latitudes[-1], self.longitudes[-1]
+
+    def last_timestamp(self) -> float | None:
+        """Return the most recent timestamp in epoch seconds."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def row(self, index: int) -> TrackRow:
+        """Materialise the sample at ``index`` (negative indices allowed)."""
+        return TrackRow(
+            self.latitudes[index],
+            self.longitudes[index],
+            self.timestamps[index],
+            _unpack(self.altitudes[index]),
+            _unpack(self.accuracies[index]),
+            _unpack(self.speeds[index]),
+            _unpack(self.headings[index]),
+            self._source_names[self.sources[index]],
+        )
+
+    def rows(self) -> Iterator[TrackRow]:
+        """Iterate over materialised samples in insertion order."""
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def segment_distances(self) -> list[float]:
+        """Return the haversine distance of every consecutive segment."""
+        lats = self.latitudes
+        lons = self.longitudes
+        return [
+            calculate_distance(
+                lats[index - 1], lons[index - 1], lats[index], lons[index]
+            )
+            for index in range(1, len(lats))
+        ]
+
+    def total_distance(self) -> float:
+        """Return the summed segment distance in meters."""
+        return math.fsum(self.segment_distances())
+
+    def elevation_gain(self) -> float:
+        """Return the cumulative positive altitude change in meters.
+
+        Samples without altitude reset the comparison, matching the behaviour
+        of the dictionary-based calculation.
+        """
+        total = 0.0
+        previous: float | None = None
+        for value in self.altitudes:
+            current = None if math.isnan(value) else value
+            if current is not None and previous is not None and current > previous:
+                total += current - previous
+            previous = current
+        return total
+
+    def max_speed(self) -> float | None:
+        """Return the highest recorded speed, if any sample carries one."""
+        speeds = [value for value in self.speeds if not math.isnan(value)]
+        return max(speeds) if speeds else None
+
+    def take(self, indices: Iterable[int]) -> Self:
+        """Return a copy holding only the samples at ``indices`` (in order)."""
+        selected = list(indices)
+        reduced = type(self)()
+        reduced._source_names = list(self._source_names)
+        reduced._source_codes = dict(self._source_codes)
+        for name in _COLUMNS:
+            setattr(reduced, name, _select(getattr(self, name), selected))
+        return reduced
+
+    def _retain(self, indices: Iterable[int]) -> None:
+        """Keep only the samples at ``indices``, compacting the columns in place."""
+        selected = list(indices)
+        for name in _COLUMNS:
+            setattr(self, name, _select(getattr(self, name), selected))
+
+    def to_route_points(self) -> list[WalkRoutePoint]:
+        """Materialise the track as JSON-friendly ``WalkRoutePoint`` dictionaries."""
+        points: list[WalkRoutePoint] = []
+        for row in self.rows():
+            point = cast(
+                WalkRoutePoint,
+                {
+                    "latitude": row.latitude,
+                    "longitude": row.longitude,
+                    "timestamp": epoch_to_datetime(row.timestamp).isoformat(),
+                    "accuracy": row.accuracy,
+                    "speed": row.speed,
+                    "altitude": row.altitude,
+                },
+            )
+            if row.heading is not None:
+                point["heading"] = row.heading
+            if row.source is not None:
+                point["source"] = row.source
+            points.append(point)
+        return points
@@ -643,6 +643,7 @@ class PawControlGardenSensorBase(PawControlSensorBase):
     """Base class for garden tracking sensors."""
 
     _module_name: Literal["garden"] = "garden"
+    _listener_module = MODULE_GARDEN
 
     def _get_garden_data(self) -> GardenModulePayload:
         """Return garden snapshot data for the current dog."""
@@ -762,6 +763,7 @@ class PawControlDietValidationSensorBase(PawControlSensorBase):
     """Base class for diet validation sensors."""
 
     _module_name: Literal["feeding"] = "feeding"
+    _listener_module = MODULE_FEEDING
 
     def _get_validation_summary(self) -> FeedingDietValidationSummary | None:
         """Return diet validation summary for the current dog."""
@@ -842,7 +844,7 @@ class PawControlLastActionSensor(PawControlSensorBase):
         # Collect timestamps from all modules
         for module in ["feeding", "walk", "health"]:
             module_data = dog_data.get(module, {})
-            if not isinstance(module_data, dict):
+            if not isinstance(module_data, Mapping):
                 continue
 
             timestamp_key = (
@@ -1753,6 +1755,8 @@ class PawControlLastGardenSessionHoursSensor(PawControlGardenSensorBase):
 class PawControlLastFeedingSensor(PawControlSensorBase):
     """Sensor for last feeding timestamp."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1927,6 +1931,8 @@ class PawControlLastFeedingHoursSensor(PawControlSensorBase):
 class PawControlDailyCaloriesSensor(PawControlSensorBase):
     """Sensor for daily calorie intake."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -1963,6 +1969,8 @@ class PawControlDailyCaloriesSensor(PawControlSensorBase):
 class PawControlFeedingScheduleAdherenceSensor(PawControlSensorBase):
     """Sensor for feeding schedule adherence."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2001,6 +2009,8 @@ class PawControlFeedingScheduleAdherenceSensor(PawControlSensorBase):
 class PawControlTotalFeedingsTodaySensor(PawControlSensorBase):
     """Sensor for total feedings today."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2035,6 +2045,8 @@ class PawControlTotalFeedingsTodaySensor(PawControlSensorBase):
 class PawControlHealthAwarePortionSensor(PawControlSensorBase):
     """Sensor for health-aware calculated portion size."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2093,6 +2105,8 @@ class PawControlHealthAwarePortionSensor(PawControlSensorBase):
 class PawControlFeedingRecommendationSensor(PawControlSensorBase):
     """Sensor for feeding recommendations based on health analysis."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2422,6 +2436,8 @@ class PawControlDietCompatibilityScoreSensor(PawControlDietValidationSensorBase)
 class PawControlDailyPortionsSensor(PawControlSensorBase):
     """Sensor for daily portions count."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2465,6 +2481,8 @@ class PawControlDailyPortionsSensor(PawControlSensorBase):
 class PawControlPortionsTodaySensor(PawControlSensorBase):
     """Sensor that reports the recorded portions served today."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2535,6 +2553,8 @@ class PawControlPortionsTodaySensor(PawControlSensorBase):
 class PawControlCalorieGoalProgressSensor(PawControlSensorBase):
     """Sensor for calorie goal progress percentage."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2639,6 +2659,8 @@ class PawControlCalorieGoalProgressSensor(PawControlSensorBase):
 class PawControlHealthFeedingStatusSensor(PawControlSensorBase):
     """Sensor reflecting overall health-aware feeding status."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2707,6 +2729,8 @@ class PawControlHealthFeedingStatusSensor(PawControlSensorBase):
 class PawControlDailyCalorieTargetSensor(PawControlSensorBase):
     """Sensor reporting the calculated daily calorie target."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2768,6 +2792,8 @@ class PawControlDailyCalorieTargetSensor(PawControlSensorBase):
 class PawControlCaloriesConsumedTodaySensor(PawControlSensorBase):
     """Sensor for calories consumed today."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2823,6 +2849,8 @@ class PawControlCaloriesConsumedTodaySensor(PawControlSensorBase):
 class PawControlPortionAdjustmentFactorSensor(PawControlSensorBase):
     """Sensor exposing the calculated portion adjustment factor."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2880,6 +2908,8 @@ class PawControlPortionAdjustmentFactorSensor(PawControlSensorBase):
 class PawControlFoodConsumptionSensor(PawControlSensorBase):
     """Sensor for food consumption tracking."""
 
+    _listener_module = MODULE_FEEDING
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -2985,6 +3015,8 @@ class PawControlFoodConsumptionSensor(PawControlSensorBase):
 class PawControlLastWalkSensor(PawControlSensorBase):
     """Sensor for last walk timestamp."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3022,6 +3054,8 @@ class PawControlLastWalkSensor(PawControlSensorBase):
 class PawControlLastWalkHoursSensor(PawControlSensorBase):
     """Sensor providing the elapsed hours since the last walk."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3055,6 +3089,8 @@ class PawControlLastWalkHoursSensor(PawControlSensorBase):
 class PawControlWalksTodaySensor(PawControlSensorBase):
     """Sensor counting walks completed today."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3085,6 +3121,8 @@ class PawControlWalksTodaySensor(PawControlSensorBase):
 class PawControlCurrentWalkDurationSensor(PawControlSensorBase):
     """Sensor indicating the active walk duration in minutes."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3116,6 +3154,8 @@ class PawControlCurrentWalkDurationSensor(PawControlSensorBase):
 class PawControlWalkCountTodaySensor(PawControlSensorBase):
     """Sensor for walk count today."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3145,6 +3185,8 @@ class PawControlWalkCountTodaySensor(PawControlSensorBase):
 class PawControlWalkDistanceTodaySensor(PawControlSensorBase):
     """Sensor for total walk distance today."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3386,6 +3428,8 @@ class PawControlTotalWalkDistanceSensor(PawControlSensorBase):
     and marked as critical. Tracks total distance over all recorded walks.
     """
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3552,7 +3596,7 @@ class PawControlWalksThisWeekSensor(PawControlSensorBase):
             walks_today = self._coerce_int(walk_data.get("walks_today", 0))
             # If we have daily walk history, sum it up
             daily_walks = walk_data.get("daily_walk_counts", {})
-            if isinstance(daily_walks, dict):
+            if isinstance(daily_walks, Mapping):
                 now = dt_util.utcnow()
                 week_start = now - timedelta(days=now.weekday())  # Monday start
 
@@ -3625,6 +3669,8 @@ class PawControlWalksThisWeekSensor(PawControlSensorBase):
 class PawControlLastWalkDurationSensor(PawControlSensorBase):
     """Sensor for duration of last walk."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3659,6 +3705,8 @@ class PawControlLastWalkDurationSensor(PawControlSensorBase):
 class PawControlLastWalkDistanceSensor(PawControlSensorBase):
     """Sensor for distance of last walk."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3693,6 +3741,8 @@ class PawControlLastWalkDistanceSensor(PawControlSensorBase):
 class PawControlTotalWalkTimeTodaySensor(PawControlSensorBase):
     """Sensor for total walk time today."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3725,6 +3775,8 @@ class PawControlTotalWalkTimeTodaySensor(PawControlSensorBase):
 class PawControlAverageWalkDurationSensor(PawControlSensorBase):
     """Sensor for average walk duration."""
 
+    _listener_module = MODULE_WALK
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3763,6 +3815,8 @@ class PawControlAverageWalkDurationSensor(PawControlSensorBase):
 class PawControlCurrentZoneSensor(PawControlSensorBase):
     """Sensor for current zone."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3786,6 +3840,8 @@ class PawControlCurrentZoneSensor(PawControlSensorBase):
 class PawControlCurrentLocationSensor(PawControlSensorBase):
     """Sensor exposing the dog's current location label."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3832,6 +3888,8 @@ class PawControlCurrentLocationSensor(PawControlSensorBase):
 class PawControlDistanceFromHomeSensor(PawControlSensorBase):
     """Sensor for distance from home."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3866,6 +3924,8 @@ class PawControlDistanceFromHomeSensor(PawControlSensorBase):
 class PawControlCurrentSpeedSensor(PawControlSensorBase):
     """Sensor for current speed."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3900,6 +3960,8 @@ class PawControlCurrentSpeedSensor(PawControlSensorBase):
 class PawControlSpeedSensor(PawControlSensorBase):
     """Compatibility sensor exposing GPS speed readings."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3932,6 +3994,8 @@ class PawControlSpeedSensor(PawControlSensorBase):
 class PawControlGPSAccuracySensor(PawControlSensorBase):
     """Sensor for GPS accuracy."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -3966,6 +4030,8 @@ class PawControlGPSAccuracySensor(PawControlSensorBase):
 class PawControlGPSBatteryLevelSensor(PawControlSensorBase):
     """Sensor for GPS tracker battery level."""
 
+    _listener_module = MODULE_GPS
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4003,6 +4069,8 @@ class PawControlGPSBatteryLevelSensor(PawControlSensorBase):
 class PawControlHealthStatusSensor(PawControlSensorBase):
     """Sensor for overall health status."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4032,6 +4100,8 @@ class PawControlHealthStatusSensor(PawControlSensorBase):
 class PawControlWeightSensor(PawControlSensorBase):
     """Sensor for dog weight."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4067,6 +4137,8 @@ class PawControlWeightSensor(PawControlSensorBase):
 class PawControlWeightTrendSensor(PawControlSensorBase):
     """Sensor for dog weight trend."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4096,6 +4168,8 @@ class PawControlWeightTrendSensor(PawControlSensorBase):
 class PawControlBodyConditionScoreSensor(PawControlSensorBase):
     """Sensor for body condition score (1-9 scale)."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4128,6 +4202,8 @@ class PawControlBodyConditionScoreSensor(PawControlSensorBase):
 class PawControlLastVetVisitSensor(PawControlSensorBase):
     """Sensor for last vet visit timestamp."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4165,6 +4241,8 @@ class PawControlLastVetVisitSensor(PawControlSensorBase):
 class PawControlHealthConditionsSensor(PawControlSensorBase):
     """Sensor exposing tracked health conditions."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4225,6 +4303,8 @@ class PawControlHealthConditionsSensor(PawControlSensorBase):
 class PawControlWeightGoalProgressSensor(PawControlSensorBase):
     """Sensor for weight goal progress percentage."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -4276,6 +4356,8 @@ class PawControlWeightGoalProgressSensor(PawControlSensorBase):
 class PawControlDailyActivityLevelSensor(PawControlSensorBase):
     """Sensor summarizing the daily health activity level."""
 
+    _listener_module = MODULE_HEALTH
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
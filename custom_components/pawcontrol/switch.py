@@ -82,6 +82,10 @@ MAX_CONCURRENT_BATCHES = 8  # Balanced for profile optimization
 # updates to Home Assistant.
 PARALLEL_UPDATES = 0
 
+# Switch attributes render the dog configuration, so switches only need waking
+# when the coordinator's ``dog_info`` payload changes.
+_DOG_INFO_MODULE = "dog_info"
+
 
 class ProfileOptimizedSwitchFactory:
     """Factory for efficient profile-based switch creation with minimal entity count."""
@@ -411,6 +415,7 @@ class OptimizedSwitchBase(PawControlDogEntityBase, SwitchEntity, RestoreEntity):
     _is_on: bool
     _last_changed: datetime
     _switch_type: str
+    _listener_module = _DOG_INFO_MODULE
 
     def __init__(
         self,
@@ -1,13 +1,16 @@
 """Telemetry helpers shared between PawControl services and coordinators."""
 
+from collections import deque
 from collections.abc import Mapping, MutableMapping, Sequence
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from math import ceil, floor, isfinite
 from statistics import median, pstdev
+import time
 from typing import Any, Final, cast
 
 from homeassistant.util import dt as dt_util
 
+from .metrics_registry import MetricsRegistry
 from .types import (
     BoolCoercionMetrics,
     BoolCoercionSample,
@@ -42,25 +45,14 @@ from .types import (
     RuntimeStoreOverallStatus,
 )
 
-_BOOL_COERCION_METRICS: BoolCoercionMetrics = {
-    "total": 0,
-    "defaulted": 0,
-    "fallback": 0,
-    "reset_count": 0,
-    "type_counts": {},
-    "reason_counts": {},
-    "samples": [],
-    "first_seen": None,
-    "last_seen": None,
-    "active_window_seconds": None,
-    "last_reset": None,
-    "last_reason": None,
-    "last_value_type": None,
-    "last_value_repr": None,
-    "last_result": None,
-    "last_default": None,
-}
 _BOOL_COERCION_SAMPLE_LIMIT = 10
+# After the first samples only every Nth value is rendered with ``repr``.
+_BOOL_COERCION_REPR_INTERVAL: Final[int] = 100
+_BOOL_COERCION_DEFAULTED_REASONS: Final[frozenset[str]] = frozenset(
+    {"none", "blank_string"},
+)
+# Bound once so bool coercion recording avoids the module attribute lookup.
+_monotonic = time.monotonic
 
 _RUNTIME_STORE_STATUS_LEVELS: dict[
     RuntimeStoreOverallStatus,
@@ -973,9 +965,48 @@ def get_runtime_performance_stats(
     if not isinstance(performance_stats, MutableMapping):
         return None
 
+    _flush_runtime_metrics(runtime_data, performance_stats)
     return cast(RuntimePerformanceStats, performance_stats)
 
 
+def get_runtime_metrics_registry(
+    runtime_data: PawControlRuntimeData | None,
+) -> MetricsRegistry | None:
+    """Return the runtime metrics registry when present."""
+    if runtime_data is None:
+        return None
+
+    registry = getattr(runtime_data, "metrics_registry", None)
+    if not isinstance(registry, MetricsRegistry):
+        return None
+
+    return registry
+
+
+def ensure_runtime_metrics_registry(
+    runtime_data: PawControlRuntimeData,
+) -> MetricsRegistry:
+    """Return the runtime metrics registry, initialising it if needed."""
+    registry = get_runtime_metrics_registry(runtime_data)
+    if registry is not None:
+        return registry
+
+    registry = MetricsRegistry()
+    runtime_data.metrics_registry = registry
+    return registry
+
+
+def _flush_runtime_metrics(
+    runtime_data: PawControlRuntimeData,
+    performance_stats: MutableMapping[str, Any],
+) -> None:
+    """Render collectors that changed since the last read into the stats."""
+    collector = get_runtime_entity_factory_guard_collector(runtime_data)
+    if collector is not None and collector.dirty:
+        performance_stats["entity_factory_guard_metrics"] = collector.render()
+        collector.dirty = False
+
+
 def ensure_runtime_performance_stats(
     runtime_data: PawControlRuntimeData,
 ) -> RuntimePerformanceStats:
@@ -1318,6 +1349,389 @@ def _build_runtime_store_assessment(
     return assessment
 
 
+_ENTITY_FACTORY_GUARD_COLLECTOR: Final[str] = "entity_factory_guard"
+_ENTITY_FACTORY_GUARD_RECENT_WINDOW: Final[int] = 5
+
+
+class EntityFactoryGuardCollector:
+    """Entity factory runtime guard telemetry recorded without dict rebuilds.
+
+    :meth:`record` runs on every guarded entity factory call and only updates
+    counters, a duration histogram and bounded deques.  :meth:`render`
+    derives the ratios, spans and trend of :class:`EntityFactoryGuardMetrics`
+    when diagnostics or system health read the performance stats.
+    """
+
+    __slots__ = (
+        "_contractions",
+        "_durations",
+        "_expansions",
+        "_samples",
+        "_stable",
+        "baseline_floor",
+        "consecutive_stable_samples",
+        "dirty",
+        "enforce_min_runtime",
+        "last_contraction_duration",
+        "last_event",
+        "last_expansion_duration",
+        "last_floor_change",
+        "last_floor_change_ratio",
+        "last_updated",
+        "longest_stable_run",
+        "lowest_runtime_floor",
+        "max_floor",
+        "peak_runtime_floor",
+        "previous_stable_ratio",
+        "recent_durations",
+        "recent_events",
+        "runtime_floor",
+    )
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Register the collector's counters and histogram in ``registry``."""
+        self._samples = registry.counter("entity_factory_guard.samples")
+        self._stable = registry.counter("entity_factory_guard.stable_samples")
+        self._expansions = registry.counter("entity_factory_guard.expansions")
+        self._contractions = registry.counter("entity_factory_guard.contractions")
+        self._durations = registry.histogram("entity_factory_guard.duration")
+        self.baseline_floor = 0.0
+        self.max_floor = 0.0
+        self.runtime_floor: float | None = None
+        self.peak_runtime_floor = 0.0
+        self.lowest_runtime_floor = 0.0
+        self.last_floor_change = 0.0
+        self.last_floor_change_ratio = 0.0
+        self.last_event: EntityFactoryGuardEvent | None = None
+        self.last_updated: float | None = None
+        self.last_expansion_duration: float | None = None
+        self.last_contraction_duration: float | None = None
+        self.enforce_min_runtime = False
+        self.consecutive_stable_samples = 0
+        self.longest_stable_run = 0
+        self.previous_stable_ratio: float | None = None
+        self.recent_durations: deque[float] = deque(
+            maxlen=_ENTITY_FACTORY_GUARD_RECENT_WINDOW
+        )
+        self.recent_events: deque[EntityFactoryGuardEvent] = deque(
+            maxlen=_ENTITY_FACTORY_GUARD_RECENT_WINDOW
+        )
+        self.dirty = False
+
+    @property
+    def samples(self) -> int:
+        """Return the number of recorded calibrations."""
+        return self._samples.value
+
+    def record(
+        self,
+        *,
+        runtime_floor: float,
+        actual_duration: float,
+        event: EntityFactoryGuardEvent,
+        baseline_floor: float,
+        max_floor: float,
+        enforce_min_runtime: bool,
+    ) -> None:
+        """Record one runtime guard calibration."""
+        samples = self._samples.value
+        if samples:
+            self.previous_stable_ratio = self._stable.value / samples
+        baseline = baseline_floor if baseline_floor > 0.0 else 0.0
+        floor_value = runtime_floor if runtime_floor > 0.0 else 0.0
+        previous_floor = self.runtime_floor
+        if previous_floor is None:
+            previous_floor = baseline
+        self.baseline_floor = baseline
+        self.max_floor = max_floor if max_floor > 0.0 else 0.0
+        self.runtime_floor = floor_value
+        if floor_value > self.peak_runtime_floor:
+            self.peak_runtime_floor = floor_value
+        lowest_candidate = floor_value if floor_value > baseline else baseline
+        if (
+            self.lowest_runtime_floor <= 0.0
+            or lowest_candidate < self.lowest_runtime_floor
+        ):
+            self.lowest_runtime_floor = lowest_candidate
+        floor_change = floor_value - previous_floor
+        self.last_floor_change = floor_change
+        self.last_floor_change_ratio = (
+            floor_change / previous_floor if previous_floor > 0 else 0.0
+        )
+
+        duration = actual_duration if actual_duration > 0.0 else 0.0
+        self._samples.inc()
+        self._durations.observe(duration)
+        if event == "stable":
+            self._stable.inc()
+            self.consecutive_stable_samples += 1
+            if self.consecutive_stable_samples > self.longest_stable_run:
+                self.longest_stable_run = self.consecutive_stable_samples
+        else:
+            self.consecutive_stable_samples = 0
+            if event == "expand":
+                self._expansions.inc()
+                self.last_expansion_duration = duration
+            elif event == "contract":
+                self._contractions.inc()
+                self.last_contraction_duration = duration
+        self.recent_durations.append(duration)
+        self.recent_events.append(event)
+        self.last_event = event
+        self.enforce_min_runtime = enforce_min_runtime
+        self.last_updated = time.time()
+        self.dirty = True
+
+    def restore(self, metrics: Mapping[str, object]) -> None:
+        """Seed the collector from a previously rendered guard payload."""
+
+        def _number(key: str) -> float | None:
+            value = metrics.get(key)
+            if isinstance(value, int | float) and not isinstance(value, bool):
+                if isfinite(value):
+                    return float(value)
+            return None
+
+        def _count(key: str) -> int:
+            value = _number(key)
+            return int(value) if value is not None else 0
+
+        self._samples.reset(_count("samples"))
+        self._stable.reset(_count("stable_samples"))
+        self._expansions.reset(_count("expansions"))
+        self._contractions.reset(_count("contractions"))
+        if (runtime_floor := _number("runtime_floor")) is not None:
+            self.runtime_floor = runtime_floor
+        self.baseline_floor = _number("baseline_floor") or 0.0
+        self.max_floor = _number("max_floor") or 0.0
+        self.peak_runtime_floor = _number("peak_runtime_floor") or 0.0
+        self.lowest_runtime_floor = _number("lowest_runtime_floor") or 0.0
+        self.previous_stable_ratio = _number("stable_ratio")
+        self.consecutive_stable_samples = _count("consecutive_stable_samples")
+        self.longest_stable_run = _count("longest_stable_run")
+        self.last_expansion_duration = _number("last_expansion_duration")
+        self.last_contraction_duration = _number("last_contraction_duration")
+
+        average = _number("average_duration")
+        minimum = _number("min_duration")
+        maximum = _number("max_duration")
+        samples = self._samples.value
+        if (
+            samples > 0
+            and average is not None
+            and minimum is not None
+            and maximum is not None
+        ):
+            self._durations.seed(
+                count=samples,
+                total=average * samples,
+                minimum=minimum,
+                maximum=maximum,
+            )
+
+        recent_durations = metrics.get("recent_durations")
+        if isinstance(recent_durations, Sequence) and not isinstance(
+            recent_durations,
+            str | bytes | bytearray,
+        ):
+            self.recent_durations.extend(
+                max(float(sample), 0.0)
+                for sample in recent_durations
+                if isinstance(sample, int | float) and isfinite(sample)
+            )
+        recent_events = metrics.get("recent_events")
+        if isinstance(recent_events, Sequence) and not isinstance(
+            recent_events,
+            str | bytes | bytearray,
+        ):
+            self.recent_events.extend(
+                cast(EntityFactoryGuardEvent, event)
+                for event in recent_events
+                if isinstance(event, str) and event
+            )
+        self.dirty = True
+
+    def rebase(self, *, runtime_floor: float, minimum_floor: float) -> None:
+        """Reset the floors and treat recorded samples as stable.
+
+        Used after cache prewarming so the synthetic warm-up calls do not
+        surface as runtime guard volatility.
+        """
+        baseline = max(self.baseline_floor, minimum_floor)
+        floor_value = max(runtime_floor, minimum_floor)
+        self.baseline_floor = baseline
+        self.runtime_floor = floor_value
+        self.last_floor_change = 0.0
+        self.last_floor_change_ratio = 0.0
+        if self.lowest_runtime_floor > 0:
+            self.lowest_runtime_floor = max(
+                baseline, min(self.lowest_runtime_floor, floor_value)
+            )
+        else:
+            self.lowest_runtime_floor = max(baseline, floor_value)
+        samples = self._samples.value
+        if samples > 0:
+            self._expansions.reset()
+            self._contractions.reset()
+            self._stable.reset(samples)
+            self.previous_stable_ratio = 1.0
+            self.recent_events.clear()
+            self.recent_events.extend(
+                ["stable"] * min(_ENTITY_FACTORY_GUARD_RECENT_WINDOW, samples)
+            )
+        self.dirty = True
+
+    def render(self) -> EntityFactoryGuardMetrics:
+        """Return the telemetry as an :class:`EntityFactoryGuardMetrics` payload."""
+        samples = self._samples.value
+        stable_samples = self._stable.value
+        expansions = self._expansions.value
+        contractions = self._contractions.value
+        runtime_floor = self.runtime_floor or 0.0
+        metrics: EntityFactoryGuardMetrics = {
+            "schema_version": 1,
+            "samples": samples,
+            "stable_samples": stable_samples,
+            "expansions": expansions,
+            "contractions": contractions,
+            "baseline_floor": self.baseline_floor,
+            "max_floor": self.max_floor,
+            "runtime_floor": runtime_floor,
+            "runtime_floor_delta": max(runtime_floor - self.baseline_floor, 0.0),
+            "peak_runtime_floor": self.peak_runtime_floor,
+            "lowest_runtime_floor": self.lowest_runtime_floor,
+            "last_floor_change": self.last_floor_change,
+            "last_floor_change_ratio": self.last_floor_change_ratio,
+            "enforce_min_runtime": self.enforce_min_runtime,
+            "consecutive_stable_samples": self.consecutive_stable_samples,
+            "longest_stable_run": self.longest_stable_run,
+        }
+        if self.last_event is not None:
+            metrics["last_event"] = self.last_event
+        if self.last_updated is not None:
+            metrics["last_updated"] = datetime.fromtimestamp(
+                self.last_updated, UTC
+            ).isoformat()
+        if self.last_expansion_duration is not None:
+            metrics["last_expansion_duration"] = self.last_expansion_duration
+        if self.last_contraction_duration is not None:
+            metrics["last_contraction_duration"] = self.last_contraction_duration
+
+        if samples > 0:
+            stable_ratio = stable_samples / samples
+            metrics["stable_ratio"] = stable_ratio
+            metrics["expansion_ratio"] = expansions / samples
+            metrics["contraction_ratio"] = contractions / samples
+            metrics["volatility_ratio"] = (expansions + contractions) / samples
+        else:
+            stable_ratio = 0.0
+            metrics["stable_ratio"] = 0.0
+            metrics["expansion_ratio"] = 0.0
+            metrics["contraction_ratio"] = 0.0
+            metrics["volatility_ratio"] = 0.0
+
+        durations = self._durations
+        if durations.count:
+            duration_span = max(durations.maximum - durations.minimum, 0.0)
+            metrics["average_duration"] = durations.total / durations.count
+            metrics["max_duration"] = durations.maximum
+            metrics["min_duration"] = durations.minimum
+            metrics["duration_span"] = duration_span
+            metrics["jitter_ratio"] = (
+                duration_span / runtime_floor if runtime_floor > 0 else duration_span
+            )
+
+        recent = list(self.recent_durations)
+        if recent:
+            last_duration = recent[-1]
+            recent_max = max(recent)
+            recent_min = min(recent)
+            recent_span = max(recent_max - recent_min, 0.0)
+            metrics["last_actual_duration"] = last_duration
+            metrics["last_duration_ratio"] = (
+                last_duration / runtime_floor if runtime_floor > 0 else 0.0
+            )
+            metrics["recent_durations"] = recent
+            metrics["recent_average_duration"] = sum(recent) / len(recent)
+            metrics["recent_max_duration"] = recent_max
+            metrics["recent_min_duration"] = recent_min
+            metrics["recent_duration_span"] = recent_span
+            metrics["recent_jitter_ratio"] = (
+                recent_span / runtime_floor if runtime_floor > 0 else recent_span
+            )
+            metrics["recent_samples"] = len(recent)
+
+        recent_events = list(self.recent_events)
+        if recent_events:
+            recent_stable_samples = recent_events.count("stable")
+            recent_stable_ratio = recent_stable_samples / len(recent_events)
+            metrics["recent_events"] = recent_events
+            metrics["recent_stable_samples"] = recent_stable_samples
+            metrics["recent_stable_ratio"] = recent_stable_ratio
+            baseline_ratio = (
+                self.previous_stable_ratio
+                if self.previous_stable_ratio is not None
+                else stable_ratio
+            )
+            trend_delta = recent_stable_ratio - baseline_ratio
+            if trend_delta > 0.05:
+                trend: EntityFactoryGuardStabilityTrend = "improving"
+            elif trend_delta < -0.05:
+                trend = "regressing"
+            else:
+                trend = "steady"
+            metrics["stability_trend"] = trend
+
+        return metrics
+
+
+def get_runtime_entity_factory_guard_collector(
+    runtime_data: PawControlRuntimeData | None,
+) -> EntityFactoryGuardCollector | None:
+    """Return the entity factory guard collector when one has been created."""
+    registry = get_runtime_metrics_registry(runtime_data)
+    if registry is None:
+        return None
+
+    collector = registry.get_collector(_ENTITY_FACTORY_GUARD_COLLECTOR)
+    if not isinstance(collector, EntityFactoryGuardCollector):
+        return None
+
+    return collector
+
+
+def record_runtime_entity_factory_guard_sample(
+    runtime_data: PawControlRuntimeData | None,
+    *,
+    runtime_floor: float,
+    actual_duration: float,
+    event: EntityFactoryGuardEvent,
+    baseline_floor: float,
+    max_floor: float,
+    enforce_min_runtime: bool,
+) -> None:
+    """Record a runtime guard calibration in the runtime metrics registry.
+
+    Unlike :func:`update_runtime_entity_factory_guard_metrics` this does not
+    touch the performance stats; the payload is rendered the next time they
+    are read through :func:`get_runtime_performance_stats`.
+    """
+    if runtime_data is None:
+        return
+
+    ensure_runtime_metrics_registry(runtime_data).collector(
+        _ENTITY_FACTORY_GUARD_COLLECTOR,
+        EntityFactoryGuardCollector,
+    ).record(
+        runtime_floor=runtime_floor,
+        actual_duration=actual_duration,
+        event=event,
+        baseline_floor=baseline_floor,
+        max_floor=max_floor,
+        enforce_min_runtime=enforce_min_runtime,
+    )
+
+
 def update_runtime_entity_factory_guard_metrics(
     runtime_data: PawControlRuntimeData | None,
     *,
@@ -1328,248 +1742,164 @@ def update_runtime_entity_factory_guard_metrics(
     max_floor: float,
     enforce_min_runtime: bool,
 ) -> EntityFactoryGuardMetrics | None:
-    """Persist the latest runtime guard calibration in the performance stats."""
+    """Persist the latest runtime guard calibration in the performance stats.
+
+    Thin wrapper around :class:`EntityFactoryGuardCollector` for callers that
+    need the rendered payload straight away.  A payload already stored in the
+    performance stats seeds the collector when it is first created.
+    """
     if runtime_data is None:
         return None
 
     performance_stats = ensure_runtime_performance_stats(runtime_data)
-    stored_metrics = performance_stats.get("entity_factory_guard_metrics")
-    if isinstance(stored_metrics, MutableMapping):
-        metrics = cast(EntityFactoryGuardMetrics, stored_metrics)
-    else:
-        metrics = cast(
-            EntityFactoryGuardMetrics,
-            {
-                "schema_version": 1,
-                "samples": 0,
-                "stable_samples": 0,
-                "expansions": 0,
-                "contractions": 0,
-            },
+    collector = get_runtime_entity_factory_guard_collector(runtime_data)
+    if collector is None:
+        collector = ensure_runtime_metrics_registry(runtime_data).collector(
+            _ENTITY_FACTORY_GUARD_COLLECTOR,
+            EntityFactoryGuardCollector,
         )
-        performance_stats["entity_factory_guard_metrics"] = metrics
-
-    metrics["schema_version"] = 1
-    previous_floor_raw: object | None = None
-    if isinstance(stored_metrics, MutableMapping):
-        previous_floor_raw = stored_metrics.get("runtime_floor")
-    previous_floor: float | None = None
-    if isinstance(previous_floor_raw, int | float) and isfinite(previous_floor_raw):
-        previous_floor = float(previous_floor_raw)
-    if previous_floor is None:
-        previous_floor = max(baseline_floor, 0.0)
-    previous_samples = int(metrics.get("samples", 0) or 0)
-    metrics.setdefault("stable_samples", 0)
-    metrics.setdefault("expansions", 0)
-    metrics.setdefault("contractions", 0)
-    previous_stable_ratio = (
-        float(metrics["stable_ratio"])
-        if isinstance(metrics.get("stable_ratio"), int | float)
-        else None
-    )
-    metrics["baseline_floor"] = max(baseline_floor, 0.0)
-    metrics["max_floor"] = max(max_floor, 0.0)
-    metrics["runtime_floor"] = max(runtime_floor, 0.0)
-    metrics["runtime_floor_delta"] = max(
-        metrics["runtime_floor"] - metrics["baseline_floor"],
-        0.0,
+        stored_metrics = performance_stats.get("entity_factory_guard_metrics")
+        if isinstance(stored_metrics, Mapping):
+            collector.restore(stored_metrics)
+
+    collector.record(
+        runtime_floor=runtime_floor,
+        actual_duration=actual_duration,
+        event=event,
+        baseline_floor=baseline_floor,
+        max_floor=max_floor,
+        enforce_min_runtime=enforce_min_runtime,
     )
-    metrics["peak_runtime_floor"] = max(
-        metrics["runtime_floor"],
-        float(metrics.get("peak_runtime_floor", 0.0) or 0.0),
+    metrics = collector.render()
+    performance_stats["entity_factory_guard_metrics"] = metrics
+    collector.dirty = False
+    return metrics
+
+
+class _BoolCoercionTelemetry:
+    """Bool coercion counters kept as plain integers until exported.
+
+    Recording runs on every :func:`types._coerce_bool` call, so it only bumps
+    counters and stores a monotonic timestamp.  While repr capture is enabled
+    the truncated representation of a value is rendered at record time for
+    the first :data:`_BOOL_COERCION_SAMPLE_LIMIT` events after a reset, which
+    are kept as samples, and for every
+    :data:`_BOOL_COERCION_REPR_INTERVAL`-th event after that.
+    ``last_value_repr`` holds the most recent sampled value.  The integration
+    only enables capture while the package logger runs at debug level.
+    """
+
+    __slots__ = (
+        "capture_repr",
+        "defaulted",
+        "fallback",
+        "first_seen",
+        "last_default",
+        "last_reason",
+        "last_reset",
+        "last_result",
+        "last_seen",
+        "last_type",
+        "last_value_repr",
+        "reason_counts",
+        "reset_count",
+        "samples",
+        "total",
+        "type_counts",
     )
-    lowest_runtime_floor = metrics.get("lowest_runtime_floor")
-    if isinstance(lowest_runtime_floor, int | float) and lowest_runtime_floor > 0:
-        metrics["lowest_runtime_floor"] = min(
-            lowest_runtime_floor,
-            max(metrics["runtime_floor"], metrics["baseline_floor"]),
-        )
-    else:
-        metrics["lowest_runtime_floor"] = max(
-            metrics["runtime_floor"],
-            metrics["baseline_floor"],
-        )
-    duration = max(actual_duration, 0.0)
-    metrics["last_actual_duration"] = duration
-    floor = metrics["runtime_floor"] or runtime_floor
-    metrics["last_duration_ratio"] = duration / floor if floor > 0 else 0.0
-    metrics["last_event"] = event
-    metrics["last_updated"] = dt_util.utcnow().isoformat()
-    metrics["enforce_min_runtime"] = enforce_min_runtime
-    if previous_floor is not None:
-        floor_change = metrics["runtime_floor"] - previous_floor
-        metrics["last_floor_change"] = floor_change
-        metrics["last_floor_change_ratio"] = (
-            floor_change / previous_floor if previous_floor > 0 else 0.0
-        )
-    else:
-        metrics.setdefault("last_floor_change", 0.0)
-        metrics.setdefault("last_floor_change_ratio", 0.0)
-
-    metrics["samples"] = previous_samples + 1
-    samples = metrics["samples"]
-    average_duration = metrics.get("average_duration")
-    if isinstance(average_duration, int | float) and previous_samples > 0:
-        metrics["average_duration"] = (
-            (float(average_duration) * previous_samples) + duration
-        ) / samples
-    else:
-        metrics["average_duration"] = duration
 
-    max_duration = metrics.get("max_duration")
-    if not isinstance(max_duration, int | float):
-        metrics["max_duration"] = duration
-    else:
-        metrics["max_duration"] = max(float(max_duration), duration)
+    def __init__(self) -> None:
+        """Initialise empty counters with repr capture enabled."""
+        self.capture_repr = True
+        self.reset_count = 0
+        self.last_reset: str | None = None
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all counters and samples, keeping the reset bookkeeping."""
+        self.total = 0
+        self.defaulted = 0
+        self.fallback = 0
+        self.type_counts: dict[type, int] = {}
+        self.reason_counts: dict[str, int] = {}
+        self.samples: list[BoolCoercionSample] = []
+        self.first_seen: float | None = None
+        self.last_seen: float | None = None
+        self.last_reason: str | None = None
+        self.last_type: type | None = None
+        self.last_value_repr: str | None = None
+        self.last_result: bool | None = None
+        self.last_default: bool | None = None
+
+    def record(self, value: Any, default: bool, result: bool, reason: str) -> None:
+        """Record one coercion."""
+        now = _monotonic()
+        self.total += 1
+        if self.first_seen is None:
+            self.first_seen = now
+        self.last_seen = now
+        if reason in _BOOL_COERCION_DEFAULTED_REASONS:
+            self.defaulted += 1
+        elif reason == "fallback":
+            self.fallback += 1
+
+        value_type = type(value)
+        type_counts = self.type_counts
+        type_counts[value_type] = type_counts.get(value_type, 0) + 1
+        reason_counts = self.reason_counts
+        reason_counts[reason] = reason_counts.get(reason, 0) + 1
+        if self.capture_repr:
+            total = self.total
+            if (
+                total <= _BOOL_COERCION_SAMPLE_LIMIT
+                or total % _BOOL_COERCION_REPR_INTERVAL == 0
+            ):
+                value_repr = _safe_repr(value)
+                self.last_value_repr = value_repr
+                if len(self.samples) < _BOOL_COERCION_SAMPLE_LIMIT:
+                    self.samples.append(
+                        {
+                            "value_type": value_type.__name__,
+                            "value_repr": value_repr,
+                            "default": bool(default),
+                            "result": bool(result),
+                            "reason": reason,
+                        },
+                    )
+        else:
+            self.last_value_repr = None
 
-    min_duration = metrics.get("min_duration")
-    if not isinstance(min_duration, int | float) or previous_samples == 0:
-        metrics["min_duration"] = duration
-    else:
-        metrics["min_duration"] = min(float(min_duration), duration)
-
-    if event == "expand":
-        metrics["expansions"] = int(metrics.get("expansions", 0) or 0) + 1
-        metrics["last_expansion_duration"] = duration
-    elif event == "contract":
-        metrics["contractions"] = int(metrics.get("contractions", 0) or 0) + 1
-        metrics["last_contraction_duration"] = duration
-    elif event == "stable":
-        metrics["stable_samples"] = (
-            int(
-                metrics.get("stable_samples", 0) or 0,
-            )
-            + 1
-        )
-    else:
-        metrics.setdefault(
-            "stable_samples",
-            int(
-                metrics.get("stable_samples", 0) or 0,
-            ),
-        )
-        metrics.setdefault(
-            "expansions",
-            int(
-                metrics.get("expansions", 0) or 0,
-            ),
-        )
-        metrics.setdefault(
-            "contractions",
-            int(
-                metrics.get("contractions", 0) or 0,
-            ),
-        )
+        self.last_type = value_type
+        self.last_reason = reason
+        self.last_result = result
+        self.last_default = default
 
-    stable_run = int(metrics.get("consecutive_stable_samples", 0) or 0)
-    longest_run = int(metrics.get("longest_stable_run", 0) or 0)
-    if event == "stable":
-        stable_run += 1
-        if stable_run > longest_run:
-            longest_run = stable_run
-    else:
-        stable_run = 0
-    metrics["consecutive_stable_samples"] = stable_run
-    metrics["longest_stable_run"] = longest_run
-    if samples > 0:
-        metrics["stable_ratio"] = (
-            float(
-                metrics.get("stable_samples", 0),
-            )
-            / samples
-        )
-        metrics["expansion_ratio"] = (
-            float(
-                metrics.get("expansions", 0),
-            )
-            / samples
-        )
-        metrics["contraction_ratio"] = (
-            float(
-                metrics.get("contractions", 0),
-            )
-            / samples
-        )
-        metrics["volatility_ratio"] = (
-            float(
-                metrics.get("expansions", 0) + metrics.get("contractions", 0),
-            )
-            / samples
-        )
-    else:
-        metrics["stable_ratio"] = 0.0
-        metrics["expansion_ratio"] = 0.0
-        metrics["contraction_ratio"] = 0.0
-        metrics["volatility_ratio"] = 0.0
-
-    existing_recent = metrics.get("recent_durations")
-    if isinstance(existing_recent, Sequence) and not isinstance(
-        existing_recent,
-        str | bytes | bytearray,
-    ):
-        recent: list[float] = [
-            max(float(sample), 0.0)
-            for sample in existing_recent
-            if isinstance(sample, int | float) and isfinite(float(sample))
-        ]
-    else:
-        recent = []
-
-    recent.append(duration)
-    if len(recent) > 5:
-        recent = recent[-5:]
-
-    metrics["recent_durations"] = recent
-    recent_average = sum(recent) / len(recent)
-    recent_max = max(recent)
-    recent_min = min(recent)
-    recent_span = max(recent_max - recent_min, 0.0)
-    metrics["recent_average_duration"] = recent_average
-    metrics["recent_max_duration"] = recent_max
-    metrics["recent_min_duration"] = recent_min
-    metrics["recent_duration_span"] = recent_span
-    metrics["recent_jitter_ratio"] = recent_span / floor if floor > 0 else recent_span
-    metrics["recent_samples"] = len(recent)
-    existing_events = metrics.get("recent_events")
-    if isinstance(existing_events, Sequence) and not isinstance(
-        existing_events,
-        str | bytes | bytearray,
-    ):
-        recent_events: list[EntityFactoryGuardEvent] = [
-            event_name
-            for event_name in existing_events
-            if isinstance(event_name, str) and event_name
-        ]
-    else:
-        recent_events = []
-
-    recent_events.append(event)
-    if len(recent_events) > 5:
-        recent_events = recent_events[-5:]
-
-    metrics["recent_events"] = recent_events
-    recent_stable_samples = sum(1 for name in recent_events if name == "stable")
-    metrics["recent_stable_samples"] = recent_stable_samples
-    recent_stable_ratio = recent_stable_samples / len(recent_events)
-    metrics["recent_stable_ratio"] = recent_stable_ratio
-    duration_span = max(metrics["max_duration"] - metrics["min_duration"], 0.0)
-    metrics["duration_span"] = duration_span
-    metrics["jitter_ratio"] = duration_span / floor if floor > 0 else duration_span
-    baseline_ratio = (
-        previous_stable_ratio
-        if previous_stable_ratio is not None
-        else metrics["stable_ratio"]
-    )
-    trend_delta = recent_stable_ratio - baseline_ratio
-    if trend_delta > 0.05:
-        trend: EntityFactoryGuardStabilityTrend = "improving"
-    elif trend_delta < -0.05:
-        trend = "regressing"
-    else:
-        trend = "steady"
 
-    metrics["stability_trend"] = trend
-    return metrics
+_BOOL_COERCION_TELEMETRY = _BoolCoercionTelemetry()
+
+
+def _monotonic_to_iso(timestamp: float | None) -> str | None:
+    """Convert a :func:`time.monotonic` reading into a UTC ISO timestamp."""
+    if timestamp is None:
+        return None
+    elapsed = max(_monotonic() - timestamp, 0.0)
+    return (dt_util.utcnow() - timedelta(seconds=elapsed)).isoformat()
+
+
+def set_bool_coercion_repr_capture(enabled: bool) -> bool:
+    """Enable or disable value repr capture for bool coercions.
+
+    Counters keep running while capture is disabled, but no samples are
+    stored and no representation of the last coerced value is kept.  The
+    integration toggles this with the package debug logging level; the
+    previous setting is returned so callers can restore it afterwards.
+    """
+    telemetry = _BOOL_COERCION_TELEMETRY
+    previous = telemetry.capture_repr
+    telemetry.capture_repr = bool(enabled)
+    if not enabled:
+        telemetry.last_value_repr = None
+    return previous
 
 
 def record_bool_coercion_event(
@@ -1580,56 +1910,27 @@ def record_bool_coercion_event(
     reason: str,
 ) -> None:
     """Record details about a boolean coercion for diagnostics."""
-    metrics = _BOOL_COERCION_METRICS
-    metrics["total"] = metrics.get("total", 0) + 1
-    iso_timestamp = dt_util.utcnow().isoformat()
-    if metrics.get("first_seen") is None:
-        metrics["first_seen"] = iso_timestamp
-    metrics["last_seen"] = iso_timestamp
-    if metrics.get("last_reset") is None:
-        metrics["last_reset"] = iso_timestamp
-
-    if reason in {"none", "blank_string"}:
-        metrics["defaulted"] = metrics.get("defaulted", 0) + 1
-    if reason == "fallback":
-        metrics["fallback"] = metrics.get("fallback", 0) + 1
-
-    value_type = type(value).__name__ if value is not None else "NoneType"
-    value_repr = _safe_repr(value)
-    type_counts = metrics.setdefault("type_counts", {})
-    type_counts[value_type] = type_counts.get(value_type, 0) + 1
-    reason_counts = metrics.setdefault("reason_counts", {})
-    reason_counts[reason] = reason_counts.get(reason, 0) + 1
-    samples = metrics.setdefault("samples", [])
-    if len(samples) < _BOOL_COERCION_SAMPLE_LIMIT:
-        samples.append(
-            {
-                "value_type": value_type,
-                "value_repr": value_repr,
-                "default": default,
-                "result": result,
-                "reason": reason,
-            },
-        )
-
-    metrics["last_reason"] = reason
-    metrics["last_value_type"] = value_type
-    metrics["last_value_repr"] = value_repr
-    metrics["last_result"] = bool(result)
-    metrics["last_default"] = bool(default)
+    _BOOL_COERCION_TELEMETRY.record(value, default, result, reason)
 
 
 def get_bool_coercion_metrics() -> BoolCoercionMetrics:
     """Return a defensive copy of the collected bool coercion metrics."""
-    first_seen = _BOOL_COERCION_METRICS.get("first_seen")
-    last_seen = _BOOL_COERCION_METRICS.get("last_seen")
+    telemetry = _BOOL_COERCION_TELEMETRY
+    first_seen = telemetry.first_seen
+    last_seen = telemetry.last_seen
+    type_counts: dict[str, int] = {}
+    for value_type, count in telemetry.type_counts.items():
+        type_name = value_type.__name__
+        type_counts[type_name] = type_counts.get(type_name, 0) + count
+    first_seen_iso = _monotonic_to_iso(first_seen)
+    last_type = telemetry.last_type
     snapshot: BoolCoercionMetrics = {
-        "total": int(_BOOL_COERCION_METRICS.get("total", 0)),
-        "defaulted": int(_BOOL_COERCION_METRICS.get("defaulted", 0)),
-        "fallback": int(_BOOL_COERCION_METRICS.get("fallback", 0)),
-        "reset_count": int(_BOOL_COERCION_METRICS.get("reset_count", 0)),
-        "type_counts": dict(_BOOL_COERCION_METRICS.get("type_counts", {})),
-        "reason_counts": dict(_BOOL_COERCION_METRICS.get("reason_counts", {})),
+        "total": telemetry.total,
+        "defaulted": telemetry.defaulted,
+        "fallback": telemetry.fallback,
+        "reset_count": telemetry.reset_count,
+        "type_counts": type_counts,
+        "reason_counts": dict(telemetry.reason_counts),
         "samples": [
             {
                 "value_type": sample["value_type"],
@@ -1638,44 +1939,35 @@ def get_bool_coercion_metrics() -> BoolCoercionMetrics:
                 "result": bool(sample["result"]),
                 "reason": sample["reason"],
             }
-            for sample in _BOOL_COERCION_METRICS.get("samples", [])
+            for sample in telemetry.samples
         ],
-        "first_seen": first_seen,
-        "last_seen": last_seen,
-        "active_window_seconds": _calculate_active_window_seconds(
-            first_seen,
-            last_seen,
+        "first_seen": first_seen_iso,
+        "last_seen": _monotonic_to_iso(last_seen),
+        "active_window_seconds": (
+            max(last_seen - first_seen, 0.0)
+            if first_seen is not None and last_seen is not None
+            else None
+        ),
+        "last_reset": telemetry.last_reset or first_seen_iso,
+        "last_reason": telemetry.last_reason,
+        "last_value_type": last_type.__name__ if last_type is not None else None,
+        "last_value_repr": telemetry.last_value_repr,
+        "last_result": (
+            bool(telemetry.last_result) if telemetry.last_result is not None else None
+        ),
+        "last_default": (
+            bool(telemetry.last_default) if telemetry.last_default is not None else None
         ),
-        "last_reset": _BOOL_COERCION_METRICS.get("last_reset"),
-        "last_reason": _BOOL_COERCION_METRICS.get("last_reason"),
-        "last_value_type": _BOOL_COERCION_METRICS.get("last_value_type"),
-        "last_value_repr": _BOOL_COERCION_METRICS.get("last_value_repr"),
-        "last_result": _BOOL_COERCION_METRICS.get("last_result"),
-        "last_default": _BOOL_COERCION_METRICS.get("last_default"),
     }
     return snapshot
 
 
 def reset_bool_coercion_metrics() -> None:
     """Reset collected bool coercion metrics (primarily for testing)."""
-    reset_count = int(_BOOL_COERCION_METRICS.get("reset_count", 0)) + 1
-    iso_timestamp = dt_util.utcnow().isoformat()
-    _BOOL_COERCION_METRICS["total"] = 0
-    _BOOL_COERCION_METRICS["defaulted"] = 0
-    _BOOL_COERCION_METRICS["fallback"] = 0
-    _BOOL_COERCION_METRICS["reset_count"] = reset_count
-    _BOOL_COERCION_METRICS["type_counts"] = {}
-    _BOOL_COERCION_METRICS["reason_counts"] = {}
-    _BOOL_COERCION_METRICS["samples"] = []
-    _BOOL_COERCION_METRICS["first_seen"] = None
-    _BOOL_COERCION_METRICS["last_seen"] = None
-    _BOOL_COERCION_METRICS["active_window_seconds"] = None
-    _BOOL_COERCION_METRICS["last_reset"] = iso_timestamp
-    _BOOL_COERCION_METRICS["last_reason"] = None
-    _BOOL_COERCION_METRICS["last_value_type"] = None
-    _BOOL_COERCION_METRICS["last_value_repr"] = None
-    _BOOL_COERCION_METRICS["last_result"] = None
-    _BOOL_COERCION_METRICS["last_default"] = None
+    telemetry = _BOOL_COERCION_TELEMETRY
+    telemetry.clear()
+    telemetry.reset_count += 1
+    telemetry.last_reset = dt_util.utcnow().isoformat()
 
 
 def summarise_bool_coercion_metrics(*, sample_limit: int = 5) -> BoolCoercionSummary:
@@ -11,6 +11,7 @@ from homeassistant.helpers.translation import async_get_translations
 
 from .const import DOMAIN
 from .language import normalize_language
+from .translation_index import get_bundled_translation_index, load_translation_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,8 +23,20 @@ def _load_bundled_component_translations_cached(
     language: str,
     base_path: str,
 ) -> dict[str, str]:
-    """Load bundled translations from ``translations/<language>.json``."""
+    """Load bundled translations from ``translations/<language>.json``.
+
+    The compiled translation index is used when present; the JSON file is only
+    parsed for trees without one.
+    """
     root = Path(base_path)
+    if (index := load_translation_index(root)) is not None:
+        if index.resolve_language(language) is None:
+            return {}
+        return {
+            component_translation_key(key): value
+            for key, value in index.common(language).items()
+        }
+
     translations_path = root / "translations" / f"{language}.json"
     if not translations_path.exists():
         return {}
@@ -169,6 +182,32 @@ def get_cached_component_translations(
     return _load_bundled_component_translations(normalized)
 
 
+def get_cached_component_template(
+    hass: HomeAssistant,
+    language: str | None,
+    key: str,
+    default: str,
+) -> str:
+    """Return the template for component ``key`` in ``language``.
+
+    Translations already loaded from Home Assistant take precedence.  Otherwise
+    the template comes from the key's slot in the bundled translation index,
+    which keeps the resolved value per language and key.
+    """
+    normalized = normalize_language(language)
+    if not _get_translation_cache(hass).get(normalized) and (
+        (index := get_bundled_translation_index()) is not None
+        and (template := index.template(normalized, key)) is not None
+    ):
+        return template
+
+    translations, fallback = get_cached_component_translation_lookup(
+        hass,
+        normalized,
+    )
+    return resolve_component_translation(translations, fallback, key, default=default)
+
+
 def get_cached_component_translation_lookup(
     hass: HomeAssistant,
     language: str | None,
@@ -0,0 +1,327 @@
+"""Precompiled, lazily loaded index of bundled ``common`` translations.
+
+The integration ships more than sixty ``translations/<language>.json`` files.
+Runtime helpers only ever read their ``common`` section, yet the JSON loaders
+parse the complete document (config flow, options, services, ...) for every
+language they touch and keep the result as a per-language dictionary.
+
+``compiled_translations.jsonl`` stores the same strings as one key-indexed
+table generated by ``python -m scripts.compile_translations``:
+
+* The first line is a JSON header holding the sorted key list and the byte
+  ``[offset, length]`` of every language row relative to the end of the
+  header.
+* Every following line is a compact JSON array aligned with the key list.
+  ``null`` marks a value that is missing or identical to the one resolved by
+  the language's fallback chain (``pt-BR`` → ``pt`` → ``en``), so regional
+  and placeholder translations cost almost nothing.
+
+:class:`TranslationIndex` memory-maps the file, resolves keys once to integer
+slots and decodes a language row only when that language is first requested.
+Resolved templates are kept per language and key, so hot-path helpers pay for
+the fallback walk only on their first lookup.
+
+Quality Scale: Platinum target
+Home Assistant: 2025.9.0+
+Python: 3.13+
+"""
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+import json
+import logging
+import mmap
+from pathlib import Path
+from typing import Final, Self
+
+_LOGGER = logging.getLogger(__name__)
+
+COMPILED_TRANSLATIONS_FILENAME: Final = "compiled_translations.jsonl"
+TRANSLATION_INDEX_FORMAT: Final = "pawcontrol-translation-index"
+TRANSLATION_INDEX_VERSION: Final = 1
+FALLBACK_LANGUAGE: Final = "en"
+
+_COMPACT_SEPARATORS: Final = (",", ":")
+_BUNDLED_BASE_PATH: Final = str(Path(__file__).resolve().parent)
+
+
+def _fallback_chain(language: str, fallback: str = FALLBACK_LANGUAGE) -> list[str]:
+    """Return ``language`` followed by its base language and ``fallback``."""
+    chain = [language]
+    base = language.split("-", 1)[0]
+    if base != language:
+        chain.append(base)
+    if fallback not in chain:
+        chain.append(fallback)
+    return chain
+
+
+def _read_common_section(path: Path) -> dict[str, str]:
+    """Return the string values of a translation file's ``common`` section."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    common = payload.get("common") if isinstance(payload, Mapping) else None
+    if not isinstance(common, Mapping):
+        return {}
+    return {
+        key: value
+        for key, value in common.items()
+        if isinstance(key, str) and isinstance(value, str)
+    }
+
+
+def compile_translation_index(translations_dir: Path) -> bytes:
+    """Compile ``translations/*.json`` into the JSON-lines index format."""
+    catalogs = {
+        path.stem: _read_common_section(path)
+        for path in sorted(translations_dir.glob("*.json"))
+    }
+    keys = sorted({key for catalog in catalogs.values() for key in catalog})
+
+    # Compile languages before their regional variants so that redundant
+    # values can be elided against an already known fallback chain.
+    ordered = sorted(catalogs, key=lambda code: (code != FALLBACK_LANGUAGE, code))
+    rows: dict[str, bytes] = {}
+    for language in ordered:
+        catalog = catalogs[language]
+        parents = [
+            catalogs[code] for code in _fallback_chain(language)[1:] if code in catalogs
+        ]
+        row: list[str | None] = []
+        for key in keys:
+            value = catalog.get(key)
+            inherited = next(
+                (parent[key] for parent in parents if key in parent),
+                None,
+            )
+            row.append(None if value == inherited else value)
+        rows[language] = json.dumps(
+            row,
+            ensure_ascii=False,
+            separators=_COMPACT_SEPARATORS,
+        ).encode("utf-8")
+
+    body = bytearray()
+    languages: dict[str, list[int]] = {}
+    for language in sorted(rows):
+        languages[language] = [len(body), len(rows[language])]
+        body += rows[language] + b"\n"
+
+    header = json.dumps(
+        {
+            "format": TRANSLATION_INDEX_FORMAT,
+            "version": TRANSLATION_INDEX_VERSION,
+            "fallback": FALLBACK_LANGUAGE,
+            "keys": keys,
+            "languages": languages,
+        },
+        ensure_ascii=False,
+        separators=_COMPACT_SEPARATORS,
+    ).encode("utf-8")
+    return header + b"\n" + bytes(body)
+
+
+class TranslationIndex:
+    """Memory-mapped, key-indexed view over the compiled translation table."""
+
+    __slots__ = (
+        "_body_offset",
+        "_buffer",
+        "_chains",
+        "_fallback",
+        "_keys",
+        "_languages",
+        "_rows",
+        "_segments",
+        "_slots",
+        "_templates",
+    )
+
+    def __init__(self, buffer: mmap.mmap | bytes) -> None:
+        """Parse the header of ``buffer``; language rows stay undecoded."""
+        header_end = buffer.find(b"\n")
+        if header_end < 0:
+            raise ValueError("Compiled translation index has no header")
+        header = json.loads(buffer[:header_end])
+        if (
+            not isinstance(header, Mapping)
+            or header.get("format") != TRANSLATION_INDEX_FORMAT
+            or header.get("version") != TRANSLATION_INDEX_VERSION
+        ):
+            raise ValueError("Unsupported compiled translation index header")
+
+        keys = header.get("keys")
+        segments = header.get("languages")
+        if not isinstance(keys, list) or not isinstance(segments, Mapping):
+            raise ValueError("Compiled translation index header is incomplete")
+
+        self._buffer = buffer
+        self._body_offset = header_end + 1
+        self._fallback = str(header.get("fallback") or FALLBACK_LANGUAGE)
+        self._keys: tuple[str, ...] = tuple(str(key) for key in keys)
+        self._slots: dict[str, int] = {key: slot for slot, key in enumerate(self._keys)}
+        try:
+            self._segments: dict[str, tuple[int, int]] = {
+                str(language): (int(segment[0]), int(segment[1]))
+                for language, segment in segments.items()
+            }
+        except (IndexError, TypeError) as err:
+            raise ValueError("Compiled translation index has bad offsets") from err
+        self._languages: dict[str, str] = {
+            language.lower(): language for language in self._segments
+        }
+        self._rows: dict[str, tuple[str | None, ...]] = {}
+        self._chains: dict[str, tuple[tuple[str | None, ...], ...]] = {}
+        self._templates: dict[tuple[str, str], str | None] = {}
+
+    @classmethod
+    def from_file(cls, path: Path) -> Self:
+        """Memory-map ``path`` and return an index over its contents."""
+        with path.open("rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except Exception:
+            buffer.close()
+            raise
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Return the indexed translation keys in slot order."""
+        return self._keys
+
+    @property
+    def languages(self) -> tuple[str, ...]:
+        """Return every language code present in the index."""
+        return tuple(self._segments)
+
+    @property
+    def loaded_languages(self) -> tuple[str, ...]:
+        """Return the languages whose rows have been decoded so far."""
+        return tuple(self._rows)
+
+    def resolve_language(self, language: str) -> str | None:
+        """Return the indexed spelling of ``language`` (case insensitive)."""
+        return self._languages.get(language.replace("_", "-").lower())
+
+    def slot(self, key: str) -> int | None:
+        """Return the integer slot for ``key`` or ``None`` when unknown."""
+        return self._slots.get(key)
+
+    def _row(self, language: str) -> tuple[str | None, ...]:
+        """Decode and cache the row for an indexed ``language``."""
+        row = self._rows.get(language)
+        if row is not None:
+            return row
+        offset, length = self._segments[language]
+        start = self._body_offset + offset
+        try:
+            decoded = json.loads(self._buffer[start : start + length])
+        except ValueError:
+            decoded = None
+        if not isinstance(decoded, list) or len(decoded) != len(self._keys):
+            _LOGGER.debug("Ignoring malformed translation row for %s", language)
+            decoded = [None] * len(self._keys)
+        row = tuple(value if isinstance(value, str) else None for value in decoded)
+        self._rows[language] = row
+        return row
+
+    def _chain(self, language: str) -> tuple[tuple[str | None, ...], ...]:
+        """Return the decoded rows of ``language``'s fallback chain."""
+        chain = self._chains.get(language)
+        if chain is not None:
+            return chain
+        codes = [
+            resolved
+            for code in _fallback_chain(
+                language.replace("_", "-").lower(), self._fallback
+            )
+            if (resolved := self.resolve_language(code)) is not None
+        ]
+        chain = tuple(self._row(code) for code in dict.fromkeys(codes))
+        self._chains[language] = chain
+        return chain
+
+    def lookup(self, language: str, slot: int) -> str | None:
+        """Return the value stored in ``slot`` following the fallback chain."""
+        for row in self._chain(language):
+            value = row[slot]
+            if value is not None:
+                return value
+        return None
+
+    def get(self, language: str, key: str, default: str | None = None) -> str | None:
+        """Return the translation for ``key`` or ``default`` when missing."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return default
+        value = self.lookup(language, slot)
+        return default if value is None else value
+
+    def template(self, language: str, key: str) -> str | None:
+        """Return the template for ``key``, resolving its slot only once."""
+        cache_key = (language, key)
+        try:
+            return self._templates[cache_key]
+        except KeyError:
+            pass
+        slot = self._slots.get(key)
+        template = None if slot is None else self.lookup(language, slot)
+        self._templates[cache_key] = template
+        return template
+
+    def templates(
+        self,
+        language: str,
+        keys: Iterable[str],
+    ) -> tuple[str | None, ...]:
+        """Return the templates for ``keys`` in the same order."""
+        template = self.template
+        return tuple(template(language, key) for key in keys)
+
+    def common(self, language: str) -> dict[str, str]:
+        """Return the merged ``common`` mapping for ``language``."""
+        chain = self._chain(language)
+        resolved: dict[str, str] = {}
+        for slot, key in enumerate(self._keys):
+            for row in chain:
+                value = row[slot]
+                if value is not None:
+                    resolved[key] = value
+                    break
+        return resolved
+
+    def close(self) -> None:
+        """Release decoded rows and unmap the backing file."""
+        self._rows.clear()
+        self._chains.clear()
+        self._templates.clear()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+@lru_cache(maxsize=4)
+def _load_translation_index_cached(base_path: str) -> TranslationIndex | None:
+    """Return the translation index stored below ``base_path`` if present."""
+    index_path = Path(base_path) / COMPILED_TRANSLATIONS_FILENAME
+    if not index_path.is_file():
+        return None
+    try:
+        return TranslationIndex.from_file(index_path)
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Failed to load compiled translations %s: %s", index_path, err)
+        return None
+
+
+def load_translation_index(base_path: Path | str) -> TranslationIndex | None:
+    """Return the cached translation index for an integration directory."""
+    return _load_translation_index_cached(str(base_path))
+
+
+def clear_translation_index_cache() -> None:
+    """Forget loaded indexes so the next lookup reads the files again."""
+    _load_translation_index_cached.cache_clear()
+
+
+def get_bundled_translation_index() -> TranslationIndex | None:
+    """Return the translation index shipped with the integration."""
+    return _load_translation_index_cached(_BUNDLED_BASE_PATH)
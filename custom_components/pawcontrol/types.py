@@ -67,6 +67,7 @@ from .const import (
     CONF_REMINDER_REPEAT_MIN,
     DEFAULT_REMINDER_REPEAT_MIN,
 )
+from .metrics_registry import MetricsRegistry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -1204,6 +1205,10 @@ class DogModulesProjection:
         return dict(self.mapping)
 
 
+# Resolved on first use; telemetry imports this module.
+_BOOL_COERCION_RECORDER: Callable[..., None] | None = None
+
+
 def _record_bool_coercion(
     value: Any,
     *,
@@ -1212,13 +1217,17 @@ def _record_bool_coercion(
     reason: str,
 ) -> None:
     """Record bool coercion telemetry for diagnostics consumers."""
-    try:
-        from .telemetry import record_bool_coercion_event
-    except Exception:  # pragma: no cover - telemetry import guarded for safety
-        return
+    global _BOOL_COERCION_RECORDER
+    recorder = _BOOL_COERCION_RECORDER
+    if recorder is None:
+        try:
+            from .telemetry import record_bool_coercion_event
+        except Exception:  # pragma: no cover - telemetry import guarded for safety
+            return
+        recorder = _BOOL_COERCION_RECORDER = record_bool_coercion_event
 
     try:
-        record_bool_coercion_event(
+        recorder(
             value=value,
             default=default,
             result=result,
@@ -2210,12 +2219,22 @@ class DashboardRenderJobConfig(TypedDict, total=False):
     service_guard_metrics: HelperManagerGuardMetrics | JSONMapping
 
 
+class DashboardViewCacheStats(TypedDict):
+    """Statistics for the renderer's content-addressed dog view cache."""
+
+    cached_views: int
+    hits: int
+    misses: int
+    skipped_writes: int
+
+
 class DashboardRendererStatistics(TypedDict):
     """Summary statistics describing renderer state."""
 
     active_jobs: int
     total_jobs_processed: int
     template_cache: TemplateCacheStats
+    view_cache: DashboardViewCacheStats
 
 
 class SwitchExtraAttributes(TypedDict, total=False):
@@ -3741,6 +3760,51 @@ class NotificationQueueStats(TypedDict):
     max_queue_size: int
 
 
+class EventQueueHistogram(TypedDict):
+    """Fixed-bucket histogram exported by the data manager event queue.
+
+    ``counts`` has one more entry than ``bounds``; the last bucket collects
+    samples above the largest bound.
+    """
+
+    bounds: list[float]
+    counts: list[int]
+    samples: int
+    mean: float
+    max: float
+
+
+class EventQueueStats(TypedDict):
+    """Throughput and latency metrics for the data manager event queue."""
+
+    depth: int
+    high_watermark: int
+    events_processed: int
+    batches_processed: int
+    backpressure_waits: int
+    depth_histogram: EventQueueHistogram
+    batch_size_histogram: EventQueueHistogram
+    latency_ms_histogram: EventQueueHistogram
+
+
+class ChannelDeliveryStats(TypedDict):
+    """Per-channel delivery lane metrics for the notification manager."""
+
+    workers: int
+    queue_limit: int
+    timeout_seconds: float
+    in_flight: int
+    waiting: int
+    completed: int
+    failed: int
+    timeouts: int
+    rejected: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_delivery_ms: float
+    max_delivery_ms: float
+
+
 class PersonEntitySnapshotEntry(TypedDict, total=False):
     """Snapshot payload exported for each discovered person entity."""
 
@@ -4209,6 +4273,7 @@ class GPSManagerStats(TypedDict):
     gps_points_processed: int
     routes_completed: int
     geofence_events: int
+    tracker_index_rebuilds: int
     last_update: datetime
 
 
@@ -4786,6 +4851,19 @@ class WalkPerformanceCounters(TypedDict):
     export_errors: int
 
 
+class PathSimplificationStats(TypedDict):
+    """Diagnostics describing how a stored walk path was simplified."""
+
+    raw_points: int
+    kept_points: int
+    compactions: int
+    tolerance_m: float
+    peak_tolerance_m: float
+    max_deviation_m: float
+    raw_distance_m: float
+    distance_error_m: float
+
+
 class WalkSessionSnapshot(TypedDict, total=False):
     """Structured walk session metadata used for diagnostics and history."""
 
@@ -4816,6 +4894,7 @@ class WalkSessionSnapshot(TypedDict, total=False):
     detection_metadata: JSONMutableMapping | None
     save_route: bool | None
     path_optimization_applied: bool | None
+    path_simplification: PathSimplificationStats | None
     current_distance: float | None
     current_duration: float | None
     elapsed_duration: NotRequired[float]
@@ -5081,6 +5160,7 @@ class CacheDiagnosticsMetadata(TypedDict, total=False):
     namespace: str
     storage_path: str
     timestamp_anomalies: dict[str, str]
+    write_behind: JSONMutableMapping
     last_generated: str | None
     manager_last_generated_age_seconds: int | float
     manager_last_activity: str | None
@@ -5803,6 +5883,45 @@ class AdaptivePollingDiagnostics(TypedDict):
     idle_grace_ms: float
 
 
+class ModuleCadenceStats(TypedDict):
+    """Refresh cadence diagnostics for one coordinator module."""
+
+    min_interval_s: float
+    max_interval_s: float
+    effective_interval_s: float
+    tracked_dogs: int
+    fetches: int
+    skipped: int
+
+
+class ModuleCadenceDiagnostics(TypedDict):
+    """Per-module refresh cadence diagnostics of the coordinator scheduler."""
+
+    modules: dict[str, ModuleCadenceStats]
+    fetches: int
+    skipped: int
+
+
+class DeviceConnectionPoolStats(TypedDict):
+    """Connection pool limits reported by the shared aiohttp connector."""
+
+    limit: int | None
+    limit_per_host: int | None
+
+
+class DeviceClientDiagnostics(TypedDict):
+    """Request statistics captured by the companion device API client."""
+
+    requests: int
+    json_decoded: int
+    not_modified: int
+    bulk_requests: int
+    bulk_fallbacks: int
+    bulk_supported: bool | None
+    conditional_entries: int
+    connection_pool: DeviceConnectionPoolStats | None
+
+
 class SetupFlagPanelEntry(TypedDict):
     """Single setup flag entry used by the diagnostics panel."""
 
@@ -5984,6 +6103,16 @@ class CoordinatorPerformanceSnapshotMetrics(TypedDict, total=False):
     rejection_breakers: list[str]
 
 
+class ScopedListenerStats(TypedDict):
+    """Fan-out counters for dog/module scoped coordinator listeners."""
+
+    listeners: int
+    dogs: int
+    dispatches: int
+    notified: int
+    skipped: int
+
+
 class CoordinatorPerformanceSnapshot(TypedDict, total=False):
     """Composite payload returned by performance snapshot helpers."""
 
@@ -5998,6 +6127,8 @@ class CoordinatorPerformanceSnapshot(TypedDict, total=False):
     resilience: CoordinatorResilienceDiagnostics
     service_execution: CoordinatorServiceExecutionSummary
     last_cycle: CoordinatorRuntimeCycleSnapshot
+    listener_fanout: ScopedListenerStats
+    module_cadence: ModuleCadenceDiagnostics
 
 
 CoordinatorSecurityAdaptiveCheck = TypedDict(
@@ -6991,12 +7122,25 @@ class StorageNamespaceDogSummary(TypedDict, total=False):
     timestamp_issue: str
 
 
+class StorageNamespaceFlushStats(TypedDict):
+    """Write-behind counters tracked per storage namespace."""
+
+    flushes: int
+    bytes_written: int
+    coalesced_writes: int
+    errors: int
+    pending: bool
+
+
 class StorageNamespaceStats(TypedDict):
     """Summary metrics for coordinator storage namespace diagnostics."""
 
     namespace: str
     dogs: int
     entries: int
+    flushes: NotRequired[int]
+    bytes_written: NotRequired[int]
+    pending_flush: NotRequired[bool]
 
 
 class StorageNamespaceSnapshot(TypedDict):
@@ -7006,11 +7150,23 @@ class StorageNamespaceSnapshot(TypedDict):
     per_dog: dict[str, StorageNamespaceDogSummary]
 
 
+class DogShardStoreStats(TypedDict):
+    """Counters describing per-dog shard persistence activity."""
+
+    shards: int
+    journal_appends: int
+    journal_records: int
+    compactions: int
+    bytes_written: int
+    replayed_records: int
+
+
 class DataManagerMetricsSnapshot(TypedDict):
     """Metrics exposed by :class:`PawControlDataManager`."""
 
     dogs: int
     storage_path: str
+    storage_shards: DogShardStoreStats
     cache_diagnostics: CacheDiagnosticsMap
 
 
@@ -7145,6 +7301,8 @@ class PawControlRuntimeData:
         entity_profile: Active entity profile configuration
         dogs: List of all configured dogs with their settings
         performance_stats: Runtime performance monitoring data
+        metrics_registry: Low-overhead counters and histograms rendered lazily
+            into ``performance_stats``
         error_history: Historical error tracking for diagnostics
         helper_manager: Home Assistant helper creation and management service
         geofencing_manager: Geofencing and GPS zone monitoring service
@@ -7180,6 +7338,10 @@ class PawControlRuntimeData:
     performance_stats: RuntimePerformanceStats = field(
         default_factory=empty_runtime_performance_stats,
     )
+    metrics_registry: MetricsRegistry = field(
+        default_factory=MetricsRegistry,
+        repr=False,
+    )
     error_history: RuntimeErrorHistory = field(default_factory=list)
     manual_event_history: deque[ManualResilienceEventRecord] = field(
         default_factory=lambda: deque(maxlen=5),
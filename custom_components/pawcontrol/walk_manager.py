@@ -23,6 +23,9 @@ from typing import Any, Final, TypeVar, cast
 
 from homeassistant.util import dt as dt_util
 
+from .route_analytics import analyze_track
+from .route_simplify import StreamingTrack, simplify_route_points
+from .route_track import TrackBuffer
 from .types import (
     GPSCacheDiagnosticsMetadata,
     GPSCacheSnapshot,
@@ -67,6 +70,7 @@ class WeatherCondition(StrEnum):
 # OPTIMIZE: Performance constants
 GPS_CACHE_SIZE_LIMIT = 1000
 PATH_POINT_LIMIT = 500  # Limit path points to prevent memory leaks
+PATH_SIMPLIFY_TOLERANCE_M = 5.0  # Max deviation of dropped path points
 STATISTICS_CACHE_TTL = 300  # 5 minutes cache for statistics
 DISTANCE_CALCULATION_CACHE_SIZE = 100
 LOCATION_ANALYSIS_BATCH_SIZE = 10
@@ -330,6 +334,12 @@ class WalkManager:
         self._walk_data: dict[str, WalkStatisticsSnapshot] = {}
         self._gps_data: dict[str, WalkGPSSnapshot] = {}
         self._current_walks: dict[str, WalkSessionSnapshot] = {}
+        # Bounded, self-simplifying path buffers for active walks;
+        # ``current_walk["path"]`` is only materialised from these when a
+        # snapshot is read.  The synced map remembers which list/revision pair
+        # was last materialised so stale snapshots are never re-imported.
+        self._walk_tracks: dict[str, StreamingTrack] = {}
+        self._synced_paths: dict[str, tuple[list[WalkRoutePoint], int]] = {}
         self._walk_history: dict[str, list[WalkSessionSnapshot]] = {}
         self._session_counters: dict[str, int] = {}
         self._data_lock = asyncio.Lock()
@@ -383,6 +393,7 @@ class WalkManager:
         )
         active_walk = self._current_walks.get(dog_id)
         if active_walk is not None:
+            self._sync_walk_path(dog_id)
             container["active_walk"] = cast(
                 WalkSessionSnapshot,
                 dict(active_walk),
@@ -813,6 +824,8 @@ class WalkManager:
             walk_data["detection_metadata"] = detection_payload
 
         self._current_walks[dog_id] = walk_data
+        self._walk_tracks[dog_id] = self._new_walk_track()
+        self._synced_paths.pop(dog_id, None)
         # Update walk status
         self._walk_data[dog_id]["walk_in_progress"] = True
         self._walk_data[dog_id]["current_walk"] = walk_data
@@ -899,25 +912,26 @@ class WalkManager:
             },
         )
 
-        # OPTIMIZE: Calculate additional statistics with caching
-        if walk_data.get("path"):
-            # Optimize path if too many points
-            if len(walk_data["path"]) > PATH_POINT_LIMIT:
-                walk_data["path"] = self._optimize_path(walk_data["path"])
-                walk_data["path_optimization_applied"] = True
-
+        # OPTIMIZE: Calculate additional statistics straight from the track
+        track = self._walk_track(dog_id)
+        self._walk_tracks.pop(dog_id, None)
+        self._synced_paths.pop(dog_id, None)
+        if track:
+            # The streaming track accumulated distance, climb and top speed
+            # over every raw sample, so simplification does not skew them.
             walk_data["distance"] = await self._calculate_total_distance_optimized(
-                walk_data["path"],
+                track,
             )
             walk_data["average_speed"] = self._calculate_average_speed(
                 walk_data,
             )
-            walk_data["max_speed"] = self._calculate_max_speed(
-                walk_data["path"],
-            )
-            walk_data["elevation_gain"] = self._calculate_elevation_gain(
-                walk_data["path"],
-            )
+            walk_data["max_speed"] = self._calculate_max_speed(track)
+            walk_data["elevation_gain"] = self._calculate_elevation_gain(track)
+            if track.compactions:
+                walk_data["path_optimization_applied"] = True
+            walk_data["path_simplification"] = track.simplification_stats()
+            # History entries are persisted/exported, so materialise once here.
+            walk_data["path"] = track.to_route_points()
             walk_data["calories_burned"] = self._estimate_calories_burned(
                 dog_id,
                 walk_data,
@@ -980,10 +994,56 @@ class WalkManager:
                 save_route=save_route,
             )
 
+    @staticmethod
+    def _new_walk_track() -> StreamingTrack:
+        """Return an empty bounded track for an active walk."""
+        return StreamingTrack(
+            capacity=PATH_POINT_LIMIT,
+            tolerance_m=PATH_SIMPLIFY_TOLERANCE_M,
+        )
+
+    def _walk_track(self, dog_id: str) -> StreamingTrack:
+        """Return the active walk track, seeding it from a stored path if needed."""
+        track = self._walk_tracks.get(dog_id)
+        walk = self._current_walks.get(dog_id)
+        path = walk.get("path") if walk is not None else None
+        if not isinstance(path, list):
+            path = []
+        synced = self._synced_paths.get(dog_id)
+        # Restored sessions (or callers writing dictionaries directly) may hold
+        # more samples than the buffer; rebuild from them once.
+        if track is None or (
+            (synced is None or synced[0] is not path) and len(path) > len(track)
+        ):
+            track = self._new_walk_track()
+            track.extend_route_points(path)
+            if walk is not None:
+                self._walk_tracks[dog_id] = track
+        return track
+
+    def _sync_walk_path(self, dog_id: str) -> None:
+        """Materialise the active track into the walk snapshot when it changed."""
+        walk = self._current_walks.get(dog_id)
+        track = self._walk_tracks.get(dog_id)
+        if walk is None or track is None:
+            return
+        path = walk.get("path")
+        synced = self._synced_paths.get(dog_id)
+        if synced is not None and synced[0] is path and synced[1] == track.revision:
+            return
+        materialised = track.to_route_points()
+        walk["path"] = materialised
+        self._synced_paths[dog_id] = (materialised, track.revision)
+        container = self._dogs.get(dog_id)
+        active_walk = container.get("active_walk") if container is not None else None
+        if isinstance(active_walk, dict):
+            active_walk["path"] = materialised
+
     def _optimize_path(self, path: list[WalkRoutePoint]) -> list[WalkRoutePoint]:
         """Optimize walk path by removing redundant points.
 
-        OPTIMIZE: Reduce memory usage by removing points that don't add significant value.
+        OPTIMIZE: Douglas-Peucker simplification keeps corners and the tail of
+        the route while bounding the number of stored points.
 
         Args:
             path: Original path points
@@ -993,15 +1053,11 @@ class WalkManager:
         """
         if len(path) <= PATH_POINT_LIMIT:
             return path
-        # Keep start and end points
-        optimized = [path[0]]
-
-        # Sample points at regular intervals
-        interval = len(path) // (PATH_POINT_LIMIT - 2)
-        optimized.extend(path[i] for i in range(interval, len(path) - 1, interval))
-
-        # Always keep end point
-        optimized.append(path[-1])
+        optimized = simplify_route_points(
+            path,
+            PATH_SIMPLIFY_TOLERANCE_M,
+            max_points=PATH_POINT_LIMIT,
+        )
 
         _LOGGER.debug(
             "Optimized path: %d -> %d points",
@@ -1055,59 +1111,58 @@ class WalkManager:
                 speed or 0,
             )
 
-        # OPTIMIZE: Add to walk path if walk in progress with point limits
+        # OPTIMIZE: Add to the columnar walk track with point limits
         if dog_id in self._current_walks:
-            current_walk = self._current_walks[dog_id]
+            track = self._walk_track(dog_id)
+            now_ts = dt_util.now().timestamp()
             # Only add point if it's significant (distance > 5m or time > 30s since last point)
             should_add_point = True
-            if current_walk["path"]:
-                last_point = current_walk["path"][-1]
-                last_location = (
-                    last_point["latitude"],
-                    last_point["longitude"],
-                )
+            last_location = track.last_position()
+            last_time = track.last_timestamp()
+            if last_location is not None and last_time is not None:
                 last_distance = self._gps_cache.calculate_distance_cached(
                     last_location,
                     new_location,
                 )
 
                 # Only add if moved significantly or time passed
-                now = dt_util.now()
-                last_time = dt_util.parse_datetime(last_point["timestamp"])
-                time_diff = (now - last_time).total_seconds()
-
-                should_add_point = last_distance > 5.0 or time_diff > 30
-
-            if should_add_point and len(current_walk["path"]) < PATH_POINT_LIMIT:
-                path_point = cast(
-                    WalkRoutePoint,
-                    {
-                        "latitude": new_location[0],
-                        "longitude": new_location[1],
-                        "timestamp": dt_util.now().isoformat(),
-                        "accuracy": self._gps_data[dog_id].get("accuracy"),
-                        "speed": speed,
-                        "altitude": self._gps_data[dog_id].get("altitude"),
-                    },
+                should_add_point = last_distance > 5.0 or now_ts - last_time > 30
+
+            if should_add_point:
+                gps_data = self._gps_data.get(dog_id, {})
+                track.add(
+                    new_location[0],
+                    new_location[1],
+                    now_ts,
+                    accuracy=gps_data.get("accuracy"),
+                    speed=speed,
+                    altitude=gps_data.get("altitude"),
                 )
-                current_walk["path"].append(path_point)
 
     async def _calculate_total_distance_optimized(
         self,
-        path: list[WalkRoutePoint],
+        path: list[WalkRoutePoint] | TrackBuffer,
     ) -> float:
         """Calculate total distance with caching optimization.
 
         OPTIMIZE: Batch distance calculations for better performance.
 
         Args:
-            path: List of GPS path points
+            path: List of GPS path points or a columnar track
 
         Returns:
             Total distance in meters
         """
         if len(path) < 2:
             return 0.0
+        if isinstance(path, StreamingTrack):
+            return path.raw_distance_m
+        if isinstance(path, TrackBuffer):
+            analytics = analyze_track(path)
+            self._performance_metrics["distance_calculations"] += (
+                analytics.segment_count
+            )
+            return analytics.total_distance_m
         total_distance = 0.0
 
         # OPTIMIZE: Batch process distance calculations
@@ -1282,19 +1337,25 @@ class WalkManager:
             energy_level = "high"
         self._walk_data[dog_id]["energy_level"] = energy_level
 
-    def _calculate_elevation_gain(self, path: list[WalkRoutePoint]) -> float:
+    def _calculate_elevation_gain(
+        self, path: list[WalkRoutePoint] | TrackBuffer
+    ) -> float:
         """Calculate total elevation gain from path.
 
         OPTIMIZE: New feature for comprehensive walk analysis.
 
         Args:
-            path: List of GPS path points with altitude data
+            path: List of GPS path points with altitude data, or a track
 
         Returns:
             Total elevation gain in meters
         """
         if len(path) < 2:
             return 0.0
+        if isinstance(path, StreamingTrack):
+            return path.raw_elevation_gain_m
+        if isinstance(path, TrackBuffer):
+            return path.elevation_gain()
         total_gain = 0.0
         last_altitude = None
 
@@ -1333,18 +1394,19 @@ class WalkManager:
             data = cast(WalkStatisticsSnapshot, dict(self._walk_data[dog_id]))
             # Add current walk if in progress
             if dog_id in self._current_walks:
+                # Reuse the materialised path until the track gains samples.
+                track = self._walk_track(dog_id)
+                self._sync_walk_path(dog_id)
                 current_walk = cast(
                     WalkSessionSnapshot,
                     dict(self._current_walks[dog_id]),
                 )
 
                 # Calculate current walk duration and distance
-                if current_walk["path"]:
+                if track:
                     current_walk[
                         "current_distance"
-                    ] = await self._calculate_total_distance_optimized(
-                        current_walk["path"],
-                    )
+                    ] = await self._calculate_total_distance_optimized(track)
 
                 start_time = dt_util.parse_datetime(current_walk["start_time"])
                 current_walk["current_duration"] = (
@@ -1415,7 +1477,7 @@ class WalkManager:
                 ),
                 # Memory usage
                 "average_path_length": sum(
-                    len(walk["path"]) for walk in self._current_walks.values()
+                    len(self._walk_track(dog_id)) for dog_id in self._current_walks
                 )
                 / max(len(self._current_walks), 1),
             }
@@ -1425,6 +1487,7 @@ class WalkManager:
     async def async_get_current_walk(self, dog_id: str) -> WalkSessionSnapshot | None:
         """Get current walk data for a dog."""
         async with self._data_lock:
+            self._sync_walk_path(dog_id)
             return (
                 cast(WalkSessionSnapshot, dict(self._current_walks[dog_id]))
                 if dog_id in self._current_walks
@@ -1507,6 +1570,7 @@ class WalkManager:
         container = self._dogs.get(dog_id)
         if container is None:
             return None
+        self._sync_walk_path(dog_id)
         active_walk = container["active_walk"]
         if not active_walk:
             return None
@@ -1528,6 +1592,7 @@ class WalkManager:
         """Return a snapshot of walk data for a dog."""
         if dog_id not in self._dogs:
             return None
+        self._sync_walk_path(dog_id)
         active_walk = self._dogs[dog_id].get("active_walk")
         active_snapshot = (
             cast(WalkSessionSnapshot, dict(active_walk))
@@ -1647,8 +1712,14 @@ class WalkManager:
             return None
         return distance_km / duration_hours
 
-    def _calculate_max_speed(self, path: list[WalkRoutePoint]) -> float | None:
+    def _calculate_max_speed(
+        self, path: list[WalkRoutePoint] | TrackBuffer
+    ) -> float | None:
         """Calculate maximum speed from path."""
+        if isinstance(path, StreamingTrack):
+            return path.raw_max_speed
+        if isinstance(path, TrackBuffer):
+            return path.max_speed()
         speeds: list[float] = []
         for point in path:
             speed = point.get("speed")
@@ -1709,6 +1780,8 @@ class WalkManager:
             self._walk_data.clear()
             self._gps_data.clear()
             self._current_walks.clear()
+            self._walk_tracks.clear()
+            self._synced_paths.clear()
             self._walk_history.clear()
             self._location_analysis_queue.clear()
             self._statistics_cache.clear()
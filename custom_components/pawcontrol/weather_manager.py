@@ -8,10 +8,12 @@ Home Assistant: 2025.9.4+
 Python: 3.13+
 """
 
+import asyncio
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 import logging
 from typing import Any, Final, Literal, NamedTuple, TypedDict, TypeGuard, TypeVar, cast
 
@@ -105,6 +107,8 @@ ALERT_FIELD_TOKENS: Final[frozenset[AlertField]] = frozenset(("title", "message"
 PRIMARY_ACTIVITIES: Final[
     tuple[Literal["walk"], Literal["play"], Literal["exercise"]]
 ] = ("walk", "play", "exercise")
+# Callers sharing a weather entity reuse a refresh younger than this
+SHARED_REFRESH_MAX_AGE: Final[timedelta] = timedelta(seconds=30)
 
 
 def _is_alert_field(value: str) -> TypeGuard[AlertField]:
@@ -371,6 +375,13 @@ class WeatherAlert:
         elapsed = (dt_util.utcnow() - self.timestamp).total_seconds() / 3600
         return elapsed < self.duration_hours
 
+    @property
+    def expires_at(self) -> datetime | None:
+        """Return when the alert stops being active, if it has a duration."""
+        if self.duration_hours is None:
+            return None
+        return self.timestamp + timedelta(hours=self.duration_hours)
+
 
 @dataclass
 class WeatherConditions:
@@ -401,6 +412,52 @@ class WeatherConditions:
         return age_hours < 2
 
 
+class WeatherHealthSnapshot(NamedTuple):
+    """Weather evaluation shared by every dog.
+
+    ``version`` increases whenever the conditions are re-parsed, so consumers
+    can cache anything derived from the snapshot per version.  ``expires_at``
+    is when the first included alert lapses, after which the snapshot is
+    rebuilt even if the version is unchanged.
+    """
+
+    version: int
+    conditions: WeatherConditions | None
+    alerts: tuple[WeatherAlert, ...]
+    health_score: int
+    expires_at: datetime | None = None
+
+
+@lru_cache(maxsize=256)
+def _parse_weather_translation_key(key: str) -> WeatherTranslationParts | None:
+    """Normalise dotted translation keys into typed translation segments.
+
+    Alert builders pass the same literal keys on every evaluation, so the
+    parsed tuples are memoised instead of re-splitting the key each time.
+    """
+    segments = tuple(part for part in key.split(".") if part)
+    if segments and segments[0] == TRANSLATION_PREFIX:
+        segments = segments[1:]
+    if not segments:
+        return None
+    section = segments[0]
+    if section == "alerts":
+        if len(segments) != 3:
+            return None
+        alert_key, field_token = segments[1], segments[2]
+        if not _is_weather_alert_key(alert_key) or not _is_alert_field(field_token):
+            return None
+        return ("alerts", alert_key, field_token)
+    if section == "recommendations":
+        if len(segments) != 2:
+            return None
+        recommendation_key = segments[1]
+        if not _is_weather_recommendation_key(recommendation_key):
+            return None
+        return ("recommendations", recommendation_key)
+    return None
+
+
 class WeatherHealthManager:
     """Manages weather-based health warnings for dogs."""
 
@@ -420,8 +477,20 @@ class WeatherHealthManager:
         self._active_alerts: list[WeatherAlert] = []
         self._translations: WeatherTranslations = empty_weather_translations()
         self._english_translations: WeatherTranslations = self._translations
+        # Resolved (localized, english) templates keyed by dotted translation key
+        self._translation_templates: dict[str, tuple[str | None, str | None]] = {}
+        self._template_catalogs: tuple[WeatherTranslations, WeatherTranslations] = (
+            self._translations,
+            self._english_translations,
+        )
         self._current_forecast: WeatherForecast | None = None
 
+        # Single-flight refreshes shared by all dogs watching the same entity
+        self._weather_version = 0
+        self._health_snapshot: WeatherHealthSnapshot | None = None
+        self._refresh_tasks: dict[str, asyncio.Task[WeatherConditions | None]] = {}
+        self._refreshed_at: dict[str, datetime] = {}
+
         # RESILIENCE: Fault tolerance for weather API calls
         self.resilience_manager = resilience_manager
         self._retry_config = RetryConfig(
@@ -489,27 +558,7 @@ class WeatherHealthManager:
     @staticmethod
     def _parse_translation_key(key: str) -> WeatherTranslationParts | None:
         """Normalise dotted translation keys into typed translation segments."""
-        segments = tuple(part for part in key.split(".") if part)
-        if segments and segments[0] == TRANSLATION_PREFIX:
-            segments = segments[1:]
-        if not segments:
-            return None
-        section = segments[0]
-        if section == "alerts":
-            if len(segments) != 3:
-                return None
-            alert_key, field_token = segments[1], segments[2]
-            if not _is_weather_alert_key(alert_key) or not _is_alert_field(field_token):
-                return None
-            return ("alerts", alert_key, field_token)
-        if section == "recommendations":
-            if len(segments) != 2:
-                return None
-            recommendation_key = segments[1]
-            if not _is_weather_recommendation_key(recommendation_key):
-                return None
-            return ("recommendations", recommendation_key)
-        return None
+        return _parse_weather_translation_key(key)
 
     def _get_translation(self, key: str, **kwargs: Any) -> str:
         """Get translated string with variable substitution.
@@ -524,14 +573,7 @@ class WeatherHealthManager:
         parts = self._parse_translation_key(key)
         if parts is None:
             return key
-        try:
-            resolved = self._resolve_translation_value(
-                self._translations,
-                parts,
-            )
-        except ValueError as err:
-            _LOGGER.debug("Translation key not found: %s (%s)", key, err)
-            resolved = None
+        resolved, english = self._get_translation_templates(key, parts)
         if resolved is not None:
             if not kwargs:
                 return resolved
@@ -551,31 +593,48 @@ class WeatherHealthManager:
                     err,
                 )
 
-        return self._get_english_fallback(parts, key, **kwargs)
+        if english is None:
+            return key
+        try:
+            return english.format(**kwargs) if kwargs else english
+        except KeyError:
+            return english
+
+        except ValueError:
+            return english
 
-    def _get_english_fallback(
+    def _get_translation_templates(
         self,
+        key: str,
         parts: WeatherTranslationParts,
-        original_key: str,
-        **kwargs: Any,
-    ) -> str:
-        """Get English fallback text for translation keys."""
+    ) -> tuple[str | None, str | None]:
+        """Return the cached localized and English templates for ``key``.
+
+        Templates are resolved once per catalog pair; assigning new catalogs
+        (for example via :meth:`async_load_translations`) invalidates them.
+        """
+        catalogs = (self._translations, self._english_translations)
+        if (
+            catalogs[0] is not self._template_catalogs[0]
+            or catalogs[1] is not self._template_catalogs[1]
+        ):
+            self._translation_templates.clear()
+            self._template_catalogs = catalogs
+        elif (templates := self._translation_templates.get(key)) is not None:
+            return templates
+
         try:
-            resolved = self._resolve_translation_value(
-                self._english_translations,
-                parts,
-            )
-        except ValueError:
+            resolved = self._resolve_translation_value(catalogs[0], parts)
+        except ValueError as err:
+            _LOGGER.debug("Translation key not found: %s (%s)", key, err)
             resolved = None
-        if resolved is None:
-            return original_key
         try:
-            return resolved.format(**kwargs) if kwargs else resolved
-        except KeyError:
-            return resolved
-
+            english = self._resolve_translation_value(catalogs[1], parts)
         except ValueError:
-            return resolved
+            english = None
+        templates = (resolved, english)
+        self._translation_templates[key] = templates
+        return templates
 
     @staticmethod
     def _resolve_translation_value(
@@ -738,6 +797,7 @@ class WeatherHealthManager:
             self._calculate_derived_conditions()
             # Update alerts based on new conditions
             await self._update_weather_alerts()
+            self._weather_version += 1
             _LOGGER.debug(
                 "Updated weather conditions: %.1f°C, %s, UV: %s",
                 temperature_c or 0,
@@ -763,6 +823,78 @@ class WeatherHealthManager:
             )
             return None
 
+    async def async_refresh_shared(
+        self,
+        weather_entity_id: str,
+        *,
+        max_age: timedelta = SHARED_REFRESH_MAX_AGE,
+    ) -> WeatherHealthSnapshot:
+        """Refresh ``weather_entity_id`` once for all concurrent callers.
+
+        Concurrent callers await the same in-flight refresh, and callers that
+        arrive within ``max_age`` of the last refresh reuse its result without
+        re-parsing the entity or re-evaluating alerts.
+
+        Args:
+            weather_entity_id: Weather entity shared by the dogs
+            max_age: How long a completed refresh satisfies new callers
+
+        Returns:
+            The shared weather health snapshot
+        """
+        task = self._refresh_tasks.get(weather_entity_id)
+        if task is None:
+            refreshed_at = self._refreshed_at.get(weather_entity_id)
+            if refreshed_at is not None and dt_util.utcnow() - refreshed_at < max_age:
+                return self.get_health_snapshot()
+            task = asyncio.create_task(self._async_refresh_entity(weather_entity_id))
+            self._refresh_tasks[weather_entity_id] = task
+        # Shield so a cancelled caller does not cancel the shared refresh.
+        await asyncio.shield(task)
+        return self.get_health_snapshot()
+
+    async def _async_refresh_entity(
+        self,
+        weather_entity_id: str,
+    ) -> WeatherConditions | None:
+        """Run one shared refresh and record its completion.
+
+        Only successful refreshes are stamped, so a failed fetch is retried by
+        the next caller instead of being reused for ``max_age``.
+        """
+        try:
+            conditions = await self.async_update_weather_data(weather_entity_id)
+        finally:
+            self._refresh_tasks.pop(weather_entity_id, None)
+        if conditions is not None:
+            self._refreshed_at[weather_entity_id] = dt_util.utcnow()
+        return conditions
+
+    def get_health_snapshot(self) -> WeatherHealthSnapshot:
+        """Return active alerts and the health score for the current version."""
+        snapshot = self._health_snapshot
+        if (
+            snapshot is None
+            or snapshot.version != self._weather_version
+            or (
+                snapshot.expires_at is not None
+                and dt_util.utcnow() >= snapshot.expires_at
+            )
+        ):
+            alerts = tuple(self.get_active_alerts())
+            expiries = [
+                alert.expires_at for alert in alerts if alert.expires_at is not None
+            ]
+            snapshot = WeatherHealthSnapshot(
+                version=self._weather_version,
+                conditions=self._current_conditions,
+                alerts=alerts,
+                health_score=self.get_weather_health_score(),
+                expires_at=min(expiries, default=None),
+            )
+            self._health_snapshot = snapshot
+        return snapshot
+
     async def async_update_forecast_data(
         self,
         weather_entity_id: str | None = None,
@@ -2230,6 +2362,7 @@ class WeatherHealthManager:
         dog_breed: str | None = None,
         dog_age_months: int | None = None,
         health_conditions: list[str] | None = None,
+        alerts: Sequence[WeatherAlert] | None = None,
     ) -> list[str]:
         """Get personalized weather recommendations for specific dog.
 
@@ -2237,13 +2370,14 @@ class WeatherHealthManager:
             dog_breed: Dog breed for breed-specific recommendations
             dog_age_months: Dog age for age-specific recommendations
             health_conditions: List of health conditions
+            alerts: Pre-filtered active alerts, e.g. from a shared snapshot
 
         Returns:
             List of personalized recommendations
         """
         recommendations = []
 
-        active_alerts = self.get_active_alerts()
+        active_alerts = self.get_active_alerts() if alerts is None else alerts
         if not active_alerts:
             recommendations.append(
                 "Weather conditions are suitable for normal activities",
@@ -2320,9 +2454,14 @@ class WeatherHealthManager:
 
     async def async_cleanup(self) -> None:
         """Cleanup weather manager resources."""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+        self._refreshed_at.clear()
         self._active_alerts.clear()
         self._current_conditions = None
         self._current_forecast = None
+        self._weather_version += 1
         self._translations = empty_weather_translations()
         self._english_translations = self._translations
         _LOGGER.debug("Weather health manager cleaned up")
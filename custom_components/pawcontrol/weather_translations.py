@@ -10,6 +10,7 @@ from .translation_helpers import (
     async_get_component_translation_lookup,
     resolve_component_translation,
 )
+from .translation_index import get_bundled_translation_index
 
 
 class WeatherAlertTranslation(TypedDict):
@@ -145,6 +146,13 @@ def _weather_recommendation_key(recommendation: WeatherRecommendationKey) -> str
     return f"weather_recommendation_{recommendation}"
 
 
+_WEATHER_TEMPLATE_KEYS: Final[tuple[str, ...]] = (
+    *(_weather_alert_title_key(alert) for alert in _WEATHER_ALERT_KEYS),
+    *(_weather_alert_message_key(alert) for alert in _WEATHER_ALERT_KEYS),
+    *(_weather_recommendation_key(key) for key in _WEATHER_RECOMMENDATION_KEYS),
+)
+
+
 def empty_weather_translations() -> WeatherTranslations:
     """Return an empty weather translations payload."""
     return {"alerts": {}, "recommendations": {}}
@@ -173,12 +181,28 @@ def _load_static_common_translations(language: str) -> dict[str, str]:
     return {**fallback, **localized}
 
 
+def _load_static_weather_templates(language: str) -> dict[str, str]:
+    """Return the packaged weather templates available for ``language``.
+
+    Only the weather keys are resolved against the compiled translation index;
+    the JSON loader is used for trees without one.
+    """
+    if (index := get_bundled_translation_index()) is None:
+        return _load_static_common_translations(language)
+    templates = index.templates(language.lower(), _WEATHER_TEMPLATE_KEYS)
+    return {
+        key: template
+        for key, template in zip(_WEATHER_TEMPLATE_KEYS, templates, strict=True)
+        if template is not None
+    }
+
+
 def get_weather_translations(language: str) -> WeatherTranslations:
     """Return weather translations without requiring Home Assistant runtime APIs."""
     normalized_language = (
         language if language in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
     )
-    common = _load_static_common_translations(normalized_language)
+    common = _load_static_weather_templates(normalized_language)
     alerts: WeatherAlertTranslations = {
         alert_key: {
             "title": str(common.get(_weather_alert_title_key(alert_key), alert_key)),
@@ -8,7 +8,6 @@ Home Assistant: 2025.9.0+
 Python: 3.13+
 """
 
-from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
@@ -21,6 +20,7 @@ from homeassistant.core import HomeAssistant
 
 from .exceptions import AuthenticationError, RateLimitError, ValidationError
 from .logging_utils import StructuredLogger
+from .rate_limiter import SlidingWindowCounter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,41 +79,86 @@ class RateLimitState:
 
     Attributes:
         source: Source identifier (IP or user)
-        requests_minute: Requests in last minute
-        requests_hour: Requests in last hour
+        minute_window: Sliding request counter over the last minute
+        hour_window: Sliding request counter over the last hour
         banned_until: Ban expiration timestamp
         total_requests: Total requests from this source
+        last_request: Timestamp of the most recent request
     """
 
     source: str
-    requests_minute: deque[float] = field(default_factory=lambda: deque(maxlen=100))
-    requests_hour: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    minute_window: SlidingWindowCounter = field(
+        default_factory=lambda: SlidingWindowCounter(60.0)
+    )
+    hour_window: SlidingWindowCounter = field(
+        default_factory=lambda: SlidingWindowCounter(3600.0)
+    )
     banned_until: float | None = None
     total_requests: int = 0
+    last_request: float | None = None
 
-    def is_banned(self) -> bool:
+    def is_banned(self, now: float | None = None) -> bool:
         """Check if source is currently banned."""
         if self.banned_until is None:
             return False
-        return time.time() < self.banned_until
+        return (time.time() if now is None else now) < self.banned_until
 
     def add_request(self, timestamp: float | None = None) -> None:
         """Record a request."""
         if timestamp is None:
             timestamp = time.time()
-        self.requests_minute.append(timestamp)
-        self.requests_hour.append(timestamp)
+        self.minute_window.add(timestamp)
+        self.hour_window.add(timestamp)
         self.total_requests += 1
+        self.last_request = timestamp
 
-    def get_minute_count(self) -> int:
+    def get_minute_count(self, now: float | None = None) -> int:
         """Get request count in last minute."""
-        cutoff = time.time() - 60
-        return sum(1 for ts in self.requests_minute if ts > cutoff)
+        return self.minute_window.count(time.time() if now is None else now)
 
-    def get_hour_count(self) -> int:
+    def get_hour_count(self, now: float | None = None) -> int:
         """Get request count in last hour."""
-        cutoff = time.time() - 3600
-        return sum(1 for ts in self.requests_hour if ts > cutoff)
+        return self.hour_window.count(time.time() if now is None else now)
+
+
+class StreamingSignatureVerifier:
+    """Incremental HMAC verification for a chunked request body.
+
+    Created by :meth:`WebhookAuthenticator.begin_verification`; the digest
+    covers the same ``"{timestamp}:{payload}"`` message as
+    :meth:`WebhookAuthenticator.generate_signature`.
+    """
+
+    __slots__ = ("_logger", "_mac", "_signature")
+
+    def __init__(
+        self,
+        mac: hmac.HMAC,
+        signature: str,
+        logger: StructuredLogger,
+    ) -> None:
+        """Initialize the verifier with a MAC already primed with the timestamp."""
+        self._mac = mac
+        self._signature = signature
+        self._logger = logger
+
+    def update(self, chunk: bytes) -> None:
+        """Feed the next chunk of the payload."""
+        self._mac.update(chunk)
+
+    def verify(self) -> bool:
+        """Compare the accumulated digest with the provided signature.
+
+        Raises:
+            AuthenticationError: If the signature does not match
+        """
+        if not hmac.compare_digest(self._signature, self._mac.hexdigest()):
+            self._logger.error(
+                "Webhook signature verification failed",
+                provided_signature=self._signature[:16] + "...",
+            )
+            raise AuthenticationError("Invalid signature")
+        return True
 
 
 class WebhookAuthenticator:
@@ -167,21 +212,63 @@ class WebhookAuthenticator:
             timestamp = time.time()
         # Combine payload with timestamp
         message = f"{timestamp}:{payload.decode()}".encode()
-
-        # Generate HMAC — use hmac.new() with explicit digestmod keyword so
-        # the call is unambiguous under Python 3.14's stricter deprecation
-        # warnings.  ``getattr(hashlib, algorithm)`` resolves e.g. sha256.
-        digest_func = getattr(hashlib, self._algorithm, None)
-        if digest_func is None:
-            raise ValueError(f"Unsupported HMAC algorithm: {self._algorithm!r}")
         signature = hmac.new(
             self._secret,
             message,
-            digestmod=digest_func,
+            digestmod=self._digestmod(),
         ).hexdigest()
 
         return signature, timestamp
 
+    def _digestmod(self) -> Any:
+        """Return the hashlib constructor for the configured algorithm."""
+        # Pass hmac.new() an explicit digestmod so the call is unambiguous
+        # under Python 3.14's stricter deprecation warnings.
+        # ``getattr(hashlib, algorithm)`` resolves e.g. sha256.
+        digest_func = getattr(hashlib, self._algorithm, None)
+        if digest_func is None:
+            raise ValueError(f"Unsupported HMAC algorithm: {self._algorithm!r}")
+        return digest_func
+
+    def _check_timestamp(self, timestamp: float) -> None:
+        """Reject timestamps outside the allowed clock difference."""
+        current_time = time.time()
+        time_diff = abs(current_time - timestamp)
+
+        if time_diff > self._max_timestamp_diff:
+            self._logger.warning(
+                "Webhook timestamp too old",
+                timestamp=timestamp,
+                current_time=current_time,
+                diff=time_diff,
+            )
+            raise AuthenticationError(
+                f"Timestamp difference too large: {time_diff:.1f}s"
+            )
+
+    def begin_verification(
+        self,
+        signature: str,
+        timestamp: float,
+    ) -> StreamingSignatureVerifier:
+        """Start verifying a payload that is read in chunks.
+
+        The timestamp is checked immediately, so stale requests are rejected
+        before their body is read.  Feed every chunk to
+        :meth:`StreamingSignatureVerifier.update` and finish with
+        :meth:`StreamingSignatureVerifier.verify`.
+
+        Raises:
+            AuthenticationError: If the timestamp is outside the allowed window
+        """
+        self._check_timestamp(timestamp)
+        mac = hmac.new(
+            self._secret,
+            f"{timestamp}:".encode(),
+            digestmod=self._digestmod(),
+        )
+        return StreamingSignatureVerifier(mac, signature, self._logger)
+
     def verify_signature(
         self,
         payload: bytes,
@@ -202,19 +289,7 @@ class WebhookAuthenticator:
             AuthenticationError: If verification fails
         """
         # Check timestamp is recent
-        current_time = time.time()
-        time_diff = abs(current_time - timestamp)
-
-        if time_diff > self._max_timestamp_diff:
-            self._logger.warning(
-                "Webhook timestamp too old",
-                timestamp=timestamp,
-                current_time=current_time,
-                diff=time_diff,
-            )
-            raise AuthenticationError(
-                f"Timestamp difference too large: {time_diff:.1f}s"
-            )
+        self._check_timestamp(timestamp)
         # Generate expected signature
         expected_signature, _ = self.generate_signature(payload, timestamp)
 
@@ -265,9 +340,11 @@ class WebhookRateLimiter:
             config: Rate limit configuration
         """
         self._config = config or RateLimitConfig()
-        self._states: dict[str, RateLimitState] = defaultdict(
-            lambda: RateLimitState(source="unknown")
-        )
+        # Ordered by last request so idle sources can be evicted from the front.
+        self._states: dict[str, RateLimitState] = {}
+        self._idle_seconds = max(3600.0, self._config.ban_duration_seconds)
+        self._evicted_sources = 0
+        self._evicted_requests = 0
         self._logger = StructuredLogger(__name__)
 
     def check_limit(self, source: str) -> None:
@@ -279,12 +356,16 @@ class WebhookRateLimiter:
         Raises:
             RateLimitError: If rate limit exceeded
         """
-        state = self._states[source]
-        state.source = source
+        now = time.time()
+        self._evict_idle(now)
+        state = self._states.pop(source, None)
+        if state is None:
+            state = RateLimitState(source=source)
+        self._states[source] = state
 
         # Check if banned
-        if state.is_banned():
-            remaining = state.banned_until - time.time() if state.banned_until else 0
+        if state.is_banned(now):
+            remaining = state.banned_until - now if state.banned_until else 0
             self._logger.warning(
                 "Blocked request from banned source",
                 source=source,
@@ -296,10 +377,10 @@ class WebhookRateLimiter:
             )
 
         # Record request
-        state.add_request()
+        state.add_request(now)
 
         # Check minute limit
-        minute_count = state.get_minute_count()
+        minute_count = state.get_minute_count(now)
         if minute_count > self._config.requests_per_minute:
             self._ban_source(state)
             raise RateLimitError(
@@ -308,7 +389,7 @@ class WebhookRateLimiter:
             )
 
         # Check hour limit
-        hour_count = state.get_hour_count()
+        hour_count = state.get_hour_count(now)
         if hour_count > self._config.requests_per_hour:
             self._ban_source(state)
             raise RateLimitError(
@@ -325,6 +406,22 @@ class WebhookRateLimiter:
                 limit=self._config.requests_per_minute,
             )
 
+    def _evict_idle(self, now: float) -> None:
+        """Forget sources without requests for longer than the idle period.
+
+        The idle period covers the hour window and the ban duration, so an
+        evicted source has neither pending counts nor an active ban.
+        """
+        cutoff = now - self._idle_seconds
+        states = self._states
+        while states:
+            state = next(iter(states.values()))
+            if state.last_request is not None and state.last_request > cutoff:
+                break
+            del states[state.source]
+            self._evicted_sources += 1
+            self._evicted_requests += state.total_requests
+
     def _ban_source(self, state: RateLimitState) -> None:
         """Ban a source temporarily.
 
@@ -345,13 +442,16 @@ class WebhookRateLimiter:
         Returns:
             Statistics dictionary
         """
-        total_requests = sum(s.total_requests for s in self._states.values())
+        total_requests = self._evicted_requests + sum(
+            s.total_requests for s in self._states.values()
+        )
         banned_sources = sum(1 for s in self._states.values() if s.is_banned())
 
         return {
             "total_sources": len(self._states),
             "total_requests": total_requests,
             "banned_sources": banned_sources,
+            "evicted_sources": self._evicted_sources,
             "config": {
                 "requests_per_minute": self._config.requests_per_minute,
                 "requests_per_hour": self._config.requests_per_hour,
@@ -1,6 +1,10 @@
 """Webhook endpoints for PawControl push updates (e.g., GPS tracker push).
 
 This enables a real push path without relying on periodic polling.
+
+Request bodies are streamed: the payload size limit is enforced while reading,
+HMAC signatures are verified incrementally over the same chunks and the JSON
+body is decoded with ``orjson`` when it is available.
 """
 
 from collections.abc import Mapping
@@ -24,11 +28,31 @@ from .const import (
     DOMAIN,
 )
 from .exceptions import AuthenticationError
-from .push_router import async_process_gps_push
-from .webhook_security import WebhookAuthenticator
+from .push_router import (
+    async_process_gps_push,
+    async_process_gps_push_batch,
+    get_payload_limit,
+    is_batch_payload,
+)
+from .webhook_security import StreamingSignatureVerifier, WebhookAuthenticator
+
+try:  # pragma: no cover - orjson ships with Home Assistant core
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 _LOGGER = logging.getLogger(__name__)
 
+_READ_CHUNK_SIZE = 16 * 1024
+
+# Authenticators are stateless apart from their secret, so one instance per
+# config entry is reused across requests.  Each is stored with the secret it
+# was built for and replaced when the entry's secret rotates.
+_AUTHENTICATORS: dict[str, tuple[str, WebhookAuthenticator]] = {}
+
 
 def _any_dog_expects_webhook(entry: ConfigEntry) -> bool:
     dogs = entry.data.get(CONF_DOGS, [])
@@ -131,6 +155,7 @@ async def async_unregister_entry_webhook(
     entry: ConfigEntry,
 ) -> None:
     """Unregister the push webhook endpoint for a config entry."""
+    _AUTHENTICATORS.pop(entry.entry_id, None)
     webhook_id = entry.options.get(CONF_WEBHOOK_ID)
     if not isinstance(webhook_id, str) or not webhook_id:
         return
@@ -165,9 +190,17 @@ async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: Any) ->
         "accuracy": 15.2,
         "timestamp": "2026-01-29T12:34:56Z"
       }
+
+    Buffered trackers may send a batch instead; each point may override the
+    batch ``dog_id`` and the response lists per-point acceptance results:
+      {
+        "dog_id": "dino",
+        "points": [
+          {"latitude": 52.52, "longitude": 13.405, "timestamp": "..."},
+          ...
+        ]
+      }
     """
-    # Read raw body once (we need it for HMAC verification and JSON parse)
-    raw = await request.read()
     headers: Mapping[str, str] = request.headers
     # Resolve which entry owns this webhook_id
     entry = _resolve_entry_for_webhook_id(hass, webhook_id)
@@ -180,6 +213,7 @@ async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: Any) ->
         )
     )
     secret = entry.options.get(CONF_WEBHOOK_SECRET)
+    verifier: StreamingSignatureVerifier | None = None
     if require_sig:
         if not isinstance(secret, str) or not secret:
             return _json_response(
@@ -198,15 +232,39 @@ async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: Any) ->
             return _json_response(
                 {"ok": False, "error": "invalid_signature"}, status=401
             )
-        authenticator = WebhookAuthenticator(secret=secret)
         try:
-            authenticator.verify_signature(raw, signature, timestamp)
+            verifier = _authenticator_for(entry.entry_id, secret).begin_verification(
+                signature, timestamp
+            )
+        except AuthenticationError:
+            return _json_response(
+                {"ok": False, "error": "invalid_signature"}, status=401
+            )
+
+    raw, size = await _async_read_body(request, get_payload_limit(entry), verifier)
+    if raw is None:
+        if verifier is not None:
+            # Unauthenticated oversize bodies are dropped without telemetry.
+            return _json_response(
+                {"ok": False, "error": "payload_too_large"}, status=413
+            )
+        result = await async_process_gps_push(
+            hass, entry, {}, source="webhook", raw_size=size
+        )
+        return _json_response(
+            {"ok": False, "error": result.get("error") or "payload_too_large"},
+            status=int(result.get("status", 413)),
+        )
+
+    if verifier is not None:
+        try:
+            verifier.verify()
         except AuthenticationError:
             return _json_response(
                 {"ok": False, "error": "invalid_signature"}, status=401
             )
     try:
-        payload = json.loads(raw.decode("utf-8"))
+        payload = _json_loads(raw)
     except Exception:
         return _json_response({"ok": False, "error": "invalid_json"}, status=400)
 
@@ -217,12 +275,31 @@ async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: Any) ->
     if isinstance(payload.get("nonce"), str) and payload.get("nonce"):
         nonce = cast(str, payload.get("nonce"))
 
+    if is_batch_payload(payload):
+        batch = await async_process_gps_push_batch(
+            hass,
+            entry,
+            cast(Mapping[str, Any], payload),
+            source="webhook",
+            raw_size=size,
+            nonce=nonce,
+        )
+        batch_body: dict[str, Any] = {
+            "ok": bool(batch.get("ok")),
+            "accepted": batch.get("accepted", 0),
+            "rejected": batch.get("rejected", 0),
+            "results": batch.get("results", []),
+        }
+        if "error" in batch:
+            batch_body["error"] = batch["error"]
+        return _json_response(batch_body, status=int(batch.get("status", 200)))
+
     result = await async_process_gps_push(
         hass,
         entry,
         cast(Mapping[str, Any], payload),
         source="webhook",
-        raw_size=len(raw),
+        raw_size=size,
         nonce=nonce,
     )
 
@@ -237,6 +314,51 @@ async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: Any) ->
     return _json_response(body, status=status)
 
 
+def _authenticator_for(entry_id: str, secret: str) -> WebhookAuthenticator:
+    """Return the cached authenticator for ``entry_id``, rebuilt on rotation."""
+    cached = _AUTHENTICATORS.get(entry_id)
+    if cached is not None and cached[0] == secret:
+        return cached[1]
+    authenticator = WebhookAuthenticator(secret=secret)
+    _AUTHENTICATORS[entry_id] = (secret, authenticator)
+    return authenticator
+
+
+async def _async_read_body(
+    request: Any,
+    limit: int,
+    verifier: StreamingSignatureVerifier | None,
+) -> tuple[bytes | None, int]:
+    """Read the request body in chunks, stopping once it exceeds ``limit``.
+
+    Returns the body and its size, or ``None`` and the bytes seen so far when
+    the limit was exceeded.  Every accepted chunk is fed to ``verifier``.
+    """
+    declared = getattr(request, "content_length", None)
+    if isinstance(declared, int) and declared > limit:
+        return None, declared
+
+    iter_chunked = getattr(getattr(request, "content", None), "iter_chunked", None)
+    if not callable(iter_chunked):
+        raw = await request.read()
+        if len(raw) > limit:
+            return None, len(raw)
+        if verifier is not None:
+            verifier.update(raw)
+        return raw, len(raw)
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in iter_chunked(_READ_CHUNK_SIZE):
+        size += len(chunk)
+        if size > limit:
+            return None, size
+        if verifier is not None:
+            verifier.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), size
+
+
 def _resolve_entry_for_webhook_id(
     hass: HomeAssistant, webhook_id: str
 ) -> ConfigEntry | None:
@@ -0,0 +1,72 @@
+"""Compile PawControl's bundled translations into a key-indexed table.
+
+Runtime helpers read ``custom_components/pawcontrol/compiled_translations.jsonl``
+instead of parsing every ``translations/<language>.json`` file.  Re-run this
+script whenever a translation file changes; ``--check`` fails when the
+committed table is out of date.
+"""
+
+import argparse
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+# Resolve project root independent of CWD
+ROOT = Path(__file__).resolve().parents[1]
+INTEGRATION_PATH = ROOT / "custom_components" / "pawcontrol"
+
+
+def _load_translation_index_module(integration_path: Path) -> ModuleType:
+    """Import ``translation_index`` without importing the integration package."""
+    spec = importlib.util.spec_from_file_location(
+        "pawcontrol_translation_index",
+        integration_path / "translation_index.py",
+    )
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+def main(argv: list[str] | None = None) -> int:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--integration-path",
+        type=Path,
+        default=INTEGRATION_PATH,
+        help="Path to the PawControl integration directory.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Validate only; exit 1 when the compiled table is out of date.",
+    )
+    args = parser.parse_args(argv)
+
+    integration_path: Path = args.integration_path
+    module = _load_translation_index_module(integration_path)
+    translations_dir = integration_path / "translations"
+    if not any(translations_dir.glob("*.json")):
+        raise SystemExit(f"No translation files found in {translations_dir}")
+
+    output_path = integration_path / module.COMPILED_TRANSLATIONS_FILENAME
+    compiled = module.compile_translation_index(translations_dir)
+    current = output_path.read_bytes() if output_path.exists() else None
+
+    if compiled == current:
+        print(f"{output_path.name} is up to date.")
+        return 0
+    if args.check:
+        print(
+            f"{output_path.name} is out of date; run "
+            "'python -m scripts.compile_translations'."
+        )
+        return 1
+
+    output_path.write_bytes(compiled)
+    print(f"Wrote {output_path.name} ({len(compiled)} bytes).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -237,6 +237,35 @@ async def test_async_patch_gps_update_merges_latest_module_payloads() -> None:
     assert updates and updates[-1]["dog-1"]["gps"]["lat"] == 50.0
 
 
+@pytest.mark.asyncio
+async def test_async_patch_gps_updates_publishes_once_for_many_dogs() -> None:
+    """Batched GPS patches update every known dog with a single publish."""
+    coordinator = _make_coordinator()
+    coordinator.registry = _DummyRegistry(["dog-1", "dog-2"])
+    coordinator._setup_complete = True
+    coordinator.last_update_success = True
+    coordinator._data = {"dog-1": {}, "dog-2": {}}
+
+    async def _gps_payload(dog_id: str) -> dict[str, str]:
+        return {"dog": dog_id}
+
+    async def _geofencing_payload(_dog_id: str) -> dict[str, bool]:
+        return {"inside_zone": False}
+
+    coordinator._modules = SimpleNamespace(
+        gps=SimpleNamespace(async_get_data=_gps_payload),
+        geofencing=SimpleNamespace(async_get_data=_geofencing_payload),
+    )
+    updates: list[dict[str, Any]] = []
+    coordinator.async_set_updated_data = lambda data: updates.append(data)
+
+    await coordinator.async_patch_gps_updates(["dog-1", "dog-2", "dog-1", "ghost"])
+
+    assert len(updates) == 1
+    assert updates[0]["dog-1"]["gps"] == {"dog": "dog-1"}
+    assert updates[0]["dog-2"]["gps"] == {"dog": "dog-2"}
+
+
 @pytest.mark.asyncio
 async def test_async_patch_gps_update_requests_refresh_when_state_not_ready() -> None:
     """GPS patch should early-return through refresh guard if cache is unready."""
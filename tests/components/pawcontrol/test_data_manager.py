@@ -375,7 +375,6 @@ async def _init_data_manager_for_export_tests(
         dogs_config=[{DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"}],
     )
     manager._async_load_storage = AsyncMock(return_value={})  # type: ignore[method-assign]
-    manager._write_storage = AsyncMock()  # type: ignore[method-assign]
     await manager.async_initialize()
     return manager
 
@@ -462,6 +461,7 @@ async def test_async_generate_report_propagates_persist_errors(  # noqa: D103
     tmp_path: Path,
 ) -> None:
     manager = await _init_data_manager_for_export_tests(mock_hass, tmp_path)
+    manager._namespace_flush_delay = 0.0
     manager._save_namespace = AsyncMock(side_effect=HomeAssistantError("persist boom"))  # type: ignore[method-assign]
 
     with pytest.raises(HomeAssistantError, match="persist boom"):
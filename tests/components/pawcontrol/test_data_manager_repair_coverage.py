@@ -20,7 +20,6 @@ async def _create_manager(mock_hass: object, tmp_path: Path) -> PawControlDataMa
         dogs_config=[{DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"}],
     )
     manager._async_load_storage = AsyncMock(return_value={})  # type: ignore[method-assign]
-    manager._write_storage = AsyncMock()  # type: ignore[method-assign]
     await manager.async_initialize()
     return manager
 
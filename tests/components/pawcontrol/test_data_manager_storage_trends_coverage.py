@@ -1,5 +1,6 @@
 """Targeted branch coverage for PawControlDataManager storage and trend helpers."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 import importlib.util
 import json
@@ -21,6 +22,7 @@ from custom_components.pawcontrol.data_manager import (
 from custom_components.pawcontrol.types import (
     DOG_ID_FIELD,
     DOG_NAME_FIELD,
+    FeedingData,
     GPSLocation,
     WalkData,
 )
@@ -34,12 +36,9 @@ async def _create_manager(mock_hass: object, tmp_path: Path) -> PawControlDataMa
         dogs_config=[{DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"}],
     )
     original_load_storage = manager._async_load_storage
-    original_write_storage = manager._write_storage
     manager._async_load_storage = AsyncMock(return_value={})  # type: ignore[method-assign]
-    manager._write_storage = AsyncMock()  # type: ignore[method-assign]
     await manager.async_initialize()
     manager._async_load_storage = original_load_storage  # type: ignore[method-assign]
-    manager._write_storage = original_write_storage  # type: ignore[method-assign]
     return manager
 
 
@@ -875,6 +874,7 @@ async def test_namespace_update_restore_and_profile_persistence_errors(  # noqa:
     tmp_path: Path,
 ) -> None:
     manager = await _create_manager(mock_hass, tmp_path)
+    manager._namespace_flush_delay = 0.0
     manager._namespace_state["reports"] = {"buddy": {"existing": True}}
     manager._get_namespace_data = AsyncMock(  # type: ignore[method-assign]
         return_value={"buddy": {"existing": True}},
@@ -922,7 +922,6 @@ async def test_async_initialize_uses_mapping_payload_and_invalid_config_raises(
             },
         },
     )
-    manager._write_storage = AsyncMock()  # type: ignore[method-assign]
     await manager.async_initialize()
     assert "buddy" in manager._dog_profiles
 
@@ -1269,6 +1268,97 @@ async def test_save_namespace_updates_state_and_wraps_oserror(  # noqa: D103
         await manager._save_namespace("reports", {"buddy": {"count": 2}})
 
 
+@pytest.mark.asyncio
+async def test_namespace_updates_are_coalesced_into_one_flush(
+    mock_hass: object,
+    tmp_path: Path,
+) -> None:
+    """Bursts of namespace updates should reach disk as a single write."""
+    manager = await _create_manager(mock_hass, tmp_path)
+    path = manager._namespace_path("reports")
+
+    for count in range(5):
+        await manager._update_namespace_for_dog(
+            "reports",
+            "buddy",
+            lambda _current, count=count: {"count": count},
+        )
+
+    assert not path.exists()
+    assert await manager._get_namespace_data("reports") == {"buddy": {"count": 4}}
+    snapshot = manager._namespace_flush_snapshot("reports")
+    assert snapshot["pending"] is True
+    assert snapshot["coalesced_writes"] == 4
+
+    await manager.async_flush_namespaces()
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"buddy": {"count": 4}}
+    snapshot = manager._namespace_flush_snapshot("reports")
+    assert snapshot["flushes"] == 1
+    assert snapshot["pending"] is False
+    assert snapshot["bytes_written"] == path.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_namespace_updates(
+    mock_hass: object,
+    tmp_path: Path,
+) -> None:
+    """Pending write-behind updates must be persisted on shutdown."""
+    manager = await _create_manager(mock_hass, tmp_path)
+    await manager._update_namespace_for_dog(
+        "reports",
+        "buddy",
+        lambda _current: {"count": 1},
+    )
+    assert manager._namespace_flush_handles
+
+    await manager.async_shutdown()
+
+    path = manager._namespace_path("reports")
+    assert json.loads(path.read_text(encoding="utf-8")) == {"buddy": {"count": 1}}
+    assert not manager._namespace_dirty_since
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_in_flight_namespace_flush(
+    mock_hass: object,
+    tmp_path: Path,
+) -> None:
+    """Shutdown must not return while a write-behind flush is still writing."""
+    manager = await _create_manager(mock_hass, tmp_path)
+    await manager._update_namespace_for_dog(
+        "reports",
+        "buddy",
+        lambda _current: {"count": 1},
+    )
+    started = asyncio.Event()
+    release = asyncio.Event()
+    original_save = manager._save_namespace
+
+    async def _slow_save(namespace: str, data: Any) -> None:
+        started.set()
+        await release.wait()
+        await original_save(namespace, data)
+
+    manager._save_namespace = _slow_save  # type: ignore[method-assign]
+    manager._start_namespace_flush("reports")
+    await started.wait()
+    (in_flight,) = manager._namespace_flush_tasks
+
+    shutdown = asyncio.create_task(manager.async_shutdown())
+    await asyncio.sleep(0.01)
+    assert not shutdown.done()
+
+    release.set()
+    await shutdown
+
+    assert in_flight.done()
+    assert not manager._namespace_flush_handles
+    path = manager._namespace_path("reports")
+    assert json.loads(path.read_text(encoding="utf-8")) == {"buddy": {"count": 1}}
+
+
 @pytest.mark.asyncio
 async def test_async_add_executor_job_supports_mock_real_and_fallback_paths(  # noqa: D103
     mock_hass: object,
@@ -1364,16 +1454,9 @@ async def test_async_save_dog_data_wraps_oserror(  # noqa: D103
         await manager._async_save_dog_data("buddy")
 
 
-def test_read_storage_payload_and_create_backup(  # noqa: D103
-    tmp_path: Path, mock_hass: object
+def test_read_storage_payload(  # noqa: D103
+    tmp_path: Path,
 ) -> None:
-    mock_hass.config.config_dir = str(tmp_path)  # type: ignore[attr-defined]
-    manager = PawControlDataManager(
-        mock_hass,  # type: ignore[arg-type]
-        entry_id="entry-storage-trends",
-        dogs_config=[],
-    )
-
     missing = tmp_path / "missing.json"
     assert PawControlDataManager._read_storage_payload(missing) is None
 
@@ -1381,11 +1464,106 @@ def test_read_storage_payload_and_create_backup(  # noqa: D103
     source.write_text('{"value": 1}', encoding="utf-8")
     assert PawControlDataManager._read_storage_payload(source) == {"value": 1}
 
-    manager._storage_path = tmp_path / "storage.json"  # type: ignore[assignment]
-    manager._backup_path = tmp_path / "backup.json"  # type: ignore[assignment]
-    manager._create_backup()
-    assert not manager._backup_path.exists()
 
-    manager._storage_path.write_text('{"dog":"buddy"}', encoding="utf-8")
-    manager._create_backup()
-    assert manager._backup_path.read_text(encoding="utf-8") == '{"dog":"buddy"}'
+@pytest.mark.asyncio
+async def test_feeding_log_appends_to_dog_shard_journal(  # noqa: D103
+    mock_hass: object,
+    tmp_path: Path,
+) -> None:
+    mock_hass.config.config_dir = str(tmp_path)  # type: ignore[attr-defined]
+    manager = PawControlDataManager(
+        mock_hass,  # type: ignore[arg-type]
+        entry_id="entry-shards",
+        dogs_config=[
+            {DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"},
+            {DOG_ID_FIELD: "max", DOG_NAME_FIELD: "Max"},
+        ],
+    )
+    await manager.async_initialize()
+    shard_store = manager._shard_store
+
+    for dog_id in ("buddy", "max"):
+        await manager._async_save_dog_data(dog_id)
+    max_snapshot = shard_store.snapshot_path("max").read_text(encoding="utf-8")
+
+    feeding = FeedingData(
+        meal_type="breakfast",
+        portion_size=150.0,
+        food_type="dry_food",
+        timestamp=datetime.now(UTC),
+    )
+    assert await manager.async_log_feeding("buddy", feeding)
+
+    journal_lines = (
+        shard_store.journal_path("buddy").read_text(encoding="utf-8").splitlines()
+    )
+    records = [json.loads(line) for line in journal_lines]
+    assert [record["f"] for record in records] == ["feeding_history", "daily_stats"]
+    assert records[0]["a"][0]["portion_size"] == 150.0
+    assert shard_store.snapshot_path("max").read_text(encoding="utf-8") == (
+        max_snapshot
+    )
+    assert not shard_store.journal_path("max").read_text(encoding="utf-8")
+    assert manager.get_metrics()["storage_shards"]["journal_records"] == 2
+
+    reloaded = PawControlDataManager(
+        mock_hass,  # type: ignore[arg-type]
+        entry_id="entry-shards",
+        dogs_config=[{DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"}],
+    )
+    await reloaded.async_initialize()
+    history = reloaded.get_feeding_history("buddy")
+    assert len(history) == 1
+    assert history[0]["meal_type"] == "breakfast"
+
+
+@pytest.mark.asyncio
+async def test_legacy_store_is_migrated_once_and_shard_errors_surface(  # noqa: D103
+    mock_hass: object,
+    tmp_path: Path,
+) -> None:
+    mock_hass.config.config_dir = str(tmp_path)  # type: ignore[attr-defined]
+    dogs_config = [
+        {DOG_ID_FIELD: "buddy", DOG_NAME_FIELD: "Buddy"},
+        {DOG_ID_FIELD: "max", DOG_NAME_FIELD: "Max"},
+    ]
+    legacy_payload = {
+        "buddy": {"feeding_history": [{"meal_type": "legacy"}]},
+        "max": {"feeding_history": [{"meal_type": "legacy"}]},
+    }
+    manager = PawControlDataManager(
+        mock_hass,  # type: ignore[arg-type]
+        entry_id="entry-migration",
+        dogs_config=dogs_config,
+    )
+    manager._async_load_storage = AsyncMock(  # type: ignore[method-assign]
+        return_value=legacy_payload,
+    )
+    await manager.async_initialize()
+    shard_store = manager._shard_store
+    assert shard_store.snapshot_path("buddy").exists()
+    assert shard_store.snapshot_path("max").exists()
+
+    reloaded = PawControlDataManager(
+        mock_hass,  # type: ignore[arg-type]
+        entry_id="entry-migration",
+        dogs_config=dogs_config,
+    )
+    reloaded._async_load_storage = AsyncMock(  # type: ignore[method-assign]
+        return_value=legacy_payload,
+    )
+    await reloaded.async_initialize()
+    reloaded._async_load_storage.assert_not_awaited()
+
+    shard_store.snapshot_path("max").write_text("{not json", encoding="utf-8")
+    broken = PawControlDataManager(
+        mock_hass,  # type: ignore[arg-type]
+        entry_id="entry-migration",
+        dogs_config=dogs_config,
+    )
+    broken._async_load_storage = AsyncMock(  # type: ignore[method-assign]
+        return_value=legacy_payload,
+    )
+    with pytest.raises(HomeAssistantError, match="Unable to read PawControl shard"):
+        await broken.async_initialize()
+    broken._async_load_storage.assert_not_awaited()
@@ -2,7 +2,9 @@
 
 from collections.abc import Mapping
 from types import SimpleNamespace
+from typing import cast
 from unittest.mock import AsyncMock
+from urllib.parse import parse_qs, urlsplit
 
 from aiohttp import ClientError, ClientTimeout
 from aiohttp.client_exceptions import ContentTypeError
@@ -478,3 +480,107 @@ async def test_async_get_json_propagates_rate_limit_error_without_json_parsing()
 
     with pytest.raises(RateLimitError):
         await client.async_get_json("/api/status")
+
+
+class _StubDeviceServer:
+    """Session stub serving feeding payloads like the companion firmware."""
+
+    closed = False
+
+    def __init__(self, dogs: dict[str, dict[str, object]], *, bulk: bool) -> None:
+        self.dogs = dogs
+        self.bulk = bulk
+        self.version = 1
+        self.paths: list[str] = []
+        self.decoded = 0
+
+    async def request(self, method: str, url: URL, **kwargs: object) -> _FakeResponse:
+        parts = urlsplit(str(url))
+        self.paths.append(parts.path)
+        etag = f'"v{self.version}"'
+        headers = cast(dict[str, str], kwargs.get("headers") or {})
+        if headers.get("If-None-Match") == etag:
+            return _FakeResponse(status=304, headers={"ETag": etag})
+
+        if parts.path == "/api/dogs/feeding":
+            if not self.bulk:
+                return _FakeResponse(status=404, text_payload="not found")
+            ids = parse_qs(parts.query)["dog_ids"][0].split(",")
+            payload: object = {"dogs": {dog_id: self.dogs[dog_id] for dog_id in ids}}
+        else:
+            payload = self.dogs[parts.path.split("/")[3]]
+        server = self
+
+        class _CountingResponse(_FakeResponse):
+            async def json(self) -> object:
+                server.decoded += 1
+                return await super().json()
+
+        return _CountingResponse(json_payload=payload, headers={"ETag": etag})
+
+
+@pytest.mark.asyncio
+async def test_bulk_feeding_fetch_uses_one_request_and_conditional_revalidation() -> (
+    None
+):
+    """All dogs load in one round trip and unchanged payloads skip JSON decoding."""
+    dogs = {f"dog-{index}": {"meals": index} for index in range(5)}
+    server = _StubDeviceServer(dogs, bulk=True)
+    client = PawControlDeviceClient(server, endpoint="https://example.test")
+
+    first = await client.async_get_feeding_payloads(list(dogs))
+    second = await client.async_get_feeding_payloads(list(dogs))
+
+    assert first == second == dogs
+    assert server.paths == ["/api/dogs/feeding"] * 2
+    assert server.decoded == 1
+    diagnostics = client.get_diagnostics()
+    assert diagnostics["requests"] == 2
+    assert diagnostics["not_modified"] == 1
+    assert diagnostics["json_decoded"] == 1
+    assert diagnostics["bulk_supported"] is True
+    assert diagnostics["connection_pool"] is None
+
+    server.connector = SimpleNamespace(  # type: ignore[attr-defined]
+        limit=100, limit_per_host=0, _conns={"host": [object()]}
+    )
+    assert client.get_diagnostics()["connection_pool"] == {
+        "limit": 100,
+        "limit_per_host": 0,
+    }
+
+    server.version += 1
+    dogs["dog-0"]["meals"] = 9
+    third = await client.async_get_feeding_payloads(list(dogs))
+    assert third["dog-0"] == {"meals": 9}
+    assert server.decoded == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_feeding_fetch_falls_back_to_per_dog_requests() -> None:
+    """Devices without the bulk endpoint are probed once, then queried per dog."""
+    dogs = {f"dog-{index}": {"meals": index} for index in range(3)}
+    server = _StubDeviceServer(dogs, bulk=False)
+    client = PawControlDeviceClient(server, endpoint="https://example.test")
+
+    assert await client.async_get_feeding_payloads(list(dogs)) == dogs
+    assert await client.async_get_feeding_payloads(list(dogs)) == dogs
+
+    assert server.paths.count("/api/dogs/feeding") == 1
+    assert len(server.paths) == 1 + 2 * len(dogs)
+    assert server.decoded == len(dogs)
+    diagnostics = client.get_diagnostics()
+    assert diagnostics["bulk_fallbacks"] == 1
+    assert diagnostics["bulk_supported"] is False
+    assert diagnostics["not_modified"] == len(dogs)
+
+
+@pytest.mark.asyncio
+async def test_bulk_feeding_fetch_encodes_dog_ids_in_query() -> None:
+    """Dog identifiers with reserved characters survive the bulk query string."""
+    dogs = {"rex&max": {"meals": 1}, "luna bell": {"meals": 2}}
+    server = _StubDeviceServer(dogs, bulk=True)
+    client = PawControlDeviceClient(server, endpoint="https://example.test")
+
+    assert await client.async_get_feeding_payloads(list(dogs)) == dogs
+    assert server.paths == ["/api/dogs/feeding"]
@@ -1,7 +1,6 @@
 """Hotspot package 3: feeding manager state/compliance regression coverage."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock
 
 import pytest
 
@@ -31,9 +30,12 @@ async def test_batch_add_feedings_rejects_missing_dog_id_payload(hass) -> None:
 
 @pytest.mark.asyncio
 async def test_batch_add_feedings_dispatches_contiguous_events_in_order(hass) -> None:
-    """Batch dispatch should preserve order and forward per-entry arguments."""
+    """Batch inserts group entries per dog but keep input order and arguments."""
     manager = FeedingManager(hass)
-    manager.async_add_feeding = AsyncMock(side_effect=["first", "second"])
+    await manager.async_initialize([
+        {"dog_id": "dog-1", "weight": 20.0},
+        {"dog_id": "dog-2", "weight": 12.0},
+    ])
 
     result = await manager.async_batch_add_feedings([
         {
@@ -48,16 +50,17 @@ async def test_batch_add_feedings_dispatches_contiguous_events_in_order(hass) ->
             "timestamp": datetime(2026, 4, 7, 12, 0, tzinfo=UTC),
             "notes": "manual correction",
         },
+        {"dog_id": "dog-1", "amount": 40.0, "meal_type": "snack"},
     ])
 
-    assert result == ["first", "second"]
-    assert manager.async_add_feeding.await_count == 2
-    first_call = manager.async_add_feeding.await_args_list[0]
-    second_call = manager.async_add_feeding.await_args_list[1]
-    assert first_call.args == ("dog-1",)
-    assert first_call.kwargs["meal_type"] == "breakfast"
-    assert second_call.args == ("dog-2",)
-    assert second_call.kwargs["notes"] == "manual correction"
+    assert [event.amount for event in result] == [90.0, 110.0, 40.0]
+    assert result[0].meal_type is MealType.BREAKFAST
+    assert result[0].scheduled is True
+    assert result[1].notes == "manual correction"
+    assert manager._feedings["dog-1"] == [result[0], result[2]]
+    assert manager._feedings["dog-2"] == [result[1]]
+    # The snapshot of every touched dog is rebuilt once and cached.
+    assert set(manager._data_cache) == {"dog-1", "dog-2"}
 
 
 @pytest.mark.asyncio
@@ -48,19 +48,11 @@ def test_translated_grooming_label_resolves_cached_translations(
     """Helpers should resolve and format translated labels when hass is available."""
     hass = SimpleNamespace()
 
+    translations = {"grooming_label_button_notes": "Notes for {dog_name}"}
     monkeypatch.setattr(
         grooming_translations,
-        "get_cached_component_translation_lookup",
-        lambda _hass, _language: (
-            {"grooming_label_button_notes": "Notes for {dog_name}"},
-            {},
-        ),
-    )
-
-    monkeypatch.setattr(
-        grooming_translations,
-        "resolve_component_translation",
-        lambda translations, _fallback, key, default: translations.get(key, default),
+        "get_cached_component_template",
+        lambda _hass, _language, key, default: translations.get(key, default),
     )
 
     assert (
@@ -80,21 +72,13 @@ def test_translated_grooming_template_handles_known_and_unknown_keys(
     """Template helper should format fallback strings and translated templates."""
     hass = SimpleNamespace()
 
+    translations = {
+        "grooming_template_notification_title": "Grooming for {dog_name}",
+    }
     monkeypatch.setattr(
         grooming_translations,
-        "get_cached_component_translation_lookup",
-        lambda _hass, _language: (
-            {
-                "grooming_template_notification_title": "Grooming for {dog_name}",
-            },
-            {},
-        ),
-    )
-
-    monkeypatch.setattr(
-        grooming_translations,
-        "resolve_component_translation",
-        lambda translations, _fallback, key, default: translations.get(key, default),
+        "get_cached_component_template",
+        lambda _hass, _language, key, default: translations.get(key, default),
     )
 
     assert (
@@ -20,6 +20,11 @@ from custom_components.pawcontrol import (
     async_setup,
     get_platforms_for_profile_and_modules,
 )
+from custom_components.pawcontrol.telemetry import (
+    get_bool_coercion_metrics,
+    record_bool_coercion_event,
+    reset_bool_coercion_metrics,
+)
 
 
 @dataclass
@@ -147,6 +152,32 @@ def test_enable_debug_logging_returns_false_when_disabled(  # noqa: D103
     assert logger.level == logging.WARNING
 
 
+def test_bool_coercion_repr_capture_follows_debug_logging(
+    _reset_global_state: None,
+) -> None:
+    """Value reprs are only captured while debug logging is active."""
+    logger = logging.getLogger("custom_components.pawcontrol")
+    logger.setLevel(logging.INFO)
+
+    def _last_repr() -> str | None:
+        reset_bool_coercion_metrics()
+        record_bool_coercion_event(
+            value="yes", default=False, result=True, reason="truthy_string"
+        )
+        return get_bool_coercion_metrics()["last_value_repr"]
+
+    assert _enable_debug_logging(_DummyEntry("entry-off")) is False
+    assert _last_repr() is None
+
+    entry = _DummyEntry("entry-debug", {"debug_logging": True})
+    assert _enable_debug_logging(entry) is True
+    assert _last_repr() == "'yes'"
+
+    _disable_debug_logging(entry)
+    assert _last_repr() is None
+    reset_bool_coercion_metrics()
+
+
 def test_enable_debug_logging_reuses_existing_entry(
     _reset_global_state: None,
 ) -> None:
@@ -1,4 +1,5 @@
-from datetime import UTC, datetime, timedelta  # noqa: D100
+import asyncio  # noqa: D100
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
 from aiohttp import ClientSession
@@ -18,6 +19,7 @@ from custom_components.pawcontrol.module_adapters import (
     _normalise_health_alert,
     _normalise_health_medication,
 )
+from custom_components.pawcontrol.weather_manager import WeatherHealthSnapshot
 
 
 class _FrozenTime:
@@ -32,6 +34,24 @@ class _DummyAdapter(_BaseModuleAdapter[dict[str, str]]):
     pass
 
 
+class _WeatherManagerStub:
+    """Serve the shared weather API from the per-test stub methods."""
+
+    async def async_refresh_shared(self, entity_id: str, *, max_age: timedelta) -> None:
+        await self.async_update_weather_data(entity_id)
+
+    async def async_update_weather_data(self, entity_id: str) -> None:
+        return None
+
+    def get_health_snapshot(self) -> WeatherHealthSnapshot:
+        return WeatherHealthSnapshot(
+            version=1,
+            alerts=tuple(self.get_active_alerts()),
+            conditions=self.get_current_conditions(),
+            health_score=self.get_weather_health_score(),
+        )
+
+
 class _FakeFeedingManager:
     def __init__(self) -> None:
         self.calls = 0
@@ -400,7 +420,7 @@ async def test_weather_module_adapter_builds_ready_payload_and_caches() -> None:
     update_calls: list[str] = []
     recommendation_calls: list[tuple[str | None, int | None, list[str] | None]] = []
 
-    class _Manager:
+    class _Manager(_WeatherManagerStub):
         async def async_update_weather_data(self, entity_id: str) -> None:
             update_calls.append(entity_id)
 
@@ -424,6 +444,7 @@ async def test_weather_module_adapter_builds_ready_payload_and_caches() -> None:
             dog_breed: str | None,
             dog_age_months: int | None,
             health_conditions: list[str] | None,
+            alerts: tuple[object, ...] = (),
         ) -> list[str]:
             recommendation_calls.append(
                 (dog_breed, dog_age_months, health_conditions),
@@ -470,7 +491,7 @@ async def test_weather_module_adapter_returns_error_payload_on_manager_failure()
         ttl=timedelta(minutes=5),
     )
 
-    class _BrokenManager:
+    class _BrokenManager(_WeatherManagerStub):
         async def async_update_weather_data(self, entity_id: str) -> None:
             raise RuntimeError(f"cannot refresh {entity_id}")
 
@@ -756,6 +777,134 @@ async def test_feeding_adapter_external_api_success_sets_ready_and_caches() -> N
         assert await adapter.async_get_data("dog-1") is payload
 
 
+@pytest.mark.asyncio
+async def test_feeding_adapter_coalesces_concurrent_dogs_into_bulk_fetch() -> None:  # noqa: D103
+    class _BulkClient:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        async def async_get_feeding_payload(self, dog_id: str) -> dict[str, object]:
+            raise AssertionError("per-dog fetch should not be used")
+
+        async def async_get_feeding_payloads(
+            self, dog_ids: list[str]
+        ) -> dict[str, dict[str, object]]:
+            self.batches.append(list(dog_ids))
+            return {dog_id: {"dog_id": dog_id} for dog_id in dog_ids if dog_id != "x"}
+
+    client = _BulkClient()
+    async with ClientSession() as session:
+        adapter = FeedingModuleAdapter(
+            session=session,
+            ttl=timedelta(minutes=5),
+            use_external_api=True,
+            api_client=client,
+        )
+        payloads = await asyncio.gather(
+            *(adapter.async_get_data(f"dog-{index}") for index in range(4))
+        )
+        with pytest.raises(NetworkError, match="no feeding data for x"):
+            await adapter.async_get_data("x")
+
+    assert [payload["dog_id"] for payload in payloads] == [
+        "dog-0",
+        "dog-1",
+        "dog-2",
+        "dog-3",
+    ]
+    assert client.batches == [["dog-0", "dog-1", "dog-2", "dog-3"], ["x"]]
+
+
+@pytest.mark.asyncio
+async def test_feeding_adapter_bulk_fetch_waits_for_staggered_dogs() -> None:  # noqa: D103
+    class _BulkClient:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        async def async_get_feeding_payloads(
+            self, dog_ids: list[str]
+        ) -> dict[str, dict[str, object]]:
+            self.batches.append(list(dog_ids))
+            return {dog_id: {"dog_id": dog_id} for dog_id in dog_ids}
+
+    async def _staggered(adapter: FeedingModuleAdapter, index: int) -> object:
+        for _ in range(index * 3):
+            await asyncio.sleep(0)
+        return await adapter.async_get_data(f"dog-{index}")
+
+    client = _BulkClient()
+    async with ClientSession() as session:
+        adapter = FeedingModuleAdapter(
+            session=session,
+            ttl=timedelta(minutes=5),
+            use_external_api=True,
+            api_client=client,
+        )
+        await asyncio.gather(*(_staggered(adapter, index) for index in range(3)))
+
+    assert client.batches == [["dog-0", "dog-1", "dog-2"]]
+
+
+@pytest.mark.asyncio
+async def test_feeding_adapter_bulk_fetch_skips_window_once_all_dogs_joined(  # noqa: D103
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _BulkClient:
+        async def async_get_feeding_payloads(
+            self, dog_ids: list[str]
+        ) -> dict[str, dict[str, object]]:
+            return {dog_id: {"dog_id": dog_id} for dog_id in dog_ids}
+
+    monkeypatch.setattr(module_adapters, "_BULK_FETCH_WINDOW_SECONDS", 30.0)
+    async with ClientSession() as session:
+        adapter = FeedingModuleAdapter(
+            session=session,
+            ttl=timedelta(minutes=5),
+            use_external_api=True,
+            api_client=_BulkClient(),
+            dog_count=1,
+        )
+        async with asyncio.timeout(1):
+            payload = await adapter.async_get_data("dog-1")
+
+    assert payload["dog_id"] == "dog-1"
+
+
+@pytest.mark.asyncio
+async def test_feeding_adapter_cancelled_flush_fails_waiting_dogs() -> None:  # noqa: D103
+    request_started = asyncio.Event()
+
+    class _HangingClient:
+        async def async_get_feeding_payloads(
+            self, dog_ids: list[str]
+        ) -> dict[str, dict[str, object]]:
+            request_started.set()
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+    async with ClientSession() as session:
+        adapter = FeedingModuleAdapter(
+            session=session,
+            ttl=timedelta(minutes=5),
+            use_external_api=True,
+            api_client=_HangingClient(),
+            dog_count=2,
+        )
+        fetches = [
+            asyncio.create_task(adapter.async_get_data(dog_id))
+            for dog_id in ("dog-1", "dog-2")
+        ]
+        await request_started.wait()
+        assert adapter._flush_task is not None
+        adapter._flush_task.cancel()
+
+        async with asyncio.timeout(1):
+            results = await asyncio.gather(*fetches, return_exceptions=True)
+
+    assert all(isinstance(result, NetworkError) for result in results)
+    assert adapter._pending_payloads == {}
+
+
 @pytest.mark.asyncio
 async def test_walk_and_garden_adapters_return_cached_payloads() -> None:  # noqa: D103
     walk_adapter = WalkModuleAdapter(ttl=timedelta(minutes=5))
@@ -857,7 +1006,7 @@ async def test_health_and_weather_adapters_cover_cache_and_optional_branches() -
         ttl=timedelta(minutes=5),
     )
 
-    class _WeatherManager:
+    class _WeatherManager(_WeatherManagerStub):
         def get_active_alerts(self) -> list[SimpleNamespace]:
             return []
 
@@ -867,6 +1016,7 @@ async def test_health_and_weather_adapters_cover_cache_and_optional_branches() -
             dog_breed: str | None,
             dog_age_months: int | None,
             health_conditions: list[str] | None,
+            alerts: tuple[object, ...] = (),
         ) -> list[str]:
             assert dog_breed is None
             assert dog_age_months == 7
@@ -888,7 +1038,7 @@ async def test_health_and_weather_adapters_cover_cache_and_optional_branches() -
         ttl=timedelta(minutes=5),
     )
 
-    class _WeatherManagerNoDogConfig:
+    class _WeatherManagerNoDogConfig(_WeatherManagerStub):
         def get_active_alerts(self) -> list[SimpleNamespace]:
             return []
 
@@ -898,6 +1048,7 @@ async def test_health_and_weather_adapters_cover_cache_and_optional_branches() -
             dog_breed: str | None,
             dog_age_months: int | None,
             health_conditions: list[str] | None,
+            alerts: tuple[object, ...] = (),
         ) -> list[str]:
             assert dog_breed is None
             assert dog_age_months is None
@@ -1024,7 +1175,7 @@ async def test_weather_adapter_parses_string_age_when_building_recommendations()
 ):
     recommendations_calls: list[tuple[str | None, int | None, list[str] | None]] = []
 
-    class _WeatherManager:
+    class _WeatherManager(_WeatherManagerStub):
         def get_active_alerts(self) -> list[SimpleNamespace]:
             return []
 
@@ -1034,6 +1185,7 @@ async def test_weather_adapter_parses_string_age_when_building_recommendations()
             dog_breed: str | None,
             dog_age_months: int | None,
             health_conditions: list[str] | None,
+            alerts: tuple[object, ...] = (),
         ) -> list[str]:
             recommendations_calls.append((dog_breed, dog_age_months, health_conditions))
             return []
@@ -1063,7 +1215,7 @@ async def test_weather_adapter_parses_string_age_when_building_recommendations()
 async def test_weather_adapter_ignores_non_scalar_age_values() -> None:  # noqa: D103
     recommendations_calls: list[tuple[str | None, int | None, list[str] | None]] = []
 
-    class _WeatherManager:
+    class _WeatherManager(_WeatherManagerStub):
         def get_active_alerts(self) -> list[SimpleNamespace]:
             return []
 
@@ -1073,6 +1225,7 @@ async def test_weather_adapter_ignores_non_scalar_age_values() -> None:  # noqa:
             dog_breed: str | None,
             dog_age_months: int | None,
             health_conditions: list[str] | None,
+            alerts: tuple[object, ...] = (),
         ) -> list[str]:
             recommendations_calls.append((dog_breed, dog_age_months, health_conditions))
             return []
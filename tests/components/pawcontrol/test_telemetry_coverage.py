@@ -187,6 +187,67 @@ def test_build_runtime_store_assessment_segments_uses_duration_fallback_for_last
     assert segments[1]["status"] == "diverged"
 
 
+def test_entity_factory_guard_collector_handles_none_runtime_and_clamps() -> None:
+    """Guard samples are ignored without runtime data and clamp invalid input."""
+    telemetry.record_runtime_entity_factory_guard_sample(
+        None,
+        runtime_floor=5.0,
+        actual_duration=1.0,
+        event="stable",
+        baseline_floor=4.0,
+        max_floor=10.0,
+        enforce_min_runtime=False,
+    )
+    assert telemetry.get_runtime_entity_factory_guard_collector(None) is None
+
+    runtime_data = SimpleNamespace(performance_stats={})
+    telemetry.record_runtime_entity_factory_guard_sample(
+        runtime_data,
+        runtime_floor=0.0,
+        actual_duration=-5.0,
+        event="unknown",
+        baseline_floor=2.0,
+        max_floor=20.0,
+        enforce_min_runtime=False,
+    )
+    metrics = telemetry.get_runtime_entity_factory_guard_metrics(runtime_data)
+
+    assert metrics is not None
+    assert metrics["samples"] == 1
+    assert metrics["runtime_floor"] == 0.0
+    assert metrics["last_actual_duration"] == 0.0
+    assert metrics["stable_ratio"] == 0.0
+    assert metrics["recent_events"] == ["unknown"]
+
+
+def test_entity_factory_guard_collector_trims_windows_and_keeps_longest_run() -> None:
+    """Recent windows stay bounded and stable runs keep their historical maximum."""
+    runtime_data = SimpleNamespace(performance_stats={})
+    events = ["stable"] * 4 + ["contract"] + ["stable"] * 2
+    for index, event in enumerate(events):
+        telemetry.record_runtime_entity_factory_guard_sample(
+            runtime_data,
+            runtime_floor=8.0,
+            actual_duration=float(index + 1),
+            event=event,
+            baseline_floor=2.0,
+            max_floor=20.0,
+            enforce_min_runtime=True,
+        )
+    metrics = telemetry.get_runtime_entity_factory_guard_metrics(runtime_data)
+
+    assert metrics is not None
+    assert metrics["samples"] == 7
+    assert metrics["contractions"] == 1
+    assert metrics["last_contraction_duration"] == 5.0
+    assert metrics["recent_durations"] == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert len(metrics["recent_events"]) == 5
+    assert metrics["consecutive_stable_samples"] == 2
+    assert metrics["longest_stable_run"] == 4
+    assert metrics["min_duration"] == 1.0
+    assert metrics["max_duration"] == 7.0
+
+
 def test_update_runtime_entity_factory_guard_metrics_calculates_regressing_trend() -> (
     None
 ):
@@ -223,6 +284,140 @@ def test_update_runtime_entity_factory_guard_metrics_calculates_regressing_trend
     assert metrics["stability_trend"] == "regressing"
 
 
+def test_entity_factory_guard_metrics_init_none_runtime_and_defaults() -> None:
+    """Guard metrics helper should initialize defaults and handle None runtime data."""
+    assert (
+        telemetry.update_runtime_entity_factory_guard_metrics(
+            None,
+            runtime_floor=5.0,
+            actual_duration=1.0,
+            event="stable",
+            baseline_floor=4.0,
+            max_floor=10.0,
+            enforce_min_runtime=False,
+        )
+        is None
+    )
+
+    runtime_data = SimpleNamespace(
+        performance_stats={"entity_factory_guard_metrics": "invalid"},
+    )
+    metrics = telemetry.update_runtime_entity_factory_guard_metrics(
+        runtime_data,
+        runtime_floor=0.0,
+        actual_duration=-5.0,
+        event="unknown",
+        baseline_floor=2.0,
+        max_floor=20.0,
+        enforce_min_runtime=False,
+    )
+
+    assert metrics is not None
+    assert metrics["samples"] == 1
+    assert metrics["runtime_floor"] == 0.0
+    assert metrics["stable_ratio"] >= 0.0
+    assert metrics["recent_events"][-1] == "unknown"
+
+
+def test_entity_factory_guard_metrics_cover_contract_stable_and_trim_branches() -> None:
+    """Guard metrics should handle contract/stable events and trimming windows."""
+    runtime_data_trim = SimpleNamespace(
+        performance_stats={
+            "entity_factory_guard_metrics": {
+                "schema_version": 1,
+                "samples": -1,
+                "stable_samples": 0,
+                "expansions": 0,
+                "contractions": 0,
+                "stable_ratio": 0.1,
+                "lowest_runtime_floor": 5.0,
+                "recent_durations": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "recent_events": ["expand", "expand", "expand", "expand", "expand"],
+            }
+        },
+    )
+    metrics_trim = telemetry.update_runtime_entity_factory_guard_metrics(
+        runtime_data_trim,
+        runtime_floor=3.0,
+        actual_duration=6.0,
+        event="stable",
+        baseline_floor=2.0,
+        max_floor=20.0,
+        enforce_min_runtime=False,
+    )
+    assert metrics_trim is not None
+    assert metrics_trim["samples"] == 0
+    assert metrics_trim["stable_ratio"] == 0.0
+    assert len(metrics_trim["recent_durations"]) == 5
+    assert len(metrics_trim["recent_events"]) == 5
+    assert metrics_trim["stability_trend"] == "improving"
+
+    runtime_data_contract = SimpleNamespace(
+        performance_stats={
+            "entity_factory_guard_metrics": {
+                "schema_version": 1,
+                "samples": 2,
+                "stable_samples": 1,
+                "expansions": 1,
+                "contractions": 0,
+                "average_duration": 2.0,
+                "max_duration": 4.0,
+                "min_duration": 1.0,
+                "runtime_floor": 10.0,
+                "stable_ratio": 0.5,
+            }
+        },
+    )
+    metrics_contract = telemetry.update_runtime_entity_factory_guard_metrics(
+        runtime_data_contract,
+        runtime_floor=8.0,
+        actual_duration=3.0,
+        event="contract",
+        baseline_floor=2.0,
+        max_floor=20.0,
+        enforce_min_runtime=True,
+    )
+    assert metrics_contract is not None
+    assert metrics_contract["samples"] == 3
+    assert metrics_contract["contractions"] == 1
+    assert metrics_contract["average_duration"] > 0.0
+    assert metrics_contract["max_duration"] >= 4.0
+    assert metrics_contract["min_duration"] <= 3.0
+
+
+def test_update_runtime_entity_factory_guard_metrics_stable_run_not_extended() -> None:
+    """Stable samples below the longest run should keep the historical max run."""
+    runtime_data = SimpleNamespace(
+        performance_stats={
+            "entity_factory_guard_metrics": {
+                "schema_version": 1,
+                "samples": 5,
+                "stable_samples": 2,
+                "expansions": 1,
+                "contractions": 1,
+                "runtime_floor": 5.0,
+                "consecutive_stable_samples": 3,
+                "longest_stable_run": 10,
+            }
+        },
+    )
+
+    metrics = telemetry.update_runtime_entity_factory_guard_metrics(
+        runtime_data,
+        runtime_floor=5.0,
+        actual_duration=2.0,
+        event="stable",
+        baseline_floor=4.0,
+        max_floor=20.0,
+        enforce_min_runtime=True,
+    )
+
+    assert metrics is not None
+    assert metrics["consecutive_stable_samples"] == 4
+    assert metrics["longest_stable_run"] == 10
+
+
+
 def test_runtime_store_timeline_summary_and_event_recording_fallbacks() -> None:
     """Timeline helpers should reuse stored summaries and support no-op recordings."""
     events = [
@@ -336,41 +531,6 @@ def test_runtime_resilience_getters_and_update_helpers() -> None:
     assert telemetry.get_runtime_resilience_diagnostics(runtime_data) is None
 
 
-def test_entity_factory_guard_metrics_init_none_runtime_and_defaults() -> None:
-    """Guard metrics helper should initialize defaults and handle None runtime data."""
-    assert (
-        telemetry.update_runtime_entity_factory_guard_metrics(
-            None,
-            runtime_floor=5.0,
-            actual_duration=1.0,
-            event="stable",
-            baseline_floor=4.0,
-            max_floor=10.0,
-            enforce_min_runtime=False,
-        )
-        is None
-    )
-
-    runtime_data = SimpleNamespace(
-        performance_stats={"entity_factory_guard_metrics": "invalid"},
-    )
-    metrics = telemetry.update_runtime_entity_factory_guard_metrics(
-        runtime_data,
-        runtime_floor=0.0,
-        actual_duration=-5.0,
-        event="unknown",
-        baseline_floor=2.0,
-        max_floor=20.0,
-        enforce_min_runtime=False,
-    )
-
-    assert metrics is not None
-    assert metrics["samples"] == 1
-    assert metrics["runtime_floor"] == 0.0
-    assert metrics["stable_ratio"] >= 0.0
-    assert metrics["recent_events"][-1] == "unknown"
-
-
 def test_record_door_sensor_persistence_failure_without_optional_error_history() -> (
     None
 ):
@@ -439,72 +599,6 @@ def test_runtime_resilience_update_branch_matrix() -> None:
     assert "resilience_summary" not in runtime_data.performance_stats
 
 
-def test_entity_factory_guard_metrics_cover_contract_stable_and_trim_branches() -> None:
-    """Guard metrics should handle contract/stable events and trimming windows."""
-    runtime_data_trim = SimpleNamespace(
-        performance_stats={
-            "entity_factory_guard_metrics": {
-                "schema_version": 1,
-                "samples": -1,
-                "stable_samples": 0,
-                "expansions": 0,
-                "contractions": 0,
-                "stable_ratio": 0.1,
-                "lowest_runtime_floor": 5.0,
-                "recent_durations": [1.0, 2.0, 3.0, 4.0, 5.0],
-                "recent_events": ["expand", "expand", "expand", "expand", "expand"],
-            }
-        },
-    )
-    metrics_trim = telemetry.update_runtime_entity_factory_guard_metrics(
-        runtime_data_trim,
-        runtime_floor=3.0,
-        actual_duration=6.0,
-        event="stable",
-        baseline_floor=2.0,
-        max_floor=20.0,
-        enforce_min_runtime=False,
-    )
-    assert metrics_trim is not None
-    assert metrics_trim["samples"] == 0
-    assert metrics_trim["stable_ratio"] == 0.0
-    assert len(metrics_trim["recent_durations"]) == 5
-    assert len(metrics_trim["recent_events"]) == 5
-    assert metrics_trim["stability_trend"] == "improving"
-
-    runtime_data_contract = SimpleNamespace(
-        performance_stats={
-            "entity_factory_guard_metrics": {
-                "schema_version": 1,
-                "samples": 2,
-                "stable_samples": 1,
-                "expansions": 1,
-                "contractions": 0,
-                "average_duration": 2.0,
-                "max_duration": 4.0,
-                "min_duration": 1.0,
-                "runtime_floor": 10.0,
-                "stable_ratio": 0.5,
-            }
-        },
-    )
-    metrics_contract = telemetry.update_runtime_entity_factory_guard_metrics(
-        runtime_data_contract,
-        runtime_floor=8.0,
-        actual_duration=3.0,
-        event="contract",
-        baseline_floor=2.0,
-        max_floor=20.0,
-        enforce_min_runtime=True,
-    )
-    assert metrics_contract is not None
-    assert metrics_contract["samples"] == 3
-    assert metrics_contract["contractions"] == 1
-    assert metrics_contract["average_duration"] > 0.0
-    assert metrics_contract["max_duration"] >= 4.0
-    assert metrics_contract["min_duration"] <= 3.0
-
-
 def test_record_door_sensor_persistence_failure_error_history_without_error_field() -> (
     None
 ):
@@ -522,76 +616,6 @@ def test_record_door_sensor_persistence_failure_error_history_without_error_fiel
     assert "error" not in latest
 
 
-def test_update_runtime_entity_factory_guard_metrics_handles_missing_previous_floor(
-    monkeypatch,
-) -> None:
-    """Guard metrics should default floor-change deltas when previous floor resolves missing."""
-    import builtins
-
-    runtime_data = SimpleNamespace(performance_stats={})
-    baseline_floor = 7.123
-    coerced_once = {"done": False}
-
-    def _patched_max(*args, **kwargs):  # type: ignore[no-untyped-def]
-        if (
-            not coerced_once["done"]
-            and len(args) == 2
-            and args[0] == baseline_floor
-            and args[1] == 0.0
-        ):
-            coerced_once["done"] = True
-            return None
-        return builtins.max(*args, **kwargs)
-
-    monkeypatch.setattr(telemetry, "max", _patched_max, raising=False)
-
-    metrics = telemetry.update_runtime_entity_factory_guard_metrics(
-        runtime_data,
-        runtime_floor=3.0,
-        actual_duration=1.0,
-        event="expand",
-        baseline_floor=baseline_floor,
-        max_floor=15.0,
-        enforce_min_runtime=False,
-    )
-
-    assert metrics is not None
-    assert metrics["last_floor_change"] == 0.0
-    assert metrics["last_floor_change_ratio"] == 0.0
-
-
-def test_update_runtime_entity_factory_guard_metrics_stable_run_not_extended() -> None:
-    """Stable samples below the longest run should keep the historical max run."""
-    runtime_data = SimpleNamespace(
-        performance_stats={
-            "entity_factory_guard_metrics": {
-                "schema_version": 1,
-                "samples": 5,
-                "stable_samples": 2,
-                "expansions": 1,
-                "contractions": 1,
-                "runtime_floor": 5.0,
-                "consecutive_stable_samples": 3,
-                "longest_stable_run": 10,
-            }
-        },
-    )
-
-    metrics = telemetry.update_runtime_entity_factory_guard_metrics(
-        runtime_data,
-        runtime_floor=5.0,
-        actual_duration=2.0,
-        event="stable",
-        baseline_floor=4.0,
-        max_floor=20.0,
-        enforce_min_runtime=True,
-    )
-
-    assert metrics is not None
-    assert metrics["consecutive_stable_samples"] == 4
-    assert metrics["longest_stable_run"] == 10
-
-
 def test_record_bool_coercion_event_honours_sample_limit() -> None:
     """Bool coercion sample storage should stop appending after the configured cap."""
     telemetry.reset_bool_coercion_metrics()
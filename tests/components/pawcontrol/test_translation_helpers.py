@@ -14,6 +14,7 @@ from custom_components.pawcontrol.translation_helpers import (
     async_get_component_translations,
     async_preload_component_translations,
     component_translation_key,
+    get_cached_component_template,
     get_cached_component_translation_lookup,
     get_cached_component_translations,
     load_bundled_component_translations_fresh,
@@ -112,6 +113,32 @@ def test_cached_component_translation_lookup_uses_self_fallback_for_english() ->
     assert translations is fallback
 
 
+def test_cached_component_template_reads_bundled_index_slots() -> None:
+    """Templates come from the bundled index unless runtime data is cached."""
+    hass = SimpleNamespace(data={})
+
+    assert (
+        get_cached_component_template(
+            hass, "de", "grooming_label_button_action", default="x"
+        )
+        == "Pflegesitzung starten"
+    )
+    assert (
+        get_cached_component_template(hass, "de", "missing_key", default="fallback")
+        == "fallback"
+    )
+
+    hass.data[DOMAIN]["translations"]["de"] = {
+        component_translation_key("grooming_label_button_action"): "Pflege",
+    }
+    assert (
+        get_cached_component_template(
+            hass, "de", "grooming_label_button_action", default="x"
+        )
+        == "Pflege"
+    )
+
+
 def test_resolve_component_translation_uses_separator_candidates() -> None:
     """Resolution should include suffix candidates for known separator patterns."""
     translations = {"quiet_hours": "Quiet hours"}
@@ -173,6 +200,10 @@ def test_bundled_translation_loader_handles_invalid_payloads(
 ) -> None:
     """Bundled translation loader should fail closed on invalid files."""
     _load_bundled_component_translations.cache_clear()
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.translation_helpers.load_translation_index",
+        lambda _path: None,
+    )
 
     monkeypatch.setattr("pathlib.Path.exists", lambda _self: True)
     monkeypatch.setattr(
@@ -198,6 +229,10 @@ def test_bundled_translation_loader_filters_non_string_entries(
 ) -> None:
     """Bundled translation loader should only keep string keys/values."""
     _load_bundled_component_translations.cache_clear()
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.translation_helpers.load_translation_index",
+        lambda _path: None,
+    )
 
     monkeypatch.setattr("pathlib.Path.exists", lambda _self: True)
     monkeypatch.setattr(
@@ -74,7 +74,11 @@ async def test_walk_manager_detection_trigger_adds_and_throttles_points() -> Non
 
     current_walk = manager._current_walks["dog-1"]
     assert current_walk["walk_type"] == "auto_detected"
-    assert len(current_walk["path"]) == 1
+    assert len(manager._walk_tracks["dog-1"]) == 1
+    active_walk = manager.get_active_walk_info("dog-1")
+    assert active_walk is not None
+    assert len(active_walk["path"]) == 1
+    assert current_walk["path"] == active_walk["path"]
     await manager.async_shutdown()
 
 
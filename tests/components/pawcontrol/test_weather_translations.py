@@ -4,6 +4,7 @@ from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+from custom_components.pawcontrol.translation_index import TranslationIndex
 from custom_components.pawcontrol.weather_translations import (
     WEATHER_ALERT_KEYS,
     WEATHER_RECOMMENDATION_KEYS,
@@ -49,6 +50,19 @@ def test_get_weather_translations_contains_all_declared_keys() -> None:
     assert set(translations["recommendations"]) == set(WEATHER_RECOMMENDATION_KEYS)
 
 
+def test_get_weather_translations_resolves_only_weather_slots() -> None:
+    """The sync helper should not merge the full common catalog per call."""
+    with patch.object(
+        TranslationIndex, "common", side_effect=AssertionError("full merge")
+    ):
+        translations = get_weather_translations("de")
+
+    assert set(translations["alerts"]) == set(WEATHER_ALERT_KEYS)
+    assert translations["alerts"]["extreme_heat_warning"]["title"] != (
+        "extreme_heat_warning"
+    )
+
+
 def test_load_static_common_translations_returns_empty_when_files_are_missing() -> None:
     """Missing translation files should produce an empty common lookup."""
     with patch.object(Path, "exists", return_value=False):
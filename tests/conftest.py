@@ -9,7 +9,7 @@ diagnostics, repairs) in constrained CI environments with >=95 % coverage.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Iterator, Mapping
 from datetime import UTC, datetime, timedelta
 from importlib import import_module
 from importlib.util import find_spec
@@ -44,6 +44,7 @@ pawcontrol_compat.ensure_homeassistant_exception_symbols()
 from homeassistant.config_entries import ConfigEntry  # noqa: E402
 
 from custom_components.pawcontrol.feeding_manager import FeedingBatchEntry  # noqa: E402
+from custom_components.pawcontrol.telemetry import set_bool_coercion_repr_capture  # noqa: E402
 from custom_components.pawcontrol.types import (  # noqa: E402
     CoordinatorDogData,
     FeedingManagerDogSetupPayload,
@@ -102,6 +103,14 @@ def tmp_path() -> Path:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(autouse=True)
+def _bool_coercion_repr_capture() -> Iterator[None]:
+    """Keep bool coercion repr capture on regardless of debug logging setup."""
+    previous = set_bool_coercion_repr_capture(True)
+    yield
+    set_bool_coercion_repr_capture(previous)
+
+
 # ==============================================================================
 # ENHANCED FIXTURES FOR PAWCONTROL TESTING
 # ==============================================================================
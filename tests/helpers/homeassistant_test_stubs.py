@@ -1883,6 +1883,7 @@ class DataUpdateCoordinator:
         self.hass = hass
         self.logger = logger
         self.name = name or "stub"
+        self._listeners: dict[object, tuple[Callable[[], None], object]] = {}
 
     async def async_config_entry_first_refresh(self) -> None:
         return None
@@ -1890,6 +1891,24 @@ class DataUpdateCoordinator:
     async def async_request_refresh(self) -> None:
         return None
 
+    def async_add_listener(
+        self,
+        update_callback: Callable[[], None],
+        context: object = None,
+    ) -> Callable[[], None]:
+        """Register a listener like ``DataUpdateCoordinator.async_add_listener``."""
+
+        def remove_listener() -> None:
+            self._listeners.pop(remove_listener, None)
+
+        self._listeners[remove_listener] = (update_callback, context)
+        return remove_listener
+
+    def async_update_listeners(self) -> None:
+        """Invoke every registered listener."""
+        for update_callback, _context in list(getattr(self, "_listeners", {}).values()):
+            update_callback()
+
     def async_set_updated_data(self, data: object) -> None:
         """Store updated data — mirrors DataUpdateCoordinator.async_set_updated_data.
 
@@ -1898,6 +1917,7 @@ class DataUpdateCoordinator:
         self.data so downstream assertions in unit tests can verify the value.
         """
         self.data = data
+        self.async_update_listeners()
 
     @classmethod
     def __class_getitem__(cls, item):  # pragma: no cover - helper stub
@@ -2305,6 +2325,7 @@ def install_homeassistant_stubs() -> None:
     entity_registry_module.RegistryEntry = RegistryEntry
     entity_registry_module.EntityRegistry = EntityRegistry
     entity_registry_module.EntityRegistryEvent = EntityRegistryEvent
+    entity_registry_module.EVENT_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
     entity_registry_module.async_get = _async_get_entity_registry
     entity_registry_module.async_entries_for_config_entry = (
         _async_entries_for_registry_config
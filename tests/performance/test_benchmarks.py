@@ -379,6 +379,656 @@ class TestSerializationPerformance:
         )
 
 
+class TestRouteAnalyticsPerformance:
+    """Performance tests for batched route analytics."""
+
+    @staticmethod
+    def _build_track(points: int = 10_000) -> Any:
+        from custom_components.pawcontrol.route_track import TrackBuffer
+
+        track = TrackBuffer()
+        for index in range(points):
+            track.add(
+                52.52 + index * 0.00002,
+                13.40 + (index % 50) * 0.00001,
+                1_767_268_800.0 + index * 2,
+                altitude=30.0 + (index % 20) * 0.5,
+                accuracy=5.0 + (index % 60),
+                speed=1.2 + (index % 10) * 0.1,
+            )
+        return track
+
+    @pytest.mark.benchmark
+    def test_route_analytics_vs_per_point_loop(self) -> None:
+        """Compare the batched engine with the per-point segment loop.
+
+        Target: batched pass < 50ms and faster than the per-point path
+        for 10k-point tracks
+        """
+        from custom_components.pawcontrol.route_analytics import analyze_track
+        from custom_components.pawcontrol.route_track import calculate_distance
+
+        track = self._build_track()
+        lats = track.latitudes
+        lons = track.longitudes
+        timestamps = track.timestamps
+
+        def per_point_operation() -> None:
+            # Mirrors the previous statistics loop: one scalar haversine and
+            # one segment object per consecutive pair.
+            segments = []
+            for i in range(1, len(lats)):
+                distance = calculate_distance(
+                    lats[i - 1], lons[i - 1], lats[i], lons[i]
+                )
+                time_diff = timestamps[i] - timestamps[i - 1]
+                if time_diff <= 0 or distance > 1000:
+                    continue
+                segments.append((track.row(i - 1), track.row(i), distance, time_diff))
+            track.elevation_gain()
+            track.max_speed()
+
+        def batched_operation() -> None:
+            analyze_track(track)
+
+        baseline = benchmark(per_point_operation, iterations=10, warmup=2)
+        result = benchmark(batched_operation, iterations=10, warmup=2)
+
+        print(f"\n{baseline}")
+        print(f"{result}")
+        assert result.meets_target(50.0), (
+            f"Route analytics too slow: {result.avg_ms:.2f}ms"
+        )
+        assert result.avg_ms < baseline.avg_ms, (
+            f"Batched analytics ({result.avg_ms:.2f}ms) not faster than "
+            f"per-point loop ({baseline.avg_ms:.2f}ms)"
+        )
+
+
+class TestFeedingContentionPerformance:
+    """Contention tests for per-dog feeding locks."""
+
+    @staticmethod
+    async def _build_manager(dog_ids: list[str]) -> Any:
+        from unittest.mock import MagicMock
+
+        from custom_components.pawcontrol.feeding_manager import FeedingManager
+
+        manager = FeedingManager(MagicMock())
+        await manager.async_initialize([
+            {"dog_id": dog_id, "weight": 20.0} for dog_id in dog_ids
+        ])
+        return manager
+
+    @pytest.mark.benchmark
+    async def test_concurrent_feed_logs_for_50_dogs(self) -> None:
+        """Benchmark concurrent feed logs while one dog's lock is held.
+
+        Target: < 100ms for 50 dogs x 5 concurrent feed logs plus snapshot
+        reads, without waiting for a slow operation on another dog
+        """
+        dog_ids = [f"dog_{i}" for i in range(50)]
+        manager = await self._build_manager([*dog_ids, "busy_dog"])
+        release = asyncio.Event()
+
+        async def slow_health_recalculation() -> None:
+            async with manager._dog_lock("busy_dog"):
+                await release.wait()
+
+        async def concurrent_feed_logs() -> None:
+            await asyncio.gather(
+                *(
+                    manager.async_add_feeding(dog_id, 50.0, "snack")
+                    for dog_id in dog_ids
+                    for _ in range(5)
+                ),
+                *(manager.async_get_feeding_data(dog_id) for dog_id in dog_ids),
+            )
+
+        blocker = asyncio.create_task(slow_health_recalculation())
+        await asyncio.sleep(0)
+        try:
+            result = await benchmark_async(
+                concurrent_feed_logs, iterations=20, warmup=2
+            )
+        finally:
+            release.set()
+            await blocker
+
+        print(f"\n{result}")
+        assert result.meets_target(100.0), (
+            f"Contended feed logs too slow: {result.avg_ms:.2f}ms"
+        )
+
+    @pytest.mark.benchmark
+    async def test_bulk_insert_vs_individual_feed_logs(self) -> None:
+        """Compare the bulk insert path with individual feed logs.
+
+        Target: bulk insert of 50 dogs x 5 feedings < 100ms
+        """
+        dog_ids = [f"dog_{i}" for i in range(50)]
+        # Separate managers so both paths see the same history lengths.
+        manager = await self._build_manager(dog_ids)
+        bulk_manager = await self._build_manager(dog_ids)
+        entries = [
+            {"dog_id": dog_id, "amount": 50.0, "meal_type": "snack"}
+            for dog_id in dog_ids
+            for _ in range(5)
+        ]
+
+        async def individual_feed_logs() -> None:
+            for entry in entries:
+                await manager.async_add_feeding(
+                    entry["dog_id"], entry["amount"], entry["meal_type"]
+                )
+            for dog_id in dog_ids:
+                await manager.async_get_feeding_data(dog_id)
+
+        async def bulk_feed_logs() -> None:
+            await bulk_manager.async_batch_add_feedings(entries)
+
+        baseline = await benchmark_async(individual_feed_logs, iterations=10, warmup=2)
+        result = await benchmark_async(bulk_feed_logs, iterations=10, warmup=2)
+
+        print(f"\n{baseline}")
+        print(f"{result}")
+        assert result.meets_target(100.0), (
+            f"Bulk feed logs too slow: {result.avg_ms:.2f}ms"
+        )
+
+
+class TestWeatherRefreshPerformance:
+    """Scaling tests for the shared weather refresh."""
+
+    @staticmethod
+    def _build(dog_count: int) -> tuple[Any, Any, list[Any]]:
+        from datetime import timedelta
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from custom_components.pawcontrol.const import (
+            CONF_DOG_AGE,
+            CONF_DOG_BREED,
+            CONF_DOG_ID,
+            CONF_DOGS,
+            CONF_WEATHER_ENTITY,
+        )
+        from custom_components.pawcontrol.module_adapters import WeatherModuleAdapter
+        from custom_components.pawcontrol.weather_manager import WeatherHealthManager
+
+        weather_state = SimpleNamespace(
+            state="sunny",
+            attributes={"temperature": 33.0, "humidity": 70, "uv_index": 9},
+        )
+        hass = MagicMock()
+        hass.states.get.return_value = weather_state
+        manager = WeatherHealthManager(hass)
+        entry = SimpleNamespace(
+            data={
+                CONF_DOGS: [
+                    {
+                        CONF_DOG_ID: f"dog_{index}",
+                        CONF_DOG_BREED: "husky" if index % 2 else "labrador",
+                        CONF_DOG_AGE: 24 if index % 3 else 120,
+                    }
+                    for index in range(dog_count)
+                ]
+            },
+            options={CONF_WEATHER_ENTITY: "weather.home"},
+        )
+        adapter = WeatherModuleAdapter(config_entry=entry, ttl=timedelta(0))
+        adapter.attach(manager)
+        return hass, adapter, [f"dog_{index}" for index in range(dog_count)]
+
+    @pytest.mark.benchmark
+    async def test_refresh_cost_flat_across_dog_count(self) -> None:
+        """Benchmark one refresh cycle for 1 and 20 dogs sharing a weather entity.
+
+        Target: 20 dogs < 20ms per cycle with exactly one entity parse
+        """
+        results = {}
+        for dog_count in (1, 20):
+            hass, adapter, dog_ids = self._build(dog_count)
+
+            async def refresh_cycle(
+                adapter: Any = adapter, dog_ids: list[str] = dog_ids
+            ) -> None:
+                await asyncio.gather(*(adapter.async_get_data(dog) for dog in dog_ids))
+
+            hass.states.get.reset_mock()
+            await refresh_cycle()
+            assert hass.states.get.call_count == 1
+            results[dog_count] = await benchmark_async(
+                refresh_cycle, iterations=50, warmup=5
+            )
+
+        print(f"\n1 dog: {results[1]}")
+        print(f"20 dogs: {results[20]}")
+        assert results[20].meets_target(20.0), (
+            f"Shared weather refresh too slow: {results[20].avg_ms:.2f}ms"
+        )
+
+
+class TestWebhookIngestPerformance:
+    """Load test for the streaming webhook endpoint."""
+
+    @pytest.mark.benchmark
+    async def test_signed_webhook_throughput_and_p99(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Drive signed GPS pushes through a local aiohttp test server.
+
+        Reports requests/s and p99 latency for 1000 requests sent by 20
+        concurrent clients. Target: p99 < 50ms
+        """
+        import json
+        from types import SimpleNamespace
+
+        from aiohttp import web
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from custom_components.pawcontrol import webhooks
+        from custom_components.pawcontrol.const import (
+            CONF_WEBHOOK_ID,
+            CONF_WEBHOOK_REQUIRE_SIGNATURE,
+            CONF_WEBHOOK_SECRET,
+        )
+        from custom_components.pawcontrol.webhook_security import WebhookAuthenticator
+
+        secret = "benchmark-secret"
+        entry = SimpleNamespace(
+            entry_id="bench",
+            options={
+                CONF_WEBHOOK_ID: "bench-hook",
+                CONF_WEBHOOK_SECRET: secret,
+                CONF_WEBHOOK_REQUIRE_SIGNATURE: True,
+            },
+        )
+        hass = SimpleNamespace(
+            config_entries=SimpleNamespace(async_entries=lambda _domain: [entry])
+        )
+
+        async def _accept(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+            return {"ok": True, "dog_id": "dino"}
+
+        monkeypatch.setattr(webhooks, "async_process_gps_push", _accept)
+
+        async def _route(request: web.Request) -> web.StreamResponse:
+            return await webhooks._handle_webhook(
+                hass, request.match_info["webhook_id"], request
+            )
+
+        app = web.Application()
+        app.router.add_post("/api/webhook/{webhook_id}", _route)
+
+        authenticator = WebhookAuthenticator(secret=secret)
+        body = json.dumps({
+            "dog_id": "dino",
+            "latitude": 52.52,
+            "longitude": 13.405,
+            "accuracy": 12.0,
+            "timestamp": "2026-01-29T12:34:56Z",
+        }).encode()
+
+        requests, concurrency = 1000, 20
+        latencies: list[float] = []
+
+        async with TestClient(TestServer(app)) as client:
+
+            async def worker(count: int) -> None:
+                for _ in range(count):
+                    signature, timestamp = authenticator.generate_signature(body)
+                    started = time.perf_counter()
+                    response = await client.post(
+                        "/api/webhook/bench-hook",
+                        data=body,
+                        headers={
+                            "X-PawControl-Signature": signature,
+                            "X-PawControl-Timestamp": str(timestamp),
+                        },
+                    )
+                    await response.read()
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    assert response.status == 200
+
+            started_total = time.perf_counter()
+            await asyncio.gather(
+                *(worker(requests // concurrency) for _ in range(concurrency))
+            )
+            elapsed = time.perf_counter() - started_total
+
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        requests_per_second = len(latencies) / elapsed
+        print(
+            f"\nWebhook ingest: {requests_per_second:.0f} req/s, "
+            f"p50 {latencies[len(latencies) // 2]:.2f}ms, p99 {p99:.2f}ms"
+        )
+        assert len(latencies) == requests
+        assert p99 < 50.0, f"Webhook p99 latency too high: {p99:.2f}ms"
+
+
+class TestDashboardRegenerationPerformance:
+    """Incremental regeneration benchmarks for the dashboard renderer."""
+
+    @pytest.mark.benchmark
+    async def test_30_dog_update_with_one_changed_dog(self, tmp_path: Any) -> None:
+        """Re-render and write a 30-dog dashboard after one dog changed.
+
+        Only the changed dog's view is regenerated and an unchanged dashboard
+        is not rewritten. Target: < 20ms per update
+        """
+        from unittest.mock import MagicMock
+
+        from custom_components.pawcontrol.dashboard_renderer import DashboardRenderer
+
+        loop = asyncio.get_running_loop()
+        hass = MagicMock()
+        hass.async_add_executor_job = lambda func, *args: loop.run_in_executor(
+            None, func, *args
+        )
+        renderer = DashboardRenderer(hass)
+        rendered: list[str] = []
+
+        async def _dog_cards(
+            dog_config: dict[str, Any], theme: Any, options: Any
+        ) -> list[dict[str, Any]]:
+            rendered.append(dog_config["dog_id"])
+            dog_id = dog_config["dog_id"]
+            return [
+                {
+                    "type": "entities",
+                    "title": f"{dog_config['dog_name']} {section}",
+                    "entities": [
+                        f"sensor.{dog_id}_{section}_{index}" for index in range(8)
+                    ],
+                }
+                for section in ("status", "feeding", "walk", "health", "gps")
+            ]
+
+        renderer.dog_generator.generate_dog_overview_cards = _dog_cards  # type: ignore[method-assign]
+        dogs: list[dict[str, Any]] = [
+            {
+                "dog_id": f"dog_{index}",
+                "dog_name": f"Dog {index}",
+                "dog_weight": 20.0,
+                "modules": {"feeding": True, "walk": True, "gps": index % 2 == 0},
+            }
+            for index in range(30)
+        ]
+        options: dict[str, Any] = {"theme": "modern"}
+        output = tmp_path / "lovelace.benchmark"
+        revision = 0
+
+        async def update_dashboard() -> None:
+            views = await renderer._render_dog_views_batch(dogs, options)
+            await renderer.write_dashboard_file({"views": views}, output)
+
+        async def update_with_one_changed_dog() -> None:
+            nonlocal revision
+            revision += 1
+            dogs[7]["dog_weight"] = 20.0 + revision / 10
+            await update_dashboard()
+
+        async def full_regeneration() -> None:
+            renderer._view_cache.clear()
+            await update_with_one_changed_dog()
+
+        await update_dashboard()
+        baseline = await benchmark_async(full_regeneration, iterations=20, warmup=2)
+        rendered.clear()
+        result = await benchmark_async(
+            update_with_one_changed_dog, iterations=20, warmup=2
+        )
+        assert rendered == ["dog_7"] * 22
+
+        writes_before = renderer.get_render_stats()["view_cache"]["skipped_writes"]
+        await update_dashboard()
+        stats = renderer.get_render_stats()["view_cache"]
+        assert stats["skipped_writes"] == writes_before + 1
+
+        print(f"\nFull regeneration: {baseline}")
+        print(f"One dog changed: {result}")
+        assert result.meets_target(20.0), (
+            f"Incremental dashboard update too slow: {result.avg_ms:.2f}ms"
+        )
+        assert result.avg_ms < baseline.avg_ms, (
+            f"Incremental update ({result.avg_ms:.2f}ms) not faster than "
+            f"full regeneration ({baseline.avg_ms:.2f}ms)"
+        )
+
+
+class TestMetricsRecordingPerformance:
+    """Per-record cost of the runtime metrics registry."""
+
+    BATCH = 10_000
+
+    @pytest.mark.benchmark
+    def test_counter_and_histogram_record(self) -> None:
+        """Record counter increments and histogram observations.
+
+        Target: < 1µs per record
+        """
+        from custom_components.pawcontrol.metrics_registry import MetricsRegistry
+
+        registry = MetricsRegistry()
+        counter = registry.counter("calls")
+        histogram = registry.histogram("duration")
+        durations = [(index % 97) / 10_000 for index in range(self.BATCH)]
+
+        def increment_batch() -> None:
+            inc = counter.inc
+            for _ in durations:
+                inc()
+
+        def observe_batch() -> None:
+            observe = histogram.observe
+            for duration in durations:
+                observe(duration)
+
+        inc_result = benchmark(increment_batch, iterations=20, warmup=2)
+        observe_result = benchmark(observe_batch, iterations=20, warmup=2)
+        inc_us = inc_result.avg_ms * 1000 / self.BATCH
+        observe_us = observe_result.avg_ms * 1000 / self.BATCH
+
+        print(f"\nCounter.inc: {inc_us:.3f}µs per record")
+        print(f"Histogram.observe: {observe_us:.3f}µs per record")
+        assert histogram.count == 22 * self.BATCH
+        assert inc_us < 1.0, f"Counter increment too slow: {inc_us:.3f}µs"
+        assert observe_us < 1.0, f"Histogram observe too slow: {observe_us:.3f}µs"
+
+    @pytest.mark.benchmark
+    def test_guard_collector_record_throughput(self) -> None:
+        """Measure recording guard samples through the collector.
+
+        Target: < 10µs per record, with the payload rendered once per read
+        """
+        from types import SimpleNamespace
+
+        from custom_components.pawcontrol import telemetry
+
+        events = ("stable", "stable", "expand", "stable", "contract")
+        batch = 2_000
+
+        def record_batch(runtime_data: Any) -> None:
+            record = telemetry.record_runtime_entity_factory_guard_sample
+            for index in range(batch):
+                record(
+                    runtime_data,
+                    runtime_floor=0.0009,
+                    actual_duration=0.0004 + (index % 7) / 100_000,
+                    event=events[index % 5],
+                    baseline_floor=0.00045,
+                    max_floor=0.0045,
+                    enforce_min_runtime=True,
+                )
+
+        runtime = SimpleNamespace(performance_stats={})
+        result = benchmark(record_batch, runtime, iterations=5, warmup=1)
+        collector_us = result.avg_ms * 1000 / batch
+
+        metrics = telemetry.get_runtime_entity_factory_guard_metrics(runtime)
+        assert metrics is not None
+        assert metrics["samples"] == 6 * batch
+
+        print(f"\nGuard collector: {collector_us:.2f}µs per record")
+        assert collector_us < 10.0, (
+            f"Guard collector too slow: {collector_us:.2f}µs per record"
+        )
+
+
+class TestBoolCoercionPerformance:
+    """Bool coercion throughput including its telemetry."""
+
+    @pytest.mark.benchmark
+    def test_coerce_100k_values(self) -> None:
+        """Coerce 100k mixed values with and without repr capture.
+
+        Target: < 150ms per 100k coercions
+        """
+        from custom_components.pawcontrol.telemetry import (
+            get_bool_coercion_metrics,
+            reset_bool_coercion_metrics,
+            set_bool_coercion_repr_capture,
+        )
+        from custom_components.pawcontrol.types import _coerce_bool
+
+        pool: list[Any] = [True, False, 0, 1, 2.5, "yes", "off", " ", "maybe", None]
+        values = [pool[index % len(pool)] for index in range(100_000)]
+
+        def coerce_all() -> None:
+            for value in values:
+                _coerce_bool(value, default=False)
+
+        reset_bool_coercion_metrics()
+        captured = benchmark(coerce_all, iterations=5, warmup=1)
+        assert get_bool_coercion_metrics()["total"] == 600_000
+
+        previous = set_bool_coercion_repr_capture(False)
+        try:
+            uncaptured = benchmark(coerce_all, iterations=5, warmup=1)
+        finally:
+            set_bool_coercion_repr_capture(previous)
+        reset_bool_coercion_metrics()
+
+        print(f"\nWith repr capture: {captured}")
+        print(f"Without repr capture: {uncaptured}")
+        assert captured.meets_target(150.0), (
+            f"Bool coercion too slow: {captured.avg_ms:.2f}ms per 100k"
+        )
+        assert uncaptured.meets_target(150.0), (
+            f"Bool coercion too slow: {uncaptured.avg_ms:.2f}ms per 100k"
+        )
+
+
+class TestTranslationIndexPerformance:
+    """Compiled translation index versus per-language JSON parsing."""
+
+    LANGUAGES = ("en", "de", "fr", "es", "pt-BR")
+
+    @staticmethod
+    def _load_json_catalogs(languages: tuple[str, ...]) -> dict[str, dict[str, str]]:
+        """Mirror the bundled JSON loader for ``languages``."""
+        import json
+        from pathlib import Path
+
+        import custom_components.pawcontrol as integration
+
+        translations_dir = Path(integration.__file__).resolve().parent / "translations"
+        catalogs: dict[str, dict[str, str]] = {}
+        for language in languages:
+            payload = json.loads(
+                (translations_dir / f"{language}.json").read_text(encoding="utf-8")
+            )
+            catalogs[language] = dict(payload["common"])
+        return catalogs
+
+    @pytest.mark.benchmark
+    def test_five_language_memory(self) -> None:
+        """Resident memory with five languages loaded.
+
+        Target: < 0.5MB for the index and less than the JSON catalogs
+        """
+        import tracemalloc
+
+        from custom_components.pawcontrol.translation_index import (
+            clear_translation_index_cache,
+            get_bundled_translation_index,
+        )
+
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            catalogs = self._load_json_catalogs(self.LANGUAGES)
+            json_bytes = tracemalloc.get_traced_memory()[0] - baseline
+            del catalogs
+
+            clear_translation_index_cache()
+            baseline = tracemalloc.get_traced_memory()[0]
+            index = get_bundled_translation_index()
+            assert index is not None
+            for language in self.LANGUAGES:
+                index.common(language)
+            index_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+            clear_translation_index_cache()
+
+        json_mb = json_bytes / (1024 * 1024)
+        index_mb = index_bytes / (1024 * 1024)
+        print(f"\nJSON catalogs: {json_mb:.3f}MB, index: {index_mb:.3f}MB")
+        assert index_mb < 0.5, f"Translation index too large: {index_mb:.3f}MB"
+        assert index_bytes < json_bytes
+
+    @pytest.mark.benchmark
+    def test_five_language_lookup(self) -> None:
+        """Slot lookups across five languages, including the cold load.
+
+        Target: < 5ms for 10k lookups
+        """
+        from custom_components.pawcontrol.translation_index import (
+            clear_translation_index_cache,
+            get_bundled_translation_index,
+        )
+
+        def cold_load() -> None:
+            clear_translation_index_cache()
+            index = get_bundled_translation_index()
+            assert index is not None
+            for language in self.LANGUAGES:
+                index.get(language, "weather_alert_extreme_heat_warning_title")
+
+        def cold_json_load() -> None:
+            self._load_json_catalogs(self.LANGUAGES)
+
+        cold_index = benchmark(cold_load, iterations=20, warmup=2)
+        cold_json = benchmark(cold_json_load, iterations=20, warmup=2)
+
+        index = get_bundled_translation_index()
+        assert index is not None
+        slots = [slot for key in index.keys if (slot := index.slot(key)) is not None]
+        requests = [
+            (self.LANGUAGES[position % len(self.LANGUAGES)], slots[position % 50])
+            for position in range(10_000)
+        ]
+
+        def lookup_all() -> None:
+            lookup = index.lookup
+            for language, slot in requests:
+                lookup(language, slot)
+
+        lookups = benchmark(lookup_all, iterations=20, warmup=2)
+        clear_translation_index_cache()
+
+        print(f"\nCold index load: {cold_index}")
+        print(f"Cold JSON load: {cold_json}")
+        print(f"10k lookups: {lookups}")
+        assert cold_index.avg_ms < cold_json.avg_ms
+        assert lookups.meets_target(5.0), (
+            f"Translation lookups too slow: {lookups.avg_ms:.2f}ms per 10k"
+        )
+
+
 class TestMemoryUsage:
     """Memory usage tests."""
 
@@ -453,6 +1103,16 @@ PERFORMANCE_TARGETS = {
     "diffing": 5.0,  # ms
     "large_diff": 50.0,  # ms
     "serialization": 10.0,  # ms
+    "route_analytics_10k": 50.0,  # ms
+    "feeding_contention_50_dogs": 100.0,  # ms
+    "feeding_bulk_insert_50_dogs": 100.0,  # ms
+    "weather_refresh_20_dogs": 20.0,  # ms
+    "webhook_ingest_p99": 50.0,  # ms
+    "dashboard_update_30_dogs": 20.0,  # ms
+    "metrics_record": 0.001,  # ms
+    "bool_coercion_100k": 150.0,  # ms
+    "translation_lookup_10k": 5.0,  # ms
+    "translation_index_5_languages": 0.5,  # MB
     "concurrent_updates": 1000.0,  # ms
     "memory_100_dogs": 50.0,  # MB
 }
@@ -23,6 +23,9 @@ from custom_components.pawcontrol.entity_factory import (
     EntityEstimate,
     EntityFactory,
 )
+from custom_components.pawcontrol.telemetry import (
+    get_runtime_entity_factory_guard_metrics,
+)
 from tests.helpers.homeassistant_test_stubs import (
     Platform as _Platform,
     install_homeassistant_stubs,
@@ -312,9 +315,7 @@ def test_runtime_guard_records_telemetry() -> None:
     baseline = factory._runtime_guard_floor
     assert baseline == pytest.approx(_MIN_OPERATION_DURATION)
 
-    existing_metrics = runtime_store.performance_stats.get(
-        "entity_factory_guard_metrics",
-    )
+    existing_metrics = get_runtime_entity_factory_guard_metrics(runtime_store)
     if isinstance(existing_metrics, dict):
         initial_samples = int(existing_metrics.get("samples", 0))
         initial_average = float(existing_metrics.get("average_duration", 0.0))
@@ -333,7 +334,8 @@ def test_runtime_guard_records_telemetry() -> None:
     expand_duration = baseline * (_RUNTIME_TARGET_RATIO + 2.0)
     factory._recalibrate_runtime_floor(expand_duration)
 
-    metrics = runtime_store.performance_stats["entity_factory_guard_metrics"]
+    metrics = get_runtime_entity_factory_guard_metrics(runtime_store)
+    assert metrics is not None
     assert metrics["expansions"] == initial_expansions + 1
     assert metrics["samples"] == initial_samples + 1
     assert metrics["runtime_floor"] >= baseline
@@ -369,7 +371,8 @@ def test_runtime_guard_records_telemetry() -> None:
     contract_duration = expanded_floor * (_RUNTIME_CONTRACT_THRESHOLD - 0.2)
     factory._recalibrate_runtime_floor(contract_duration)
 
-    metrics = runtime_store.performance_stats["entity_factory_guard_metrics"]
+    metrics = get_runtime_entity_factory_guard_metrics(runtime_store)
+    assert metrics is not None
     assert metrics["samples"] == initial_samples + 2
     assert metrics["contractions"] == initial_contractions + 1
     assert metrics["last_event"] == "contract"
@@ -402,7 +405,8 @@ def test_runtime_guard_records_telemetry() -> None:
     stable_duration = factory._runtime_guard_floor * 1.8
     factory._recalibrate_runtime_floor(stable_duration)
 
-    metrics = runtime_store.performance_stats["entity_factory_guard_metrics"]
+    metrics = get_runtime_entity_factory_guard_metrics(runtime_store)
+    assert metrics is not None
     assert metrics["samples"] == initial_samples + 3
     assert metrics["stable_samples"] >= 1
     assert metrics["last_event"] == "stable"
@@ -5,9 +5,12 @@ from unittest.mock import patch
 
 from custom_components.pawcontrol.diagnostics import _get_bool_coercion_diagnostics
 from custom_components.pawcontrol.telemetry import (
+    _BOOL_COERCION_REPR_INTERVAL,
+    _BOOL_COERCION_SAMPLE_LIMIT,
     get_bool_coercion_metrics,
     record_bool_coercion_event,
     reset_bool_coercion_metrics,
+    set_bool_coercion_repr_capture,
     summarise_bool_coercion_metrics,
 )
 from custom_components.pawcontrol.types import _coerce_bool
@@ -164,14 +167,11 @@ def test_bool_coercion_metrics_include_active_window_seconds() -> None:
     """The metrics should surface the active window between coercions."""
     reset_bool_coercion_metrics()
 
-    start = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
-    later = start + timedelta(seconds=42)
-
-    with patch("custom_components.pawcontrol.telemetry.dt_util.utcnow") as mock_utcnow:
-        mock_utcnow.return_value = start
+    with patch("custom_components.pawcontrol.telemetry._monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 1_000.0
         assert _coerce_bool("true", default=False) is True
 
-        mock_utcnow.return_value = later
+        mock_monotonic.return_value = 1_042.0
         assert _coerce_bool("false", default=True) is False
 
     metrics = get_bool_coercion_metrics()
@@ -339,3 +339,82 @@ def test_summarise_bool_coercion_metrics_limits_samples() -> None:
     assert cleared["total"] == 0
     assert cleared["reason_counts"] == {}
     assert cleared["samples"] == []
+
+
+def test_bool_coercion_repr_is_captured_at_record_time() -> None:
+    """Reprs are rendered when recorded, not when metrics are exported."""
+
+    class _MutableValue:
+        renders = 0
+
+        def __init__(self) -> None:
+            self.label = "before"
+
+        def __repr__(self) -> str:
+            _MutableValue.renders += 1
+            return self.label
+
+    reset_bool_coercion_metrics()
+    value = _MutableValue()
+    for _ in range(50):
+        assert _coerce_bool(value, default=False) is True
+    value.label = "after"
+
+    assert _MutableValue.renders == _BOOL_COERCION_SAMPLE_LIMIT
+    metrics = get_bool_coercion_metrics()
+    assert metrics["total"] == 50
+    assert metrics["type_counts"] == {"_MutableValue": 50}
+    assert len(metrics["samples"]) == _BOOL_COERCION_SAMPLE_LIMIT
+    assert metrics["last_value_repr"] == "before"
+    assert _MutableValue.renders == _BOOL_COERCION_SAMPLE_LIMIT
+
+    reset_bool_coercion_metrics()
+
+
+def test_bool_coercion_repr_is_sampled_after_the_first_events() -> None:
+    """Past the sample limit only every Nth value is rendered."""
+    reset_bool_coercion_metrics()
+    interval = _BOOL_COERCION_REPR_INTERVAL
+
+    for index in range(1, 2 * interval + 1):
+        record_bool_coercion_event(
+            value=index, default=False, result=True, reason="fallback"
+        )
+        metrics = get_bool_coercion_metrics()
+        if index <= _BOOL_COERCION_SAMPLE_LIMIT or index % interval == 0:
+            assert metrics["last_value_repr"] == repr(index)
+
+    assert metrics["total"] == 2 * interval
+    assert metrics["last_value_repr"] == repr(2 * interval)
+    assert len(metrics["samples"]) == _BOOL_COERCION_SAMPLE_LIMIT
+
+    record_bool_coercion_event(
+        value="skipped", default=False, result=True, reason="fallback"
+    )
+    metrics = get_bool_coercion_metrics()
+    assert metrics["last_value_type"] == "str"
+    assert metrics["last_value_repr"] == repr(2 * interval)
+
+    reset_bool_coercion_metrics()
+
+
+def test_bool_coercion_repr_capture_can_be_disabled() -> None:
+    """Disabling repr capture should keep counters but drop value details."""
+    reset_bool_coercion_metrics()
+    previous = set_bool_coercion_repr_capture(False)
+    try:
+        assert _coerce_bool("yes", default=False) is True
+        assert _coerce_bool(None, default=True) is True
+
+        metrics = get_bool_coercion_metrics()
+        assert metrics["total"] == 2
+        assert metrics["defaulted"] == 1
+        assert metrics["reason_counts"] == {"truthy_string": 1, "none": 1}
+        assert metrics["samples"] == []
+        assert metrics["last_value_type"] == "NoneType"
+        assert metrics["last_value_repr"] is None
+    finally:
+        set_bool_coercion_repr_capture(previous)
+
+    assert previous is True
+    reset_bool_coercion_metrics()
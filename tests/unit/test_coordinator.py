@@ -8,11 +8,14 @@ import pytest
 
 from custom_components.pawcontrol import coordinator as coordinator_module
 from custom_components.pawcontrol.coordinator import PawControlCoordinator
+from custom_components.pawcontrol.coordinator_diffing import ListenerScope
 from custom_components.pawcontrol.coordinator_runtime import (
     EntityBudgetSnapshot,
     RuntimeCycleInfo,
 )
+from custom_components.pawcontrol.device_tracker import PawControlGPSTracker
 from custom_components.pawcontrol.exceptions import ValidationError
+from custom_components.pawcontrol.sensor import PawControlLastFeedingSensor
 
 
 @pytest.mark.unit
@@ -145,6 +148,100 @@ async def test_async_apply_module_updates_merges_data(
     }
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_dog_snapshot_versions_follow_published_payloads(
+    mock_hass, mock_config_entry, mock_session
+) -> None:
+    """Snapshots stay stable between updates and are read-only views."""
+    coordinator = PawControlCoordinator(mock_hass, mock_config_entry, mock_session)
+    coordinator._data = {"test_dog": {"feeding": {"mode": "manual"}}}
+
+    first = coordinator.get_dog_snapshot("test_dog")
+    assert first is not None
+    assert coordinator.get_dog_snapshot("test_dog") is first
+    assert first.data["feeding"] is coordinator._data["test_dog"]["feeding"]
+    with pytest.raises(TypeError):
+        first.data["feeding"] = {}  # type: ignore[index]
+
+    await coordinator.async_apply_module_updates(
+        "test_dog", "feeding", {"mode": "scheduled"}
+    )
+
+    second = coordinator.get_dog_snapshot("test_dog")
+    assert second is not None
+    assert second.version > first.version
+    assert second.data["feeding"]["mode"] == "scheduled"
+    assert coordinator.get_dog_snapshot("unknown") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_module_updates_only_wake_scoped_listeners_for_changed_module(
+    mock_hass, mock_config_entry, mock_session
+) -> None:
+    """Scoped listeners only fire when their dog and module changed."""
+    coordinator = PawControlCoordinator(mock_hass, mock_config_entry, mock_session)
+    coordinator._data = {"test_dog": {"gps": {"lat": 1.0}, "walk": {}}}
+    coordinator.data = dict(coordinator._data)
+    calls: list[str] = []
+    coordinator.async_add_listener(
+        lambda: calls.append("dog"), ListenerScope("test_dog")
+    )
+    coordinator.async_add_listener(
+        lambda: calls.append("walk"), ListenerScope("test_dog", "walk")
+    )
+    remove_other = coordinator.async_add_listener(
+        lambda: calls.append("other"), ListenerScope("other_dog")
+    )
+
+    await coordinator.async_apply_module_updates("test_dog", "gps", {"lat": 2.0})
+
+    assert calls == ["dog"]
+    assert coordinator._scoped_listeners.get_stats()["skipped"] == 2
+
+    calls.clear()
+    remove_other()
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+
+    assert sorted(calls) == ["dog", "walk"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_feeding_updates_do_not_wake_gps_entities(
+    mock_hass, mock_config_entry, mock_session
+) -> None:
+    """Module-scoped entities only wake for their own module's changes."""
+    coordinator = PawControlCoordinator(mock_hass, mock_config_entry, mock_session)
+    coordinator._data = {
+        "test_dog": {"gps": {"latitude": 1.0}, "feeding": {"meals_today": 0}},
+    }
+    coordinator.data = dict(coordinator._data)
+    tracker = PawControlGPSTracker(coordinator, "test_dog", "Buddy")
+    feeding_sensor = PawControlLastFeedingSensor(coordinator, "test_dog", "Buddy")
+    assert tracker.coordinator_context == ListenerScope("test_dog", "gps")
+    assert feeding_sensor.coordinator_context == ListenerScope("test_dog", "feeding")
+
+    calls: list[str] = []
+    coordinator.async_add_listener(
+        lambda: calls.append("gps"), tracker.coordinator_context
+    )
+    coordinator.async_add_listener(
+        lambda: calls.append("feeding"), feeding_sensor.coordinator_context
+    )
+
+    await coordinator.async_apply_module_updates(
+        "test_dog", "feeding", {"meals_today": 1}
+    )
+    assert calls == ["feeding"]
+
+    calls.clear()
+    await coordinator.async_apply_module_updates("test_dog", "gps", {"latitude": 2.0})
+    assert calls == ["gps"]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_async_update_data_without_dogs(
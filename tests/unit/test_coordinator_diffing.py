@@ -12,6 +12,8 @@ from custom_components.pawcontrol.coordinator_diffing import (
     CoordinatorDataDiff,
     DataDiff,
     DogDataDiff,
+    ListenerScope,
+    ScopedListenerRegistry,
     SmartDiffTracker,
     compute_coordinator_diff,
     compute_data_diff,
@@ -569,6 +571,61 @@ class TestSmartDiffTracker:
         })
 
 
+class TestScopedListenerRegistry:
+    """Test ScopedListenerRegistry fan-out."""
+
+    def _registry(self) -> tuple[ScopedListenerRegistry, list[str]]:
+        registry = ScopedListenerRegistry()
+        calls: list[str] = []
+        for name, scope in (
+            ("buddy", ListenerScope("buddy")),
+            ("buddy.gps", ListenerScope("buddy", "gps")),
+            ("buddy.walk", ListenerScope("buddy", "walk")),
+            ("max", ListenerScope("max")),
+        ):
+            registry.add(scope, lambda name=name: calls.append(name))
+        return registry, calls
+
+    def test_dispatch_only_wakes_changed_dog_and_module(self) -> None:
+        """A GPS change for one dog must not wake other dogs or modules."""
+        registry, calls = self._registry()
+        tracker = SmartDiffTracker()
+        max_payload = {"gps": {"lat": 1.0}}
+        tracker.update({"buddy": {"gps": {"lat": 45.0}}, "max": max_payload})
+
+        diff = tracker.update({"buddy": {"gps": {"lat": 45.1}}, "max": max_payload})
+
+        assert registry.dispatch(diff) == 2
+        assert sorted(calls) == ["buddy", "buddy.gps"]
+        stats = registry.get_stats()
+        assert stats["listeners"] == 4
+        assert stats["notified"] == 2
+        assert stats["skipped"] == 2
+
+    def test_dispatch_force_and_added_dogs_wake_all_scopes(self) -> None:
+        """Forced dispatches and newly added dogs notify every matching scope."""
+        registry, calls = self._registry()
+
+        registry.dispatch(CoordinatorDataDiff(added_dogs=frozenset({"buddy"})))
+        assert sorted(calls) == ["buddy", "buddy.gps", "buddy.walk"]
+
+        calls.clear()
+        assert registry.dispatch(CoordinatorDataDiff(), force=True) == 4
+
+    def test_remove_listener(self) -> None:
+        """Removed listeners are no longer invoked and removal is idempotent."""
+        registry = ScopedListenerRegistry()
+        calls: list[str] = []
+        remove = registry.add(ListenerScope("buddy"), lambda: calls.append("x"))
+
+        remove()
+        remove()
+
+        assert len(registry) == 0
+        assert registry.dispatch(CoordinatorDataDiff(), force=True) == 0
+        assert calls == []
+
+
 class TestGetChangedFields:
     """Test get_changed_fields function."""
 
@@ -1,7 +1,8 @@
 """Tests for coordinator_runtime classes not covered by test_adaptive_polling.
 
 Covers RuntimeCycleInfo.to_dict, EntityBudgetSnapshot properties,
-summarize_entity_budgets, and CoordinatorRuntime.execute_cycle via mocking.
+summarize_entity_budgets, ModuleRefreshScheduler cadences, and
+CoordinatorRuntime.execute_cycle via mocking.
 """
 
 from datetime import UTC, datetime
@@ -11,8 +12,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.pawcontrol.coordinator_runtime import (
+    AdaptivePollingController,
     CoordinatorRuntime,
     EntityBudgetSnapshot,
+    ModuleCadence,
+    ModuleRefreshScheduler,
     RuntimeCycleInfo,
     summarize_entity_budgets,
 )
@@ -485,3 +489,83 @@ class TestCoordinatorRuntimeExecuteCycle:
         assert payload["garden"] == {"status": "ok", "value": 42}
         assert payload["status_snapshot"] == {"overall_status": "mixed"}
         snapshot_builder.assert_called_once_with("rex", payload)
+
+
+# ---------------------------------------------------------------------------
+# ModuleRefreshScheduler
+# ---------------------------------------------------------------------------
+
+
+class TestModuleRefreshScheduler:
+    """Tests for per-module refresh cadences."""
+
+    def test_unchanged_payloads_back_off_until_changed_or_invalidated(self) -> None:  # noqa: D102
+        scheduler = ModuleRefreshScheduler({"weather": ModuleCadence(60.0, 240.0)})
+
+        assert scheduler.is_due("rex", "weather", 0.0)
+        scheduler.record("rex", "weather", changed=True, now=0.0)
+        assert not scheduler.is_due("rex", "weather", 30.0)
+        assert scheduler.is_due("rex", "weather", 60.0)
+
+        scheduler.record("rex", "weather", changed=False, now=60.0)
+        scheduler.record("rex", "weather", changed=False, now=180.0)
+        assert not scheduler.is_due("rex", "weather", 300.0)
+        assert scheduler.as_diagnostics()["modules"]["weather"] == {
+            "min_interval_s": 60.0,
+            "max_interval_s": 240.0,
+            "effective_interval_s": 240.0,
+            "tracked_dogs": 1,
+            "fetches": 3,
+            "skipped": 2,
+        }
+
+        scheduler.record("rex", "weather", changed=True, now=420.0)
+        assert scheduler.is_due("rex", "weather", 480.0)
+
+        scheduler.record("rex", "weather", changed=False, now=480.0)
+        scheduler.invalidate(["rex"])
+        assert scheduler.is_due("rex", "weather", 481.0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_dog_data_reuses_payloads_of_modules_not_due(self) -> None:  # noqa: D102
+        from custom_components.pawcontrol.coordinator_support import (
+            CoordinatorMetrics,
+            DogConfigRegistry,
+        )
+        from custom_components.pawcontrol.resilience import RetryConfig
+
+        calls: list[str] = []
+
+        async def _fetch(module: str) -> dict[str, object]:
+            calls.append(module)
+            return {"status": "ready", "module": module}
+
+        def _build_tasks(_dog_id, _modules, *, include=None):
+            return [
+                CoordinatorModuleTask(module=module, coroutine=_fetch(module))
+                for module in ("gps", "weather")
+                if include is None or include(module)
+            ]
+
+        registry = MagicMock(spec=DogConfigRegistry)
+        registry.get.return_value = {"dog_id": "rex", "dog_name": "Rex"}
+        runtime = CoordinatorRuntime(
+            registry=registry,
+            modules=MagicMock(build_tasks=_build_tasks),
+            resilience_manager=MagicMock(),
+            retry_config=cast(RetryConfig, MagicMock()),
+            metrics=MagicMock(spec=CoordinatorMetrics),
+            adaptive_polling=AdaptivePollingController(initial_interval_seconds=60.0),
+            logger=MagicMock(),
+            scheduler=ModuleRefreshScheduler(),
+        )
+
+        first = await runtime._fetch_dog_data("rex", previous={})
+        second = await runtime._fetch_dog_data("rex", previous=first)
+
+        assert calls == ["gps", "weather", "gps"]
+        assert second["weather"] is first["weather"]
+        assert "status_snapshot" in second
+        diagnostics = runtime._scheduler.as_diagnostics()
+        assert diagnostics["modules"]["weather"]["skipped"] == 1
+        assert diagnostics["fetches"] == 3
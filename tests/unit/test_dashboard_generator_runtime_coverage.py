@@ -182,6 +182,7 @@ def _build_generator(
     )
     generator._performance_metrics = _metrics_payload()
     generator._cleanup_tasks = set()
+    generator._file_digests = {}
     return generator
 
 
@@ -1960,3 +1961,34 @@ async def test_runtime_weather_dashboard_and_component_paths(
     }
     assert batch_generator.has_weather_dashboard("ok") is True
     assert batch_generator.has_weather_dashboard("missing") is False
+
+
+@pytest.mark.asyncio
+async def test_runtime_update_file_skips_unchanged_dashboard_content(
+    hass: Any,
+    config_entry_factory: Callable[..., Any],
+    local_tmp_dir: Path,
+) -> None:
+    """Re-rendering identical content must not rewrite the dashboard file."""
+    generator = _build_generator(
+        hass,
+        config_entry_factory(entry_id="coverage-update-unchanged"),
+        local_tmp_dir,
+        initialized=True,
+    )
+    dashboard_file = local_tmp_dir / ".storage" / "lovelace.unchanged"
+    info = {"title": "Unchanged", "url": "unchanged", "icon": "mdi:dog"}
+    config = {"views": [{"path": "overview", "cards": []}]}
+
+    assert await generator._update_dashboard_file_async(dashboard_file, config, info)
+    written = dashboard_file.read_text(encoding="utf-8")
+    assert not await generator._update_dashboard_file_async(
+        dashboard_file, config, info
+    )
+    assert dashboard_file.read_text(encoding="utf-8") == written
+    assert generator._performance_metrics["file_operations"] == 1
+    assert generator._performance_metrics["cache_hits"] == 1
+
+    changed = {"views": [{"path": "overview", "cards": [{"type": "map"}]}]}
+    assert await generator._update_dashboard_file_async(dashboard_file, changed, info)
+    assert generator._performance_metrics["file_operations"] == 2
@@ -393,3 +393,69 @@ async def test_write_dashboard_file_cleanup_reaches_final_exists_check(
         await renderer.write_dashboard_file({"views": []}, output)
 
     assert temp_exists_checks >= 21
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_dog_views_are_reused_until_their_inputs_change(
+    renderer: dashboard_renderer.DashboardRenderer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only dogs whose config, theme or options changed are re-rendered."""
+    rendered: list[str] = []
+
+    async def _cards(dog_config: Any, *args: Any) -> list[dict[str, str]]:
+        rendered.append(dog_config["dog_id"])
+        return [{"type": "entities"}]
+
+    monkeypatch.setattr(renderer.dog_generator, "generate_dog_overview_cards", _cards)
+    dogs = [
+        {"dog_id": "buddy", "dog_name": "Buddy", "modules": {"gps": True}},
+        {"dog_id": "rex", "dog_name": "Rex", "modules": {"gps": False}},
+    ]
+
+    first = await renderer._render_dog_views_batch(dogs, {"theme": "modern"})
+    dogs[1]["modules"] = {"gps": True}
+    second = await renderer._render_dog_views_batch(dogs, {"theme": "modern"})
+    await renderer._render_dog_views_batch(dogs, {"theme": "night"})
+
+    assert rendered == ["buddy", "rex", "rex", "buddy", "rex"]
+    assert second[0] == first[0]
+    assert second[0] is not first[0]
+    stats = renderer.get_render_stats()["view_cache"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 5
+
+    # Mutating a returned view must not leak into the cached copy.
+    second[0]["cards"].append({"type": "markdown"})
+    third = await renderer._render_dog_views_batch(dogs, {"theme": "modern"})
+    assert third[0] == first[0]
+
+    monkeypatch.setattr(dashboard_renderer, "VIEW_CACHE_TTL_SECONDS", 0)
+    await renderer._render_dog_views_batch(dogs, {"theme": "night"})
+    assert rendered[-2:] == ["buddy", "rex"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_write_dashboard_file_skips_unchanged_content(
+    renderer: dashboard_renderer.DashboardRenderer,
+    tmp_path: Any,
+) -> None:
+    """Identical payloads are not rewritten while the file still exists."""
+    output = tmp_path / "dashboards" / "buddy.json"
+
+    assert await renderer.write_dashboard_file({"views": []}, output) is True
+    assert await renderer.write_dashboard_file({"views": []}, output) is False
+    assert (
+        await renderer.write_dashboard_file({"views": [{"title": "New"}]}, output)
+        is True
+    )
+
+    output.unlink()
+    assert (
+        await renderer.write_dashboard_file({"views": [{"title": "New"}]}, output)
+        is True
+    )
+    assert output.exists()
+    assert renderer.get_render_stats()["view_cache"]["skipped_writes"] == 1
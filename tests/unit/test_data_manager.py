@@ -1394,6 +1394,31 @@ async def test_async_get_module_history_respects_limit(tmp_path: Path) -> None:
     assert await manager.async_get_module_history(MODULE_HEALTH, "unknown") == []
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_remove_dog_drops_history_indexes(tmp_path: Path) -> None:
+    """Removing a dog releases its profile and history indexes."""
+    hass = SimpleNamespace(config=SimpleNamespace(config_dir=str(tmp_path)))
+    manager = PawControlDataManager(
+        hass=hass,
+        entry_id="history-remove",
+        dogs_config=[
+            {"dog_id": "buddy", "modules": {MODULE_HEALTH: True}},
+            {"dog_id": "luna", "modules": {MODULE_HEALTH: True}},
+        ],
+    )
+    await manager.async_initialize()
+    for dog_id in ("buddy", "luna"):
+        await manager.async_log_health_data(dog_id, {"weight": 12.0})
+        await manager.async_get_module_history(MODULE_HEALTH, dog_id)
+
+    await manager.async_remove_dog("buddy")
+
+    assert {key[0] for key in manager._history_indexes} == {"luna"}
+    assert await manager.async_get_registered_dogs() == ["luna"]
+    assert await manager.async_get_module_history(MODULE_HEALTH, "buddy") == []
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_weekly_health_report_filters_old_entries(
@@ -187,10 +187,7 @@ def test_data_manager_namespace_lock_reuse(mock_hass) -> None:  # noqa: D103
 # Reusable init helper with correct empty-dict mock
 async def _init_manager(mock_hass, dog_id: str = "rex") -> PawControlDataManager:
     mgr = _make_manager(mock_hass, dog_id)
-    with (
-        patch.object(mgr, "_async_load_storage", AsyncMock(return_value={})),
-        patch.object(mgr, "_write_storage", AsyncMock()),
-    ):
+    with patch.object(mgr, "_async_load_storage", AsyncMock(return_value={})):
         await mgr.async_initialize()
     return mgr
 
@@ -216,7 +213,7 @@ async def test_data_manager_async_log_feeding(mock_hass) -> None:
         food_type="dry_food",
         timestamp=datetime(2025, 6, 1, 8, 0, tzinfo=UTC),
     )
-    with patch.object(mgr, "_write_storage", AsyncMock()):
+    with patch.object(mgr, "_async_save_dog_data", AsyncMock()):
         await mgr.async_log_feeding(dog_id="rex", feeding=feeding)
     profile = mgr._dog_profiles.get("rex")
     assert profile is not None and len(profile.feeding_history) >= 1
@@ -227,7 +224,7 @@ async def test_data_manager_async_log_feeding(mock_hass) -> None:
 async def test_data_manager_async_log_health_data(mock_hass) -> None:
     """async_log_health_data records an entry in the dog's health_history."""
     mgr = await _init_manager(mock_hass)
-    with patch.object(mgr, "_write_storage", AsyncMock()):
+    with patch.object(mgr, "_async_save_dog_data", AsyncMock()):
         await mgr.async_log_health_data(
             dog_id="rex",
             health={"weight": 22.5, "mood": "happy"},
@@ -259,7 +256,7 @@ async def test_data_manager_async_get_registered_dogs(mock_hass) -> None:
 async def test_data_manager_async_update_dog_data(mock_hass) -> None:
     """async_update_dog_data completes without raising."""
     mgr = await _init_manager(mock_hass)
-    with patch.object(mgr, "_write_storage", AsyncMock()):
+    with patch.object(mgr, "_async_save_dog_data", AsyncMock()):
         result = await mgr.async_update_dog_data(
             dog_id="rex",
             updates={"custom_field": "hello"},
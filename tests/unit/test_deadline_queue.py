@@ -0,0 +1,76 @@
+"""Unit tests for the keyed deadline queue."""
+
+import asyncio
+
+import pytest
+
+from custom_components.pawcontrol.deadline_queue import DeadlineQueue
+
+
+@pytest.mark.unit
+def test_pop_due_returns_live_keys_in_deadline_order() -> None:
+    """Rescheduled and cancelled keys never fire with a stale deadline."""
+    queue: DeadlineQueue[str] = DeadlineQueue()
+    queue.schedule("batch", 30.0)
+    queue.schedule("expiry", 10.0)
+    queue.schedule("retry", 20.0)
+    queue.schedule("batch", 5.0, keep_earlier=True)
+    queue.schedule("expiry", 50.0, keep_earlier=True)
+    queue.schedule("retry", 40.0)
+    queue.cancel("gone")
+
+    assert len(queue) == 3
+    assert queue.next_deadline() == 5.0
+    assert queue.pop_due(15.0) == ["batch", "expiry"]
+    assert queue.pop_due(25.0) == []
+    assert "retry" in queue
+    assert queue.next_deadline() == 40.0
+
+    queue.cancel("retry")
+    assert queue.next_deadline() is None
+    assert queue.pop_due(100.0) == []
+
+
+@pytest.mark.unit
+def test_rescheduling_compacts_stale_entries() -> None:
+    """Repeated rescheduling keeps the heap proportional to live keys."""
+    queue: DeadlineQueue[int] = DeadlineQueue()
+    for step in range(1_000):
+        queue.schedule(step % 4, float(step))
+
+    assert len(queue) == 4
+    assert len(queue._heap) <= 64
+    assert queue.pop_due(10_000.0) == [0, 1, 2, 3]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_wait_idles_until_something_is_scheduled() -> None:
+    """An empty queue waits for a schedule call instead of polling."""
+    queue: DeadlineQueue[str] = DeadlineQueue()
+    waiter = asyncio.create_task(queue.async_wait(0.0, 60.0))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.schedule("now", 0.0)
+    await asyncio.wait_for(waiter, timeout=1)
+    await asyncio.wait_for(queue.async_wait(0.0, 60.0), timeout=1)
+    assert queue.pop_due(0.0) == ["now"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_wait_wakes_when_an_earlier_deadline_is_scheduled() -> None:
+    """A pending sleep is cut short by an earlier deadline, not by later ones."""
+    queue: DeadlineQueue[str] = DeadlineQueue()
+    queue.schedule("late", 3_600.0)
+    waiter = asyncio.create_task(queue.async_wait(0.0))
+    await asyncio.sleep(0)
+
+    queue.schedule("later", 7_200.0)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.schedule("soon", 1.0)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert queue.next_deadline() == 1.0
@@ -0,0 +1,141 @@
+"""Unit tests for the per-dog shard storage engine."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from custom_components.pawcontrol.dog_storage import DogShardStore
+
+
+def _state() -> dict[str, Any]:
+    return {
+        "config": {"dog_id": "buddy", "dog_name": "Buddy"},
+        "daily_stats": {"feedings_count": 0},
+        "current_walk": None,
+        "feeding_history": [],
+    }
+
+
+def _save(store: DogShardStore, state: dict[str, Any]) -> None:
+    pending = store.prepare("buddy", state)
+    if pending is not None:
+        store.commit(pending, store.write(pending))
+
+
+@pytest.mark.unit
+def test_first_save_writes_snapshot_and_appends_afterwards(tmp_path: Path) -> None:
+    """Untracked dogs are snapshotted; later saves only journal the delta."""
+    store = DogShardStore(tmp_path)
+    state = _state()
+
+    _save(store, state)
+    assert store.snapshot_path("buddy").exists()
+    assert store.journal_path("buddy").read_text(encoding="utf-8") == ""
+
+    state["feeding_history"].append({"portion_size": 100})
+    pending = store.prepare("buddy", state)
+    assert pending is not None
+    assert pending.snapshot is None
+    assert pending.records == [
+        {"f": "feeding_history", "a": [{"portion_size": 100}], "s": 1}
+    ]
+    store.commit(pending, store.write(pending))
+
+    assert store.prepare("buddy", state) is None
+    stats = store.get_stats()
+    assert stats["compactions"] == 1
+    assert stats["journal_records"] == 1
+
+
+@pytest.mark.unit
+def test_replay_restores_trimmed_history_and_state(tmp_path: Path) -> None:
+    """Journal replay reproduces appends, front trims and state replacement."""
+    store = DogShardStore(tmp_path)
+    state = _state()
+    _save(store, state)
+
+    history = state["feeding_history"]
+    for index in range(5):
+        history.append({"index": index})
+        _save(store, state)
+    history[:] = history[-2:]
+    history.append({"index": 5})
+    state["daily_stats"] = {"feedings_count": 6}
+    _save(store, state)
+
+    payload, sequence, journal_records = DogShardStore(tmp_path).load("buddy")
+    assert payload["feeding_history"] == [{"index": 3}, {"index": 4}, {"index": 5}]
+    assert payload["daily_stats"] == {"feedings_count": 6}
+    assert sequence == journal_records == 7
+
+
+@pytest.mark.unit
+def test_middle_deletion_is_journaled_as_full_list(tmp_path: Path) -> None:
+    """Removing an entry inside the persisted range is not mistaken for a trim."""
+    store = DogShardStore(tmp_path)
+    state = _state()
+    _save(store, state)
+
+    history = state["feeding_history"]
+    history.extend({"index": index} for index in range(4))
+    _save(store, state)
+    del history[1]
+    history.append({"index": 4})
+
+    pending = store.prepare("buddy", state)
+    assert pending is not None
+    assert pending.records == [
+        {
+            "f": "feeding_history",
+            "v": [{"index": 0}, {"index": 2}, {"index": 3}, {"index": 4}],
+            "s": 2,
+        }
+    ]
+    store.commit(pending, store.write(pending))
+
+    payload, _sequence, _records = DogShardStore(tmp_path).load("buddy")
+    assert payload["feeding_history"] == history
+
+
+@pytest.mark.unit
+def test_compaction_folds_journal_into_snapshot(tmp_path: Path) -> None:
+    """Exceeding the threshold rewrites the snapshot and truncates the journal."""
+    store = DogShardStore(tmp_path, compaction_threshold=3)
+    state = _state()
+    _save(store, state)
+
+    for index in range(4):
+        state["feeding_history"].append({"index": index})
+        _save(store, state)
+
+    snapshot = json.loads(store.snapshot_path("buddy").read_text(encoding="utf-8"))
+    assert snapshot["seq"] == 4
+    assert len(snapshot["data"]["feeding_history"]) == 4
+    assert store.get_stats()["compactions"] == 2
+
+    payload, _sequence, _records = DogShardStore(tmp_path).load("buddy")
+    assert payload["feeding_history"] == state["feeding_history"]
+
+
+@pytest.mark.unit
+def test_load_skips_folded_records_and_torn_tail(tmp_path: Path) -> None:
+    """Records already in the snapshot and torn trailing lines are ignored."""
+    store = DogShardStore(tmp_path)
+    store.snapshot_path("buddy").write_text(
+        json.dumps({"seq": 1, "data": {"feeding_history": [{"index": 0}]}}),
+        encoding="utf-8",
+    )
+    store.journal_path("buddy").write_text(
+        '{"s":1,"f":"feeding_history","a":[{"index":0}]}\n'
+        '{"s":2,"f":"feeding_history","a":[{"index":1}]}\n'
+        '{"s":3,"f":"feeding_hist',
+        encoding="utf-8",
+    )
+
+    payload, sequence, _records = store.load("buddy")
+
+    assert payload["feeding_history"] == [{"index": 0}, {"index": 1}]
+    assert sequence == 2
+    assert store.load("unknown") is None
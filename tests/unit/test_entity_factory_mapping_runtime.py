@@ -14,6 +14,9 @@ from custom_components.pawcontrol.entity_factory import (
     EntityPerformanceMetrics,
     EntityProfileDefinition,
 )
+from custom_components.pawcontrol.telemetry import (
+    get_runtime_entity_factory_guard_metrics,
+)
 
 
 def test_entity_creation_config_mapping_behaviour() -> None:
@@ -173,7 +176,8 @@ def test_entity_factory_prewarm_updates_runtime_guard_metrics_payload() -> None:
 
     factory._prewarm_caches()
 
-    metrics = runtime_data.performance_stats["entity_factory_guard_metrics"]
+    metrics = get_runtime_entity_factory_guard_metrics(runtime_data)
+    assert metrics is not None
     assert metrics["baseline_floor"] >= _MIN_OPERATION_DURATION
     assert metrics["runtime_floor"] >= _MIN_OPERATION_DURATION
     assert metrics["runtime_floor_delta"] >= 0.0
@@ -11,9 +11,11 @@ Covers:
                   get_feeding_data, get_active_emergency
 """
 
-from datetime import datetime, time
+import asyncio
+from datetime import datetime, time, timedelta
 from unittest.mock import MagicMock
 
+from homeassistant.util import dt as dt_util
 import pytest
 
 from custom_components.pawcontrol.feeding_manager import (
@@ -22,6 +24,7 @@ from custom_components.pawcontrol.feeding_manager import (
     FeedingScheduleType,
     MealSchedule,
     MealType,
+    _FeedingAggregates,
 )
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -542,6 +545,100 @@ async def test_async_batch_add_feedings_skips_invalid_amount(mock_hass) -> None:
     assert any(e.amount == 150.0 for e in events)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_batch_add_feedings_invalidates_cache_on_partial_failure(
+    mock_hass,
+) -> None:
+    """A failing entry still drops the dog's cached snapshot."""
+    mgr = await _init_manager(mock_hass)
+    stale = await mgr.async_get_feeding_data("rex")
+    assert mgr._data_cache["rex"] is stale
+
+    record = mgr._record_feeding
+    calls = 0
+
+    def _fail_second(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("boom")
+        return record(*args, **kwargs)
+
+    mgr._record_feeding = _fail_second
+    with pytest.raises(RuntimeError):
+        await mgr.async_batch_add_feedings([
+            {"dog_id": "rex", "amount": 100.0},
+            {"dog_id": "rex", "amount": 80.0},
+        ])
+
+    assert "rex" not in mgr._data_cache
+    assert len(await mgr.async_get_feedings("rex")) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_dog_locks_do_not_block_other_dogs(mock_hass) -> None:
+    """Work on one dog must not wait for another dog's lock."""
+    mgr = FeedingManager(mock_hass)
+    await mgr.async_initialize([
+        {"dog_id": "rex", "weight": 20.0},
+        {"dog_id": "bella", "weight": 8.0},
+    ])
+
+    async with mgr._dog_lock("rex"):
+        event = await asyncio.wait_for(mgr.async_add_feeding("bella", 50.0), 1)
+        await asyncio.wait_for(mgr.async_get_feeding_data("bella"), 1)
+        blocked = asyncio.create_task(mgr.async_add_feeding("rex", 60.0))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+    assert event.amount == 50.0
+    assert (await blocked).amount == 60.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_running_aggregates_follow_trimmed_history(mock_hass) -> None:
+    """Per-day totals stay equal to a full rescan across days and trimming."""
+    mgr = FeedingManager(mock_hass, max_history=5)
+    await mgr.async_initialize([{"dog_id": "rex", "weight": 20.0}])
+    midnight = dt_util.start_of_local_day()
+    feedings = [
+        (midnight - timedelta(hours=14), 100.0, "breakfast"),
+        (midnight - timedelta(hours=4), 150.0, "dinner"),
+        (midnight + timedelta(minutes=1), 50.0, "breakfast"),
+        (midnight + timedelta(minutes=2), 20.0, "snack"),
+        (midnight + timedelta(minutes=3), 30.0, "snack"),
+        (midnight + timedelta(minutes=4), 60.0, "dinner"),
+    ]
+    for when, amount, meal in feedings:
+        await mgr.async_add_feeding("rex", amount, meal, time=when)
+
+    history = mgr._feedings["rex"]
+    aggregates = mgr._feeding_aggregates["rex"]
+    rescanned = _FeedingAggregates.from_history(history)
+    assert len(history) == 5
+    assert aggregates.day_counts == rescanned.day_counts
+    assert aggregates.day_amounts == rescanned.day_amounts
+    assert aggregates.day_meals == rescanned.day_meals
+    assert aggregates.last_feeding is history[-1]
+    assert aggregates.day_counts[midnight.date() - timedelta(days=1)] == 1
+
+    snapshot = mgr._build_feeding_snapshot("rex")
+    assert snapshot["feedings_today"] == {"breakfast": 1, "snack": 2, "dinner": 1}
+    assert snapshot["daily_amount_consumed"] == 160.0
+    assert len(snapshot["feedings"]) == 5
+
+    stats = await mgr.async_get_statistics("rex", days=7)
+    assert stats["total_feedings"] == 5
+    assert stats["most_common_meal"] == "dinner"
+
+    # Replacing the history is detected and re-aggregated.
+    mgr._feedings["rex"] = history[-1:]
+    assert mgr._build_feeding_snapshot("rex")["feedings_today"] == {"dinner": 1}
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # FeedingManager — history limit enforcement
 # ══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,50 @@
+"""Unit tests for the geofence zone spatial index."""
+
+import pytest
+
+from custom_components.pawcontrol.geofence_index import ZoneIndex
+from custom_components.pawcontrol.route_track import calculate_distance
+
+
+@pytest.mark.unit
+def test_candidates_cover_every_containing_zone() -> None:
+    """Every zone containing a query point is returned as a candidate."""
+    circles = [
+        (f"zone-{row}-{col}", 52.0 + row * 0.01, 13.0 + col * 0.013, 150.0 + col)
+        for row in range(20)
+        for col in range(20)
+    ]
+    index = ZoneIndex.from_circles(circles, cell_degrees=0.02)
+
+    for step in range(400):
+        lat = 52.0 + (step * 7 % 200) * 0.001
+        lon = 13.0 + (step * 11 % 260) * 0.001
+        candidates = index.candidates(lat, lon)
+        inside = {
+            key
+            for key, zone_lat, zone_lon, radius in circles
+            if calculate_distance(zone_lat, zone_lon, lat, lon) <= radius
+        }
+        assert inside <= candidates
+        assert len(candidates) < 10
+
+    assert len(index) == 400
+    index.remove("zone-0-0")
+    assert "zone-0-0" not in index
+    assert "zone-0-0" not in index.candidates(52.0, 13.0)
+
+
+@pytest.mark.unit
+def test_antimeridian_and_polar_zones() -> None:
+    """Zones wrapping the date line or covering a pole are still found."""
+    index: ZoneIndex[str] = ZoneIndex()
+    index.insert("dateline", 0.0, 179.999, 1_000.0)
+    index.insert("pole", 89.999, 0.0, 5_000.0)
+
+    assert "dateline" in index.candidates(0.0, -179.999)
+    assert "dateline" in index.candidates(0.0, 179.995)
+    assert "pole" in index.candidates(89.99, 120.0)
+    assert index.candidates(0.0, 90.0) == {"pole"}
+
+    index.clear()
+    assert not index.candidates(0.0, 179.999)
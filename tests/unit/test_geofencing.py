@@ -349,3 +349,67 @@ def test_set_notification_manager_accepts_none(mock_hass) -> None:
     geofencing.set_notification_manager(None)
 
     assert geofencing._notification_manager is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_zone_checks_use_index_and_zone_changes_mark_dogs(mock_hass) -> None:
+    """Only nearby zones are evaluated and zone edits queue a re-check."""
+    geofencing = PawControlGeofencing(mock_hass, "entry")
+    fire = AsyncMock()
+    geofencing._fire_zone_event = fire
+    for index in range(50):
+        geofencing._zones[f"zone-{index}"] = GeofenceZone(
+            id=f"zone-{index}",
+            name=f"Zone {index}",
+            type=GeofenceType.SAFE_ZONE,
+            latitude=52.0 + index * 0.1,
+            longitude=13.0,
+            radius=100.0,
+        )
+    state = DogLocationState("buddy")
+    state.add_location(GPSLocation(latitude=52.5, longitude=13.0, accuracy=5.0))
+    geofencing._dog_states["buddy"] = state
+
+    await geofencing._check_dog_location(state)
+
+    assert state.current_zones == {"zone-5"}
+    fire.assert_awaited_once_with("buddy", "zone-5", GeofenceEvent.ENTERED)
+
+    # Moving away exits the current zone even though it is no longer nearby.
+    state.add_location(GPSLocation(latitude=52.55, longitude=13.0, accuracy=5.0))
+    await geofencing._check_dog_location(state)
+    assert state.current_zones == set()
+    assert fire.await_args.args == ("buddy", "zone-5", GeofenceEvent.LEFT)
+
+    geofencing._invalidate_zone_index()
+    assert geofencing._dirty_dogs == {"buddy"}
+    assert geofencing._check_requested.is_set()
+    await geofencing._check_all_locations()
+    assert geofencing._dirty_dogs == set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_overlapping_zone_events_fire_in_stable_order(mock_hass) -> None:
+    """Entering several zones at once fires their events in zone order."""
+    geofencing = PawControlGeofencing(mock_hass, "entry")
+    fire = AsyncMock()
+    geofencing._fire_zone_event = fire
+    zone_ids = [f"zone-{letter}" for letter in "edcba"]
+    for zone_id in zone_ids:
+        geofencing._zones[zone_id] = GeofenceZone(
+            id=zone_id,
+            name=zone_id,
+            type=GeofenceType.SAFE_ZONE,
+            latitude=52.5,
+            longitude=13.0,
+            radius=100.0,
+        )
+    state = DogLocationState("buddy")
+    state.add_location(GPSLocation(latitude=52.5, longitude=13.0, accuracy=5.0))
+    geofencing._dog_states["buddy"] = state
+
+    await geofencing._check_dog_location(state)
+
+    assert [call.args[1] for call in fire.await_args_list] == zone_ids
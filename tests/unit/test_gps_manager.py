@@ -9,12 +9,14 @@ Python: 3.13+
 
 import asyncio
 from datetime import UTC, datetime, timedelta
-from typing import cast
+from types import SimpleNamespace
+from typing import Any, cast
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.core import HomeAssistant
 import pytest
 
+from custom_components.pawcontrol import gps_manager as gm
 from custom_components.pawcontrol.gps_manager import (
     GeofenceZone,
     GPSAccuracy,
@@ -83,54 +85,125 @@ class TestGPSManagerInitialization:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-class TestGPSTrackingTasks:
-    """Validate GPS tracking background task scheduling."""
+class TestGPSTrackerSubscriptions:
+    """Validate indexed tracker resolution and state-change driven tracking."""
 
-    async def test_start_tracking_task_handles_asyncmock_scheduler(
+    async def test_tracker_index_is_built_once_and_invalidated_by_registry(
         self, mock_gps_manager: GPSGeofenceManager
     ) -> None:
-        """Ensure fallback scheduling engages when hass returns AsyncMock."""
+        """Repeated lookups reuse the index until a tracker registry event."""
         manager = mock_gps_manager
-        tracking_config: GPSTrackingConfigInput = {
-            "enabled": True,
-            "track_route": True,
-            "update_interval_seconds": 0,
-        }
-        await manager.async_configure_dog_gps("test_dog", tracking_config)
+        await manager.async_configure_dog_gps("buddy", {"enabled": True})
+        registry = SimpleNamespace(
+            entities={
+                "device_tracker.buddy_collar": SimpleNamespace(
+                    platform="device_tracker",
+                    name="Buddy Collar",
+                    entity_id="device_tracker.buddy_collar",
+                ),
+                "device_tracker.buddy_tractive": SimpleNamespace(
+                    platform="tractive",
+                    name="Buddy Tractive",
+                    entity_id="device_tracker.buddy_tractive",
+                ),
+                "sensor.buddy_battery": SimpleNamespace(
+                    platform="sensor",
+                    name="Buddy Battery",
+                    entity_id="sensor.buddy_battery",
+                ),
+            }
+        )
+
+        with patch.object(gm.er, "async_get", return_value=registry) as get_registry:
+            for _ in range(5):
+                assert manager._resolve_tracker_entities("buddy") == (
+                    "device_tracker.buddy_collar",
+                    "device_tracker.buddy_tractive",
+                )
+            assert get_registry.call_count == 1
+
+            manager._handle_entity_registry_updated(
+                SimpleNamespace(data={"entity_id": "sensor.buddy_battery"})
+            )
+            manager._resolve_tracker_entities("buddy")
+            assert get_registry.call_count == 1
 
-        manager._active_routes["test_dog"] = WalkRoute(
-            dog_id="test_dog",
+            manager._handle_entity_registry_updated(
+                SimpleNamespace(data={"entity_id": "device_tracker.buddy_collar"})
+            )
+            manager._resolve_tracker_entities("buddy")
+            assert get_registry.call_count == 2
+
+        stats = await manager.async_get_statistics()
+        assert stats["tracker_index_rebuilds"] == 2
+
+    async def test_tracker_state_changes_only_ingest_movement(
+        self, mock_gps_manager: GPSGeofenceManager
+    ) -> None:
+        """The subscription adds points only when coordinates change."""
+        manager = mock_gps_manager
+        await manager.async_configure_dog_gps("buddy", {"enabled": True})
+        manager._active_routes["buddy"] = WalkRoute(
+            dog_id="buddy",
             start_time=datetime.now(UTC),
         )
+        manager._tracker_index = {"buddy": ("device_tracker.buddy",)}
+        manager._indexed_dog_ids = frozenset({"buddy"})
+        manager.async_add_gps_point = AsyncMock()  # type: ignore[method-assign]
+        manager.hass.async_create_task = lambda coro: asyncio.ensure_future(coro)
+
+        captured: dict[str, Any] = {}
+
+        def _track(_hass: Any, entity_ids: list[str], action: Any) -> Any:
+            captured["entity_ids"] = entity_ids
+            captured["action"] = action
+            return lambda: captured.setdefault("unsubscribed", True)
+
+        def _state(lat: float, lon: float, accuracy: float) -> SimpleNamespace:
+            return SimpleNamespace(
+                state="not_home",
+                attributes={
+                    "latitude": lat,
+                    "longitude": lon,
+                    "gps_accuracy": accuracy,
+                },
+            )
 
-        loop = asyncio.get_running_loop()
-
-        async def _fast_sleep(_: float) -> None:
-            return None
+        with patch.object(gm, "async_track_state_change_event", side_effect=_track):
+            manager._subscribe_tracker_entities("buddy")
 
-        manager.hass.async_create_task.return_value = None
+        assert captured["entity_ids"] == ["device_tracker.buddy"]
+        action = captured["action"]
 
-        with (
-            patch(
-                "custom_components.pawcontrol.gps_manager.asyncio.sleep",
-                new=AsyncMock(side_effect=_fast_sleep),
-            ),
-            patch(
-                "custom_components.pawcontrol.gps_manager.asyncio.create_task"
-            ) as create_task,
-        ):
-            create_task.side_effect = lambda coro, *, name=None: loop.create_task(
-                coro, name=name
+        action(
+            SimpleNamespace(
+                data={
+                    "old_state": _state(52.5, 13.4, 5.0),
+                    "new_state": _state(52.5, 13.4, 9.0),
+                }
+            )
+        )
+        action(
+            SimpleNamespace(
+                data={
+                    "old_state": _state(52.5, 13.4, 5.0),
+                    "new_state": _state(52.6, 13.5, 5.0),
+                }
             )
+        )
+        await asyncio.sleep(0)
 
-            await manager._start_tracking_task("test_dog")
+        manager.async_add_gps_point.assert_awaited_once_with(
+            dog_id="buddy",
+            latitude=52.6,
+            longitude=13.5,
+            accuracy=5.0,
+            source=LocationSource.DEVICE_TRACKER,
+        )
 
-        assert create_task.called
-        task = manager._tracking_tasks.get("test_dog")
-        assert isinstance(task, asyncio.Task)
-        manager._active_routes.pop("test_dog", None)
-        await asyncio.sleep(0)
-        await manager._stop_tracking_task("test_dog")
+        await manager._stop_tracker_subscription("buddy")
+        assert captured["unsubscribed"] is True
+        assert "buddy" not in manager._tracker_unsubs
 
 
 @pytest.mark.unit
@@ -1,7 +1,5 @@
 """Runtime coverage tests for less-traveled GPS manager branches."""
 
-import asyncio
-from contextlib import suppress
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -120,7 +118,7 @@ async def test_async_start_gps_tracking_re_raises_tracking_task_errors(
     with (
         patch.object(
             mock_gps_manager,
-            "_start_tracking_task",
+            "_start_tracker_subscription",
             AsyncMock(side_effect=RuntimeError("task-fail")),
         ),
         pytest.raises(RuntimeError, match="task-fail"),
@@ -164,7 +162,7 @@ async def test_async_end_gps_tracking_re_raises_stop_errors(mock_gps_manager) ->
     with (
         patch.object(
             mock_gps_manager,
-            "_stop_tracking_task",
+            "_stop_tracker_subscription",
             AsyncMock(side_effect=RuntimeError("stop-fail")),
         ),
         pytest.raises(RuntimeError, match="stop-fail"),
@@ -387,40 +385,32 @@ async def test_async_export_routes_respects_date_to_and_zero_limit(
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_start_tracking_task_returns_when_config_missing_or_disabled(
+async def test_start_tracker_subscription_returns_when_config_missing_or_disabled(
     mock_gps_manager,
 ) -> None:
-    """Tracking task startup should no-op without active configuration."""
+    """Tracker subscriptions should no-op without active configuration."""
     manager = mock_gps_manager
     manager._active_routes["dog-1"] = WalkRoute(
         dog_id="dog-1",
         start_time=datetime.now(UTC),
     )
 
-    await manager._start_tracking_task("dog-1")
-    assert "dog-1" not in manager._tracking_tasks
+    await manager._start_tracker_subscription("dog-1")
+    assert "dog-1" not in manager._tracker_unsubs
 
     await manager.async_configure_dog_gps("dog-1", {"enabled": False})
-    await manager._start_tracking_task("dog-1")
-    assert "dog-1" not in manager._tracking_tasks
+    await manager._start_tracker_subscription("dog-1")
+    assert "dog-1" not in manager._tracker_unsubs
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_stop_tracking_task_logs_timeout_when_cancel_wait_expires(
+async def test_stop_tracker_subscription_is_noop_without_subscription(
     mock_gps_manager,
 ) -> None:
-    """Stopping tasks should tolerate cancellation wait timeouts."""
-    manager = mock_gps_manager
-    task = asyncio.create_task(asyncio.sleep(60))
-    manager._tracking_tasks["dog-1"] = task
-
-    with patch.object(gm.asyncio, "wait_for", side_effect=TimeoutError):
-        await manager._stop_tracking_task("dog-1")
-
-    task.cancel()
-    with suppress(asyncio.CancelledError):
-        await task
+    """Stopping an unknown subscription should not raise."""
+    await mock_gps_manager._stop_tracker_subscription("dog-1")
+    assert mock_gps_manager._tracker_unsubs == {}
 
 
 @pytest.mark.unit
@@ -448,10 +438,7 @@ async def test_update_location_from_device_tracker_adds_matching_entity_point(
     manager.async_add_gps_point = AsyncMock()  # type: ignore[method-assign]
     manager.hass.states.get = lambda _entity_id: fake_state  # type: ignore[assignment]
 
-    with (
-        patch.object(gm.er, "async_get", return_value=fake_registry),
-        patch.object(gm.dr, "async_get", return_value=SimpleNamespace()),
-    ):
+    with patch.object(gm.er, "async_get", return_value=fake_registry):
         await manager._update_location_from_device_tracker("dog-1")
 
     manager.async_add_gps_point.assert_awaited_once()
@@ -587,7 +574,9 @@ async def test_calculate_route_statistics_handles_empty_and_invalid_segments(
     )
     invalid_route.gps_points = [p1, p2]
     await manager._calculate_route_statistics(invalid_route)
-    assert invalid_route.segments == []
+    assert invalid_route.analytics is not None
+    assert invalid_route.analytics.valid_segment_count == 0
+    assert invalid_route.analytics.outlier_count == 1
 
 
 @pytest.mark.unit
@@ -624,6 +613,11 @@ async def test_calculate_route_statistics_sets_quality_buckets(
     await manager._calculate_route_statistics(route)
 
     assert route.route_quality == expected_quality
+    assert route.analytics is not None
+    assert route.analytics.valid_segment_count == len(accuracies) - 1
+    assert sum(route.analytics.segment_distances) == pytest.approx(
+        route.total_distance_meters
+    )
 
 
 @pytest.mark.unit
@@ -691,194 +685,60 @@ async def test_export_routes_json_includes_geofence_event_payloads(
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_start_tracking_task_loop_handles_timeout_branch(
-    mock_gps_manager,
-) -> None:
-    """Tracking loop should tolerate update timeouts and continue."""
-    manager = mock_gps_manager
-    await _configure_active_tracking(manager)
-    original_sleep = gm.asyncio.sleep
-
-    async def _sleep_and_stop(_seconds: float) -> None:
-        manager._active_routes.pop("dog-1", None)
-        await original_sleep(0)
-
-    with (
-        patch.object(gm.asyncio, "wait_for", AsyncMock(side_effect=TimeoutError)),
-        patch.object(gm.asyncio, "sleep", AsyncMock(side_effect=_sleep_and_stop)),
-    ):
-        await manager._start_tracking_task("dog-1")
-        await manager._tracking_tasks["dog-1"]
-
-    await manager._stop_tracking_task("dog-1")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_tracking_task_loop_handles_cancelled_error_branch(
+async def test_start_tracker_subscription_tolerates_initial_read_timeout(
     mock_gps_manager,
 ) -> None:
-    """Cancelling the task should hit the cancellation guard branch."""
+    """A slow initial tracker read should not prevent the subscription."""
     manager = mock_gps_manager
     await _configure_active_tracking(manager)
-    blocker = asyncio.Event()
+    manager._tracker_index = {"dog-1": ("device_tracker.dog_1",)}
+    manager._indexed_dog_ids = frozenset({"dog-1"})
 
-    async def _never_returns(_dog_id: str) -> None:
-        await blocker.wait()
+    with patch.object(gm.asyncio, "wait_for", AsyncMock(side_effect=TimeoutError)):
+        await manager._start_tracker_subscription("dog-1")
 
-    manager._update_location_from_device_tracker = AsyncMock(side_effect=_never_returns)  # type: ignore[method-assign]
-    manager.hass.async_create_task = lambda coro, name=None: asyncio.create_task(
-        coro, name=name
-    )
-
-    await manager._start_tracking_task("dog-1")
-    task = manager._tracking_tasks["dog-1"]
-    await asyncio.sleep(0)
-    task.cancel()
-    await asyncio.sleep(0)
-    assert task.done()
-
-    await manager._stop_tracking_task("dog-1")
+    assert manager._tracker_unsubs["dog-1"][0] == ("device_tracker.dog_1",)
+    await manager._stop_tracker_subscription("dog-1")
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_start_tracking_task_loop_handles_generic_error_branch(
+async def test_registry_update_resubscribes_active_tracker_subscriptions(
     mock_gps_manager,
 ) -> None:
-    """Unexpected update errors should be caught by the outer loop guard."""
+    """Tracker registry changes should rebuild the index and resubscribe."""
     manager = mock_gps_manager
     await _configure_active_tracking(manager)
-    manager._update_location_from_device_tracker = AsyncMock(  # type: ignore[method-assign]
-        side_effect=RuntimeError("loop-boom")
-    )
-    manager.hass.async_create_task = lambda coro, name=None: asyncio.create_task(
-        coro, name=name
-    )
-
-    await manager._start_tracking_task("dog-1")
-    task = manager._tracking_tasks["dog-1"]
-    await task
-    assert task.done()
-
-    await manager._stop_tracking_task("dog-1")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_tracking_task_accepts_future_scheduler_return(
-    mock_gps_manager,
-) -> None:
-    """Scheduler futures should be accepted as resolved tracking handles."""
-    manager = mock_gps_manager
-    await _configure_active_tracking(manager)
-    loop = asyncio.get_running_loop()
-
-    def _schedule_future(coro, name=None):  # type: ignore[no-untyped-def]
-        coro.close()
-        future = loop.create_future()
-        future.set_result(None)
-        return future
-
-    manager.hass.async_create_task = _schedule_future
-
-    await manager._start_tracking_task("dog-1")
-
-    task_handle = manager._tracking_tasks["dog-1"]
-    assert isinstance(task_handle, asyncio.Future)
-    assert task_handle.done()
-
-    await manager._stop_tracking_task("dog-1")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_tracking_task_retries_hass_scheduler_without_name(
-    mock_gps_manager,
-) -> None:
-    """TypeError from named hass scheduling should retry without name."""
-    manager = mock_gps_manager
-    await _configure_active_tracking(manager)
-    scheduler_calls: list[str | None] = []
-
-    async def _finish_first_iteration(_dog_id: str) -> None:
-        manager._active_routes.pop("dog-1", None)
-
-    manager._update_location_from_device_tracker = AsyncMock(  # type: ignore[method-assign]
-        side_effect=_finish_first_iteration
-    )
-
-    def _schedule(coro, name=None):  # type: ignore[no-untyped-def]
-        scheduler_calls.append(name)
-        if name is not None:
-            raise TypeError("scheduler has no name kwarg")
-        return asyncio.create_task(coro)
+    registry = SimpleNamespace(entities={})
+    unsubscribed: list[str] = []
 
-    manager.hass.async_create_task = _schedule
+    def _track(_hass, entity_ids, _action):  # type: ignore[no-untyped-def]
+        return lambda: unsubscribed.extend(entity_ids)
 
-    await manager._start_tracking_task("dog-1")
-    await manager._tracking_tasks["dog-1"]
-
-    assert scheduler_calls[0] is not None
-    assert scheduler_calls[1] is None
-
-    await manager._stop_tracking_task("dog-1")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_tracking_task_falls_back_to_loop_scheduler_when_missing(
-    mock_gps_manager,
-) -> None:
-    """When hass scheduler is missing, loop.create_task fallback should run."""
-    manager = mock_gps_manager
-    await _configure_active_tracking(manager)
-    loop_calls: list[str | None] = []
-    manager.hass.async_create_task = None
-
-    async def _finish_first_iteration(_dog_id: str) -> None:
-        manager._active_routes.pop("dog-1", None)
-
-    manager._update_location_from_device_tracker = AsyncMock(  # type: ignore[method-assign]
-        side_effect=_finish_first_iteration
-    )
-
-    def _loop_create_task(coro, name=None):  # type: ignore[no-untyped-def]
-        loop_calls.append(name)
-        if name is not None:
-            coro.close()
-            raise TypeError("loop has no name kwarg")
-        return asyncio.create_task(coro)
-
-    manager.hass.loop = SimpleNamespace(create_task=_loop_create_task)
-
-    await manager._start_tracking_task("dog-1")
-    await manager._tracking_tasks["dog-1"]
-
-    assert loop_calls[0] is not None
-    assert loop_calls[1] is None
-
-    await manager._stop_tracking_task("dog-1")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_tracking_task_raises_when_scheduler_returns_no_task(
-    mock_gps_manager,
-) -> None:
-    """Task startup should fail loudly when no scheduler produces a task."""
-    manager = mock_gps_manager
-    await _configure_active_tracking(manager)
-    manager.hass.async_create_task = None
+    with (
+        patch.object(gm.er, "async_get", return_value=registry),
+        patch.object(gm, "async_track_state_change_event", side_effect=_track),
+    ):
+        manager._subscribe_tracker_entities("dog-1")
+        assert manager._tracker_unsubs["dog-1"][0] == ()
 
-    def _null_task_factory(coro, name=None):  # type: ignore[no-untyped-def]
-        coro.close()
-        return None
+        registry.entities["device_tracker.dog_1"] = SimpleNamespace(
+            platform="device_tracker",
+            name="Dog-1 Collar",
+            entity_id="device_tracker.dog_1",
+        )
+        manager._handle_entity_registry_updated(
+            SimpleNamespace(
+                data={"action": "create", "entity_id": "device_tracker.dog_1"}
+            )
+        )
 
-    manager.hass.loop = SimpleNamespace(create_task=_null_task_factory)
+    assert manager._tracker_unsubs["dog-1"][0] == ("device_tracker.dog_1",)
+    assert unsubscribed == []
 
-    with pytest.raises(RuntimeError, match="Failed to schedule GPS tracking task"):
-        await manager._start_tracking_task("dog-1")
+    await manager.async_cleanup()
+    assert unsubscribed == ["device_tracker.dog_1"]
+    assert manager._registry_unsub is None
 
 
 @pytest.mark.unit
@@ -929,10 +789,37 @@ async def test_update_location_from_device_tracker_continues_until_match_found(
     }
     manager.hass.states.get = lambda entity_id: fake_states.get(entity_id)  # type: ignore[assignment]
 
-    with (
-        patch.object(gm.er, "async_get", return_value=fake_registry),
-        patch.object(gm.dr, "async_get", return_value=SimpleNamespace()),
-    ):
+    with patch.object(gm.er, "async_get", return_value=fake_registry):
         await manager._update_location_from_device_tracker("dog-1")
 
     manager.async_add_gps_point.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_route_points_are_stored_columnar_and_exported_from_columns(
+    mock_gps_manager,
+) -> None:
+    """Assigned point lists become a GPSTrack that exports without GPSPoint objects."""
+    manager = mock_gps_manager
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    route = WalkRoute(dog_id="dog-1", start_time=start)
+    route.gps_points = [
+        GPSPoint(
+            latitude=52.5,
+            longitude=13.4,
+            timestamp=start + timedelta(seconds=index * 30),
+            accuracy=3.0,
+            source=LocationSource.WEBHOOK,
+        )
+        for index in range(3)
+    ]
+
+    assert isinstance(route.gps_points, gm.GPSTrack)
+    assert route.gps_points[-1].timestamp == start + timedelta(seconds=60)
+    assert route.gps_points[0].source is LocationSource.WEBHOOK
+
+    payload = await manager._export_routes_json("dog-1", [route])
+    exported = payload["content"]["routes"][0]["gps_points"]
+    assert [point["timestamp"] for point in exported][0] == start.isoformat()
+    assert exported[0]["source"] == "webhook"
@@ -56,19 +56,16 @@ def test_translated_grooming_label_with_hass_and_cache_hit() -> None:
     translation_key = GROOMING_LABEL_TRANSLATION_KEYS["button_action"]
     resolved = "Perform Grooming Action"
 
-    with (
-        patch(
-            "custom_components.pawcontrol.grooming_translations.get_cached_component_translation_lookup",
-            return_value=({"en": {translation_key: resolved}}, {}),
-        ),
-        patch(
-            "custom_components.pawcontrol.grooming_translations.resolve_component_translation",
-            return_value=resolved,
-        ),
-    ):
+    with patch(
+        "custom_components.pawcontrol.grooming_translations.get_cached_component_template",
+        return_value=resolved,
+    ) as template_lookup:
         result = translated_grooming_label(mock_hass, "en", "button_action")
 
     assert result == resolved
+    template_lookup.assert_called_once_with(
+        mock_hass, "en", translation_key, default="button_action"
+    )
 
 
 @pytest.mark.unit
@@ -78,21 +75,18 @@ def test_translated_grooming_label_with_hass_and_format_values() -> None:
     translation_key = GROOMING_LABEL_TRANSLATION_KEYS["button_action"]
     resolved_template = "Action for {dog}"
 
-    with (
-        patch(
-            "custom_components.pawcontrol.grooming_translations.get_cached_component_translation_lookup",
-            return_value=({"en": {translation_key: resolved_template}}, {}),
-        ),
-        patch(
-            "custom_components.pawcontrol.grooming_translations.resolve_component_translation",
-            return_value=resolved_template,
-        ),
-    ):
+    with patch(
+        "custom_components.pawcontrol.grooming_translations.get_cached_component_template",
+        return_value=resolved_template,
+    ) as template_lookup:
         result = translated_grooming_label(
             mock_hass, "en", "button_action", dog="Buddy"
         )
 
     assert result == "Action for Buddy"
+    template_lookup.assert_called_once_with(
+        mock_hass, "en", translation_key, default="button_action"
+    )
 
 
 @pytest.mark.unit
@@ -118,21 +112,18 @@ def test_translated_grooming_template_with_hass_resolved() -> None:
     translation_key = GROOMING_TEMPLATE_TRANSLATION_KEYS["notification_title"]
     resolved = "Grooming due for {dog}"
 
-    with (
-        patch(
-            "custom_components.pawcontrol.grooming_translations.get_cached_component_translation_lookup",
-            return_value=({translation_key: resolved}, {}),
-        ),
-        patch(
-            "custom_components.pawcontrol.grooming_translations.resolve_component_translation",
-            return_value=resolved,
-        ),
-    ):
+    with patch(
+        "custom_components.pawcontrol.grooming_translations.get_cached_component_template",
+        return_value=resolved,
+    ) as template_lookup:
         result = translated_grooming_template(
             mock_hass, "en", "notification_title", dog="Max"
         )
 
     assert result == "Grooming due for Max"
+    template_lookup.assert_called_once_with(
+        mock_hass, "en", translation_key, default="notification_title"
+    )
 
 
 @pytest.mark.unit
@@ -23,15 +23,11 @@ def test_translated_grooming_label_uses_component_lookup_when_hass_available(
     """Known keys should resolve via translation lookup when hass is present."""
     hass = SimpleNamespace()
 
+    translations = {"grooming_label_button_action": "Aktivieren"}
     monkeypatch.setattr(
         grooming_translations,
-        "get_cached_component_translation_lookup",
-        lambda _hass, _language: ({"grooming_label_button_action": "Aktivieren"}, {}),
-    )
-    monkeypatch.setattr(
-        grooming_translations,
-        "resolve_component_translation",
-        lambda translations, _fallback, key, default: translations.get(key, default),
+        "get_cached_component_template",
+        lambda _hass, _language, key, default: translations.get(key, default),
     )
 
     result = grooming_translations.translated_grooming_label(
@@ -61,20 +57,14 @@ def test_translated_grooming_template_with_hass_uses_fallback_default(
     """Template translations should fall back to provided key when unresolved."""
     hass = SimpleNamespace()
 
-    monkeypatch.setattr(
-        grooming_translations,
-        "get_cached_component_translation_lookup",
-        lambda _hass, _language: ({}, {}),
-    )
-
     captured: dict[str, object] = {}
 
-    def _resolve(translations, fallback, key, default) -> str:
-        captured["inputs"] = (translations, fallback, key, default)
+    def _resolve(hass_arg, language, key, default) -> str:
+        captured["inputs"] = (hass_arg, language, key, default)
         return "Template {dog}"
 
     monkeypatch.setattr(
-        grooming_translations, "resolve_component_translation", _resolve
+        grooming_translations, "get_cached_component_template", _resolve
     )
 
     result = grooming_translations.translated_grooming_template(
@@ -86,8 +76,8 @@ def test_translated_grooming_template_with_hass_uses_fallback_default(
 
     assert result == "Template Bello"
     assert captured["inputs"] == (
-        {},
-        {},
+        hass,
+        "en",
         "grooming_template_notification_message",
         "notification_message",
     )
@@ -492,3 +492,92 @@ async def test_async_process_notifications_prioritizes_high_priority(
     assert 30 in sleep_calls
     assert not notification_manager._high_priority_queue
     assert not notification_manager._notification_queue
+
+
+@pytest.mark.asyncio
+async def test_event_queue_wakes_consumer_and_applies_backpressure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Queued events are drained without polling and producers are throttled."""
+    hass = MagicMock(spec=HomeAssistant)
+    config_entry = MagicMock(spec=ConfigEntry)
+    config_entry.data = {CONF_DOGS: [{"dog_id": "dog-1"}]}
+    config_entry.options = {}
+    config_entry.entry_id = "entry-id"
+
+    storage = MagicMock()
+    storage.async_shutdown = AsyncMock()
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.helpers.PawControlDataStorage",
+        lambda *_: storage,
+    )
+
+    data_manager = PawControlData(hass, config_entry)
+    batches: list[list[QueuedEvent]] = []
+
+    async def capture(events: list[QueuedEvent]) -> None:
+        batches.append(events)
+
+    monkeypatch.setattr(data_manager, "_process_event_batch", capture)
+
+    # Without a consumer task producers drain a batch themselves once the
+    # high watermark is reached instead of dropping events.
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.helpers.EVENT_QUEUE_HIGH_WATERMARK", 5
+    )
+    for index in range(12):
+        await data_manager.async_log_feeding("dog-1", {"portion": index})
+
+    assert sum(len(batch) for batch in batches) == 10
+    assert len(data_manager._event_queue) == 2
+    assert data_manager.get_event_queue_stats()["backpressure_waits"] == 2
+
+    data_manager._event_task = asyncio.create_task(data_manager._process_events())
+    try:
+        for index in range(12, 30):
+            await data_manager.async_log_feeding("dog-1", {"portion": index})
+        async with asyncio.timeout(1.0):
+            while data_manager._event_queue:
+                await asyncio.sleep(0.01)
+    finally:
+        await data_manager.async_shutdown()
+
+    portions = [event["data"]["portion"] for batch in batches for event in batch]
+    assert portions == list(range(30))
+    stats = data_manager.get_event_queue_stats()
+    assert stats["events_processed"] == 30
+    assert stats["batch_size_histogram"]["samples"] == stats["batches_processed"]
+    assert stats["latency_ms_histogram"]["samples"] == 30
+    assert stats["latency_ms_histogram"]["max"] < 1000
+    assert sum(stats["depth_histogram"]["counts"]) == stats["batches_processed"]
+
+
+def test_event_queue_stats_registered_as_cache_monitor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Event queue stats reach the data manager's cache diagnostics."""
+    hass = MagicMock(spec=HomeAssistant)
+    config_entry = MagicMock(spec=ConfigEntry)
+    config_entry.data = {CONF_DOGS: [{"dog_id": "dog-1"}]}
+    config_entry.options = {}
+    config_entry.entry_id = "entry-id"
+    runtime_data = MagicMock()
+    register_monitor = runtime_data.data_manager.register_cache_monitor
+    get_runtime_data = MagicMock(return_value=runtime_data)
+
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.helpers.PawControlDataStorage",
+        lambda *_: MagicMock(),
+    )
+    monkeypatch.setattr(
+        "custom_components.pawcontrol.helpers.get_runtime_data",
+        get_runtime_data,
+    )
+
+    data_manager = PawControlData(hass, config_entry)
+
+    get_runtime_data.assert_called_once_with(hass, config_entry)
+    register_monitor.assert_called_once_with("event_queue", data_manager)
+    snapshot = data_manager.coordinator_snapshot()
+    assert snapshot["stats"] == data_manager.get_event_queue_stats()
+    assert snapshot["stats"]["high_watermark"] > 0
@@ -0,0 +1,106 @@
+"""Unit tests for the module history time index."""
+
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from custom_components.pawcontrol.history_index import ModuleHistoryIndex
+
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _parse(value: Any) -> datetime | None:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _index() -> ModuleHistoryIndex:
+    return ModuleHistoryIndex(
+        "timestamp",
+        parse=_parse,
+        normalise=lambda entry: dict(entry),
+    )
+
+
+def _entry(hours: int, **extra: Any) -> dict[str, Any]:
+    return {"timestamp": (BASE + timedelta(hours=hours)).isoformat(), **extra}
+
+
+def _hours(entries: list[Mapping[str, Any]]) -> list[Any]:
+    return [entry["n"] for entry in entries]
+
+
+@pytest.mark.unit
+def test_appends_are_inserted_without_rebuilding() -> None:
+    """Entries appended to the same list are merged incrementally."""
+    history = [_entry(2, n=2), _entry(0, n=0)]
+    index = _index()
+    index.sync(history)
+    assert index.rebuilds == 1
+
+    history.append(_entry(1, n=1))
+    history.append(_entry(3, n=3))
+    index.sync(history)
+
+    assert index.rebuilds == 1
+    assert len(index) == 4
+    assert _hours(index.query()) == [3, 2, 1, 0]
+    assert _hours(index.query(newest_first=False, limit=2)) == [0, 1]
+
+
+@pytest.mark.unit
+def test_trimmed_or_replaced_lists_trigger_rebuild() -> None:
+    """Trimming in place or swapping the list resynchronises the index."""
+    history = [_entry(hour, n=hour) for hour in range(5)]
+    index = _index()
+    index.sync(history)
+
+    history[:] = history[2:]
+    index.sync(history)
+    assert index.rebuilds == 2
+    assert _hours(index.query()) == [4, 3, 2]
+
+    index.sync([_entry(9, n=9)])
+    assert index.rebuilds == 3
+    assert _hours(index.query()) == [9]
+
+
+@pytest.mark.unit
+def test_window_queries_are_inclusive_and_skip_untimed_entries() -> None:
+    """Bounded queries bisect the timed keys and honour the limit."""
+    history = [_entry(hour, n=hour) for hour in range(10)]
+    history.append({"timestamp": "not-a-date", "n": "bad"})
+    history.append({"n": "missing"})
+    history.append("ignored")
+    index = _index()
+    index.sync(history)
+
+    since = BASE + timedelta(hours=3)
+    until = BASE + timedelta(hours=6)
+    assert _hours(index.query(since=since, until=until)) == [6, 5, 4, 3]
+    assert _hours(index.query(since=since, limit=2)) == [9, 8]
+    assert index.count(since=since, until=until) == 4
+    assert _hours(index.query(limit=0)) == []
+
+    unbounded = _hours(index.query())
+    assert unbounded[:10] == list(range(9, -1, -1))
+    assert unbounded[10:] == ["bad", "missing"]
+    assert _hours(index.query(newest_first=False))[:2] == ["missing", "bad"]
+
+
+@pytest.mark.unit
+def test_query_returns_copies_of_cached_payloads() -> None:
+    """Callers may mutate query results without corrupting the cache."""
+    history = [_entry(0, n=0)]
+    index = _index()
+    index.sync(history)
+
+    index.query()[0]["n"] = "changed"
+
+    assert _hours(index.query()) == [0]
@@ -0,0 +1,144 @@
+"""Unit tests for the runtime metrics registry and guard collector."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.pawcontrol import telemetry
+from custom_components.pawcontrol.metrics_registry import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+@pytest.mark.unit
+def test_histogram_tracks_buckets_and_extremes() -> None:
+    """Observations land in fixed buckets and keep count, sum and extremes."""
+    histogram = Histogram("duration", bounds=(0.001, 0.01, 0.1))
+    for value in (0.0005, 0.002, 0.002, 0.05, 0.5):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.total == pytest.approx(0.5545)
+    assert histogram.mean == pytest.approx(0.1109)
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(1.0) == 0.5
+    rendered = histogram.render()
+    assert rendered["min"] == 0.0005
+    assert rendered["max"] == 0.5
+    assert rendered["buckets"] == {
+        "le_0.001": 1,
+        "le_0.01": 2,
+        "le_0.1": 1,
+        "overflow": 1,
+    }
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert histogram.quantile(0.95) is None
+    assert histogram.render()["min"] is None
+
+
+@pytest.mark.unit
+def test_histogram_seed_carries_aggregates_without_buckets() -> None:
+    """Seeded summaries feed count, sum and extremes but not the buckets."""
+    histogram = Histogram("duration", bounds=(0.001, 0.01))
+    histogram.seed(count=2, total=0.004, minimum=0.001, maximum=0.003)
+    histogram.observe(0.0005)
+
+    assert histogram.count == 3
+    assert histogram.total == pytest.approx(0.0045)
+    assert histogram.minimum == 0.0005
+    assert histogram.maximum == 0.003
+    assert sum(histogram.counts) == 1
+
+
+@pytest.mark.unit
+def test_registry_reuses_metrics_and_rejects_kind_mismatch() -> None:
+    """Metrics are created once per name and keep their declared kind."""
+    registry = MetricsRegistry()
+    counter = registry.counter("calls")
+    counter.inc()
+    counter.inc(2)
+    registry.gauge("floor").set(0.5)
+
+    assert registry.counter("calls") is counter
+    assert registry.render() == {"calls": 3, "floor": 0.5}
+    assert list(registry) == ["calls", "floor"]
+    with pytest.raises(TypeError):
+        registry.histogram("calls")
+
+    collector = registry.collector("guard", lambda _registry: Counter("guard"))
+    assert registry.collector("guard", lambda _registry: Counter("other")) is collector
+    assert "guard" in registry
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.get_collector("guard") is None
+
+
+@pytest.mark.unit
+def test_guard_collector_renders_payload_lazily() -> None:
+    """Samples only touch the collector; the payload is rendered on read."""
+    samples = [
+        (0.00045, 0.0004, "stable"),
+        (0.0009, 0.003, "expand"),
+        (0.0009, 0.0008, "stable"),
+        (0.0006, 0.0001, "contract"),
+        (0.0006, 0.0005, "stable"),
+        (0.0006, 0.0005, "stable"),
+        (0.0012, 0.004, "expand"),
+    ]
+    runtime = SimpleNamespace(performance_stats={})
+    for runtime_floor, duration, event in samples:
+        telemetry.record_runtime_entity_factory_guard_sample(
+            runtime,
+            runtime_floor=runtime_floor,
+            actual_duration=duration,
+            event=event,
+            baseline_floor=0.00045,
+            max_floor=0.0045,
+            enforce_min_runtime=True,
+        )
+        assert "entity_factory_guard_metrics" not in runtime.performance_stats
+
+    collector = telemetry.get_runtime_entity_factory_guard_collector(runtime)
+    assert collector is not None
+    assert collector.dirty is True
+
+    rendered = telemetry.get_runtime_entity_factory_guard_metrics(runtime)
+    assert rendered is not None
+    assert collector.dirty is False
+    assert rendered["last_updated"]
+    assert rendered["samples"] == 7
+    assert rendered["stable_samples"] == 4
+    assert rendered["expansions"] == 2
+    assert rendered["contractions"] == 1
+    assert rendered["stable_ratio"] == pytest.approx(4 / 7)
+    assert rendered["volatility_ratio"] == pytest.approx(3 / 7)
+    assert rendered["runtime_floor"] == 0.0012
+    assert rendered["peak_runtime_floor"] == 0.0012
+    assert rendered["lowest_runtime_floor"] == 0.00045
+    assert rendered["last_floor_change"] == pytest.approx(0.0006)
+    assert rendered["last_floor_change_ratio"] == pytest.approx(1.0)
+    assert rendered["last_event"] == "expand"
+    assert rendered["last_expansion_duration"] == 0.004
+    assert rendered["last_contraction_duration"] == 0.0001
+    assert rendered["max_duration"] == 0.004
+    assert rendered["min_duration"] == 0.0001
+    assert rendered["recent_durations"] == [0.0008, 0.0001, 0.0005, 0.0005, 0.004]
+    assert rendered["recent_events"] == [
+        "stable",
+        "contract",
+        "stable",
+        "stable",
+        "expand",
+    ]
+    assert rendered["recent_stable_ratio"] == pytest.approx(0.6)
+    assert rendered["consecutive_stable_samples"] == 0
+    assert rendered["longest_stable_run"] == 2
+    # 3/5 recent stable samples against 4/6 before the last sample.
+    assert rendered["stability_trend"] == "regressing"
+
+    assert telemetry.get_runtime_entity_factory_guard_metrics(runtime) is rendered
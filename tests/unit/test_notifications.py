@@ -959,6 +959,88 @@ class TestChannelDelivery:
         # Should have recorded failure
         assert len(notification.failed_channels) > 0
 
+    async def test_slow_channel_does_not_block_other_notifications(
+        self, mock_notification_manager
+    ) -> None:
+        """A hung channel only occupies its own delivery lane."""
+        manager = mock_notification_manager
+        release = asyncio.Event()
+        delivered: list[str] = []
+
+        async def slow_webhook(notification: NotificationEvent) -> None:
+            await release.wait()
+            delivered.append(f"webhook:{notification.title}")
+
+        async def persistent(notification: NotificationEvent) -> None:
+            delivered.append(f"persistent:{notification.title}")
+
+        manager._handlers[NotificationChannel.WEBHOOK] = slow_webhook
+        manager._handlers[NotificationChannel.PERSISTENT] = persistent
+
+        slow_send = asyncio.create_task(
+            manager.async_send_notification(
+                notification_type=NotificationType.SYSTEM_INFO,
+                title="Slow",
+                message="Hung endpoint",
+                force_channels=[NotificationChannel.WEBHOOK],
+            )
+        )
+        for _ in range(20):
+            await asyncio.sleep(0)
+            lane = manager._delivery_pool.snapshot().get("webhook")
+            if lane and lane["in_flight"]:
+                break
+
+        await asyncio.wait_for(
+            manager.async_send_notification(
+                notification_type=NotificationType.SYSTEM_INFO,
+                title="Fast",
+                message="Unaffected",
+                force_channels=[NotificationChannel.PERSISTENT],
+            ),
+            timeout=1,
+        )
+        assert delivered == ["persistent:Fast"]
+
+        release.set()
+        await slow_send
+        assert delivered == ["persistent:Fast", "webhook:Slow"]
+
+        stats = await manager.async_get_performance_statistics()
+        lanes = stats["channel_delivery"]
+        assert lanes["webhook"]["completed"] == lanes["persistent"]["completed"] == 1
+        assert lanes["webhook"]["in_flight"] == 0
+        assert (
+            lanes["webhook"]["max_delivery_ms"]
+            >= lanes["persistent"]["max_delivery_ms"]
+        )
+
+    async def test_channel_timeout_marks_channel_failed(
+        self, mock_notification_manager
+    ) -> None:
+        """Deliveries exceeding the lane timeout are recorded as failures."""
+        manager = mock_notification_manager
+        manager._delivery_pool = notifications_module.ChannelDeliveryPool(
+            timeouts={"webhook": 0.01},
+        )
+
+        async def hung_webhook(notification: NotificationEvent) -> None:
+            await asyncio.Event().wait()
+
+        manager._handlers[NotificationChannel.WEBHOOK] = hung_webhook
+
+        notification_id = await manager.async_send_notification(
+            notification_type=NotificationType.SYSTEM_INFO,
+            title="Timeout",
+            message="Never answers",
+            force_channels=[NotificationChannel.WEBHOOK],
+        )
+
+        notification = manager._notifications[notification_id]
+        assert notification.failed_channels == [NotificationChannel.WEBHOOK]
+        lane = manager._delivery_pool.snapshot()["webhook"]
+        assert lane["timeouts"] == lane["failed"] == 1
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -1012,6 +1094,42 @@ class TestBatchProcessing:
         # Batch queue should have reasonable size
         assert len(mock_notification_manager._batch_queue) < 25
 
+    async def test_full_batch_flushes_without_waiting_for_max_age(
+        self, mock_notification_manager
+    ) -> None:
+        """A batch that reaches its size limit is due immediately."""
+        manager = mock_notification_manager
+        sent: list[NotificationEvent] = []
+
+        async def record_send(notification: NotificationEvent) -> None:
+            sent.append(notification)
+
+        manager._send_to_channels = AsyncMock(side_effect=record_send)
+        for index in range(notifications_module.BATCH_PROCESSING_SIZE + 2):
+            await manager.async_send_notification(
+                notification_type=NotificationType.FEEDING_REMINDER,
+                title=f"Feed {index}",
+                message="Queued",
+                dog_id="full_dog",
+                allow_batching=True,
+            )
+
+        process_task = asyncio.create_task(manager._process_batch_notifications())
+        try:
+            async with asyncio.timeout(1):
+                while not sent:
+                    await asyncio.sleep(0.01)
+        finally:
+            process_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await process_task
+
+        assert len(sent) == 1
+        assert sent[0].data["batch_count"] == notifications_module.BATCH_PROCESSING_SIZE
+        # The overflow stays pending until its own deadline.
+        assert len(manager._pending_batches["full_dog_feeding_reminder"]) == 2
+        assert "full_dog_feeding_reminder" in manager._batch_deadlines
+
     async def test_background_batch_flushes_pending_notifications(
         self, mock_notification_manager, monkeypatch
     ) -> None:
@@ -1531,6 +1649,79 @@ class TestNotificationRetries:
             await retry_task
         manager._retry_task = None
 
+    async def test_retry_waits_for_in_flight_delivery(
+        self, mock_notification_manager
+    ) -> None:
+        """A due retry must not re-send a notification still being delivered."""
+        manager = mock_notification_manager
+
+        for task_attr in ("_batch_task", "_retry_task", "_cleanup_task"):
+            task = getattr(manager, task_attr)
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            setattr(manager, task_attr, None)
+
+        release = asyncio.Event()
+        attempts: list[int] = []
+
+        async def slow_handler(notification: NotificationEvent) -> None:
+            attempts.append(notification.retry_count)
+            await release.wait()
+
+        manager._handlers[NotificationChannel.MOBILE] = (
+            manager._wrap_handler_with_monitoring(
+                slow_handler, NotificationChannel.MOBILE
+            )
+        )
+
+        notification = NotificationEvent(
+            id="in-flight",
+            dog_id=None,
+            notification_type=NotificationType.SYSTEM_INFO,
+            priority=NotificationPriority.NORMAL,
+            title="Status",
+            message="Slow delivery",
+            created_at=datetime.now(UTC) - timedelta(seconds=RETRY_DELAY_SECONDS * 4),
+            channels=[NotificationChannel.MOBILE],
+            failed_channels=[NotificationChannel.MOBILE],
+        )
+        manager._notifications[notification.id] = notification
+
+        delivery = asyncio.create_task(manager._send_to_channels(notification))
+        for _ in range(5):
+            if attempts:
+                break
+            await asyncio.sleep(0)
+        assert attempts == [0]
+
+        # The earlier failure left a retry that is already due.
+        manager._schedule_retry(notification)
+        retry_task = asyncio.create_task(manager._retry_failed_notifications())
+        manager._retry_task = retry_task
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        assert attempts == [0]
+        assert notification.retry_count == 0
+
+        release.set()
+        await delivery
+        for _ in range(50):
+            if len(attempts) == 2:
+                break
+            await asyncio.sleep(0)
+
+        assert attempts == [0, 1]
+        assert notification.failed_channels == []
+        assert manager._in_flight == set()
+
+        retry_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await retry_task
+        manager._retry_task = None
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
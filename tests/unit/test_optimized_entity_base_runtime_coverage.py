@@ -14,6 +14,10 @@ from homeassistant.util import dt as dt_util
 import pytest
 
 from custom_components.pawcontrol import optimized_entity_base as oeb
+from custom_components.pawcontrol.coordinator_accessors import (
+    DogSnapshot,
+    DogSnapshotIndex,
+)
 from custom_components.pawcontrol.optimized_entity_base import (
     _ATTRIBUTES_CACHE,
     _AVAILABILITY_CACHE,
@@ -63,6 +67,20 @@ class _DummyCoordinator:
         self.refresh_calls += 1
 
 
+class _SnapshotCoordinator(_DummyCoordinator):
+    """Coordinator double publishing versioned dog snapshots."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._snapshots = DogSnapshotIndex()
+
+    def get_dog_snapshot(self, dog_id: str) -> DogSnapshot | None:
+        payload = self._dog_payload.get(dog_id)
+        if payload is None:
+            return None
+        return self._snapshots.resolve(dog_id, payload)
+
+
 class _RefreshOnlyCoordinator:
     """Coordinator exposing only ``async_refresh`` for branch coverage."""
 
@@ -70,6 +88,7 @@ class _RefreshOnlyCoordinator:
         self.available = True
         self.last_update_success = True
         self.refresh_calls = 0
+        self.schedule_invalidations = 0
 
     def get_dog_data(self, dog_id: str) -> Mapping[str, Any] | None:
         _ = dog_id
@@ -79,6 +98,9 @@ class _RefreshOnlyCoordinator:
         _ = dog_id, module
         return {}
 
+    def _invalidate_module_schedule(self) -> None:
+        self.schedule_invalidations += 1
+
     async def async_refresh(self) -> None:
         self.refresh_calls += 1
 
@@ -633,6 +655,57 @@ def test_get_dog_data_cached_bypasses_cache_when_cached_was_offline() -> None:
     assert payload["status"] == "online"
 
 
+def test_snapshot_cache_is_zero_copy_and_keyed_by_version() -> None:
+    """Snapshot reads share the coordinator payload until its version changes."""
+    coordinator = _SnapshotCoordinator()
+    gps = {"latitude": 1.0}
+    coordinator._dog_payload["dog-1"] = {
+        "status": "online",
+        "last_update": None,
+        "gps": gps,
+    }
+    entity = _DummyEntity(coordinator)
+
+    first = entity._get_dog_data_cached()
+    assert first is entity._get_dog_data_cached()
+    assert first["gps"] == gps
+    with pytest.raises(TypeError):
+        first["status"] = "offline"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        first["gps"]["latitude"] = 3.0  # type: ignore[index]
+    module = entity._get_module_data_cached("gps")
+    assert module is entity._get_module_data_cached("gps")
+    assert module["latitude"] == 1.0
+
+    coordinator._dog_payload["dog-1"] = {
+        "status": "online",
+        "last_update": None,
+        "gps": {"latitude": 2.0},
+    }
+
+    assert entity._get_dog_data_cached()["gps"]["latitude"] == 2.0
+    assert entity._get_module_data_cached("gps")["latitude"] == 2.0
+    assert _STATE_CACHE[f"dog_data_{entity._dog_id}"].version == 2
+
+
+def test_snapshot_cache_drops_payload_when_coordinator_goes_offline() -> None:
+    """A coordinator outage must not keep serving the last snapshot."""
+    coordinator = _SnapshotCoordinator()
+    coordinator._dog_payload["dog-1"] = {
+        "status": "online",
+        "last_update": None,
+        "gps": {"latitude": 1.0},
+    }
+    entity = _DummyEntity(coordinator)
+    assert entity._get_dog_data_cached()["status"] == "online"
+
+    coordinator.available = False
+    coordinator.last_update_success = False
+
+    assert entity._get_dog_data_cached()["status"] == "offline"
+    assert _STATE_CACHE[f"dog_data_{entity._dog_id}"].coordinator_available is False
+
+
 def test_get_module_data_cached_for_typed_and_untyped_paths(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -782,6 +855,7 @@ async def test_async_update_and_refresh_dispatcher_branches(
     refresh_entity = _DummyEntity(_RefreshOnlyCoordinator())
     await refresh_entity._async_request_refresh()
     assert refresh_entity.coordinator.refresh_calls == 1
+    assert refresh_entity.coordinator.schedule_invalidations == 1
 
 
 @pytest.mark.asyncio
@@ -342,3 +342,196 @@ async def test_async_process_gps_push_handles_gps_manager_failures(
 
     assert rejected["error"] == "gps_rejected"
     assert failed["error"] == "gps_update_failed"
+
+
+@pytest.mark.asyncio
+async def test_async_process_gps_push_batch_applies_points_with_single_patch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batches apply valid points in timestamp order and patch the coordinator once."""
+    hass = SimpleNamespace(data={})
+    entry = _entry(source="webhook")
+    gps_manager = SimpleNamespace(async_add_gps_point=AsyncMock(return_value=True))
+    coordinator = SimpleNamespace(
+        gps_geofence_manager=None,
+        async_patch_gps_update=AsyncMock(),
+        async_patch_gps_updates=AsyncMock(),
+        async_refresh_dog=AsyncMock(),
+    )
+    runtime = SimpleNamespace(coordinator=coordinator, gps_geofence_manager=gps_manager)
+    monkeypatch.setattr(
+        push_router, "require_runtime_data", lambda _hass, _entry: runtime
+    )
+
+    result = await push_router.async_process_gps_push_batch(
+        hass,
+        entry,
+        payload={
+            "dog_id": "dog-1",
+            "points": [
+                {
+                    "latitude": 10.0,
+                    "longitude": 20.0,
+                    "timestamp": "2025-01-01T01:02:05+00:00",
+                },
+                {"latitude": 100.0, "longitude": 20.0},
+                {
+                    "latitude": 11.0,
+                    "longitude": 21.0,
+                    "timestamp": "2025-01-01T01:02:03+00:00",
+                },
+                {"dog_id": "dog-404", "latitude": 1.0, "longitude": 2.0},
+            ],
+        },
+        source="webhook",
+    )
+
+    assert result["ok"] is True
+    assert result["accepted"] == 2
+    assert result["rejected"] == 2
+    assert [item.get("error") for item in result["results"]] == [
+        None,
+        "coordinates_out_of_range",
+        None,
+        "unknown_dog_id",
+    ]
+    assert [item["index"] for item in result["results"]] == [0, 1, 2, 3]
+    latitudes = [
+        call.kwargs["latitude"]
+        for call in gps_manager.async_add_gps_point.await_args_list
+    ]
+    assert latitudes == [11.0, 10.0]
+    coordinator.async_patch_gps_updates.assert_awaited_once_with(["dog-1"])
+    coordinator.async_patch_gps_update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_async_process_gps_push_batch_charges_rate_limit_once_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A batch consumes one limiter slot; replays and empty batches are rejected."""
+    hass = SimpleNamespace(data={})
+    entry = _entry(source="webhook")
+    entry.options["push_rate_limit_webhook_per_minute"] = 1
+    gps_manager = SimpleNamespace(async_add_gps_point=AsyncMock(return_value=True))
+    coordinator = SimpleNamespace(
+        gps_geofence_manager=None,
+        async_patch_gps_update=AsyncMock(),
+        async_refresh_dog=AsyncMock(),
+    )
+    runtime = SimpleNamespace(coordinator=coordinator, gps_geofence_manager=gps_manager)
+    monkeypatch.setattr(
+        push_router, "require_runtime_data", lambda _hass, _entry: runtime
+    )
+    payload = {
+        "dog_id": "dog-1",
+        "points": [{"latitude": 10.0, "longitude": 20.0 + i} for i in range(5)],
+    }
+
+    first = await push_router.async_process_gps_push_batch(
+        hass, entry, payload=payload, source="webhook", nonce="n-1"
+    )
+    replay = await push_router.async_process_gps_push_batch(
+        hass, entry, payload=payload, source="webhook", nonce="n-1"
+    )
+    limited = await push_router.async_process_gps_push_batch(
+        hass, entry, payload=payload, source="webhook"
+    )
+    empty = await push_router.async_process_gps_push_batch(
+        hass, entry, payload={"dog_id": "dog-1", "points": []}, source="webhook"
+    )
+
+    assert first["accepted"] == 5
+    assert gps_manager.async_add_gps_point.await_count == 5
+    # Coordinators without the batch hook fall back to per-dog patching.
+    coordinator.async_patch_gps_update.assert_awaited_once_with("dog-1")
+    assert replay["error"] == "replay_nonce"
+    assert replay["status"] == 409
+    assert limited["ok"] is False
+    assert limited["status"] == 429
+    assert limited["rejected"] == 5
+    assert empty["error"] == "invalid_payload"
+
+
+@pytest.mark.asyncio
+async def test_async_process_gps_push_batch_caps_points_per_dog(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Points beyond the per-dog point budget are rejected in batch order."""
+    hass = SimpleNamespace(data={})
+    entry = _entry(source="webhook")
+    gps_manager = SimpleNamespace(async_add_gps_point=AsyncMock(return_value=True))
+    coordinator = SimpleNamespace(
+        gps_geofence_manager=None,
+        async_patch_gps_update=AsyncMock(),
+        async_refresh_dog=AsyncMock(),
+    )
+    runtime = SimpleNamespace(coordinator=coordinator, gps_geofence_manager=gps_manager)
+    monkeypatch.setattr(
+        push_router, "require_runtime_data", lambda _hass, _entry: runtime
+    )
+    monkeypatch.setattr(push_router, "_BATCH_POINTS_PER_MINUTE", 3)
+    payload = {
+        "dog_id": "dog-1",
+        "points": [{"latitude": 10.0, "longitude": 20.0 + i} for i in range(5)],
+    }
+
+    result = await push_router.async_process_gps_push_batch(
+        hass, entry, payload=payload, source="webhook"
+    )
+
+    assert result["accepted"] == 3
+    assert [item.get("error") for item in result["results"]] == [
+        None,
+        None,
+        None,
+        "rate_limited",
+        "rate_limited",
+    ]
+    assert gps_manager.async_add_gps_point.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_process_gps_push_batch_orders_naive_and_aware_timestamps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Naive timestamps are read as UTC so mixed batches still sort."""
+    hass = SimpleNamespace(data={})
+    entry = _entry(source="webhook")
+    gps_manager = SimpleNamespace(async_add_gps_point=AsyncMock(return_value=True))
+    coordinator = SimpleNamespace(
+        gps_geofence_manager=None,
+        async_patch_gps_update=AsyncMock(),
+        async_refresh_dog=AsyncMock(),
+    )
+    runtime = SimpleNamespace(coordinator=coordinator, gps_geofence_manager=gps_manager)
+    monkeypatch.setattr(
+        push_router, "require_runtime_data", lambda _hass, _entry: runtime
+    )
+
+    result = await push_router.async_process_gps_push_batch(
+        hass,
+        entry,
+        payload={
+            "dog_id": "dog-1",
+            "points": [
+                {"latitude": 10.0, "longitude": 20.0},
+                {
+                    "latitude": 11.0,
+                    "longitude": 21.0,
+                    "timestamp": "2024-01-01T00:00:00",
+                },
+                {
+                    "latitude": 12.0,
+                    "longitude": 22.0,
+                    "timestamp": "2024-01-01T00:00:05+00:00",
+                },
+            ],
+        },
+        source="webhook",
+    )
+
+    assert result["accepted"] == 3
+    calls = gps_manager.async_add_gps_point.await_args_list
+    assert [call.kwargs["latitude"] for call in calls] == [11.0, 12.0, 10.0]
+    assert all(call.kwargs["timestamp"].tzinfo is not None for call in calls)
@@ -215,9 +215,7 @@ def test_limiter_reuses_matching_instance_and_replaces_with_new_limit() -> None:
 
 def test_rate_limiter_allow_prunes_expired_and_enforces_capacity() -> None:
     """Limiter should evict old events and reject bursts over configured max."""
-    limiter = push_router._RateLimiter(
-        window_seconds=60, max_events=2, events=push_router.deque()
-    )
+    limiter = push_router.SlidingWindowLimiter(60.0, 2)
 
     assert limiter.allow(100.0) is True
     assert limiter.allow(150.0) is True
@@ -0,0 +1,76 @@
+"""Unit tests for the shared sliding-window rate limiter."""
+
+import pytest
+
+from custom_components.pawcontrol.rate_limiter import (
+    RateLimiterRegistry,
+    SlidingWindowCounter,
+    SlidingWindowLimiter,
+)
+
+
+@pytest.mark.unit
+def test_counter_bounds_memory_and_expires_buckets() -> None:
+    """High request rates merge into buckets that leave the window together."""
+    counter = SlidingWindowCounter(60.0)
+    for index in range(10_000):
+        counter.add(1_000.0 + index * 0.006)
+
+    assert counter.count(1_060.0) == 10_000
+    assert len(counter._buckets) <= 61
+    assert counter.last_event() == pytest.approx(1_059.994)
+    assert counter.count(1_120.1) == 0
+    assert counter.last_event() is None
+
+    counter.add(2_000.0, count=3)
+    assert counter.count(2_000.0) == 3
+    counter.clear()
+    assert counter.count(2_000.0) == 0
+
+
+@pytest.mark.unit
+def test_limiter_admits_until_window_is_full() -> None:
+    """Rejected attempts are not recorded and capacity returns over time."""
+    limiter = SlidingWindowLimiter(60.0, 2)
+
+    assert limiter.allow(100.0) is True
+    assert limiter.allow(150.0) is True
+    assert limiter.allow(159.0) is False
+    assert limiter.count(159.0) == 2
+    assert limiter.allow(161.0) is True
+    assert limiter.last_seen == 161.0
+    assert limiter.window_seconds == 60.0
+
+
+@pytest.mark.unit
+def test_limiter_admit_charges_each_batched_event() -> None:
+    """Weighted admissions grant only the remaining budget."""
+    limiter = SlidingWindowLimiter(60.0, 5)
+
+    assert limiter.admit(100.0, 3) == 3
+    assert limiter.admit(101.0, 4) == 2
+    assert limiter.admit(102.0, 1) == 0
+    assert limiter.allow(102.0) is False
+    assert limiter.count(102.0) == 5
+    assert limiter.admit(161.0, 4) == 4
+
+
+@pytest.mark.unit
+def test_registry_evicts_idle_keys_and_rebuilds_changed_limits() -> None:
+    """Idle keys are dropped and new limits replace stale limiters."""
+    registry: RateLimiterRegistry[str] = RateLimiterRegistry(idle_seconds=300.0)
+
+    assert registry.allow("a", 0.0, window_seconds=60.0, max_events=1) is True
+    assert registry.allow("b", 100.0, window_seconds=60.0, max_events=1) is True
+    assert registry.allow("a", 30.0, window_seconds=60.0, max_events=1) is False
+    assert registry.allow("a", 30.0, window_seconds=60.0, max_events=2) is True
+    assert list(registry) == ["b", "a"]
+
+    assert registry.allow("c", 350.0, window_seconds=60.0, max_events=1) is True
+    assert "b" in registry
+    assert registry.evict_idle(401.0) == 2
+    assert list(registry) == ["c"]
+    assert registry.evicted == 2
+
+    registry.discard("c")
+    assert len(registry) == 0
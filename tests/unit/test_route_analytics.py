@@ -0,0 +1,88 @@
+"""Unit tests for the batched route analytics engine."""
+
+import math
+
+import pytest
+
+from custom_components.pawcontrol.route_analytics import HAS_NUMPY, analyze_track
+from custom_components.pawcontrol.route_track import TrackBuffer, calculate_distance
+
+
+def _track(count: int) -> TrackBuffer:
+    track = TrackBuffer()
+    for index in range(count):
+        track.add(
+            52.52 + index * 0.0001,
+            13.40 + (index % 5) * 0.00005,
+            1_767_268_800.0 + index * 10,
+            altitude=math.nan if index % 7 == 3 else 30.0 + (index % 4),
+            accuracy=80.0 if index % 10 == 0 else 5.0,
+            speed=float(index % 9),
+        )
+    return track
+
+
+@pytest.mark.unit
+def test_fallback_matches_per_point_formulas() -> None:
+    """The pure-Python pass filters jumps and stalls like the old loops."""
+    track = _track(6)
+    # A stalled sample followed by a >1 km jump: both segments are outliers.
+    track.add(track.latitudes[-1], track.longitudes[-1], track.timestamps[-1])
+    track.add(53.0, 13.4, track.timestamps[-1] + 10)
+
+    analytics = analyze_track(track, use_numpy=False)
+
+    distances = [
+        calculate_distance(
+            track.latitudes[i - 1],
+            track.longitudes[i - 1],
+            track.latitudes[i],
+            track.longitudes[i],
+        )
+        for i in range(1, len(track))
+    ]
+    assert list(analytics.segment_distances) == pytest.approx(distances)
+    assert analytics.total_distance_m == pytest.approx(sum(distances))
+    assert analytics.outlier_count == 2
+    assert list(analytics.valid_segments) == [1, 1, 1, 1, 1, 0, 0]
+    assert analytics.valid_distance_m == pytest.approx(sum(distances[:5]))
+    assert analytics.valid_duration_s == 50.0
+    assert analytics.max_speed_mps == pytest.approx(max(distances[:5]) / 10)
+    assert analytics.elevation_gain_m == pytest.approx(track.elevation_gain())
+    assert analytics.max_recorded_speed == 5.0
+    assert analytics.accuracy_ratio == pytest.approx(7 / 8)
+    assert analytics.quality_score == pytest.approx(62.5)
+
+
+@pytest.mark.unit
+def test_empty_and_single_point_tracks() -> None:
+    """Degenerate tracks produce neutral analytics."""
+    assert analyze_track(TrackBuffer()).quality_score == 0.0
+
+    single = _track(1)
+    analytics = analyze_track(single)
+    assert analytics.segment_count == 0
+    assert analytics.avg_speed_mps is None
+    assert analytics.accuracy_ratio == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+def test_numpy_path_matches_fallback() -> None:
+    """Vectorised and pure-Python passes agree on every figure."""
+    track = _track(2_000)
+    track.add(54.0, 13.4, track.timestamps[-1] + 5)
+
+    fast = analyze_track(track, use_numpy=True)
+    slow = analyze_track(track, use_numpy=False)
+
+    assert list(fast.segment_distances) == pytest.approx(list(slow.segment_distances))
+    assert fast.valid_segments == slow.valid_segments
+    assert fast.total_distance_m == pytest.approx(slow.total_distance_m)
+    assert fast.valid_distance_m == pytest.approx(slow.valid_distance_m)
+    assert fast.avg_speed_mps == pytest.approx(slow.avg_speed_mps)
+    assert fast.max_speed_mps == pytest.approx(slow.max_speed_mps)
+    assert fast.max_recorded_speed == slow.max_recorded_speed
+    assert fast.elevation_gain_m == pytest.approx(slow.elevation_gain_m)
+    assert fast.accuracy_ratio == slow.accuracy_ratio
+    assert fast.outlier_count == slow.outlier_count == 1
@@ -0,0 +1,140 @@
+"""Unit tests for error-bounded route simplification."""
+
+import math
+
+import pytest
+
+from custom_components.pawcontrol.route_simplify import (
+    StreamingTrack,
+    simplify_indices,
+    simplify_route_points,
+    simplify_track,
+)
+from custom_components.pawcontrol.route_track import TrackBuffer
+
+_METERS_PER_DEG = 111_195.0
+
+
+def _zigzag(count: int) -> list[tuple[float, float]]:
+    """Return a wandering path with a few meters of lateral jitter."""
+    return [
+        (
+            52.52 + index * 0.00005,
+            13.40 + 0.00004 * math.sin(index / 3) + (index // 400) * 0.001,
+        )
+        for index in range(count)
+    ]
+
+
+def _deviation(
+    point: tuple[float, float], polyline: list[tuple[float, float]]
+) -> float:
+    """Distance in meters from ``point`` to the closest polyline segment."""
+    cos_lat = math.cos(math.radians(polyline[0][0]))
+
+    def project(lat: float, lon: float) -> tuple[float, float]:
+        return lon * _METERS_PER_DEG * cos_lat, lat * _METERS_PER_DEG
+
+    px, py = project(*point)
+    best = math.inf
+    for (alat, alon), (blat, blon) in zip(polyline, polyline[1:], strict=False):
+        ax, ay = project(alat, alon)
+        bx, by = project(blat, blon)
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy or 1e-12
+        t = min(1.0, max(0.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+        best = min(best, math.hypot(px - ax - t * dx, py - ay - t * dy))
+    return best
+
+
+@pytest.mark.unit
+def test_simplify_indices_keeps_corners_within_tolerance() -> None:
+    """Straight legs collapse while the corner and endpoints survive."""
+    lats = [52.52 + i * 0.0001 for i in range(50)] + [52.5249] * 49
+    lons = [13.40] * 50 + [13.40 + i * 0.0001 for i in range(1, 50)]
+
+    result = simplify_indices(lats, lons, 2.0)
+
+    assert result.indices == [0, 49, 98]
+    assert result.max_deviation_m < 2.0
+
+    capped = simplify_indices(*zip(*_zigzag(300), strict=True), 0.1, max_points=20)
+    assert len(capped.indices) <= 20
+    assert capped.tolerance_m > 0.1
+
+
+@pytest.mark.unit
+def test_streaming_track_bounds_memory_and_measures_error() -> None:
+    """Online compaction keeps the tail and reports a sound error bound."""
+    samples = _zigzag(3_000)
+    track = StreamingTrack(capacity=200, tolerance_m=1.0)
+    reference = TrackBuffer()
+    for index, (lat, lon) in enumerate(samples):
+        track.add(lat, lon, float(index), altitude=float(index % 5), speed=1.5)
+        reference.add(lat, lon, float(index), altitude=float(index % 5))
+
+    assert len(track) <= 200
+    assert track.raw_points == 3_000
+    assert track.compactions > 0
+    assert track.last_position() == samples[-1]
+    assert track.row(0).latitude == samples[0][0]
+    assert track.raw_distance_m == pytest.approx(reference.total_distance())
+    assert track.raw_elevation_gain_m == pytest.approx(reference.elevation_gain())
+    assert track.raw_max_speed == 1.5
+    assert 0.0 <= track.distance_error_m < track.raw_distance_m * 0.05
+
+    polyline = list(zip(track.latitudes, track.longitudes, strict=True))
+    worst = max(_deviation(sample, polyline) for sample in samples)
+    assert worst <= track.max_deviation_m + 0.01
+
+    stats = track.simplification_stats()
+    assert stats["kept_points"] == len(track)
+    assert stats["tolerance_m"] == 1.0
+    assert stats["peak_tolerance_m"] >= stats["tolerance_m"]
+
+
+@pytest.mark.unit
+def test_streaming_track_keeps_base_tolerance_after_dense_stretch() -> None:
+    """A raised compaction tolerance does not carry over to later samples."""
+    track = StreamingTrack(capacity=50, tolerance_m=1.0)
+    # Dense lateral jitter forces the first compaction to raise its tolerance.
+    for index in range(51):
+        track.add(52.52 + index * 0.00001, 13.40 + (index % 2) * 0.0001, index)
+    assert track.compactions == 1
+    assert track.peak_tolerance_m > 1.0
+    assert track.tolerance_m == 1.0
+
+    # A later straight stretch with one 5 m detour keeps the detour because
+    # the next compaction starts from the configured tolerance again.
+    detour = (52.53, 13.41 + 5 / (_METERS_PER_DEG * math.cos(math.radians(52.53))))
+    for index in range(50):
+        lat, lon = 52.52 + 0.0005 + index * 0.0002, 13.41
+        if index == 25:
+            lat, lon = detour
+        track.add(lat, lon, 100 + index)
+    assert track.compactions == 2
+    assert detour in zip(track.latitudes, track.longitudes, strict=True)
+
+    track.clear()
+    assert track.peak_tolerance_m == 1.0
+
+
+@pytest.mark.unit
+def test_simplify_helpers_preserve_original_points() -> None:
+    """Mapping and track helpers reuse the same stage."""
+    points = [
+        {"latitude": lat, "longitude": lon, "timestamp": index}
+        for index, (lat, lon) in enumerate(_zigzag(500))
+    ]
+    points.insert(3, {"latitude": None, "longitude": 13.4})
+
+    simplified = simplify_route_points(points, 2.0, max_points=50)
+
+    assert len(simplified) <= 50
+    assert simplified[0] is points[0]
+    assert simplified[-1] is points[-1]
+
+    track = TrackBuffer()
+    track.add(52.5, 13.4, 0.0)
+    track.add(52.5001, 13.4, 1.0)
+    assert simplify_track(track) is track
@@ -0,0 +1,71 @@
+"""Unit tests for the columnar GPS track buffer."""
+
+from datetime import UTC, datetime, timedelta
+import math
+
+import pytest
+
+from custom_components.pawcontrol.route_track import (
+    TrackBuffer,
+    calculate_distance,
+    datetime_to_epoch,
+)
+
+
+def _track(count: int) -> TrackBuffer:
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    track = TrackBuffer()
+    for index in range(count):
+        track.add(
+            52.52 + index * 0.0001,
+            13.40,
+            datetime_to_epoch(start + timedelta(seconds=index * 10)),
+            altitude=30.0 + (index % 3),
+            speed=float(index),
+        )
+    return track
+
+
+@pytest.mark.unit
+def test_statistics_read_columns_directly() -> None:
+    """Distance, elevation and speed statistics match the per-point formulas."""
+    track = _track(4)
+
+    expected = sum(
+        calculate_distance(track.latitudes[i - 1], 13.40, track.latitudes[i], 13.40)
+        for i in range(1, 4)
+    )
+    assert track.total_distance() == pytest.approx(expected)
+    assert track.total_distance() == pytest.approx(33.36, abs=0.05)
+    # 30 -> 31 -> 32 -> 30 climbs twice by one meter.
+    assert track.elevation_gain() == pytest.approx(2.0)
+    assert track.max_speed() == 3.0
+    assert track.last_position() == (track.latitudes[-1], 13.40)
+
+
+@pytest.mark.unit
+def test_route_points_round_trip_and_missing_values() -> None:
+    """Dictionaries are materialised on demand and parsed back once."""
+    points = [
+        {
+            "latitude": 52.5,
+            "longitude": 13.4,
+            "timestamp": "2026-01-01T12:00:00+00:00",
+            "accuracy": 4.0,
+            "source": "webhook",
+        },
+        {"latitude": 52.6, "longitude": 13.5, "timestamp": "not-a-time"},
+        {"latitude": 52.7, "longitude": 13.6, "timestamp": "2026-01-01T12:01:00Z"},
+    ]
+
+    track = TrackBuffer.from_route_points(points)
+    materialised = track.to_route_points()
+
+    assert len(track) == 2
+    assert math.isnan(track.altitudes[0])
+    assert materialised[0]["timestamp"] == "2026-01-01T12:00:00+00:00"
+    assert materialised[0]["accuracy"] == 4.0
+    assert materialised[0]["altitude"] is None
+    assert materialised[0]["source"] == "webhook"
+    assert "source" not in materialised[1]
+    assert track.row(-1).timestamp - track.row(0).timestamp == 60.0
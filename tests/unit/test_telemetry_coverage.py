@@ -211,7 +211,7 @@ def test_runtime_bool_coercion_summary_helpers_cover_mapping_and_store_paths(
 def test_record_bool_coercion_event_recreates_missing_last_reset() -> None:
     """Recording coercions should repopulate ``last_reset`` when absent."""
     telemetry.reset_bool_coercion_metrics()
-    telemetry._BOOL_COERCION_METRICS["last_reset"] = None
+    telemetry._BOOL_COERCION_TELEMETRY.last_reset = None
     telemetry.record_bool_coercion_event(
         value="yes",
         default=False,
@@ -0,0 +1,153 @@
+"""Tests for the precompiled translation index."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from custom_components.pawcontrol import translation_index
+from custom_components.pawcontrol.translation_index import (
+    COMPILED_TRANSLATIONS_FILENAME,
+    TranslationIndex,
+    clear_translation_index_cache,
+    compile_translation_index,
+    load_translation_index,
+)
+
+INTEGRATION_PATH = (
+    Path(__file__).resolve().parents[2] / "custom_components" / "pawcontrol"
+)
+
+
+def _write_catalog(translations_dir: Path, language: str, common: object) -> None:
+    translations_dir.mkdir(parents=True, exist_ok=True)
+    (translations_dir / f"{language}.json").write_text(
+        json.dumps({"common": common, "config": {"step": {}}}),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def compiled_index(tmp_path: Path) -> Path:
+    """Compile a small translation tree with regional and placeholder entries."""
+    translations_dir = tmp_path / "translations"
+    _write_catalog(
+        translations_dir,
+        "en",
+        {"greeting": "Hello {name}", "farewell": "Bye", "colour": "Color"},
+    )
+    _write_catalog(translations_dir, "pt", {"greeting": "Olá {name}", "farewell": 1})
+    _write_catalog(
+        translations_dir,
+        "pt-BR",
+        {"greeting": "Olá {name}", "colour": "Cor"},
+    )
+    _write_catalog(translations_dir, "de", {"greeting": "Hallo {name}"})
+    index_path = tmp_path / COMPILED_TRANSLATIONS_FILENAME
+    index_path.write_bytes(compile_translation_index(translations_dir))
+    return index_path
+
+
+def test_bundled_index_matches_translation_files() -> None:
+    """The committed table must be regenerated whenever translations change."""
+    compiled = compile_translation_index(INTEGRATION_PATH / "translations")
+    committed = (INTEGRATION_PATH / COMPILED_TRANSLATIONS_FILENAME).read_bytes()
+
+    assert compiled == committed, (
+        "compiled_translations.jsonl is stale; run "
+        "'python -m scripts.compile_translations'"
+    )
+
+
+def test_index_resolves_slots_and_fallback_chain(compiled_index: Path) -> None:
+    """Keys map to stable slots and missing values walk the fallback chain."""
+    index = TranslationIndex.from_file(compiled_index)
+
+    assert index.keys == ("colour", "farewell", "greeting")
+    assert index.slot("greeting") == 2
+    assert index.slot("unknown") is None
+
+    slot = index.slot("farewell")
+    assert slot is not None
+    assert index.lookup("de", slot) == "Bye"
+    assert index.get("pt_br", "colour") == "Cor"
+    assert index.get("PT-BR", "greeting") == "Olá {name}"
+    assert index.get("pt", "colour") == "Color"
+    assert index.get("xx", "greeting") == "Hello {name}"
+    assert index.get("de", "unknown", "fallback") == "fallback"
+    assert index.templates("de", ("greeting", "farewell", "unknown")) == (
+        "Hallo {name}",
+        "Bye",
+        None,
+    )
+    assert index.common("pt-BR") == {
+        "colour": "Cor",
+        "farewell": "Bye",
+        "greeting": "Olá {name}",
+    }
+    index.close()
+
+
+def test_index_caches_resolved_templates(
+    compiled_index: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Templates are resolved through the fallback chain once per key."""
+    index = TranslationIndex.from_file(compiled_index)
+    lookups: list[tuple[str, int]] = []
+    lookup = TranslationIndex.lookup
+
+    def _counting_lookup(
+        self: TranslationIndex,
+        language: str,
+        slot: int,
+    ) -> str | None:
+        lookups.append((language, slot))
+        return lookup(self, language, slot)
+
+    monkeypatch.setattr(TranslationIndex, "lookup", _counting_lookup)
+    for _ in range(3):
+        assert index.template("de", "farewell") == "Bye"
+        assert index.template("de", "unknown") is None
+
+    assert lookups == [("de", 1)]
+    index.close()
+
+
+def test_index_elides_inherited_values_and_loads_lazily(
+    compiled_index: Path,
+) -> None:
+    """Rows only store overrides and are decoded on first use."""
+    lines = compiled_index.read_bytes().split(b"\n")
+    header = json.loads(lines[0])
+    assert sorted(header["languages"]) == ["de", "en", "pt", "pt-BR"]
+    offset, length = header["languages"]["pt-BR"]
+    body = b"\n".join(lines[1:])
+    assert json.loads(body[offset : offset + length]) == ["Cor", None, None]
+
+    index = TranslationIndex.from_file(compiled_index)
+    assert index.loaded_languages == ()
+    assert index.get("de", "greeting") == "Hallo {name}"
+    assert index.loaded_languages == ("de", "en")
+    index.close()
+
+
+def test_load_translation_index_handles_missing_and_invalid_files(
+    tmp_path: Path,
+) -> None:
+    """Callers fall back to the JSON files when no usable index exists."""
+    clear_translation_index_cache()
+    assert load_translation_index(tmp_path) is None
+
+    invalid_dir = tmp_path / "invalid"
+    invalid_dir.mkdir()
+    (invalid_dir / COMPILED_TRANSLATIONS_FILENAME).write_text(
+        '{"format": "other"}\n[]\n', encoding="utf-8"
+    )
+    assert load_translation_index(invalid_dir) is None
+
+    clear_translation_index_cache()
+    bundled = translation_index.get_bundled_translation_index()
+    assert bundled is not None
+    assert "en" in bundled.languages
+    assert bundled.get("de", "weather_alert_extreme_heat_warning_title")
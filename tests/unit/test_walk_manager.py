@@ -17,7 +17,11 @@ from custom_components.pawcontrol.walk_manager import dt_util as walk_dt_util
 
 if not hasattr(walk_dt_util, "UTC"):
     walk_dt_util.UTC = UTC  # type: ignore[attr-defined]
-from custom_components.pawcontrol.walk_manager import WalkManager, WeatherCondition
+from custom_components.pawcontrol.walk_manager import (
+    PATH_POINT_LIMIT,
+    WalkManager,
+    WeatherCondition,
+)
 
 
 @pytest.mark.unit
@@ -989,3 +993,91 @@ class TestWalkManagerCoverageBoost:
             )
             is False
         )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_active_walk_path_is_columnar_until_read(
+    mock_walk_manager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Active walk samples live in the track buffer and materialise on read."""
+    dog_id = next(iter(mock_walk_manager._dogs))
+    await mock_walk_manager.async_start_walk(dog_id)
+    base = datetime(2026, 4, 7, 12, 0, tzinfo=UTC)
+    for index in range(5):
+        sample_time = base + timedelta(seconds=40 * index)
+        monkeypatch.setattr(
+            walk_dt_util, "now", lambda sample_time=sample_time: sample_time
+        )
+        await mock_walk_manager._process_walk_detection_optimized(
+            dog_id,
+            (52.52, 13.4),
+            (52.52 + index * 0.001, 13.4),
+            speed=3.0,
+        )
+
+    assert len(mock_walk_manager._walk_tracks[dog_id]) == 5
+    assert mock_walk_manager._current_walks[dog_id]["path"] == []
+
+    active = mock_walk_manager.get_active_walk_info(dog_id)
+    assert active is not None
+    assert len(active["path"]) == 5
+
+    track = mock_walk_manager._walk_tracks[dog_id]
+    materialised: list[int] = []
+    to_route_points = type(track).to_route_points
+
+    def _counting_to_route_points(self):
+        materialised.append(len(self))
+        return to_route_points(self)
+
+    monkeypatch.setattr(type(track), "to_route_points", _counting_to_route_points)
+    for _ in range(2):
+        mock_walk_manager._statistics_cache.clear()
+        snapshot = await mock_walk_manager.async_get_walk_data_cached(dog_id)
+        assert len(snapshot["current_walk"]["path"]) == 5
+    assert materialised == []
+
+    completed = await mock_walk_manager.async_end_walk(dog_id)
+    assert completed is not None
+    assert len(completed["path"]) == 5
+    assert completed["distance"] == pytest.approx(444.8, abs=0.5)
+    assert completed["max_speed"] == 3.0
+    assert dog_id not in mock_walk_manager._walk_tracks
+
+
+@pytest.mark.asyncio
+async def test_long_walk_path_is_simplified_without_losing_tail(
+    mock_walk_manager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Walks beyond the point limit keep their corner and final sample."""
+    dog_id = next(iter(mock_walk_manager._dogs))
+    await mock_walk_manager.async_start_walk(dog_id)
+    base = datetime(2026, 4, 7, 12, 0, tzinfo=UTC)
+    leg = PATH_POINT_LIMIT
+    samples = [(52.52 + i * 0.0001, 13.4) for i in range(leg)]
+    corner = samples[-1]
+    samples += [(corner[0], 13.4 + i * 0.0001) for i in range(1, leg)]
+    for index, location in enumerate(samples):
+        sample_time = base + timedelta(seconds=40 * index)
+        monkeypatch.setattr(
+            walk_dt_util, "now", lambda sample_time=sample_time: sample_time
+        )
+        await mock_walk_manager._process_walk_detection_optimized(
+            dog_id, samples[index - 1], location, speed=float(index % 7)
+        )
+
+    assert len(mock_walk_manager._walk_tracks[dog_id]) <= PATH_POINT_LIMIT
+
+    completed = await mock_walk_manager.async_end_walk(dog_id)
+    assert completed is not None
+    path = completed["path"]
+    assert (path[-1]["latitude"], path[-1]["longitude"]) == samples[-1]
+    assert any((point["latitude"], point["longitude"]) == corner for point in path)
+    stats = completed["path_simplification"]
+    assert stats["raw_points"] == len(samples)
+    assert stats["kept_points"] == len(path)
+    assert stats["distance_error_m"] < 1.0
+    assert completed["path_optimization_applied"] is True
+    assert completed["distance"] == pytest.approx(stats["raw_distance_m"], abs=0.01)
+    assert completed["max_speed"] == 6.0
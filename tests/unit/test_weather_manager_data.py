@@ -456,3 +456,137 @@ async def test_weather_module_adapter_includes_conditions_when_available(
     assert conditions["temperature_c"] == 30.0
     assert conditions["last_updated"]
     assert "activities" in payload["recommendations"][0].lower()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_refresh_shared_parses_entity_once_for_concurrent_dogs(
+    hass: HomeAssistant,
+    weather_manager: WeatherHealthManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent callers share one refresh and one versioned snapshot."""
+    hass.states.async_set(
+        "weather.shared",
+        "sunny",
+        {
+            weather_module.ATTR_WEATHER_TEMPERATURE: 34.0,
+            weather_module.ATTR_WEATHER_HUMIDITY: 70,
+            weather_module.ATTR_WEATHER_UV_INDEX: 8,
+        },
+    )
+    calls = 0
+    original = weather_manager.async_update_weather_data
+
+    async def _counting_update(entity_id: str | None = None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return await original(entity_id)
+
+    monkeypatch.setattr(weather_manager, "async_update_weather_data", _counting_update)
+
+    snapshots = await asyncio.gather(
+        *(weather_manager.async_refresh_shared("weather.shared") for _ in range(20))
+    )
+
+    assert calls == 1
+    assert {snapshot.version for snapshot in snapshots} == {1}
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0].alerts
+    assert snapshots[0].health_score == weather_manager.get_weather_health_score()
+
+    cached = await weather_manager.async_refresh_shared("weather.shared")
+    assert cached is snapshots[0]
+    assert calls == 1
+
+    refreshed = await weather_manager.async_refresh_shared(
+        "weather.shared", max_age=timedelta(0)
+    )
+    assert calls == 2
+    assert refreshed.version == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_refresh_shared_retries_failures_and_drops_expired_alerts(
+    hass: HomeAssistant,
+    weather_manager: WeatherHealthManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Failed refreshes are not reused and lapsed alerts leave the snapshot."""
+    hass.states.async_set(
+        "weather.shared",
+        "sunny",
+        {
+            weather_module.ATTR_WEATHER_TEMPERATURE: 34.0,
+            weather_module.ATTR_WEATHER_HUMIDITY: 70,
+            weather_module.ATTR_WEATHER_UV_INDEX: 8,
+        },
+    )
+    results: list[bool] = [False, True]
+    original = weather_manager.async_update_weather_data
+
+    async def _flaky_update(entity_id: str | None = None):
+        if not results.pop(0):
+            return None
+        return await original(entity_id)
+
+    monkeypatch.setattr(weather_manager, "async_update_weather_data", _flaky_update)
+
+    await weather_manager.async_refresh_shared("weather.shared")
+    assert "weather.shared" not in weather_manager._refreshed_at
+
+    snapshot = await weather_manager.async_refresh_shared("weather.shared")
+    assert results == []
+    assert snapshot.alerts
+    assert snapshot.expires_at is not None
+    assert weather_manager.get_health_snapshot() is snapshot
+
+    expired_at = snapshot.expires_at + timedelta(seconds=1)
+    monkeypatch.setattr(dt_util, "utcnow", lambda: expired_at)
+    rebuilt = weather_manager.get_health_snapshot()
+
+    assert rebuilt is not snapshot
+    assert rebuilt.version == snapshot.version
+    assert all(alert.is_active for alert in rebuilt.alerts)
+    assert len(rebuilt.alerts) < len(snapshot.alerts)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_weather_module_adapter_drops_lapsed_shared_alerts(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    weather_manager: WeatherHealthManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Shared alert payloads are rebuilt once the snapshot's first alert lapses."""
+    config_entry.options = {CONF_WEATHER_ENTITY: "weather.shared"}
+    hass.states.async_set(
+        "weather.shared",
+        "sunny",
+        {
+            weather_module.ATTR_WEATHER_TEMPERATURE: 34.0,
+            weather_module.ATTR_WEATHER_HUMIDITY: 70,
+            weather_module.ATTR_WEATHER_UV_INDEX: 8,
+        },
+    )
+    adapter = WeatherModuleAdapter(
+        config_entry=cast(PawControlConfigEntry, config_entry),
+        ttl=timedelta(days=1),
+    )
+    adapter.attach(weather_manager)
+
+    first = await adapter.async_get_data("test_dog")
+    snapshot = weather_manager.get_health_snapshot()
+    assert first["alerts"]
+    assert snapshot.expires_at is not None
+
+    expired_at = snapshot.expires_at + timedelta(seconds=1)
+    monkeypatch.setattr(dt_util, "utcnow", lambda: expired_at)
+    second = await adapter.async_get_data("other_dog")
+
+    assert weather_manager.get_health_snapshot().version == snapshot.version
+    assert len(second["alerts"]) < len(first["alerts"])
+    assert len(second["alerts"]) == len(weather_manager.get_health_snapshot().alerts)
@@ -112,6 +112,20 @@ def test_get_translation_handles_non_string_local_entries(
     assert fallback == "🔥 Extreme Heat Warning"
 
 
+def test_get_translation_refreshes_templates_when_catalog_changes(
+    weather_manager: WeatherHealthManager,
+) -> None:
+    """Cached templates must follow the active catalog after a reload."""
+    key = "weather.alerts.extreme_heat_warning.title"
+    weather_manager._translations = get_weather_translations("de")
+    assert weather_manager._get_translation(key) == "🔥 Warnung vor extremer Hitze"
+    assert key in weather_manager._translation_templates
+
+    weather_manager._translations = weather_manager._english_translations
+
+    assert weather_manager._get_translation(key) == "🔥 Extreme Heat Warning"
+
+
 @pytest.mark.parametrize(
     ("parts", "expected"),
     [
@@ -144,7 +144,7 @@ def test_get_weather_translations_falls_back_to_key_when_common_missing(
     """Missing common entries should resolve to the raw weather key names."""
     monkeypatch.setattr(
         weather_translations,
-        "_load_static_common_translations",
+        "_load_static_weather_templates",
         lambda _language: {},
     )
 
@@ -355,8 +355,9 @@ def test_rate_limit_state_add_request_uses_current_time(
 
     state.add_request()
 
-    assert list(state.requests_minute) == [321.0]
-    assert list(state.requests_hour) == [321.0]
+    assert state.minute_window.last_event() == 321.0
+    assert state.hour_window.last_event() == 321.0
+    assert state.last_request == 321.0
     assert state.total_requests == 1
 
 
@@ -427,3 +428,23 @@ async def test_security_manager_skips_rate_limit_when_source_ip_missing(
 
     assert result == {"event": "feed"}
     assert manager.get_security_stats()["rate_limiter"]["total_sources"] == 0
+
+
+def test_streaming_verification_matches_generated_signature() -> None:
+    """Chunked verification accepts the same signatures as ``verify_signature``."""
+    authenticator = WebhookAuthenticator(secret="stream-secret")
+    payload = b'{"dog_id": "dino", "latitude": 52.5}'
+    signature, timestamp = authenticator.generate_signature(payload)
+
+    verifier = authenticator.begin_verification(signature, timestamp)
+    for start in range(0, len(payload), 7):
+        verifier.update(payload[start : start + 7])
+    assert verifier.verify() is True
+
+    tampered = authenticator.begin_verification(signature, timestamp)
+    tampered.update(payload + b" ")
+    with pytest.raises(AuthenticationError, match="Invalid signature"):
+        tampered.verify()
+
+    with pytest.raises(AuthenticationError, match="Timestamp difference too large"):
+        authenticator.begin_verification(signature, timestamp - 3600)
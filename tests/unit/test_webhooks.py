@@ -1,6 +1,6 @@
 """Unit tests for webhook endpoint helpers."""
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
@@ -29,6 +29,25 @@ class _DummyRequest:
         return self._body
 
 
+class _StreamingRequest:
+    def __init__(
+        self,
+        chunks: list[bytes],
+        headers: dict[str, str] | None = None,
+        content_length: int | None = None,
+    ) -> None:
+        self.headers = headers or {}
+        self.content_length = content_length
+        self.content = SimpleNamespace(iter_chunked=self._iter_chunked)
+        self._chunks = chunks
+        self.chunks_read = 0
+
+    async def _iter_chunked(self, _size: int) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
 class _ConfigEntries:
     def __init__(self, entries: list[MagicMock] | None = None) -> None:
         self._entries = entries or []
@@ -270,7 +289,7 @@ async def test_handle_webhook_paths(monkeypatch: pytest.MonkeyPatch) -> None:  #
         def __init__(self, secret: str) -> None:
             self.secret = secret
 
-        def verify_signature(self, _raw: bytes, _sig: str, _ts: float) -> None:
+        def begin_verification(self, _sig: str, _ts: float) -> None:
             raise webhooks.AuthenticationError("bad")
 
     monkeypatch.setattr(webhooks, "WebhookAuthenticator", _FailingAuthenticator)
@@ -333,6 +352,30 @@ async def test_handle_webhook_paths(monkeypatch: pytest.MonkeyPatch) -> None:  #
     assert failed_without_dog.status == 422
     assert "dog_id" not in json.loads(failed_without_dog.body.decode())
 
+    process_batch = AsyncMock(
+        return_value={
+            "ok": True,
+            "status": 200,
+            "accepted": 1,
+            "rejected": 1,
+            "results": [
+                {"ok": True, "status": 200, "dog_id": "buddy", "index": 0},
+                {"ok": False, "status": 400, "error": "missing_coordinates"},
+            ],
+        }
+    )
+    monkeypatch.setattr(webhooks, "async_process_gps_push_batch", process_batch)
+    batch_response = await webhooks._handle_webhook(
+        hass,
+        "id-1",
+        _DummyRequest(json.dumps({"dog_id": "buddy", "points": [{}, {}]}).encode()),
+    )
+    batch_body = json.loads(batch_response.body.decode())
+    assert batch_response.status == 200
+    assert batch_body["accepted"] == 1
+    assert batch_body["results"][1]["error"] == "missing_coordinates"
+    process_fail_without_dog.assert_awaited_once()
+
 
 @pytest.mark.asyncio
 async def test_handle_webhook_requires_secret_when_signatures_enabled() -> None:  # noqa: D103
@@ -342,3 +385,75 @@ async def test_handle_webhook_requires_secret_when_signatures_enabled() -> None:
     hass = _make_hass([entry])
     response = await webhooks._handle_webhook(hass, "id-1", _DummyRequest(b"{}"))
     assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_handle_webhook_streams_signed_body_and_caps_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Signed bodies are verified chunk by chunk and oversize reads stop early."""
+    entry = _make_entry(
+        options={
+            CONF_WEBHOOK_ID: "id-1",
+            CONF_WEBHOOK_SECRET: "secret-1",
+            CONF_WEBHOOK_REQUIRE_SIGNATURE: True,
+        }
+    )
+    hass = _make_hass([entry])
+    process = AsyncMock(return_value={"ok": True, "dog_id": "buddy"})
+    monkeypatch.setattr(webhooks, "async_process_gps_push", process)
+
+    body = json.dumps({"dog_id": "buddy", "latitude": 1.0, "longitude": 2.0})
+    signature, timestamp = webhooks.WebhookAuthenticator(
+        secret="secret-1"
+    ).generate_signature(body.encode())
+    headers = {
+        "X-PawControl-Signature": signature,
+        "X-PawControl-Timestamp": str(timestamp),
+    }
+    encoded = body.encode()
+    chunks = [encoded[:10], encoded[10:25], encoded[25:]]
+
+    response = await webhooks._handle_webhook(
+        hass, "id-1", _StreamingRequest(chunks, headers)
+    )
+    assert response.status == 200
+    assert process.await_args.kwargs["raw_size"] == len(encoded)
+    authenticator = webhooks._authenticator_for("entry-1", "secret-1")
+    assert webhooks._authenticator_for("entry-1", "secret-1") is authenticator
+
+    tampered = await webhooks._handle_webhook(
+        hass, "id-1", _StreamingRequest([encoded[:-1] + b" "], headers)
+    )
+    assert tampered.status == 401
+
+    oversize = _StreamingRequest([b"x" * 4096] * 100, headers)
+    too_large = await webhooks._handle_webhook(hass, "id-1", oversize)
+    assert too_large.status == 413
+    assert oversize.chunks_read < 100
+
+    declared = _StreamingRequest([], headers, content_length=10**9)
+    assert (await webhooks._handle_webhook(hass, "id-1", declared)).status == 413
+    assert process.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_authenticator_cache_follows_secret_rotation_and_unload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rotated secrets replace the entry's authenticator and unload drops it."""
+    monkeypatch.setattr(webhooks, "_AUTHENTICATORS", {})
+    monkeypatch.setattr(webhooks, "async_unregister", MagicMock())
+    first = webhooks._authenticator_for("entry-1", "secret-1")
+    rotated = webhooks._authenticator_for("entry-1", "secret-2")
+
+    assert rotated is not first
+    assert webhooks._authenticator_for("entry-1", "secret-2") is rotated
+    assert list(webhooks._AUTHENTICATORS) == ["entry-1"]
+
+    entry = _make_entry(
+        options={CONF_WEBHOOK_ID: "id-1", CONF_WEBHOOK_SECRET: "secret-3"}
+    )
+    await webhooks.async_unregister_entry_webhook(_make_hass([entry]), entry)
+
+    assert webhooks._AUTHENTICATORS == {}